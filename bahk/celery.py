@@ -185,6 +185,16 @@ app.conf.beat_schedule = {
             }
         }
     },
+    'rollover-profile-fast-stats-hourly': {
+        'task': 'hub.tasks.rollover_profile_fast_stats_task',
+        # Hourly so each timezone's midnight is picked up; rows roll over once per local day
+        'schedule': crontab(minute=10),
+        'options': {
+            'sentry': {
+                'monitor_slug': 'hourly-profile-fast-stats-rollover',
+            }
+        }
+    },
     'refresh-reading-texts-weekly': {
         'task': 'hub.tasks.refresh_all_reading_texts_task',
         'schedule': crontab(day_of_week='monday', hour=4, minute=0),  # Monday 4:00 AM
@@ -194,6 +204,43 @@ app.conf.beat_schedule = {
             }
         }
     },
+    'prefetch-upcoming-days-nightly': {
+        'task': 'hub.tasks.prefetch_upcoming_days_task',
+        'schedule': crontab(hour=0, minute=30),  # 12:30 AM daily, after the feast date task
+        'options': {
+            'sentry': {
+                'monitor_slug': 'nightly-horizon-prefetch',
+            }
+        }
+    },
+    'prerender-quotes-of-the-day-nightly': {
+        'task': 'hub.tasks.prerender_quotes_of_the_day_task',
+        'schedule': crontab(hour=0, minute=45),  # 12:45 AM daily; renders today and tomorrow
+        'options': {
+            'sentry': {
+                'monitor_slug': 'nightly-quote-of-the-day-prerender',
+            }
+        }
+    },
+    'resume-llm-batch-polling': {
+        'task': 'hub.tasks.resume_llm_batch_polling_task',
+        # Picks up LLM batches whose poll chain was lost to a worker restart
+        'schedule': crontab(minute='*/15'),
+        'options': {
+            'sentry': {
+                'monitor_slug': 'frequent-llm-batch-polling-resume',
+            }
+        }
+    },
+    'refresh-stale-thumbnails-daily': {
+        'task': 'hub.tasks.refresh_stale_thumbnails_task',
+        'schedule': crontab(hour=3, minute=30),  # 3:30 AM daily
+        'options': {
+            'sentry': {
+                'monitor_slug': 'daily-thumbnail-refresh',
+            }
+        }
+    },
 }
 
 # ── Startup: Redis connectivity check ─────────────────────────────────────────────
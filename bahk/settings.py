@@ -370,6 +370,11 @@ else:
 CELERY_BROKER_URL = config('REDIS_URL', default='redis://redis:6379/0')
 CELERY_RESULT_BACKEND = config('REDIS_URL', default='redis://redis:6379/1') # Use a separate DB for results is good practice
 
+# Image processing runs on its own queue so thumbnail bursts don't delay other tasks
+CELERY_TASK_ROUTES = {
+    'hub.tasks.generate_thumbnail_task': {'queue': 'thumbnails'},
+}
+
 # Default transport options
 CELERY_BROKER_TRANSPORT_OPTIONS = {}
 CELERY_RESULT_BACKEND_TRANSPORT_OPTIONS = {}
@@ -433,6 +438,17 @@ READING_CONTEXT_REGENERATION_THRESHOLD = config('READING_CONTEXT_REGENERATION_TH
 # ANTHROPIC SETTINGS
 ANTHROPIC_API_KEY = config('ANTHROPIC_API_KEY')
 
+# LLM BATCH SETTINGS (bulk context regeneration through the providers' batch APIs)
+# 'provider' submits to the Anthropic/OpenAI batch endpoints; 'local' sends the
+# requests one at a time instead (for development without batch access).
+LLM_BATCH_BACKEND = config('LLM_BATCH_BACKEND', default='provider')
+LLM_BATCH_POLL_INTERVAL = config('LLM_BATCH_POLL_INTERVAL', default=30, cast=int)  # seconds
+LLM_BATCH_TIMEOUT = config('LLM_BATCH_TIMEOUT', default=86400, cast=int)  # seconds; batches finish within 24h
+
+# ICON MATCHING SETTINGS
+# Seconds an icon match result stays cached; entries are also dropped when icons change.
+ICON_MATCH_CACHE_TTL = config('ICON_MATCH_CACHE_TTL', default=60 * 60 * 24 * 7, cast=int)
+
 # API.BIBLE SETTINGS
 BIBLE_API_KEY = config('BIBLE_API_KEY', default='')
 # Number of days after which a reading's text is considered stale and needs refresh.
@@ -442,6 +458,23 @@ READING_TEXT_REFRESH_DAYS = config('READING_TEXT_REFRESH_DAYS', default=23, cast
 # Maximum number of readings to keep in the database.  Oldest readings are
 # pruned during the weekly refresh to stay within the API calls/month budget.
 MAX_READINGS = config('MAX_READINGS', default=2000, cast=int)
+# Concurrent API.Bible requests during the bulk reading-text refresh
+BIBLE_API_MAX_CONCURRENCY = config('BIBLE_API_MAX_CONCURRENCY', default=4, cast=int)
+
+# LOOK-AHEAD PREFETCH SETTINGS
+# Days (starting today) whose readings, texts, feasts and contexts are prefetched nightly,
+# and how many of those days are processed concurrently.
+PREFETCH_HORIZON_DAYS = config('PREFETCH_HORIZON_DAYS', default=14, cast=int)
+PREFETCH_HORIZON_WORKERS = config('PREFETCH_HORIZON_WORKERS', default=4, cast=int)
+
+# SACREDTRADITION.AM SCRAPING SETTINGS
+# Base URL of the lectionary site (overridable to point the scraper at a fixture server),
+# per-request timeout in seconds, and retries (with backoff) on connection errors and 429/5xx.
+SACREDTRADITION_BASE_URL = config('SACREDTRADITION_BASE_URL', default='https://sacredtradition.am')
+SACREDTRADITION_TIMEOUT = config('SACREDTRADITION_TIMEOUT', default=10, cast=int)
+SACREDTRADITION_RETRIES = config('SACREDTRADITION_RETRIES', default=2, cast=int)
+# Concurrent page fetches (one per date) during the bulk reading-text refresh
+SACREDTRADITION_MAX_CONCURRENCY = config('SACREDTRADITION_MAX_CONCURRENCY', default=2, cast=int)
 
 # Test settings
 if 'test' in sys.argv:
@@ -664,6 +697,12 @@ AWS_S3_ENDPOINT_URL = config('AWS_S3_ENDPOINT_URL', default=None)
 # AWS Location Service configuration
 AWS_LOCATION_PLACE_INDEX = config('AWS_LOCATION_PLACE_INDEX', default='ExamplePlaceIndex')
 AWS_LOCATION_API_KEY = config('AWS_LOCATION_SERVICES_KEY', default=None)
+# Place index requests per second shared by all geocoding threads of a process,
+# and the number of threads batch geocoding uses
+AWS_LOCATION_REQUESTS_PER_SECOND = config('AWS_LOCATION_REQUESTS_PER_SECOND', default=5.0, cast=float)
+AWS_LOCATION_GEOCODE_CONCURRENCY = config('AWS_LOCATION_GEOCODE_CONCURRENCY', default=4, cast=int)
+# Resolve city names with the bundled offline gazetteer before calling AWS Location
+GEOCODING_GAZETTEER_ENABLED = config('GEOCODING_GAZETTEER_ENABLED', default=True, cast=bool)
 
 # Force version 4 signing for S3
 AWS_S3_SIGNATURE_VERSION = 's3v4'
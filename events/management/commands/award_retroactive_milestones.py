@@ -4,7 +4,6 @@ Management command to award retroactive milestones to existing users.
 
 from django.core.management.base import BaseCommand
 from django.contrib.auth import get_user_model
-from django.db import models
 from django.utils import timezone
 from events.models import UserMilestone
 from hub.models import Fast
@@ -83,9 +82,7 @@ class Command(BaseCommand):
                     continue
                 
                 # Get user's earliest fast by finding the fast with the earliest start date
-                user_fasts = user.profile.fasts.annotate(
-                    start_date=models.Min('days__date')
-                ).order_by('start_date')
+                user_fasts = user.profile.fasts.order_by('start_date')
                 
                 if not user_fasts.exists():
                     # User has never joined a fast
@@ -160,12 +157,8 @@ class Command(BaseCommand):
                 today = timezone.now().date()
                 user_completed_fasts = Fast.objects.filter(
                     profiles=user.profile,
-                    days__date__lt=today  # Only fasts that have ended
-                ).annotate(
-                    end_date=models.Max('days__date')
-                ).filter(
-                    end_date__lt=today  # Ensure the fast has actually ended
-                ).distinct().order_by('end_date')
+                    end_date__lt=today  # Only fasts that have ended
+                ).order_by('end_date')
                 
                 # Filter out weekly fasts and find the first non-weekly completed fast
                 first_nonweekly_fast = None
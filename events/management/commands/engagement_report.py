@@ -268,13 +268,8 @@ class Command(BaseCommand):
         return [NewUsersOverTimeRow(date=x["day"].isoformat(), count=x["count"]) for x in qs]
 
     def _compute_fast_engagement(self, start_dt: datetime, end_dt: datetime) -> List[FastEngagementRow]:
-        # Optimize query to avoid N+1 problem by prefetching profiles and counting them
-        fasts = (
-            Fast.objects.all()
-            .select_related("church")
-            .prefetch_related("profiles")
-            .annotate(participant_count=Count("profiles"))
-        )
+        # participant_count is a denormalized column on Fast, so no join is needed
+        fasts = Fast.objects.all().select_related("church")
 
         # joins/leaves in period based on Events
         joins = (
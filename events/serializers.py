@@ -195,52 +195,8 @@ class UserActivityFeedSerializer(serializers.ModelSerializer, ThumbnailCacheMixi
         return obj.object_id
     
     def get_target_thumbnail(self, obj):
-        """Get the thumbnail URL for the target object if available."""
-        if not obj.target:
-            return None
-        
-        target = obj.target
-        
-        # Handle Fast thumbnails (image field with image_thumbnail spec)
-        if hasattr(target, 'image_thumbnail') and hasattr(target, 'image') and target.image:
-            try:
-                # Use cached thumbnail URL if available
-                cached_url = self.update_thumbnail_cache(target, 'image', 'image_thumbnail')
-                if cached_url:
-                    return cached_url
-
-                # Fall back to direct thumbnail URL
-                return target.image_thumbnail.url
-            except Exception:
-                pass
-        
-        # Handle Profile thumbnails
-        if hasattr(target, 'profile_image') and target.profile_image:
-            try:
-                # Use cached thumbnail URL if available
-                cached_url = self.update_thumbnail_cache(target, 'profile_image', 'profile_image_thumbnail')
-                if cached_url:
-                    return cached_url
-                
-                # Fall back to direct thumbnail URL
-                if hasattr(target, 'profile_image_thumbnail'):
-                    return target.profile_image_thumbnail.url
-            except Exception:
-                pass
-        
-        # Handle Video/Article/Recipe thumbnails (for devotionals, learning resources)
-        if hasattr(target, 'thumbnail') and target.thumbnail:
-            try:
-                # Use cached thumbnail URL if available (for video thumbnails)
-                if hasattr(target, 'cached_thumbnail_url') and target.cached_thumbnail_url:
-                    return target.cached_thumbnail_url
-                
-                # Fall back to direct thumbnail URL (works for both video and article/recipe thumbnails)
-                return target.thumbnail.url
-            except Exception:
-                pass
-        
-        return None
+        """Get the cached thumbnail URL for the target object if available."""
+        return self.get_cached_thumbnail_url(obj.target)
 
     def to_representation(self, instance):
         lang = self.context.get('lang') or (self.context.get('request').query_params.get('lang') if self.context.get('request') else None) or 'en'
@@ -117,10 +117,12 @@ def track_fast_membership_changes(sender, instance, action, pk_set, **kwargs):
                         except Exception as milestone_error:
                             logger.error(f"Error creating first fast join milestone for {user.username}: {milestone_error}")
                         
-                        # Check for participation milestones after user joins
+                        # Check for participation milestones after user joins. The counter was
+                        # already bumped by hub.signals (hub registers its receivers first), so
+                        # the fresh value lets the milestone fire as soon as it is crossed.
                         try:
                             from .tasks import track_fast_participant_milestone_task
-                            track_fast_participant_milestone_task.delay(fast.id)
+                            track_fast_participant_milestone_task.delay(fast.id, fast.participant_count)
                             logger.info(f"Scheduled milestone check for fast {fast.name} after user join")
                         except Exception as milestone_error:
                             logger.error(f"Error scheduling milestone check for fast {fast.name}: {milestone_error}")
@@ -153,7 +155,7 @@ def track_fast_membership_changes(sender, instance, action, pk_set, **kwargs):
                         # Check for participation milestones after user leaves
                         try:
                             from .tasks import track_fast_participant_milestone_task
-                            track_fast_participant_milestone_task.delay(fast.id)
+                            track_fast_participant_milestone_task.delay(fast.id, fast.participant_count)
                             logger.info(f"Scheduled milestone check for fast {fast.name} after user leave")
                         except Exception as milestone_error:
                             logger.error(f"Error scheduling milestone check for fast {fast.name}: {milestone_error}")
@@ -476,7 +478,7 @@ def track_fast_beginning(fast):
                 'church_id': fast.church.id if fast.church else None,
                 'church_name': fast.church.name if fast.church else None,
                 'year': fast.year,
-                'participant_count': fast.profiles.count(),
+                'participant_count': fast.participant_count,
             }
         )
         logger.info(f"Tracked FAST_BEGINNING event: {fast}")
@@ -505,7 +507,7 @@ def track_fast_ending(fast):
                 'church_id': fast.church.id if fast.church else None,
                 'church_name': fast.church.name if fast.church else None,
                 'year': fast.year,
-                'final_participant_count': fast.profiles.count(),
+                'final_participant_count': fast.participant_count,
             }
         )
         logger.info(f"Tracked FAST_ENDING event: {fast}")
@@ -523,8 +525,7 @@ def check_and_track_participation_milestones(fast):
         fast: Fast instance
     """
     try:
-        current_count = fast.profiles.count()
-        track_fast_participant_milestone(fast, current_count)
+        return track_fast_participant_milestone(fast, fast.participant_count)
         
     except Exception as e:
         logger.error(f"Error checking participation milestones for fast {fast}: {e}")
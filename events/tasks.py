@@ -244,9 +244,9 @@ def track_fast_participant_milestone_task(self, fast_id, participant_count=None,
         
         fast = Fast.objects.get(id=fast_id)
         
-        # Calculate participant count if not provided
+        # Fall back to the denormalized counter if no count was provided
         if participant_count is None:
-            participant_count = fast.profiles.count()
+            participant_count = fast.participant_count
         
         # Track the milestone
         milestone_created = track_fast_participant_milestone(fast, participant_count, milestone_type)
@@ -312,17 +312,12 @@ def check_fast_beginning_events_task():
     """
     try:
         from hub.models import Fast
-        from django.db.models import Min
         from django.utils import timezone
         
         today = timezone.now().date()
         
         # Find fasts that start today (first day of the fast)
-        fasts_beginning_today = Fast.objects.annotate(
-            start_date=Min('days__date')
-        ).filter(
-            start_date=today
-        ).distinct()
+        fasts_beginning_today = Fast.objects.filter(start_date=today)
         
         events_created = 0
         for fast in fasts_beginning_today:
@@ -367,7 +362,9 @@ def check_fast_beginning_events_task():
 def check_participation_milestones_task():
     """
     Check all active fasts for participation milestones.
-    This task runs daily to ensure milestones are tracked.
+
+    Milestones normally fire on join via the membership signal; this daily scan
+    is a safety net that reads the denormalized participant counter.
     """
     try:
         from hub.models import Fast
@@ -377,9 +374,7 @@ def check_participation_milestones_task():
         today = timezone.now().date()
         
         # Find active fasts (those with days today or in the future)
-        active_fasts = Fast.objects.filter(
-            days__date__gte=today
-        ).distinct()
+        active_fasts = Fast.objects.filter(end_date__gte=today)
         
         milestones_created = 0
         fasts_checked = 0
@@ -661,21 +656,14 @@ def check_completed_fast_milestones_task():
         from hub.models import Fast
         from django.utils import timezone
         from datetime import timedelta
-        from django.db import models
         from .models import UserMilestone
         from notifications.utils import is_weekly_fast
         
         yesterday = timezone.now().date() - timedelta(days=1)
         logger.info(f"Checking for fasts that ended on {yesterday}")
         
-        # Find fasts that ended yesterday
-        completed_fasts = Fast.objects.filter(
-            days__date=yesterday
-        ).annotate(
-            end_date=models.Max('days__date')
-        ).filter(
-            end_date=yesterday  # Only fasts where yesterday was truly the last day
-        ).distinct()
+        # Find fasts that ended yesterday (yesterday was truly the last day)
+        completed_fasts = Fast.objects.filter(end_date=yesterday)
         
         milestones_awarded = 0
         users_processed = 0
@@ -707,12 +695,8 @@ def check_completed_fast_milestones_task():
                     # Get all fasts this user has participated in that have ended before today
                     user_completed_fasts = Fast.objects.filter(
                         profiles=profile,
-                        days__date__lt=timezone.now().date()
-                    ).annotate(
-                        end_date=models.Max('days__date')
-                    ).filter(
                         end_date__lt=timezone.now().date()
-                    ).distinct()
+                    )
                     
                     # Filter out weekly fasts
                     non_weekly_completed_fasts = [
@@ -496,9 +496,12 @@ class TrackChecklistUsedView(APIView):
                 request=request,
             )
             
-            # Invalidate the stats cache for this user since checklist_uses count changed
-            from hub.utils import invalidate_fast_stats_cache
-            invalidate_fast_stats_cache(request.user)
+            # Count the use on the user's fast stats row (served by FastStatsView)
+            from hub.models import ProfileFastStats
+            from hub.utils import get_user_profile_safe
+            profile = get_user_profile_safe(request.user)
+            if profile is not None:
+                ProfileFastStats.record_checklist_use(profile)
             
             return Response({"status": "ok"})
         except Exception as e:
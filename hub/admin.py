@@ -33,6 +33,7 @@ from hub.models import (
     Feast,
     FeastContext,
     LLMPrompt,
+    PassageContext,
     PatristicQuote,
     Profile,
     Reading,
@@ -42,9 +43,14 @@ from hub.services.bible_api_service import BibleAPIService, fetch_text_for_readi
 from hub.tasks import (
     generate_reading_context_task,
     generate_feast_context_task,
+    regenerate_reading_contexts_batch_task,
+    regenerate_feast_contexts_batch_task,
+    determine_feast_designations_batch_task,
     match_icon_to_feast_task,
+    prewarm_icon_match_cache_task,
     fetch_armenian_reading_text_task,
 )
+from icons.matching import icon_match_cache_stats
 
 _MAX_NUM_TO_SHOW = 3  # maximum object names to show in list
 
@@ -324,11 +330,6 @@ class FastAdmin(admin.ModelAdmin):
     sortable_by = ("get_name", "participant_count")
     exclude = ("name", "description", "culmination_feast")  # Avoid duplicate with translation fields
 
-    def get_queryset(self, request):
-        queryset = super().get_queryset(request)
-        queryset = queryset.annotate(participant_count=models.Count("profiles"))
-        return queryset
-
     def get_name(self, fast):
         return fast
 
@@ -362,12 +363,6 @@ class FastAdmin(admin.ModelAdmin):
         url = fast.image.url
         return format_html('<a href="{}">{}</a>', url, "Image Link")
 
-    def participant_count(self, fast):
-        return fast.participant_count
-
-    participant_count.short_description = "Participants"
-    participant_count.admin_order_field = "participant_count"
-
     def get_urls(self):
         """Add endpoints to admin views."""
         return [
@@ -645,7 +640,13 @@ class ReadingAdmin(admin.ModelAdmin):
         "start_chapter",
         "start_verse",
     )
-    actions = ["force_regenerate_context", "compare_prompts", "fetch_bible_text", "fetch_armenian_text"]
+    actions = [
+        "force_regenerate_context",
+        "batch_regenerate_context",
+        "compare_prompts",
+        "fetch_bible_text",
+        "fetch_armenian_text",
+    ]
     readonly_fields = ("text_fetched_at", "has_fums_token", "fetch_text_link", "armenian_text_links", "text_hy_fetched_at", "has_hy_fums_token")
     exclude = ("book", "text", "fums_token", "text_hy_fums_token")  # Avoid duplicates with translation fields
 
@@ -802,6 +803,18 @@ class ReadingAdmin(admin.ModelAdmin):
         "Force regenerate AI context for selected readings"
     )
 
+    def batch_regenerate_context(self, request, queryset):
+        """Regenerate context for selected readings as one LLM batch."""
+        reading_ids = list(queryset.values_list("id", flat=True))
+        regenerate_reading_contexts_batch_task.delay(reading_ids)
+        self.message_user(
+            request, f"Submitted batch regeneration for {len(reading_ids)} readings."
+        )
+
+    batch_regenerate_context.short_description = (
+        "Regenerate AI context for selected readings (batch API, within 24h)"
+    )
+
     def armenian_text_links(self, reading):
         """Render a button to fetch Armenian text for this reading."""
         if not reading or not reading.pk:
@@ -1021,6 +1034,42 @@ class ReadingContextAdmin(admin.ModelAdmin):
     text_preview.short_description = "Text Preview"
 
 
+@admin.register(PassageContext, site=admin.site)
+class PassageContextAdmin(admin.ModelAdmin):
+    list_display = (
+        "book_key",
+        "start_chapter",
+        "start_verse",
+        "end_chapter",
+        "end_verse",
+        "prompt",
+        "model",
+        "updated_at",
+        "text_preview",
+    )
+    list_filter = ("model",)
+    search_fields = ("book_key", "text")
+    ordering = ("book_key", "start_chapter", "start_verse")
+    raw_id_fields = ("prompt",)
+    readonly_fields = ("updated_at",)
+    exclude = ("text",)  # Avoid duplicate with translation fields
+
+    fieldsets = (
+        (None, {
+            'fields': ('book_key', 'start_chapter', 'start_verse', 'end_chapter', 'end_verse',
+                       'prompt', 'model', 'updated_at')
+        }),
+        ('Context Translations', {
+            'fields': ('text_en', 'text_hy')
+        }),
+    )
+
+    def text_preview(self, obj):
+        return Truncator(obj.text).chars(100)
+
+    text_preview.short_description = "Text Preview"
+
+
 class FeastYearFilter(admin.SimpleListFilter):
     """Custom filter to filter feasts by year."""
 
@@ -1064,8 +1113,11 @@ class FeastAdmin(admin.ModelAdmin):
     actions = [
         "force_rematch_icon",
         "match_icon_if_missing",
+        "prewarm_icon_match_cache",
         "force_regenerate_context",
+        "batch_regenerate_context",
         "regenerate_context_with_instructions",
+        "batch_determine_designation",
     ]
     exclude = ("name",)  # Avoid duplicate with translation fields
     readonly_fields = ("icon_rematch_links",)
@@ -1135,7 +1187,8 @@ class FeastAdmin(admin.ModelAdmin):
             if feast.icon_id is not None:
                 feast.icon = None
                 feast.save(update_fields=["icon"])
-            match_icon_to_feast_task.delay(feast.id)
+            # Bypass the cached match, which would only return the same icon
+            match_icon_to_feast_task.delay(feast.id, force=True)
             return True
 
         # Only if missing
@@ -1217,6 +1270,22 @@ class FeastAdmin(admin.ModelAdmin):
         "Match icon only if missing for selected feasts"
     )
 
+    def prewarm_icon_match_cache(self, request, queryset):
+        """Cache icon matches for selected feasts without assigning icons."""
+        feast_ids = list(queryset.values_list("id", flat=True))
+        prewarm_icon_match_cache_task.delay(feast_ids)
+        stats = icon_match_cache_stats()
+        self.message_user(
+            request,
+            f"Enqueued icon match cache prewarm for {len(feast_ids)} feasts. "
+            f"Cache so far: {stats['hits']} hits, {stats['misses']} misses.",
+            level=messages.SUCCESS,
+        )
+
+    prewarm_icon_match_cache.short_description = (
+        "Prewarm icon match cache for selected feasts"
+    )
+
     def force_regenerate_context(self, request, queryset):
         """Force enqueues context regeneration for selected feasts."""
         count = queryset.count()
@@ -1230,6 +1299,30 @@ class FeastAdmin(admin.ModelAdmin):
         "Force regenerate AI context for selected feasts"
     )
 
+    def batch_regenerate_context(self, request, queryset):
+        """Regenerate context for selected feasts as one LLM batch."""
+        feast_ids = list(queryset.values_list("id", flat=True))
+        regenerate_feast_contexts_batch_task.delay(feast_ids)
+        self.message_user(
+            request, f"Submitted batch regeneration for {len(feast_ids)} feasts."
+        )
+
+    batch_regenerate_context.short_description = (
+        "Regenerate AI context for selected feasts (batch API, within 24h)"
+    )
+
+    def batch_determine_designation(self, request, queryset):
+        """Determine missing designations for selected feasts as one LLM batch."""
+        feast_ids = list(queryset.values_list("id", flat=True))
+        determine_feast_designations_batch_task.delay(feast_ids)
+        self.message_user(
+            request, f"Submitted designation batch for {len(feast_ids)} feasts (existing designations are kept)."
+        )
+
+    batch_determine_designation.short_description = (
+        "Determine missing designations for selected feasts (batch API)"
+    )
+
     def regenerate_context_with_instructions(self, request, queryset):
         """Redirect to intermediate page for providing improvement instructions."""
         selected = queryset.values_list('pk', flat=True)
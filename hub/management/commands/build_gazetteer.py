@@ -0,0 +1,90 @@
+"""Build the bundled offline geocoding gazetteer from GeoNames dumps."""
+
+import io
+import zipfile
+
+from django.core.management.base import BaseCommand, CommandError
+
+from hub.services.gazetteer import (
+    Gazetteer,
+    gazetteer_path,
+    is_latin,
+    normalize_name,
+    reset_gazetteer,
+    write_gazetteer,
+)
+
+# Feature codes of abandoned or destroyed places and historical capitals
+SKIPPED_FEATURE_CODES = {"PPLH", "PPLQ", "PPLW", "PPLCH"}
+# Aliases shorter than this (mostly codes) are left out
+MIN_ALIAS_LENGTH = 3
+
+
+def _open_text(path: str):
+    """Open a GeoNames dump, either plain text or the zip it is distributed in."""
+    if path.endswith(".zip"):
+        archive = zipfile.ZipFile(path)
+        members = [name for name in archive.namelist() if name.endswith(".txt")]
+        if not members:
+            raise CommandError(f"No .txt file in {path}")
+        return io.TextIOWrapper(archive.open(members[0]), encoding="utf-8")
+    return open(path, encoding="utf-8")
+
+
+def _rows(path: str):
+    with _open_text(path) as f:
+        for line in f:
+            if line.strip() and not line.startswith("#"):
+                yield line.rstrip("\n").split("\t")
+
+
+class Command(BaseCommand):
+    help = (
+        "Reduce a GeoNames cities dump (e.g. cities15000.zip) into data/gazetteer.tsv.gz, "
+        "the offline gazetteer tried before AWS Location when geocoding."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("source", help="Path of the GeoNames cities dump (cities15000.txt or .zip)")
+        parser.add_argument("--countries", required=True, help="Path of the GeoNames countryInfo.txt")
+        parser.add_argument("--admin1", help="Path of the GeoNames admin1CodesASCII.txt (state names)")
+        parser.add_argument(
+            "--min-population", type=int, default=15000,
+            help="Leave out places with fewer inhabitants (default: 15000)",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            countries = [(row[0], row[1], row[4]) for row in _rows(options["countries"])]
+            admin1 = [(row[0], row[2] or row[1]) for row in _rows(options["admin1"])] if options["admin1"] else []
+            places = []
+            for row in _rows(options["source"]):
+                if len(row) < 15 or row[6] != "P" or row[7] in SKIPPED_FEATURE_CODES:
+                    continue
+                population = int(row[14] or 0)
+                if population < options["min_population"]:
+                    continue
+                name = row[1]
+                aliases = {
+                    key for key in map(normalize_name, filter(is_latin, row[3].split(",") if row[3] else []))
+                    if len(key) >= MIN_ALIAS_LENGTH
+                }
+                # The ASCII name differs when letters were transliterated ("Zürich", "Zurich")
+                aliases.add(normalize_name(row[2]))
+                key = normalize_name(name)
+                keys = [key] if key else []
+                keys += sorted(aliases - {key, ""})
+                if keys:
+                    places.append((name, row[8], row[10], float(row[4]), float(row[5]), population, keys))
+        except (OSError, ValueError, IndexError) as e:
+            raise CommandError(f"Could not read the GeoNames dumps: {e}")
+
+        places.sort(key=lambda place: -place[5])
+        path = gazetteer_path()
+        write_gazetteer(path, countries, admin1, places)
+        reset_gazetteer()
+        gazetteer = Gazetteer.from_file(path)
+        self.stdout.write(self.style.SUCCESS(
+            f"✓ Wrote {len(gazetteer)} places ({len(gazetteer.keys)} names and aliases), "
+            f"{len(countries)} countries and {len(admin1)} states to {path}"
+        ))
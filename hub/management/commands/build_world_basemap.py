@@ -0,0 +1,59 @@
+"""Build the bundled participant-map basemap from Natural Earth country data."""
+
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from hub.services.basemap import basemap_path, reset_basemap
+
+
+class Command(BaseCommand):
+    help = (
+        "Simplify a Natural Earth admin-0 countries layer (e.g. ne_110m_admin_0_countries.zip) "
+        "into data/world_basemap.geojson, the basemap used by the participant maps."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("source", help="Path of the countries layer (shapefile, zip or GeoJSON)")
+        parser.add_argument(
+            "--tolerance", type=float, default=0.05,
+            help="Simplification tolerance in degrees (default: 0.05)",
+        )
+        parser.add_argument(
+            "--precision", type=int, default=3,
+            help="Decimal places kept in coordinates (default: 3)",
+        )
+
+    def handle(self, *args, **options):
+        import geopandas as gpd
+        import shapely
+
+        source = options["source"]
+        try:
+            countries = gpd.read_file(f"zip://{source}" if source.endswith(".zip") else source)
+        except Exception as e:
+            raise CommandError(f"Could not read {source}: {e}")
+        countries.columns = [column if column == "geometry" else column.lower() for column in countries.columns]
+        missing = {"name", "iso_a3"} - set(countries.columns)
+        if missing:
+            raise CommandError(f"Missing columns: {', '.join(sorted(missing))}")
+
+        countries = countries.to_crs("EPSG:4326")
+        geometries = countries.geometry.simplify(options["tolerance"], preserve_topology=True)
+        precision = options["precision"]
+        geometries = shapely.make_valid(shapely.transform(geometries.values, lambda coords: coords.round(precision)))
+
+        features = [
+            {
+                "type": "Feature",
+                "properties": {"name": name, "iso_a3": iso_a3},
+                "geometry": geometry.__geo_interface__,
+            }
+            for name, iso_a3, geometry in zip(countries["name"], countries["iso_a3"], geometries)
+            if not geometry.is_empty
+        ]
+        path = basemap_path()
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"type": "FeatureCollection", "features": features}, f, separators=(",", ":"))
+        reset_basemap()
+        self.stdout.write(self.style.SUCCESS(f"✓ Wrote {len(features)} countries to {path}"))
@@ -66,7 +66,8 @@ class Command(BaseCommand):
                     f"Processed {stats['total']} profiles: "
                     f"{stats['successful']} successful, "
                     f"{stats['failed']} failed, "
-                    f"{stats['cached']} from cache."
+                    f"{stats['cached']} from cache, "
+                    f"{stats['offline']} locations resolved offline."
                 ))
             else:
                 self.stdout.write(self.style.ERROR(f"Geocoding failed: {result['message']}")) 
\ No newline at end of file
@@ -0,0 +1,44 @@
+"""Prewarm the icon match cache for upcoming feasts and report its hit rate."""
+
+from django.core.management.base import BaseCommand
+
+from hub.tasks import prewarm_icon_match_cache_task
+from icons.matching import icon_match_cache_stats, reset_icon_match_cache_stats
+
+
+class Command(BaseCommand):
+    help = "Cache icon matches for the feasts of the coming days, or show cache hit/miss counts"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            help="Days starting today to prewarm (default: PREFETCH_HORIZON_DAYS)",
+        )
+        parser.add_argument(
+            "--stats",
+            action="store_true",
+            help="Only show the cache hit/miss counts",
+        )
+        parser.add_argument(
+            "--reset-stats",
+            action="store_true",
+            help="Reset the cache hit/miss counts",
+        )
+
+    def handle(self, *args, **options):
+        if options["reset_stats"]:
+            reset_icon_match_cache_stats()
+            self.stdout.write(self.style.SUCCESS("Reset icon match cache stats"))
+            return
+
+        if not options["stats"]:
+            summary = prewarm_icon_match_cache_task(days=options.get("days"))
+            self.stdout.write(self.style.SUCCESS(
+                f"Prewarmed {summary['warmed']} of {summary['feasts']} feasts "
+                f"({summary['already_cached']} already cached, {summary['failed']} failed)"
+            ))
+
+        stats = icon_match_cache_stats()
+        hit_rate = f"{stats['hit_rate']:.1%}" if stats["hit_rate"] is not None else "n/a"
+        self.stdout.write(f"Icon match cache: {stats['hits']} hits, {stats['misses']} misses (hit rate {hit_rate})")
@@ -0,0 +1,32 @@
+"""Rebuild the participant density cells of fasts."""
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from hub.models import Fast
+from hub.services.participant_density import rebuild_density
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the participant density cells served by the fast participants density endpoint. "
+        "Run after migrating and after bulk profile updates, which skip the signals that maintain them."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--fast", type=int, action="append", dest="fast_ids", help="Fast ID (repeatable)")
+        parser.add_argument("--all", action="store_true", help="Include fasts that have ended")
+
+    def handle(self, *args, **options):
+        fasts = Fast.objects.all()
+        if options.get("fast_ids"):
+            fasts = fasts.filter(pk__in=options["fast_ids"])
+        elif not options["all"]:
+            fasts = fasts.exclude(end_date__lt=timezone.now().date())
+
+        total = 0
+        for fast in fasts.order_by("pk"):
+            participants = rebuild_density(fast)
+            total += 1
+            self.stdout.write(f"  {fast}: {participants} participants")
+        self.stdout.write(self.style.SUCCESS(f"✓ Rebuilt participant density of {total} fasts"))
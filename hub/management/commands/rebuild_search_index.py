@@ -0,0 +1,31 @@
+"""Rebuild the full-text search documents of searchable models."""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from hub.services.search_service import SEARCH_SOURCES, rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = (
+        "Re-index devotionals, learning resources and prayers for search. "
+        "Run after bulk imports or updates, which skip the save signals."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--model",
+            action="append",
+            dest="models",
+            help=f"Model label to re-index (repeatable; default: all of {', '.join(SEARCH_SOURCES)})",
+        )
+
+    def handle(self, *args, **options):
+        labels = options.get("models")
+        unknown = set(labels or ()) - SEARCH_SOURCES.keys()
+        if unknown:
+            raise CommandError(f"Not searchable: {', '.join(sorted(unknown))}")
+
+        counts = rebuild_search_index(labels)
+        for label, count in counts.items():
+            self.stdout.write(f"  {label}: {count}")
+        self.stdout.write(self.style.SUCCESS(f"✓ Indexed {sum(counts.values())} objects"))
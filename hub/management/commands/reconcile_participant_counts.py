@@ -0,0 +1,58 @@
+"""
+Management command to repair drift in the denormalized Fast.participant_count column.
+"""
+from django.core.management.base import BaseCommand
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from hub.models import Fast, Profile
+
+
+def _membership_count_subquery():
+    """Subquery counting Profile.fasts rows for the outer fast."""
+    return Coalesce(
+        Subquery(
+            Profile.fasts.through.objects.filter(fast_id=OuterRef('pk'))
+            .order_by()
+            .values('fast_id')
+            .annotate(total=Count('pk'))
+            .values('total')
+        ),
+        0,
+    )
+
+
+class Command(BaseCommand):
+    help = 'Recomputes Fast.participant_count from the Profile.fasts join table'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--fast-id', type=int, help='Only reconcile this fast (default: all fasts)')
+        parser.add_argument('--dry-run', action='store_true', help='Report drift without fixing it')
+
+    def handle(self, *args, **options):
+        fasts = Fast.objects.all()
+        if options['fast_id']:
+            fasts = fasts.filter(id=options['fast_id'])
+
+        drifted = list(
+            fasts.annotate(actual_count=_membership_count_subquery())
+            .exclude(participant_count=F('actual_count'))
+            .values_list('id', 'name', 'participant_count', 'actual_count')
+        )
+
+        for fast_id, name, stored, actual in drifted:
+            self.stdout.write(f"  Fast {fast_id} ({name}): stored {stored}, actual {actual}")
+
+        if not drifted:
+            self.stdout.write(self.style.SUCCESS('All participant counts are in sync'))
+            return
+
+        if options['dry_run']:
+            self.stdout.write(self.style.WARNING(f'{len(drifted)} fast(s) out of sync (dry run, nothing changed)'))
+            return
+
+        # Recompute in the UPDATE itself so joins that land meanwhile are not lost
+        Fast.objects.filter(id__in=[row[0] for row in drifted]).update(
+            participant_count=_membership_count_subquery()
+        )
+        self.stdout.write(self.style.SUCCESS(f'Reconciled participant counts for {len(drifted)} fast(s)'))
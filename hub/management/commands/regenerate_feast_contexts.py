@@ -3,7 +3,7 @@
 from django.core.management.base import BaseCommand
 
 from hub.models import Feast
-from hub.tasks import generate_feast_context_task
+from hub.tasks import generate_feast_context_task, regenerate_feast_contexts_batch_task
 
 
 class Command(BaseCommand):
@@ -20,6 +20,11 @@ class Command(BaseCommand):
             type=int,
             help="Regenerate context for a specific feast ID",
         )
+        parser.add_argument(
+            "--batch",
+            action="store_true",
+            help="With --all, submit all feasts as one LLM batch (cheaper, finishes within 24h)",
+        )
 
     def handle(self, *args, **options):
         if options.get("feast_id"):
@@ -43,6 +48,11 @@ class Command(BaseCommand):
                 return
             
             self.stdout.write(f"Regenerating contexts for {count} feasts...")
+
+            if options.get("batch"):
+                regenerate_feast_contexts_batch_task.delay(list(feasts.values_list("id", flat=True)))
+                self.stdout.write(self.style.SUCCESS(f"\n✓ Queued batch regeneration for {count} feasts"))
+                return
             
             for feast in feasts:
                 generate_feast_context_task.delay(feast.id, force_regeneration=True)
@@ -1,19 +1,19 @@
+import os
+
 from django.core.management.base import BaseCommand
-from hub.models import Profile, Fast
-from icons.models import Icon
-from learning_resources.models import Video, Article
 
-MODELS = {
-    'profile': (Profile, 'profile_image'),
-    'fast': (Fast, 'image'),
-    'video': (Video, 'thumbnail'),
-    'article': (Article, 'image'),
-    'icon': (Icon, 'image'),
-}
+from hub.services.thumbnail_service import (
+    THUMBNAIL_SOURCES,
+    enqueue_thumbnail,
+    stale_thumbnail_ids,
+    warm_thumbnails,
+)
+
+MODELS = {label.split('.')[1].lower(): label for label in THUMBNAIL_SOURCES}
 
 
 class Command(BaseCommand):
-    help = 'Updates cached thumbnail URLs for models with images'
+    help = 'Pre-warms or refreshes cached thumbnail URLs for models with images'
 
     def add_arguments(self, parser):
         parser.add_argument(
@@ -21,19 +21,46 @@ class Command(BaseCommand):
             choices=list(MODELS.keys()),
             help='Only update thumbnails for this model (default: all models)',
         )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Regenerate every thumbnail, not just missing or stale ones',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=os.cpu_count() or 1,
+            help='Number of processes generating thumbnails (default: CPU count)',
+        )
+        parser.add_argument(
+            '--enqueue',
+            action='store_true',
+            help='Queue the work on the Celery thumbnail queue instead of running it here',
+        )
 
     def handle(self, *args, **kwargs):
         selected = kwargs['model']
-        targets = {selected: MODELS[selected]} if selected else MODELS
-
-        for name, (model_class, image_field) in targets.items():
-            qs = model_class.objects.filter(**{f'{image_field}__isnull': False})
-            self.stdout.write(f"Updating {qs.count()} {name} thumbnails...")
-            for obj in qs:
-                try:
-                    obj.save()
-                    self.stdout.write(f"  ✓ {name} {obj.id}")
-                except Exception as e:
-                    self.stdout.write(self.style.ERROR(f"  ✗ {name} {obj.id}: {e}"))
-
-        self.stdout.write(self.style.SUCCESS("Finished updating thumbnail caches"))
+        labels = [MODELS[selected]] if selected else list(MODELS.values())
+
+        jobs = []
+        for label in labels:
+            ids = stale_thumbnail_ids(label, force=kwargs['force'])
+            self.stdout.write(f"{len(ids)} {label} thumbnails to update")
+            jobs.extend((label, pk) for pk in ids)
+
+        if kwargs['enqueue']:
+            queued = sum(enqueue_thumbnail(label, pk) for label, pk in jobs)
+            self.stdout.write(self.style.SUCCESS(f"Queued {queued} thumbnails"))
+            return
+
+        failed = 0
+        for label, pk, url, error in warm_thumbnails(jobs, workers=kwargs['workers']):
+            if error:
+                failed += 1
+                self.stdout.write(self.style.ERROR(f"  ✗ {label} {pk}: {error}"))
+            else:
+                self.stdout.write(f"  ✓ {label} {pk}")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Finished updating thumbnail caches ({len(jobs) - failed} updated, {failed} failed)"
+        ))
@@ -0,0 +1,33 @@
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def populate_participant_counts(apps, schema_editor):
+    """Backfill Fast.participant_count from the Profile.fasts join table."""
+    Fast = apps.get_model('hub', 'Fast')
+    Profile = apps.get_model('hub', 'Profile')
+    memberships = (
+        Profile.fasts.through.objects.filter(fast_id=OuterRef('pk'))
+        .order_by()
+        .values('fast_id')
+        .annotate(total=Count('pk'))
+        .values('total')
+    )
+    Fast.objects.update(participant_count=Coalesce(Subquery(memberships), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hub', '0050_add_fast_designation_to_feast'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='fast',
+            name='participant_count',
+            field=models.IntegerField(default=0, editable=False, verbose_name='Participants'),
+        ),
+        migrations.RunPython(populate_participant_counts, migrations.RunPython.noop),
+    ]
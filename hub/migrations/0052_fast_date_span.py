@@ -0,0 +1,55 @@
+# Generated by Django 4.2.11 on 2026-10-18 21:17
+
+from django.db import migrations, models
+from django.db.models import Count, Max, Min, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def populate_date_spans(apps, schema_editor):
+    """Backfill start_date, end_date and total_days from each fast's days."""
+    Fast = apps.get_model('hub', 'Fast')
+    Day = apps.get_model('hub', 'Day')
+    days = Day.objects.filter(fast=OuterRef('pk')).order_by().values('fast')
+    Fast.objects.update(
+        start_date=Subquery(days.annotate(value=Min('date')).values('value')),
+        end_date=Subquery(days.annotate(value=Max('date')).values('value')),
+        total_days=Coalesce(Subquery(days.annotate(value=Count('pk')).values('value')), 0),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hub', '0051_fast_participant_count'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='day',
+            options={'base_manager_name': 'objects'},
+        ),
+        migrations.AddField(
+            model_name='fast',
+            name='end_date',
+            field=models.DateField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='fast',
+            name='start_date',
+            field=models.DateField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='fast',
+            name='total_days',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='fast',
+            index=models.Index(fields=['start_date', 'end_date'], name='hub_fast_start_d_642a99_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='fast',
+            index=models.Index(fields=['end_date'], name='hub_fast_end_dat_449c95_idx'),
+        ),
+        migrations.RunPython(populate_date_spans, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 4.2.11 on 2026-10-18 22:12
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hub', '0052_fast_date_span'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProfileFastStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('joined_count', models.PositiveIntegerField(default=0)),
+                ('completed_count', models.PositiveIntegerField(default=0)),
+                ('past_fast_days', models.PositiveIntegerField(default=0)),
+                ('checklist_uses', models.PositiveIntegerField(default=0)),
+                ('as_of', models.DateField(blank=True, help_text='User-local date the completed/past-day counts were computed for', null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('profile', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='fast_stats', to='hub.profile')),
+            ],
+            options={
+                'verbose_name_plural': 'profile fast stats',
+            },
+        ),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 4.2.11 on 2026-10-19 00:00
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import modeltrans.fields
+
+from hub.constants import normalize_book_name
+
+
+def populate_passage_contexts(apps, schema_editor):
+    """Seed the store with the newest complete active context of each passage, prompt and model."""
+    ReadingContext = apps.get_model('hub', 'ReadingContext')
+    PassageContext = apps.get_model('hub', 'PassageContext')
+    other_languages = [lang for lang in getattr(settings, 'MODELTRANS_AVAILABLE_LANGUAGES', ['en', 'hy']) if lang != 'en']
+
+    entries = {}
+    contexts = (
+        ReadingContext.objects.filter(active=True, prompt__isnull=False, prompt__applies_to='readings')
+        .select_related('reading', 'prompt')
+        .order_by('time_of_generation', 'pk')
+    )
+    for context in contexts.iterator():
+        i18n = context.i18n or {}
+        if not (context.text or '').strip() or not all((i18n.get(f'text_{lang}') or '').strip() for lang in other_languages):
+            continue
+        reading = context.reading
+        key = (normalize_book_name(reading.book) or '', reading.start_chapter, reading.start_verse,
+               reading.end_chapter, reading.end_verse, context.prompt_id, context.prompt.model)
+        entries[key] = PassageContext(
+            book_key=key[0], start_chapter=key[1], start_verse=key[2], end_chapter=key[3], end_verse=key[4],
+            prompt_id=key[5], model=key[6], text=context.text,
+            i18n={f'text_{lang}': i18n[f'text_{lang}'] for lang in other_languages},
+        )
+    PassageContext.objects.bulk_create(entries.values(), batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hub', '0053_profile_fast_stats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PassageContext',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('book_key', models.CharField(help_text='Normalized (English) book name', max_length=64)),
+                ('start_chapter', models.IntegerField()),
+                ('start_verse', models.IntegerField()),
+                ('end_chapter', models.IntegerField()),
+                ('end_verse', models.IntegerField()),
+                ('model', models.CharField(help_text='The LLM model the prompt used at generation time', max_length=32)),
+                ('text', models.TextField(help_text='The generated context text')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('i18n', modeltrans.fields.TranslationField(fields=('text',), required_languages=(), virtual_fields=True)),
+                ('prompt', models.ForeignKey(help_text='The prompt used to generate this context', on_delete=django.db.models.deletion.CASCADE, related_name='passage_contexts', to='hub.llmprompt')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='passagecontext',
+            constraint=models.UniqueConstraint(fields=('book_key', 'start_chapter', 'start_verse', 'end_chapter', 'end_verse', 'prompt', 'model'), name='unique_passage_context'),
+        ),
+        migrations.RunPython(populate_passage_contexts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,123 @@
+# Generated by Django 4.2.11 on 2026-10-19 00:00
+
+import django.contrib.postgres.search
+from django.contrib.postgres.search import SearchVector
+from django.db import connections, migrations, models
+import django.db.models.deletion
+
+# Snapshot of hub.services.search_service as of this migration, so later
+# changes to the live index do not change what this migration does.
+# model label -> (title fields, body fields); dotted paths follow relations
+SEARCH_SOURCES = {
+    'hub.Devotional': (('video.title',), ('description', 'video.description')),
+    'learning_resources.Video': (('title',), ('description',)),
+    'learning_resources.Article': (('title',), ('body',)),
+    'learning_resources.Recipe': (('title',), ('description', 'ingredients', 'directions')),
+    'prayers.Prayer': (('title',), ('text',)),
+    'prayers.PrayerSet': (('title',), ('description',)),
+}
+SEARCH_CONFIGS = {'en': 'english', 'hy': 'simple'}
+
+GIN_INDEXES = {
+    'hub_searchdoc_vector_en_gin': 'vector_en',
+    'hub_searchdoc_vector_hy_gin': 'vector_hy',
+}
+
+
+def create_gin_indexes(apps, schema_editor):
+    # GIN is PostgreSQL-only; other databases use the text_* fallback columns
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, column in GIN_INDEXES.items():
+        schema_editor.execute(f'CREATE INDEX {name} ON hub_searchdocument USING gin ({column})')
+
+
+def drop_gin_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name in GIN_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+def _field_text(obj, path, lang):
+    *relations, field = path.split('.')
+    for relation in relations:
+        obj = getattr(obj, relation, None)
+        if obj is None:
+            return ''
+    # Historical models have no modeltrans fields; translations are in i18n
+    if lang == 'en':
+        return getattr(obj, field, None) or ''
+    return (getattr(obj, 'i18n', None) or {}).get(f'{field}_{lang}') or ''
+
+
+def _join(obj, paths, lang):
+    return ' '.join(text for text in (_field_text(obj, path, lang) for path in paths) if text)
+
+
+def index_existing_objects(apps, schema_editor):
+    """Index the objects of every searchable model, so search works right after deploying."""
+    ContentType = apps.get_model('contenttypes', 'ContentType')
+    SearchDocument = apps.get_model('hub', 'SearchDocument')
+    postgresql = connections[SearchDocument.objects.db].vendor == 'postgresql'
+    for label, (title_paths, body_paths) in SEARCH_SOURCES.items():
+        model = apps.get_model(label)
+        content_type, _ = ContentType.objects.get_or_create(
+            app_label=model._meta.app_label, model=model._meta.model_name,
+        )
+        relations = {path.rsplit('.', 1)[0] for path in title_paths + body_paths if '.' in path}
+        for obj in model.objects.select_related(*relations).iterator(chunk_size=500):
+            texts = {
+                lang: (_join(obj, title_paths, lang), _join(obj, body_paths, lang))
+                for lang in SEARCH_CONFIGS
+            }
+            document, _ = SearchDocument.objects.update_or_create(
+                content_type=content_type,
+                object_id=obj.pk,
+                defaults={
+                    f'text_{lang}': f'{title} {body}'.strip().lower()
+                    for lang, (title, body) in texts.items()
+                },
+            )
+            if postgresql:
+                SearchDocument.objects.filter(pk=document.pk).update(**{
+                    f'vector_{lang}': (
+                        SearchVector(models.Value(title, output_field=models.TextField()),
+                                     config=SEARCH_CONFIGS[lang], weight='A')
+                        + SearchVector(models.Value(body, output_field=models.TextField()),
+                                       config=SEARCH_CONFIGS[lang], weight='B')
+                    )
+                    for lang, (title, body) in texts.items()
+                })
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('hub', '0054_passage_context'),
+        ('learning_resources', '0008_article_i18n_recipe_i18n_video_i18n_and_more'),
+        ('prayers', '0008_prayerrequest_icon'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('text_en', models.TextField(blank=True, default='')),
+                ('text_hy', models.TextField(blank=True, default='')),
+                ('vector_en', django.contrib.postgres.search.SearchVectorField(null=True)),
+                ('vector_hy', django.contrib.postgres.search.SearchVectorField(null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('content_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='contenttypes.contenttype')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='searchdocument',
+            constraint=models.UniqueConstraint(fields=('content_type', 'object_id'), name='unique_search_document'),
+        ),
+        migrations.RunPython(create_gin_indexes, drop_gin_indexes),
+        migrations.RunPython(index_existing_objects, migrations.RunPython.noop),
+    ]
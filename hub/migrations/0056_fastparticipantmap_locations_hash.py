@@ -0,0 +1,18 @@
+# Generated by Django 4.2.11 on 2026-10-19 00:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hub', '0055_search_document'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='fastparticipantmap',
+            name='locations_hash',
+            field=models.CharField(blank=True, default='', max_length=64),
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 4.2.11 on 2026-10-19 01:05
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+from hub.services.participant_density import rebuild_density
+
+
+def bin_existing_participants(apps, schema_editor):
+    """Bin the participants of every fast, so density maps are complete right after deploying."""
+    Fast = apps.get_model('hub', 'Fast')
+    Profile = apps.get_model('hub', 'Profile')
+    ParticipantDensityCell = apps.get_model('hub', 'ParticipantDensityCell')
+    fast_ids = Profile.fasts.through.objects.filter(
+        profile__latitude__isnull=False, profile__longitude__isnull=False,
+    ).values_list('fast_id', flat=True).distinct()
+    for fast in Fast.objects.filter(pk__in=fast_ids).iterator():
+        rebuild_density(fast, profile_model=Profile, cell_model=ParticipantDensityCell)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hub', '0056_fastparticipantmap_locations_hash'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ParticipantDensityCell',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('zoom', models.PositiveSmallIntegerField()),
+                ('x', models.IntegerField()),
+                ('y', models.IntegerField()),
+                ('count', models.IntegerField(default=0)),
+                ('longitude_sum', models.FloatField(default=0.0)),
+                ('latitude_sum', models.FloatField(default=0.0)),
+                ('fast', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='density_cells', to='hub.fast')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='participantdensitycell',
+            constraint=models.UniqueConstraint(fields=('fast', 'zoom', 'x', 'y'), name='unique_participant_density_cell'),
+        ),
+        migrations.RunPython(bin_existing_participants, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.11 on 2026-10-19 01:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hub', '0057_participant_density_cell'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LLMBatch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('reading_contexts', 'Reading contexts'), ('feast_contexts', 'Feast contexts'), ('feast_designations', 'Feast designations')], max_length=32)),
+                ('model', models.CharField(help_text='The LLM model the requests were sent to', max_length=32)),
+                ('provider_batch_id', models.CharField(max_length=128, unique=True)),
+                ('params', models.JSONField(default=dict, help_text='What to write once the results arrive')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('completed', 'Completed'), ('expired', 'Expired')], db_index=True, default='pending', max_length=16)),
+                ('submitted_at', models.DateTimeField(auto_now_add=True)),
+                ('last_polled_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'LLM batch',
+                'verbose_name_plural': 'LLM batches',
+            },
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 4.2.11 on 2026-10-19 02:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hub', '0058_llm_batch'),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='passagecontext',
+            name='unique_passage_context',
+        ),
+        migrations.AddField(
+            model_name='passagecontext',
+            name='prompt_digest',
+            field=models.CharField(default='', help_text="SHA-256 of the prompt's role and text at generation time", max_length=64),
+        ),
+        migrations.AddConstraint(
+            model_name='passagecontext',
+            constraint=models.UniqueConstraint(fields=('book_key', 'start_chapter', 'start_verse', 'end_chapter', 'end_verse', 'prompt', 'model', 'prompt_digest'), name='unique_passage_context'),
+        ),
+    ]
@@ -2,11 +2,16 @@
 
 import logging
 
+import pytz
+
 from django.contrib.auth.models import User
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.postgres.search import SearchVectorField
 from django.core.exceptions import ValidationError
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
-from django.db.models import constraints
+from django.db.models import Count, F, Max, Min, OuterRef, Q, Subquery, constraints
+from django.db.models.functions import Coalesce
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from django.utils import timezone
@@ -20,8 +25,8 @@ import bahk.settings as settings
 from hub.constants import (
     CATENA_ABBREV_FOR_BOOK_NORMALIZED,
     CATENA_HOME_PAGE_URL,
-    DAYS_TO_CACHE_THUMBNAIL,
 )
+from hub.services.thumbnail_service import sync_thumbnail
 from learning_resources.models import Video
 from learning_resources.utils import devotional_set_image_upload_path
 
@@ -110,62 +115,40 @@ class Fast(models.Model):
         help_text="URL to a link to learn more--must include protocol (e.g. https://)",
     )
 
-    # Track changes to the image field
-    tracker = FieldTracker(fields=["image"])
+    # Denormalized number of profiles that joined this fast. Maintained with atomic
+    # F() updates by the Profile.fasts m2m signal (see hub.signals); repair drift
+    # with the `reconcile_participant_counts` management command.
+    participant_count = models.IntegerField(default=0, editable=False, verbose_name="Participants")
+
+    # Denormalized date span of the fast's days, kept current by Day signals and
+    # DayQuerySet.update() (see Fast.refresh_date_spans)
+    start_date = models.DateField(null=True, blank=True, editable=False)
+    end_date = models.DateField(null=True, blank=True, editable=False)
+    total_days = models.IntegerField(default=0, editable=False)
+
+    # Track changes to the image field (and church, for calendar cache invalidation)
+    tracker = FieldTracker(fields=["image", "church"])
+
+    # Fields maintained outside of save() that a (possibly stale) instance must not overwrite
+    DENORMALIZED_FIELDS = ("participant_count", "start_date", "end_date", "total_days")
 
     def save(self, **kwargs):
         # First check if this is a new instance or if the image field has changed
         is_new_image = (
             self._state.adding
-            or "image" in kwargs.get("update_fields", [])
+            or "image" in (kwargs.get("update_fields") or [])
             or (not self._state.adding and self.tracker.has_changed("image"))
         )
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.DENORMALIZED_FIELDS
+            ]
         super().save(**kwargs)
 
-        # Handle thumbnail URL caching after the instance and image are fully saved to S3
-        if self.image:
-            # Update cache if:
-            # 1. No cached URL exists
-            # 2. Image was changed/uploaded
-            # 3. Cache is older than 7 days
-            should_update_cache = (
-                not self.cached_thumbnail_url
-                or is_new_image
-                or (
-                    self.cached_thumbnail_updated
-                    and (timezone.now() - self.cached_thumbnail_updated).days
-                    >= DAYS_TO_CACHE_THUMBNAIL
-                )
-            )
-
-            if should_update_cache:
-                try:
-                    # Force generation of the thumbnail and wait for S3 upload
-                    thumbnail = self.image_thumbnail.generate()
-
-                    # Get the S3 URL after the file has been uploaded
-                    self.cached_thumbnail_url = self.image_thumbnail.url
-                    self.cached_thumbnail_updated = timezone.now()
-
-                    # Save again to update the cache fields only
-                    super().save(
-                        update_fields=[
-                            "cached_thumbnail_url",
-                            "cached_thumbnail_updated",
-                        ]
-                    )
-                except Exception as e:
-                    logging.error(
-                        f"Error caching S3 thumbnail URL for Fast {self.id}: {e}"
-                    )
-        else:
-            # Clear cached URL if image is removed
-            if self.cached_thumbnail_url or self.cached_thumbnail_updated:
-                self.cached_thumbnail_url = None
-                self.cached_thumbnail_updated = None
-                super().save(
-                    update_fields=["cached_thumbnail_url", "cached_thumbnail_updated"]
-                )
+        # Thumbnails are generated in the background (see hub.services.thumbnail_service)
+        sync_thumbnail(self, image_changed=is_new_image)
 
         # Update year if days exist
         if self.days.exists():
@@ -198,8 +181,25 @@ class Fast(models.Model):
         indexes = [
             models.Index(fields=["church"]),
             models.Index(fields=["culmination_feast_date"]),
+            models.Index(fields=["start_date", "end_date"]),
+            models.Index(fields=["end_date"]),
         ]
 
+    @classmethod
+    def refresh_date_spans(cls, fast_ids):
+        """Recompute start_date, end_date and total_days from Day rows for the given fasts."""
+        fast_ids = {fast_id for fast_id in fast_ids if fast_id is not None}
+        if not fast_ids:
+            return
+        days = Day.objects.filter(fast=OuterRef("pk")).order_by().values("fast")
+        cls.objects.filter(pk__in=fast_ids).update(
+            start_date=Subquery(days.annotate(value=Min("date")).values("value")),
+            end_date=Subquery(days.annotate(value=Max("date")).values("value")),
+            total_days=Coalesce(Subquery(days.annotate(value=Count("pk")).values("value")), 0),
+        )
+        # Members' completed/past-day counts depend on the span; recompute them on next read
+        ProfileFastStats.objects.filter(profile__fasts__in=fast_ids).update(as_of=None)
+
     @property
     def modal_id(self):
         return f"fastModal_{self.id}"
@@ -273,7 +273,7 @@ class Profile(models.Model):
     )
 
     # Track changes to the profile_image field
-    tracker = FieldTracker(fields=["profile_image", "location", "timezone"])
+    tracker = FieldTracker(fields=["profile_image", "location", "timezone", "latitude", "longitude"])
 
     def geocode_location(self):
         """
@@ -315,50 +315,8 @@ class Profile(models.Model):
         # Call the parent save method
         super().save(**kwargs)
 
-        # Handle thumbnail URL caching after the instance and image are fully saved to S3
-        if self.profile_image:
-            # Update cache if:
-            # 1. No cached URL exists
-            # 2. Image was changed/uploaded
-            # 3. Cache is older than 7 days
-            should_update_cache = (
-                not self.cached_thumbnail_url
-                or is_new_image
-                or (
-                    self.cached_thumbnail_updated
-                    and (timezone.now() - self.cached_thumbnail_updated).days
-                    >= DAYS_TO_CACHE_THUMBNAIL
-                )
-            )
-
-            if should_update_cache:
-                try:
-                    # Force generation of the thumbnail and wait for S3 upload
-                    thumbnail = self.profile_image_thumbnail.generate()
-
-                    # Get the S3 URL after the file has been uploaded
-                    self.cached_thumbnail_url = self.profile_image_thumbnail.url
-                    self.cached_thumbnail_updated = timezone.now()
-
-                    # Save again to update the cache fields only
-                    super().save(
-                        update_fields=[
-                            "cached_thumbnail_url",
-                            "cached_thumbnail_updated",
-                        ]
-                    )
-                except Exception as e:
-                    logging.error(
-                        f"Error caching S3 thumbnail URL for Profile {self.id}: {e}"
-                    )
-        else:
-            # Clear cached URL if image is removed
-            if self.cached_thumbnail_url or self.cached_thumbnail_updated:
-                self.cached_thumbnail_url = None
-                self.cached_thumbnail_updated = None
-                super().save(
-                    update_fields=["cached_thumbnail_url", "cached_thumbnail_updated"]
-                )
+        # Thumbnails are generated in the background (see hub.services.thumbnail_service)
+        sync_thumbnail(self, image_changed=is_new_image)
 
         # If location changed, trigger async geocoding
         if location_changed and self.location:
@@ -368,6 +326,128 @@ class Profile(models.Model):
         return self.user.email
 
 
+class ProfileFastStats(models.Model):
+    """Per-user fasting statistics served by FastStatsView as a single row.
+
+    The membership counts are refreshed by the Profile.fasts signal,
+    ``checklist_uses`` is incremented by the checklist tracking endpoint, and
+    the date-dependent counts are rolled over to each user's new local date by
+    ``rollover_profile_fast_stats_task``. A row whose ``as_of`` is not the
+    user's local date (or is null, after a fast's days changed) is recomputed
+    on read.
+    """
+
+    profile = models.OneToOneField(
+        Profile, on_delete=models.CASCADE, related_name="fast_stats"
+    )
+    joined_count = models.PositiveIntegerField(default=0)
+    completed_count = models.PositiveIntegerField(default=0)
+    past_fast_days = models.PositiveIntegerField(default=0)
+    checklist_uses = models.PositiveIntegerField(default=0)
+    as_of = models.DateField(
+        null=True,
+        blank=True,
+        help_text="User-local date the completed/past-day counts were computed for",
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name_plural = "profile fast stats"
+
+    def __str__(self):
+        return f"Fast stats for {self.profile}"
+
+    @staticmethod
+    def local_today(profile):
+        """The current date in the profile's timezone (UTC if unset or unknown)."""
+        try:
+            tz = pytz.timezone(profile.timezone) if profile.timezone else pytz.UTC
+        except pytz.UnknownTimeZoneError:
+            tz = pytz.UTC
+        return timezone.localdate(timezone=tz)
+
+    @staticmethod
+    def membership_counts(profile_id, as_of):
+        """Joined, completed and past-day counts for a profile's fasts as of a date."""
+        counts = Fast.objects.filter(profiles=profile_id).aggregate(
+            joined_count=Count("pk"),
+            completed_count=Count("pk", filter=Q(end_date__lt=as_of)),
+        )
+        counts["past_fast_days"] = Day.objects.filter(
+            fast__profiles=profile_id, date__lte=as_of
+        ).count()
+        return counts
+
+    @classmethod
+    def for_profile(cls, profile):
+        """Return the profile's stats row, building or rolling it over if needed."""
+        today = cls.local_today(profile)
+        stats = cls.objects.filter(profile=profile).first()
+        if stats is None or stats.as_of != today:
+            stats = cls.refresh(profile, as_of=today)
+        return stats
+
+    @classmethod
+    def refresh(cls, profile, as_of=None):
+        """Recompute the membership counts for ``profile`` and return its row."""
+        as_of = as_of or cls.local_today(profile)
+        counts = cls.membership_counts(profile.pk, as_of)
+        stats, created = cls.objects.get_or_create(
+            profile=profile,
+            defaults={**counts, "as_of": as_of, "checklist_uses": _count_checklist_uses(profile.user_id)},
+        )
+        if not created:
+            for field, value in counts.items():
+                setattr(stats, field, value)
+            stats.as_of = as_of
+            stats.save(update_fields=[*counts, "as_of", "updated_at"])
+        return stats
+
+    @classmethod
+    def record_checklist_use(cls, profile):
+        """Count one checklist use, building the row from the event log if it is missing."""
+        if not cls.objects.filter(profile=profile).update(
+            checklist_uses=F("checklist_uses") + 1, updated_at=timezone.now()
+        ):
+            cls.for_profile(profile)
+
+
+def _count_checklist_uses(user_id):
+    """Backfill value for checklist_uses from the events log."""
+    try:
+        from events.models import Event, EventType
+    except ImportError:
+        return 0
+    return Event.objects.filter(
+        user_id=user_id, event_type__code=EventType.CHECKLIST_USED
+    ).count()
+
+
+class DayQuerySet(models.QuerySet):
+    """QuerySet that keeps the date span columns on Fast in step with bulk updates.
+
+    Reverse-FK helpers such as ``fast.days.add(...)``/``set(...)`` move days with
+    ``QuerySet.update()``, which bypasses the Day save signals.
+    """
+
+    def update(self, **kwargs):
+        if not {"fast", "fast_id", "date"} & kwargs.keys():
+            return super().update(**kwargs)
+        day_ids = list(self.values_list("pk", flat=True))
+        affected = set(self.values_list("fast_id", flat=True))
+        rows = super().update(**kwargs)
+        affected.update(Day.objects.filter(pk__in=day_ids).values_list("fast_id", flat=True))
+        Fast.refresh_date_spans(affected)
+
+        from hub.utils import invalidate_fast_calendar_cache, invalidate_fast_detail_cache
+
+        invalidate_fast_calendar_cache(
+            Fast.objects.filter(pk__in=affected - {None}).values_list("church_id", flat=True)
+        )
+        invalidate_fast_detail_cache(affected)
+        return rows
+
+
 class Day(models.Model):
     """Model for a day in time."""
 
@@ -382,10 +462,16 @@ class Day(models.Model):
         default=Church.get_default_pk,
     )
 
+    objects = DayQuerySet.as_manager()
+
+    # Track the fast so a day moved between fasts refreshes both date spans
+    tracker = FieldTracker(fields=["fast"])
+
     def __str__(self):
         return f'{self.date.strftime("%Y-%m-%d")} ({f"{self.fast.name}, " if self.fast else ""}{self.church.name})'
 
     class Meta:
+        base_manager_name = "objects"
         indexes = [
             models.Index(fields=["fast", "date"]),
             models.Index(fields=["date"]),
@@ -393,6 +479,26 @@ class Day(models.Model):
         ]
 
 
+@receiver(post_save, sender=Day)
+def refresh_fast_date_span_on_day_save(sender, instance, **kwargs):
+    """Refresh the date span of the day's fast (and its previous fast if it moved)."""
+    Fast.refresh_date_spans({instance.fast_id, instance.tracker.previous("fast")})
+    _reload_cached_fast_date_span(instance)
+
+
+@receiver(post_delete, sender=Day)
+def refresh_fast_date_span_on_day_delete(sender, instance, **kwargs):
+    """Refresh the date span of the fast the deleted day belonged to."""
+    Fast.refresh_date_spans({instance.fast_id})
+    _reload_cached_fast_date_span(instance)
+
+
+def _reload_cached_fast_date_span(day):
+    """Keep an in-memory Fast attached to the day in step with the stored span."""
+    if day.fast_id is not None and Day.fast.is_cached(day):
+        day.fast.refresh_from_db(fields=["start_date", "end_date", "total_days"])
+
+
 class DevotionalSet(models.Model):
     """Model for an ordered collection of devotionals based on a fast."""
 
@@ -445,50 +551,8 @@ class DevotionalSet(models.Model):
 
         super().save(**kwargs)
 
-        # Handle thumbnail URL caching after the instance and image are fully saved to S3
-        if self.image:
-            # Update cache if:
-            # 1. No cached URL exists
-            # 2. Image was changed/uploaded
-            # 3. Cache is older than 7 days
-            should_update_cache = (
-                not self.cached_thumbnail_url
-                or is_new_image
-                or (
-                    self.cached_thumbnail_updated
-                    and (timezone.now() - self.cached_thumbnail_updated).days
-                    >= DAYS_TO_CACHE_THUMBNAIL
-                )
-            )
-
-            if should_update_cache:
-                try:
-                    # Force generation of the thumbnail and wait for S3 upload
-                    thumbnail = self.thumbnail.generate()
-
-                    # Get the S3 URL after the file has been uploaded
-                    self.cached_thumbnail_url = self.thumbnail.url
-                    self.cached_thumbnail_updated = timezone.now()
-
-                    # Save again to update the cache fields only
-                    super().save(
-                        update_fields=[
-                            "cached_thumbnail_url",
-                            "cached_thumbnail_updated",
-                        ]
-                    )
-                except Exception as e:
-                    logging.error(
-                        f"Error caching S3 thumbnail URL for DevotionalSet {self.id}: {e}"
-                    )
-        else:
-            # Clear cached URL if image is removed
-            if self.cached_thumbnail_url or self.cached_thumbnail_updated:
-                self.cached_thumbnail_url = None
-                self.cached_thumbnail_updated = None
-                super().save(
-                    update_fields=["cached_thumbnail_url", "cached_thumbnail_updated"]
-                )
+        # Thumbnails are generated in the background (see hub.services.thumbnail_service)
+        sync_thumbnail(self, image_changed=is_new_image)
 
     # Class-level cache invalidation counter
     _cache_version = 0
@@ -780,6 +844,8 @@ class FastParticipantMap(models.Model):
     last_updated = models.DateTimeField(auto_now=True)
     participant_count = models.IntegerField(default=0)
     format = models.CharField(max_length=10, default="svg")  # 'png' or 'svg'
+    # SHA-256 of the participant coordinates the map was rendered from
+    locations_hash = models.CharField(max_length=64, blank=True, default="")
 
     @property
     def map_url(self):
@@ -798,6 +864,31 @@ class FastParticipantMap(models.Model):
         ]
 
 
+class ParticipantDensityCell(models.Model):
+    """Number of a fast's participants in one grid cell at one zoom level.
+
+    Maintained incrementally by hub.signals as profiles join or leave fasts or
+    change coordinates; see hub.services.participant_density.
+    """
+
+    fast = models.ForeignKey(Fast, on_delete=models.CASCADE, related_name="density_cells")
+    zoom = models.PositiveSmallIntegerField()
+    x = models.IntegerField()
+    y = models.IntegerField()
+    count = models.IntegerField(default=0)
+    # Sums of the participants' coordinates, for the cell's centroid
+    longitude_sum = models.FloatField(default=0.0)
+    latitude_sum = models.FloatField(default=0.0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["fast", "zoom", "x", "y"], name="unique_participant_density_cell"),
+        ]
+
+    def __str__(self):
+        return f"{self.fast} z{self.zoom} ({self.x}, {self.y}): {self.count}"
+
+
 class GeocodingCache(models.Model):
     """
     Cache for geocoded locations to avoid repeated API calls.
@@ -948,6 +1039,53 @@ class ReadingContext(models.Model):
         return f"Context for {self.reading}: {self.text[:100]}"
 
 
+class PassageContext(models.Model):
+    """Generated reading context keyed by passage, so it outlives the Reading rows.
+
+    The lectionary repeats every year: a new Reading for a passage that already
+    has a context generated with the active prompt and model copies it instead
+    of calling the LLM again.  Entries are independent of Reading, so pruning
+    old readings does not discard them.  ``prompt_digest`` records the prompt's
+    text, so editing the prompt in place stops its old contexts being reused.
+    """
+
+    book_key = models.CharField(max_length=64, help_text="Normalized (English) book name")
+    start_chapter = models.IntegerField()
+    start_verse = models.IntegerField()
+    end_chapter = models.IntegerField()
+    end_verse = models.IntegerField()
+    prompt = models.ForeignKey(
+        LLMPrompt,
+        on_delete=models.CASCADE,
+        related_name="passage_contexts",
+        help_text="The prompt used to generate this context",
+    )
+    model = models.CharField(max_length=32, help_text="The LLM model the prompt used at generation time")
+    prompt_digest = models.CharField(
+        max_length=64, default="", help_text="SHA-256 of the prompt's role and text at generation time",
+    )
+    text = models.TextField(help_text="The generated context text")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    # Translations for user-facing fields
+    i18n = TranslationField(fields=('text',))
+
+    class Meta:
+        constraints = [
+            constraints.UniqueConstraint(
+                fields=[
+                    "book_key", "start_chapter", "start_verse", "end_chapter", "end_verse",
+                    "prompt", "model", "prompt_digest",
+                ],
+                name="unique_passage_context",
+            ),
+        ]
+
+    def __str__(self):
+        return (f"Context for {self.book_key} {self.start_chapter}:{self.start_verse}-"
+                f"{self.end_chapter}:{self.end_verse} ({self.model})")
+
+
 class FeastContext(models.Model):
     """Model for storing context for feast days, typically generated by an LLM."""
 
@@ -999,6 +1137,41 @@ class FeastContext(models.Model):
         return f"Context for {self.feast}: {self.text[:100]}"
 
 
+class LLMBatch(models.Model):
+    """A provider batch of LLM requests awaiting results.
+
+    Bulk regeneration submits its prompts through the provider's batch API and
+    stores the batch ID here; ``poll_llm_batch_task`` checks on it until it
+    has ended and then writes the results described by ``kind`` and ``params``.
+    """
+
+    class Kind(models.TextChoices):
+        READING_CONTEXTS = "reading_contexts", "Reading contexts"
+        FEAST_CONTEXTS = "feast_contexts", "Feast contexts"
+        FEAST_DESIGNATIONS = "feast_designations", "Feast designations"
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        COMPLETED = "completed", "Completed"
+        EXPIRED = "expired", "Expired"
+
+    kind = models.CharField(max_length=32, choices=Kind.choices)
+    model = models.CharField(max_length=32, help_text="The LLM model the requests were sent to")
+    provider_batch_id = models.CharField(max_length=128, unique=True)
+    params = models.JSONField(default=dict, help_text="What to write once the results arrive")
+    status = models.CharField(max_length=16, choices=Status.choices, default=Status.PENDING, db_index=True)
+    submitted_at = models.DateTimeField(auto_now_add=True)
+    last_polled_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "LLM batch"
+        verbose_name_plural = "LLM batches"
+
+    def __str__(self):
+        return f"{self.get_kind_display()} batch {self.provider_batch_id} ({self.status})"
+
+
 class PatristicQuote(models.Model):
     """Model for storing patristic quotes from Church Fathers and Saints."""
 
@@ -1048,3 +1221,29 @@ class PatristicQuote(models.Model):
         # Return first 50 characters of the quote text
         from django.utils.text import Truncator
         return f"{Truncator(self.text).chars(50)} - {self.attribution}"
+
+
+class SearchDocument(models.Model):
+    """Precomputed full-text search document of one searchable object.
+
+    Maintained by hub.services.search_service.  ``vector_en`` uses the
+    'english' text search configuration on the English text and
+    ``vector_hy`` the 'simple' one on the Armenian translations; both have
+    GIN indexes on PostgreSQL (created in migration 0055).  The lowercased
+    ``text_*`` columns back the fallback search on other databases.
+    """
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.PositiveBigIntegerField()
+    text_en = models.TextField(blank=True, default='')
+    text_hy = models.TextField(blank=True, default='')
+    vector_en = SearchVectorField(null=True)
+    vector_hy = SearchVectorField(null=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['content_type', 'object_id'], name='unique_search_document'),
+        ]
+
+    def __str__(self):
+        return f"Search document for {self.content_type.model} {self.object_id}"
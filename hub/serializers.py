@@ -4,8 +4,6 @@ from django.utils import timezone  # Add missing timezone import
 
 from better_profanity import profanity
 from django.contrib.auth.models import Group, User
-from django.db.models.signals import post_save
-from django.dispatch import receiver
 from rest_framework import serializers
 from django.utils.translation import activate
 from django.contrib.auth.password_validation import validate_password
@@ -26,18 +24,7 @@ class ProfileSerializer(serializers.ModelSerializer, ThumbnailCacheMixin):
     thumbnail = serializers.SerializerMethodField()
 
     def get_thumbnail(self, obj):
-        if obj.profile_image:
-            # Try to get/update cached URL
-            cached_url = self.update_thumbnail_cache(obj, 'profile_image', 'profile_image_thumbnail')
-            if cached_url:
-                return cached_url
-            
-            # Fall back to direct thumbnail URL if caching fails
-            try:
-                return obj.profile_image_thumbnail.url
-            except Exception:
-                return None
-        return None
+        return self.get_cached_thumbnail_url(obj)
 
     class Meta:
         model = models.Profile
@@ -163,22 +150,6 @@ class ChurchSerializer(serializers.ModelSerializer):
         fields = ["id", "name"]
 
 
-# Add signal to handle thumbnail caching
-@receiver(post_save, sender=models.Fast)
-def update_thumbnail_cache(sender, instance, **kwargs):
-    """Update thumbnail cache in the background after save."""
-    if instance.image and not instance.cached_thumbnail_url:
-        try:
-            url = instance.image_thumbnail.url
-            # Use update to avoid recursive signal triggering
-            models.Fast.objects.filter(id=instance.id).update(
-                cached_thumbnail_url=url,
-                cached_thumbnail_updated=timezone.now()
-            )
-        except Exception as e:
-            logging.error(f"Error caching thumbnail URL for Fast {instance.id}: {e}")
-
-
 class FastSerializer(serializers.ModelSerializer, ThumbnailCacheMixin):
     church = ChurchSerializer()
     participant_count = serializers.SerializerMethodField()
@@ -207,25 +178,18 @@ class FastSerializer(serializers.ModelSerializer, ThumbnailCacheMixin):
         return obj.id in self._user_fast_ids
 
     def get_participant_count(self, obj):
-        """Use annotated count if available, otherwise query"""
-        if hasattr(obj, 'participant_count'):
-            return obj.participant_count
-        return obj.profiles.count()
+        """Read the denormalized counter maintained by the Profile.fasts signal"""
+        return obj.participant_count
     
     def get_countdown(self, obj):
-        """Use cached current_date and annotated end_date to avoid extra queries"""
+        """Use cached current_date and the stored end_date to avoid extra queries"""
         if obj.culmination_feast and obj.culmination_feast_date:
             days_to_feast = (obj.culmination_feast_date - self.current_date).days
             if days_to_feast < 0:
                 return f"{obj.culmination_feast} has passed"
             return f"<span class='days_to_finish'>{days_to_feast}</span> day{'' if days_to_feast == 1 else 's'} until {obj.culmination_feast}"
 
-        # Use annotated end_date if available, otherwise fall back to aggregate
-        latest_day = getattr(obj, 'end_date', None)
-        if latest_day is None:
-            from django.db.models import Max
-            latest_day = obj.days.aggregate(max_date=Max('date'))['max_date']
-
+        latest_day = obj.end_date
         if not latest_day:
             return f"No days available for {obj.name}"
 
@@ -244,18 +208,12 @@ class FastSerializer(serializers.ModelSerializer, ThumbnailCacheMixin):
         return None
 
     def get_start_date(self, obj):
-        """Use annotated value if available, otherwise query"""
-        if hasattr(obj, 'start_date'):
-            return obj.start_date
-        first_day = obj.days.order_by('date').values_list('date', flat=True).first()
-        return first_day
+        """Stored first day of the fast, maintained from its Day rows"""
+        return obj.start_date
 
     def get_end_date(self, obj):
-        """Use annotated value if available, otherwise query"""
-        if hasattr(obj, 'end_date'):
-            return obj.end_date
-        last_day = obj.days.order_by('-date').values_list('date', flat=True).first()
-        return last_day
+        """Stored last day of the fast, maintained from its Day rows"""
+        return obj.end_date
     
     def get_has_passed(self, obj):
         """Use cached current_date and optimize end_date check"""
@@ -272,8 +230,8 @@ class FastSerializer(serializers.ModelSerializer, ThumbnailCacheMixin):
         return next_day
     
     def get_total_number_of_days(self, obj):
-        """Use annotated value if available, excluding Day 0 from the count."""
-        total = obj.total_days if hasattr(obj, 'total_days') else obj.days.count()
+        """Use the stored day count, excluding Day 0 from the count."""
+        total = obj.total_days
         if obj.has_day_zero:
             total -= 1
         return total
@@ -298,20 +256,8 @@ class FastSerializer(serializers.ModelSerializer, ThumbnailCacheMixin):
             return None
 
     def get_thumbnail(self, obj):
-        """Get the thumbnail URL, preferring cached version to avoid S3 calls"""
-        if obj.image:
-            # Try to get/update cached URL
-            cached_url = self.update_thumbnail_cache(obj, 'image', 'image_thumbnail')
-            if cached_url:
-                return cached_url
-            
-            # Fall back to direct thumbnail URL if caching fails
-            try:
-                return obj.image_thumbnail.url
-            except Exception as e:
-                logging.error(f"Error getting thumbnail URL for Fast {obj.id}: {e}")
-                return None
-        return None
+        """Get the cached thumbnail URL (generated in the background, never during serialization)"""
+        return self.get_cached_thumbnail_url(obj)
 
     class Meta:
         model = models.Fast
@@ -341,9 +287,43 @@ class FastSerializer(serializers.ModelSerializer, ThumbnailCacheMixin):
     def _user_fast_ids(self):
         """Cache the list of fast IDs the user has joined"""
         request = self.context.get('request')
-        if not request or not request.user.is_authenticated:
+        # Shared payloads are user-independent; views overlay `joined` per request
+        if self.context.get('shared_payload') or not request or not request.user.is_authenticated:
             return set()
-        return set(request.user.profile.fasts.values_list('id', flat=True))
+        from hub.utils import get_joined_fast_ids
+        return get_joined_fast_ids(request.user)
+
+
+class FastCalendarSerializer(serializers.ModelSerializer):
+    """Compact, user-independent fast payload for the calendar endpoint.
+
+    Only reads columns stored on Fast so a month of fasts serializes without
+    extra queries or thumbnail generation.
+    """
+    total_number_of_days = serializers.SerializerMethodField()
+    thumbnail = serializers.SerializerMethodField()
+
+    def get_total_number_of_days(self, obj):
+        """Stored day count, excluding Day 0 from the count."""
+        return obj.total_days - 1 if obj.has_day_zero else obj.total_days
+
+    def get_thumbnail(self, obj):
+        return obj.cached_thumbnail_url
+
+    class Meta:
+        model = models.Fast
+        fields = ['id', 'name', 'culmination_feast', 'culmination_feast_date',
+                  'start_date', 'end_date', 'total_number_of_days', 'has_day_zero',
+                  'thumbnail', 'url']
+
+    def to_representation(self, instance):
+        lang = self.context.get('lang') or (self.context.get('request').query_params.get('lang') if self.context.get('request') else None) or 'en'
+        activate(lang)
+        data = super().to_representation(instance)
+        data['name'] = getattr(instance, 'name_i18n', instance.name)
+        data['culmination_feast'] = getattr(instance, 'culmination_feast_i18n', instance.culmination_feast)
+        return data
+
 
 class JoinFastSerializer(serializers.ModelSerializer):
     fast_id = serializers.IntegerField(write_only=True)
@@ -353,70 +333,35 @@ class JoinFastSerializer(serializers.ModelSerializer):
         fields = ['fast_id']
 
 class FastStatsSerializer(serializers.Serializer):
+    """Serializes a profile's fast statistics from its ProfileFastStats row."""
     joined_fasts = serializers.SerializerMethodField()
     total_fasts = serializers.SerializerMethodField()
     total_fast_days = serializers.SerializerMethodField()
     completed_fasts = serializers.SerializerMethodField()
     checklist_uses = serializers.SerializerMethodField()
 
+    @cached_property
+    def _stats(self):
+        """Stats row passed in by the view, or loaded for the serialized profile."""
+        return self.context.get('stats') or models.ProfileFastStats.for_profile(self.instance)
+
     def get_joined_fasts(self, obj):
         return obj.fasts.values_list('id', flat=True)
 
     def get_total_fasts(self, obj):
         # returns the total number of fasts the user has joined
-        return obj.fasts.count()
+        return self._stats.joined_count
     
     def get_total_fast_days(self, obj):
-        # Optimized version: Use database aggregation instead of N+1 queries
-        # Only count days that have already occurred (not future dates)
-        from django.db.models import Count, Q
-        from django.utils import timezone
-        import pytz
-        
-        # Get timezone from context, default to UTC
-        tz = self.context.get('tz') or pytz.UTC
-        today = timezone.localdate(timezone=tz)
-        
-        # Single query with aggregation - much more efficient
-        # Filter to only count days that have occurred (date <= today)
-        result = obj.fasts.aggregate(
-            total_days=Count('days', filter=Q(days__date__lte=today), distinct=True)
-        )
-        return result['total_days'] or 0
+        # Only days that have already occurred (not future dates)
+        return self._stats.past_fast_days
     
     def get_completed_fasts(self, obj):
-        # Count fasts where the end date has passed
-        from django.db.models import Max
-        from django.utils import timezone
-        import pytz
-        
-        # Get timezone from context, default to UTC
-        tz = self.context.get('tz') or pytz.UTC
-        today = timezone.localdate(timezone=tz)
-        
-        # Annotate each fast with its end_date (max date of its days)
-        # Then filter for fasts where end_date is before today
-        completed = obj.fasts.annotate(
-            end_date=Max('days__date')
-        ).filter(end_date__lt=today).count()
-        
-        return completed
+        # Fasts whose end date has passed
+        return self._stats.completed_count
     
     def get_checklist_uses(self, obj):
-        # Count CHECKLIST_USED events for this user
-        # Note: This depends on Event records not being deleted
-        try:
-            from events.models import Event, EventType
-            
-            checklist_count = Event.objects.filter(
-                user=obj.user,
-                event_type__code=EventType.CHECKLIST_USED
-            ).count()
-            
-            return checklist_count
-        except Exception:
-            # If events app is not available or there's an error, return 0
-            return 0
+        return self._stats.checklist_uses
     
     class Meta:
         fields = ['joined_fasts', 'total_fasts', 'total_fast_days', 'completed_fasts', 'checklist_uses']
@@ -427,7 +372,7 @@ class DaySerializer(serializers.ModelSerializer):
         model = models.Day
         fields = ['id', 'date', 'fast', 'church']
 
-class ParticipantSerializer(serializers.ModelSerializer):
+class ParticipantSerializer(serializers.ModelSerializer, ThumbnailCacheMixin):
     thumbnail = serializers.SerializerMethodField()
     abbreviation = serializers.SerializerMethodField()
     user = serializers.SerializerMethodField()
@@ -447,9 +392,7 @@ class ParticipantSerializer(serializers.ModelSerializer):
             return obj.user.email[0]
 
     def get_thumbnail(self, obj):
-        if obj.profile_image_thumbnail:
-            return obj.profile_image_thumbnail.url
-        return None
+        return self.get_cached_thumbnail_url(obj)
 
     class Meta:
         model = models.Profile
@@ -489,7 +432,7 @@ class PasswordResetConfirmSerializer(serializers.Serializer):
         return data
     
 
-class DevotionalSerializer(serializers.ModelSerializer):
+class DevotionalSerializer(serializers.ModelSerializer, ThumbnailCacheMixin):
     title = serializers.SerializerMethodField()
     description = serializers.SerializerMethodField()
     thumbnail = serializers.SerializerMethodField()
@@ -522,16 +465,7 @@ class DevotionalSerializer(serializers.ModelSerializer):
         return obj.video.thumbnail.url if obj.video and obj.video.thumbnail else None
 
     def get_thumbnail_small(self, obj):
-        if obj.video and obj.video.thumbnail:
-            # Try to get cached URL first
-            if obj.video.cached_thumbnail_url:
-                return obj.video.cached_thumbnail_url
-            # Fall back to generating URL
-            try:
-                return obj.video.thumbnail_small.url
-            except Exception:
-                return None
-        return None
+        return self.get_cached_thumbnail_url(obj.video)
 
     def get_video(self, obj):
         return obj.video.video.url if obj.video and obj.video.video else None
@@ -4,19 +4,30 @@ AWS Location Service Geocoding Integration
 This module provides geocoding functionality using AWS Location Service.
 It uses the existing AWS credentials from settings.py and provides
 both direct API access and a Django-friendly service class.
+
+Locations are first looked up offline, in the hardcoded common locations and
+the bundled city gazetteer (hub.services.gazetteer); only the rest cost an
+AWS request.
 """
 import time
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import boto3
 from django.conf import settings
 from botocore.exceptions import ClientError, BotoCoreError
 from typing import Dict, Tuple, Optional, List
 
+from hub.services import gazetteer
+
 logger = logging.getLogger(__name__)
 
 # Create a place index name with a default fallback
 PLACE_INDEX_NAME = getattr(settings, 'AWS_LOCATION_PLACE_INDEX', 'ExamplePlaceIndex')
 API_KEY = getattr(settings, 'AWS_LOCATION_API_KEY', None)
+REQUESTS_PER_SECOND = getattr(settings, 'AWS_LOCATION_REQUESTS_PER_SECOND', 5.0)
+GEOCODE_CONCURRENCY = getattr(settings, 'AWS_LOCATION_GEOCODE_CONCURRENCY', 4)
+GAZETTEER_ENABLED = getattr(settings, 'GEOCODING_GAZETTEER_ENABLED', True)
 
 # Common locations hardcoded for fallback and faster responses
 COMMON_LOCATIONS = {
@@ -66,12 +77,41 @@ class AWSLocationServiceGeocoderError(Exception):
     pass
 
 
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+
+    Tokens accrue at ``rate`` per second up to ``capacity``; ``acquire`` takes
+    one, sleeping until one is available. Concurrent callers share the rate.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
 class AWSLocationServiceGeocoder:
     """
     AWS Location Service geocoder implementation.
     
     This class provides geocoding functionality using AWS Location Service,
-    with fallback to hardcoded common locations for better performance and reliability.
+    with hardcoded common locations and the offline gazetteer tried first for
+    better performance and reliability.
     """
     
     def __init__(self, place_index_name: str = None, api_key: str = None):
@@ -87,8 +127,9 @@ class AWSLocationServiceGeocoder:
         self.place_index_name = place_index_name or PLACE_INDEX_NAME
         self.api_key = api_key or API_KEY
         self._client = None
-        self._last_request_time = 0
-        self._request_interval = 0.2  # 5 requests per second max (200ms between requests)
+        self._client_lock = threading.Lock()
+        # Shared by every thread using this geocoder (5 requests per second by default)
+        self._limiter = TokenBucket(REQUESTS_PER_SECOND)
     
     @property
     def client(self):
@@ -98,42 +139,30 @@ class AWSLocationServiceGeocoder:
         Returns:
             boto3.client: Initialized AWS Location Service client
         """
-        if self._client is None:
-            # Check if we're using API key authentication
-            if self.api_key:
-                # Create client with API key authentication
-                self._client = boto3.client(
-                    'location',
-                    region_name=settings.AWS_S3_REGION_NAME,
-                    aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-                    aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-                    # Additional API key header will be added on each request
-                )
-            else:
-                # Create client with standard IAM authentication
-                self._client = boto3.client(
-                    'location',
-                    region_name=settings.AWS_S3_REGION_NAME,
-                    aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-                    aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY
-                )
+        with self._client_lock:
+            if self._client is None:
+                self._client = self._create_client()
         return self._client
+
+    def _create_client(self):
+        """Create the AWS Location Service client (boto3 clients are thread-safe)."""
+        # With an API key, the key is added to each request (see geocode);
+        # otherwise the standard IAM authentication is used
+        return boto3.client(
+            'location',
+            region_name=settings.AWS_S3_REGION_NAME,
+            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+        )
     
     def _rate_limit(self):
         """
         Enforce rate limiting for AWS Location Service API calls.
         
-        This method ensures we don't exceed the service's rate limits
-        by adding a delay between requests if needed.
+        Blocks until the geocoder's token bucket, shared by all threads,
+        allows another request.
         """
-        current_time = time.time()
-        time_since_last_request = current_time - self._last_request_time
-        
-        if time_since_last_request < self._request_interval:
-            # Sleep to maintain minimum interval between requests
-            time.sleep(self._request_interval - time_since_last_request)
-        
-        self._last_request_time = time.time()
+        self._limiter.acquire()
     
     def _normalize_location(self, location: str) -> str:
         """
@@ -162,12 +191,53 @@ class AWSLocationServiceGeocoder:
         """
         return COMMON_LOCATIONS.get(location)
     
+    def _check_gazetteer(self, location: str) -> Optional[Tuple[float, float]]:
+        """
+        Resolve a location with the offline city gazetteer.
+        
+        Args:
+            location: The location text
+            
+        Returns:
+            Tuple of (latitude, longitude) if found unambiguously, None otherwise
+        """
+        if not GAZETTEER_ENABLED:
+            return None
+        return gazetteer.lookup(location)
+    
+    def geocode_offline(self, location: str) -> Optional[Tuple[float, float]]:
+        """
+        Geocode a location string without any network request.
+        
+        Checks hardcoded common locations, then the offline gazetteer.
+        
+        Args:
+            location: The location string to geocode
+            
+        Returns:
+            Tuple of (latitude, longitude) if found, None otherwise (the
+            location is then left to AWS Location Service)
+        """
+        if not location:
+            return None
+        
+        coordinates = self._check_hardcoded_locations(self._normalize_location(location))
+        if coordinates:
+            logger.debug(f"Found {location} in hardcoded locations: {coordinates}")
+            return coordinates
+        
+        coordinates = self._check_gazetteer(location)
+        if coordinates:
+            logger.debug(f"Found {location} in the gazetteer: {coordinates}")
+        return coordinates
+    
     def geocode(self, location: str) -> Optional[Tuple[float, float]]:
         """
         Geocode a location string to coordinates.
         
-        This method first checks hardcoded common locations for faster response,
-        then falls back to AWS Location Service if needed.
+        This method first checks hardcoded common locations and the offline
+        gazetteer for faster response, then falls back to AWS Location Service
+        if needed.
         
         Args:
             location: The location string to geocode
@@ -182,12 +252,9 @@ class AWSLocationServiceGeocoder:
             logger.warning("Empty location provided for geocoding")
             return None
             
-        normalized_location = self._normalize_location(location)
-        
-        # First check hardcoded locations for common places
-        coordinates = self._check_hardcoded_locations(normalized_location)
+        # First check hardcoded locations and the gazetteer
+        coordinates = self.geocode_offline(location)
         if coordinates:
-            logger.debug(f"Found {location} in hardcoded locations: {coordinates}")
             return coordinates
             
         try:
@@ -229,29 +296,48 @@ class AWSLocationServiceGeocoder:
             logger.error(error_message)
             raise AWSLocationServiceGeocoderError(error_message) from e
 
-    def batch_geocode(self, locations: List[str]) -> Dict[str, Optional[Tuple[float, float]]]:
+    def _geocode_or_none(self, location: str) -> Optional[Tuple[float, float]]:
+        try:
+            return self.geocode(location)
+        except AWSLocationServiceGeocoderError as e:
+            logger.error(f"Failed to geocode {location}: {str(e)}")
+            return None
+
+    def batch_geocode(self, locations: List[str], max_workers: Optional[int] = None) -> Dict[str, Optional[Tuple[float, float]]]:
         """
         Geocode multiple locations in batch.
         
+        Locations that normalize to the same text are geocoded once. Those
+        known offline are resolved directly; the rest are geocoded
+        concurrently, within the geocoder's shared request rate.
+        
         Args:
             locations: List of location strings to geocode
+            max_workers: Number of concurrent requests (default: AWS_LOCATION_GEOCODE_CONCURRENCY)
             
         Returns:
             Dictionary mapping original location strings to their coordinates
             (None for locations that couldn't be geocoded)
         """
         results = {}
-        
+        # One original spelling per normalized location
+        unique = {}
         for location in locations:
             if not location:
                 results[location] = None
-                continue
-                
-            try:
-                results[location] = self.geocode(location)
-            except AWSLocationServiceGeocoderError as e:
-                logger.error(f"Failed to geocode {location}: {str(e)}")
-                results[location] = None
+            else:
+                unique.setdefault(self._normalize_location(location), location)
+
+        if unique:
+            resolved = {normalized: self.geocode_offline(location) for normalized, location in unique.items()}
+            remote = {normalized: location for normalized, location in unique.items() if not resolved[normalized]}
+            if remote:
+                workers = max(1, min(max_workers or GEOCODE_CONCURRENCY, len(remote)))
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='geocode') as executor:
+                    resolved.update(zip(remote, executor.map(self._geocode_or_none, remote.values())))
+            for location in locations:
+                if location:
+                    results[location] = resolved[self._normalize_location(location)]
                 
         return results
 
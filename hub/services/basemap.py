@@ -0,0 +1,145 @@
+"""Process-wide world basemap for the participant maps.
+
+The basemap is the Natural Earth 1:110m country layer, pre-simplified and
+bundled as ``data/world_basemap.geojson`` (regenerate it with the
+``build_world_basemap`` management command).  It used to be downloaded from
+naciscdn.org and parsed for every map; now it is read once per worker
+process, and the outlines of the world and contiguous-US views are clipped,
+projected and serialized as SVG path data at load time.
+
+Both views use an equirectangular projection scaled to ``VIEW_WIDTH`` SVG
+units, which is what the participant maps were plotted in before.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from typing import Optional
+
+import numpy as np
+import shapely
+from django.conf import settings
+from shapely.geometry import box, shape
+
+logger = logging.getLogger(__name__)
+
+# View bounds as (min_lon, min_lat, max_lon, max_lat)
+# The world view excludes Antarctica and the North Pole
+WORLD_BOUNDS = (-180.0, -60.0, 180.0, 85.0)
+# The contiguous United States (approximate)
+US_BOUNDS = (-125.0, 24.0, -66.0, 49.5)
+US_ISO_A3 = "USA"
+
+# Map views as bounds; the US view has a one-degree margin around the points
+VIEWS = {
+    "world": WORLD_BOUNDS,
+    "us": (US_BOUNDS[0] - 1, US_BOUNDS[1] - 1, US_BOUNDS[2] + 1, US_BOUNDS[3] + 1),
+}
+VIEW_WIDTH = 1000
+
+
+def basemap_path() -> str:
+    return os.path.join(settings.BASE_DIR, "data", "world_basemap.geojson")
+
+
+def _rings(geometries, bounds) -> list[np.ndarray]:
+    """Exterior and interior rings of the polygons clipped to ``bounds``, as (N, 2) lon/lat arrays."""
+    rings = []
+    for geometry in shapely.clip_by_rect(np.asarray(geometries, dtype=object), *bounds):
+        for polygon in getattr(geometry, "geoms", [geometry]):
+            if polygon.is_empty or polygon.geom_type != "Polygon":
+                continue
+            rings.append(np.asarray(polygon.exterior.coords, dtype=float))
+            rings.extend(np.asarray(interior.coords, dtype=float) for interior in polygon.interiors)
+    return rings
+
+
+def project(lon_lat: np.ndarray, view: str) -> np.ndarray:
+    """Project (N, 2) lon/lat coordinates to SVG units of ``view``."""
+    min_lon, _, max_lon, max_lat = VIEWS[view]
+    scale = VIEW_WIDTH / (max_lon - min_lon)
+    return np.column_stack(((lon_lat[:, 0] - min_lon) * scale, (max_lat - lon_lat[:, 1]) * scale))
+
+
+def view_size(view: str) -> tuple[float, float]:
+    """Width and height of ``view`` in SVG units."""
+    min_lon, min_lat, max_lon, max_lat = VIEWS[view]
+    return VIEW_WIDTH, round(VIEW_WIDTH * (max_lat - min_lat) / (max_lon - min_lon), 1)
+
+
+def _path_data(rings: list[np.ndarray], view: str) -> str:
+    parts = []
+    for ring in rings:
+        points = np.round(project(ring, view), 1)
+        parts.append("M" + "L".join(f"{x:g} {y:g}" for x, y in points) + "Z")
+    return "".join(parts)
+
+
+class Basemap:
+    """Country outlines with the world and contiguous-US views precomputed."""
+
+    def __init__(self, features: list[dict]):
+        self.names = [feature["properties"].get("name", "") for feature in features]
+        self.iso_a3 = [feature["properties"].get("iso_a3", "") for feature in features]
+        self.geometries = [shape(feature["geometry"]) for feature in features]
+        us_geometries = [geometry for geometry, iso in zip(self.geometries, self.iso_a3) if iso == US_ISO_A3]
+
+        self.rings = {
+            "world": _rings(self.geometries, VIEWS["world"]),
+            "us": _rings(us_geometries, VIEWS["us"]),
+        }
+        # SVG path data ("d" attribute) of the outlines of each view
+        self.paths = {view: _path_data(rings, view) for view, rings in self.rings.items()}
+        # Fingerprint of the drawn outlines, so maps are re-rendered when the basemap changes
+        self.digest = hashlib.sha256(
+            "\n".join(self.paths[view] for view in sorted(self.paths)).encode()
+        ).hexdigest()
+
+    def __len__(self):
+        return len(self.geometries)
+
+    @classmethod
+    def fallback(cls) -> "Basemap":
+        """A single world rectangle, used when the bundled file is unusable."""
+        return cls([{
+            "properties": {"name": "World", "iso_a3": ""},
+            "geometry": box(-180, -90, 180, 90).__geo_interface__,
+        }])
+
+
+_basemap: Optional[Basemap] = None
+_basemap_lock = threading.Lock()
+
+
+def get_basemap() -> Basemap:
+    """The world basemap, loaded from the bundled file on first use.
+
+    Returns:
+        The basemap, or a plain world rectangle if the file is missing or
+        unreadable
+    """
+    global _basemap
+
+    with _basemap_lock:
+        if _basemap is not None:
+            return _basemap
+        path = basemap_path()
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                features = json.load(f)["features"]
+            _basemap = Basemap(features)
+            logger.info("Loaded %d basemap countries from %s", len(_basemap), path)
+        except (OSError, ValueError, KeyError) as e:
+            logger.error(f"Error reading basemap file {path}: {e}")
+            logger.warning("Using a simplified map without country boundaries")
+            _basemap = Basemap.fallback()
+        return _basemap
+
+
+def reset_basemap() -> None:
+    """Drop the loaded basemap so the next lookup reads the file again."""
+    global _basemap
+    with _basemap_lock:
+        _basemap = None
@@ -12,7 +12,10 @@ import logging
 
 import requests
 from decouple import config
+from django.conf import settings
 from django.utils import timezone
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from hub.constants import APOCRYPHA_USFM_IDS, BOOK_NAME_TO_USFM
 
@@ -21,6 +24,7 @@ logger = logging.getLogger(__name__)
 BASE_URL = "https://rest.api.bible/v1"
 NKJV_BIBLE_ID = "63097d2a0a2f7db3-01"
 KJVAIC_BIBLE_ID = "a6aee10bb058511c-01"  # KJV with Apocrypha, American Edition
+REQUEST_TIMEOUT = 15  # seconds
 
 
 class BibleAPIService:
@@ -30,15 +34,31 @@ class BibleAPIService:
     books, automatically falls back to KJVAIC.
     """
 
-    def __init__(self, api_key: str | None = None):
-        """Initialize with API key from argument, Django settings, or env var."""
+    def __init__(self, api_key: str | None = None, timeout: float = REQUEST_TIMEOUT):
+        """Initialize with API key from argument, Django settings, or env var.
+
+        The session's connection pool fits ``BIBLE_API_MAX_CONCURRENCY``
+        threads sharing it, and rate-limited (429) or unavailable responses
+        are retried with exponential backoff, honouring ``Retry-After``.
+        """
         self.api_key = api_key or config("BIBLE_API_KEY", default="")
         if not self.api_key:
             raise ValueError(
                 "API key required. Set BIBLE_API_KEY in environment or Django settings."
             )
+        self.timeout = timeout
         self.session = requests.Session()
         self.session.headers.update({"api-key": self.api_key})
+        retry = Retry(
+            total=3,
+            backoff_factor=1,
+            status_forcelist=(429, 502, 503, 504),
+            allowed_methods=("GET",),
+            raise_on_status=False,
+        )
+        self.session.mount("https://", HTTPAdapter(
+            pool_maxsize=getattr(settings, "BIBLE_API_MAX_CONCURRENCY", 4), max_retries=retry,
+        ))
 
     def get_passage(
         self,
@@ -82,7 +102,7 @@ class BibleAPIService:
         }
 
         url = f"{BASE_URL}/bibles/{bible_id}/passages/{passage_id}"
-        resp = self.session.get(url, params=params)
+        resp = self.session.get(url, params=params, timeout=self.timeout)
         resp.raise_for_status()
         json_data = resp.json()
 
@@ -172,6 +192,7 @@ def fetch_text_for_reading(reading, service: BibleAPIService | None = None) -> b
         (e.g. missing API key, unknown book).
     """
     from hub.models import Reading as ReadingModel  # deferred to avoid circular import
+    from hub.utils import bump_content_version
 
     if service is None:
         try:
@@ -194,6 +215,8 @@ def fetch_text_for_reading(reading, service: BibleAPIService | None = None) -> b
             text_fetched_at=timezone.now(),
             fums_token=result.get("fums_token", ""),
         )
+        # QuerySet.update() skips the post_save signal that normally bumps this
+        bump_content_version("readings")
         logger.info(
             "Fetched text for Reading %s (%s).",
             reading.pk, reading.passage_reference,
@@ -0,0 +1,95 @@
+"""Single-flight enqueueing of LLM context generation.
+
+Views queue ``generate_reading_context_task``/``generate_feast_context_task``
+whenever they see a missing or incomplete context, which would otherwise
+queue one identical (and expensive) job per request until the first one
+finished.  ``enqueue_reading_context``/``enqueue_feast_context`` first take
+an atomic claim in the cache (``cache.add``) keyed by target and language set,
+and only queue the task if the claim was free.  The task releases the claim
+when it finishes or fails for good (``held_context_claim``); the TTL only
+bounds how long a lost job blocks new ones.
+
+``is_context_generation_in_flight`` lets views report a pending context
+instead of queueing again.
+"""
+
+import logging
+import time
+from contextlib import contextmanager
+
+from celery.exceptions import Retry
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+READING = "reading"
+FEAST = "feast"
+
+# Context generation calls the LLM once per language and may retry 3 times a minute apart
+CONTEXT_CLAIM_TTL = getattr(settings, "LLM_CONTEXT_CLAIM_TTL", 60 * 15)
+
+
+def context_claim_key(kind: str, target_id: int, force: bool = False) -> str:
+    """Cache key of the claim on generating contexts of one target in every language."""
+    languages = "-".join(sorted(getattr(settings, "MODELTRANS_AVAILABLE_LANGUAGES", ["en", "hy"])))
+    mode = "force" if force else "fill"
+    return f"bahk:context_inflight:{kind}:{target_id}:{languages}:{mode}"
+
+
+def is_context_generation_in_flight(kind: str, target_id: int) -> bool:
+    """Whether a generation job for the target is queued or running."""
+    return bool(cache.get_many([context_claim_key(kind, target_id), context_claim_key(kind, target_id, True)]))
+
+
+def release_context_claim(kind: str, target_id: int, force: bool = False) -> None:
+    cache.delete(context_claim_key(kind, target_id, force))
+
+
+def _enqueue(kind: str, task, target_id: int, force: bool, **kwargs) -> bool:
+    key = context_claim_key(kind, target_id, force)
+    if not cache.add(key, time.time(), CONTEXT_CLAIM_TTL):
+        logger.debug("Context generation for %s %s already in flight", kind, target_id)
+        return False
+    try:
+        task.delay(target_id, force_regeneration=force, **kwargs)
+    except Exception:
+        release_context_claim(kind, target_id, force)
+        raise
+    return True
+
+
+def enqueue_reading_context(reading_id: int, force_regeneration: bool = False) -> bool:
+    """Queue context generation for a reading unless a job for it is already in flight.
+
+    Returns:
+        True if a job was queued.
+    """
+    from hub.tasks import generate_reading_context_task  # deferred to avoid circular import
+
+    return _enqueue(READING, generate_reading_context_task, reading_id, force_regeneration)
+
+
+def enqueue_feast_context(feast_id: int, force_regeneration: bool = False, **kwargs) -> bool:
+    """Queue context generation for a feast unless a job for it is already in flight.
+
+    Returns:
+        True if a job was queued.
+    """
+    from hub.tasks import generate_feast_context_task  # deferred to avoid circular import
+
+    return _enqueue(FEAST, generate_feast_context_task, feast_id, force_regeneration, **kwargs)
+
+
+@contextmanager
+def held_context_claim(kind: str, target_id: int, force: bool = False):
+    """Release the target's claim when the task body exits, unless a retry is pending."""
+    release = True
+    try:
+        yield
+    except Retry:
+        release = False
+        raise
+    finally:
+        if release:
+            release_context_claim(kind, target_id, force)
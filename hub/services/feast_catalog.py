@@ -0,0 +1,134 @@
+"""Process-wide, indexed copy of the feast reference data (``data/feasts.json``).
+
+``_find_all_matching_feasts`` used to read and parse the file on every call
+and score every entry.  The catalog is loaded once, lazily, and reloaded when
+the file's mtime changes.  Entries are indexed by (month, day) and by
+character-trigram postings, so only entries on the feast's date or sharing
+the most trigrams with its name are scored.
+"""
+
+import heapq
+import json
+import logging
+import os
+import threading
+from collections import Counter, defaultdict
+from typing import Iterable, Optional
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Entries with the highest trigram overlap that are scored for a name
+MAX_TRIGRAM_CANDIDATES = 50
+
+
+def _trigrams(text: str) -> set[str]:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class FeastCatalog:
+    """Feast reference entries with date and trigram indexes."""
+
+    def __init__(self, entries: list[dict]):
+        self.entries = entries
+        # Lowercased names, aligned with entries
+        self.names = [entry.get('name', '').lower() for entry in entries]
+        self._by_date = defaultdict(list)
+        self._postings = defaultdict(list)
+        self._trigram_counts = []
+        for index, (entry, name) in enumerate(zip(entries, self.names)):
+            self._by_date[(entry.get('month'), entry.get('day'))].append(index)
+            trigrams = _trigrams(name)
+            self._trigram_counts.append(len(trigrams))
+            for trigram in trigrams:
+                self._postings[trigram].append(index)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def candidates(
+        self,
+        names: Iterable[str],
+        month: Optional[str] = None,
+        day: Optional[str] = None,
+        limit: int = MAX_TRIGRAM_CANDIDATES,
+    ) -> list[int]:
+        """Indices of the entries worth scoring against ``names``.
+
+        Args:
+            names: Lowercased names to match (e.g. English and Armenian)
+            month: Full month name of the feast's date, e.g. "January"
+            day: Zero-padded day of the feast's date, e.g. "06"
+            limit: Number of entries to keep by trigram overlap
+
+        Returns:
+            Sorted indices of the ``limit`` entries with the highest trigram
+            Dice coefficient against any of the names, plus every entry on
+            the given date
+        """
+        overlap = {}
+        for name in names:
+            trigrams = _trigrams(name)
+            shared = Counter()
+            for trigram in trigrams:
+                shared.update(self._postings.get(trigram, ()))
+            for index, count in shared.items():
+                dice = 2 * count / (len(trigrams) + self._trigram_counts[index])
+                if dice > overlap.get(index, 0.0):
+                    overlap[index] = dice
+
+        selected = set(heapq.nlargest(limit, overlap, key=overlap.get))
+        if month and day:
+            selected.update(self._by_date.get((month, day), ()))
+        return sorted(selected)
+
+
+_catalog: Optional[FeastCatalog] = None
+_catalog_mtime: Optional[float] = None
+_catalog_lock = threading.Lock()
+
+
+def feast_catalog_path() -> str:
+    return os.path.join(settings.BASE_DIR, 'data', 'feasts.json')
+
+
+def get_feast_catalog() -> Optional[FeastCatalog]:
+    """The feast reference catalog, (re)loading it if the file changed.
+
+    Returns:
+        The catalog, or None if the file is missing or unreadable
+    """
+    global _catalog, _catalog_mtime
+
+    path = feast_catalog_path()
+    if not os.path.exists(path):
+        logger.warning(f"Feasts reference file not found at {path}")
+        return None
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        mtime = None
+
+    with _catalog_lock:
+        if _catalog is not None and mtime is not None and mtime == _catalog_mtime:
+            return _catalog
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            logger.error(f"Error reading feasts reference file: {e}")
+            return None
+        _catalog = FeastCatalog(entries)
+        _catalog_mtime = mtime
+        logger.info("Loaded %d feast reference entries from %s", len(_catalog), path)
+        return _catalog
+
+
+def reset_feast_catalog() -> None:
+    """Drop the loaded catalog so the next lookup reads the file again."""
+    global _catalog, _catalog_mtime
+    with _catalog_lock:
+        _catalog = None
+        _catalog_mtime = None
@@ -0,0 +1,368 @@
+"""Offline city gazetteer, the first geocoding tier before AWS Location.
+
+The gazetteer is the GeoNames ``cities15000`` dump (cities of 15,000+
+inhabitants, CC BY 4.0 geonames.org), reduced to names, Latin-script aliases,
+country and first-level administrative division (state), coordinates and
+population, and bundled as ``data/gazetteer.tsv.gz`` (regenerate it with the
+``build_gazetteer`` management command).  It is read once per process.
+
+Profile locations such as "Yerevan", "Austin, TX" or "Paris, France" are
+resolved by normalized name, narrowed down by the country and state
+qualifiers after the city; aliases and name prefixes are only used together
+with a qualifier.  When several cities remain, the most
+populous wins only if it clearly dominates; ambiguous or unknown locations
+return None and are left to AWS Location.
+
+Everything is held in flat ``array`` columns and newline-joined string blobs
+rather than per-city objects: about 5 MB for 34,000 cities and 140,000 keys.
+"""
+
+import gzip
+import logging
+import os
+import re
+import threading
+import unicodedata
+from array import array
+from bisect import bisect_left
+from typing import Iterable, Optional
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Coordinates are stored as integers of 1e-5 degrees (about 1 m)
+COORDINATE_SCALE = 100_000
+# The most populous of several matching cities of a country wins only when it
+# has this many times the population of the next one ("Portland" is Portland,
+# Oregon, but "Springfield" is left to AWS)
+DOMINANCE = 5
+# Prefix matching ("Yerev, Armenia" for Yerevan) needs at least this many characters
+# and gives up when the prefix matches more keys than PREFIX_LIMIT
+MIN_PREFIX_LENGTH = 5
+PREFIX_LIMIT = 64
+NO_ADMIN1 = 0xFFFF
+
+# Abbreviations expanded in names, so "St. Louis" matches "Saint Louis"
+ABBREVIATIONS = {"st": "saint", "ste": "sainte", "mt": "mount", "ft": "fort"}
+# Latin letters that have no decomposition
+TRANSLITERATIONS = str.maketrans({
+    "ł": "l", "ø": "o", "đ": "d", "ħ": "h", "ı": "i", "ß": "ss", "æ": "ae", "œ": "oe", "þ": "th", "ð": "d",
+})
+# Common country names missing from the GeoNames country list
+COUNTRY_ALIASES = {
+    "us": "US", "usa": "US", "u s a": "US", "america": "US", "united states of america": "US",
+    "uk": "GB", "great britain": "GB", "britain": "GB", "england": "GB", "scotland": "GB", "wales": "GB",
+    "northern ireland": "GB", "holland": "NL", "russian federation": "RU", "republic of armenia": "AM",
+}
+# Postal abbreviations of divisions that GeoNames numbers
+DIVISION_ABBREVIATIONS = {
+    "ab": "CA.01", "bc": "CA.02", "mb": "CA.03", "nb": "CA.04", "nl": "CA.05", "ns": "CA.07", "on": "CA.08",
+    "pe": "CA.09", "qc": "CA.10", "sk": "CA.11", "yt": "CA.12", "nt": "CA.13", "nu": "CA.14",
+    "act": "AU.01", "nsw": "AU.02", "qld": "AU.04", "sa": "AU.05", "tas": "AU.06", "vic": "AU.07", "wa": "AU.08",
+}
+
+_NON_ALPHANUMERIC = re.compile(r"[^0-9a-z]+")
+
+
+def _fold(text: str) -> str:
+    text = text.lower()
+    if not text.isascii():
+        text = unicodedata.normalize("NFKD", text.translate(TRANSLITERATIONS))
+        text = "".join(ch for ch in text if not unicodedata.combining(ch)).replace("’", "")
+    return text.replace("'", "")
+
+
+def normalize_name(text: str) -> str:
+    """Lowercase ASCII words of ``text``, with accents, punctuation and abbreviations resolved."""
+    tokens = _NON_ALPHANUMERIC.sub(" ", _fold(text)).split()
+    return " ".join(ABBREVIATIONS.get(token, token) for token in tokens)
+
+
+def is_latin(text: str) -> bool:
+    """Whether ``text`` is written in the Latin script (after removing accents)."""
+    return _fold(text).isascii()
+
+
+class _Strings:
+    """Read-only sequence of strings stored as one newline-joined blob."""
+
+    def __init__(self, strings: Iterable[str]):
+        strings = list(strings)
+        self._blob = "\n".join(strings)
+        self._starts = array("I", [0] * (len(strings) + 1))
+        position = 0
+        for i, string in enumerate(strings):
+            position += len(string) + 1
+            self._starts[i + 1] = position
+
+    def __len__(self):
+        return len(self._starts) - 1
+
+    def __getitem__(self, i: int) -> str:
+        return self._blob[self._starts[i]:self._starts[i + 1] - 1]
+
+
+class Gazetteer:
+    """Name and alias index over a list of cities.
+
+    Args:
+        countries: (ISO code, ISO3 code, name) of every country
+        admin1: ("<country>.<code>", name) of first-level divisions
+        places: (name, country, admin1 code, latitude, longitude, population,
+            keys) of every city, the keys being its normalized name and aliases
+    """
+
+    def __init__(self, countries: Iterable[tuple], admin1: Iterable[tuple], places: Iterable[tuple]):
+        countries = list(countries)
+        admin1 = list(admin1)
+        self.country_codes = [code for code, _, _ in countries]
+        self.admin1_codes = [code for code, _ in admin1]
+        country_index = {code: i for i, code in enumerate(self.country_codes)}
+        admin1_index = {code: i for i, code in enumerate(self.admin1_codes)}
+
+        names = []
+        self.countries = array("H")
+        self.admin1 = array("H")
+        self.latitudes = array("i")
+        self.longitudes = array("i")
+        self.populations = array("I")
+        entries = []
+        name_keys = []
+        for name, country, admin1_code, latitude, longitude, population, keys in places:
+            if country not in country_index or not keys:
+                continue
+            place = len(names)
+            names.append(name)
+            self.countries.append(country_index[country])
+            self.admin1.append(admin1_index.get(f"{country}.{admin1_code}", NO_ADMIN1))
+            self.latitudes.append(round(latitude * COORDINATE_SCALE))
+            self.longitudes.append(round(longitude * COORDINATE_SCALE))
+            self.populations.append(population)
+            entries.extend((key, place) for key in keys)
+            name_keys.append(keys[0])
+        self.names = _Strings(names)
+
+        # Sorted unique keys; the places of key i are places[starts[i]:starts[i + 1]],
+        # and name_keys holds the index of the key of each place's own name
+        entries.sort()
+        keys = []
+        self.starts = array("I")
+        self.places = array("I", (place for _, place in entries))
+        self.name_keys = array("I", bytes(4 * len(names)))
+        for i, (key, place) in enumerate(entries):
+            if not keys or keys[-1] != key:
+                keys.append(key)
+                self.starts.append(i)
+            if key == name_keys[place]:
+                self.name_keys[place] = len(keys) - 1
+        self.starts.append(len(entries))
+        self.keys = _Strings(keys)
+
+        self.qualifiers = self._build_qualifiers(countries, admin1, country_index, admin1_index)
+
+    @staticmethod
+    def _build_qualifiers(countries, admin1, country_index, admin1_index) -> dict[str, tuple[frozenset, frozenset]]:
+        """Normalized country and division names and codes -> (country indexes, admin1 indexes)."""
+        matches = {}
+
+        def add(text, kind, index):
+            key = normalize_name(text)
+            if key:
+                matches.setdefault(key, (set(), set()))[kind].add(index)
+
+        for i, (code, iso3, name) in enumerate(countries):
+            for text in (code, iso3, name):
+                add(text, 0, i)
+        for text, code in COUNTRY_ALIASES.items():
+            if code in country_index:
+                add(text, 0, country_index[code])
+        for i, (code, name) in enumerate(admin1):
+            add(name, 1, i)
+            # Letter codes such as TX or ENG; most countries use numbers
+            division = code.split(".", 1)[-1]
+            if division.isalpha():
+                add(division, 1, i)
+        for text, code in DIVISION_ABBREVIATIONS.items():
+            if code in admin1_index:
+                add(text, 1, admin1_index[code])
+        return {key: (frozenset(c), frozenset(a)) for key, (c, a) in matches.items()}
+
+    def __len__(self):
+        return len(self.names)
+
+    def coordinates(self, place: int) -> tuple[float, float]:
+        """(latitude, longitude) of a place."""
+        return self.latitudes[place] / COORDINATE_SCALE, self.longitudes[place] / COORDINATE_SCALE
+
+    def _key_index(self, key: str) -> Optional[int]:
+        i = bisect_left(self.keys, key)
+        return i if i < len(self.keys) and self.keys[i] == key else None
+
+    def candidates(self, key: str, prefix: bool = False) -> list[int]:
+        """Places named ``key`` (or with a name starting with it)."""
+        if not prefix:
+            i = self._key_index(key)
+            return [] if i is None else list(self.places[self.starts[i]:self.starts[i + 1]])
+        i = bisect_left(self.keys, key)
+        end = i
+        while end < len(self.keys) and self.keys[end].startswith(key):
+            end += 1
+            if end - i > PREFIX_LIMIT:
+                return []
+        return list(self.places[self.starts[i]:self.starts[end]])
+
+    def _qualifier(self, text: str) -> Optional[tuple[frozenset, frozenset]]:
+        # Postal codes are ignored ("Austin, TX 78701")
+        text = " ".join(token for token in text.split() if not token.isdigit())
+        return self.qualifiers.get(text)
+
+    def _matches(self, place: int, qualifier: tuple[frozenset, frozenset]) -> bool:
+        countries, admin1 = qualifier
+        return self.countries[place] in countries or self.admin1[place] in admin1
+
+    def _pick(self, places: list[int], key: str) -> Optional[int]:
+        """The only place, or the dominant one by population.
+
+        Places named ``key`` take precedence over places with it as an alias.
+        """
+        i = self._key_index(key)
+        named = [place for place in places if self.name_keys[place] == i]
+        ranked = sorted(set(named or places), key=lambda place: -self.populations[place])
+        if len(ranked) == 1:
+            return ranked[0]
+        if ranked and self.populations[ranked[0]] >= DOMINANCE * max(1, self.populations[ranked[1]]):
+            return ranked[0]
+        return None
+
+    def resolve(self, location: str) -> Optional[int]:
+        """The place a free-text location refers to, or None when unknown or ambiguous."""
+        parts = [normalize_name(part) for part in (location or "").split(",")]
+        parts = [part for part in parts if part]
+        if not parts:
+            return None
+        city, qualifiers = parts[0], []
+        for text in parts[1:]:
+            qualifier = self._qualifier(text)
+            if qualifier is None:
+                if not text.isdigit():
+                    return None
+                continue
+            qualifiers.append(qualifier)
+
+        candidates = self.candidates(city)
+        if not candidates and len(parts) == 1:
+            # "Austin TX", "Gyumri Armenia": trailing words as the qualifier
+            words = city.split()
+            for n in (1, 2):
+                qualifier = self._qualifier(" ".join(words[-n:])) if len(words) > n else None
+                if qualifier:
+                    city, qualifiers = " ".join(words[:-n]), [qualifier]
+                    candidates = self.candidates(city)
+                    break
+        region = self.qualifiers.get(city)
+        if region and not qualifiers and (region[0] or not candidates):
+            # A country or state on its own ("Armenia", not Armenia in Colombia)
+            return None
+
+        if not qualifiers:
+            # Without a country or state only a place's own name is trusted:
+            # aliases and prefixes match too loosely ("Talin" is not Tallinn),
+            # and places of the same name in several countries are ambiguous
+            # ("Armavir" in Armenia or Russia)
+            key = self._key_index(city)
+            named = [place for place in candidates if self.name_keys[place] == key]
+            if len({self.countries[place] for place in named}) > 1:
+                return None
+            return self._pick(named, city)
+
+        candidates = [place for place in candidates if all(self._matches(place, q) for q in qualifiers)]
+        if not candidates and len(city) >= MIN_PREFIX_LENGTH:
+            candidates = [
+                place for place in self.candidates(city, prefix=True)
+                if all(self._matches(place, q) for q in qualifiers)
+            ]
+        return self._pick(candidates, city)
+
+    def lookup(self, location: str) -> Optional[tuple[float, float]]:
+        """(latitude, longitude) of a free-text location, or None to leave it to AWS."""
+        place = self.resolve(location)
+        return None if place is None else self.coordinates(place)
+
+    @classmethod
+    def from_file(cls, path: str) -> "Gazetteer":
+        """Load a gazetteer written by ``write_gazetteer``."""
+        countries, admin1, places = [], [], []
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                fields = line.rstrip("\n").split("\t")
+                if fields[0] == "P":
+                    _, name, country, admin1_code, latitude, longitude, population, keys = fields
+                    places.append((
+                        name, country, admin1_code, float(latitude), float(longitude), int(population),
+                        keys.split("|"),
+                    ))
+                elif fields[0] == "C":
+                    countries.append(tuple(fields[1:4]))
+                elif fields[0] == "A":
+                    admin1.append(tuple(fields[1:3]))
+        return cls(countries, admin1, places)
+
+
+def write_gazetteer(path: str, countries: Iterable[tuple], admin1: Iterable[tuple], places: Iterable[tuple]) -> None:
+    """Write the gzipped, tab-separated gazetteer file read by ``Gazetteer.from_file``.
+
+    Arguments are as for ``Gazetteer``; lines are tagged C (country),
+    A (admin1) and P (place), with the keys of a place joined by "|".
+    """
+    with gzip.open(path, "wt", encoding="utf-8", compresslevel=9) as f:
+        for country in countries:
+            f.write("\t".join(("C", *country)) + "\n")
+        for division in admin1:
+            f.write("\t".join(("A", *division)) + "\n")
+        for name, country, admin1_code, latitude, longitude, population, keys in places:
+            f.write(
+                f"P\t{name}\t{country}\t{admin1_code}\t{latitude:.5f}\t{longitude:.5f}\t{population}\t"
+                f"{'|'.join(keys)}\n"
+            )
+
+
+def gazetteer_path() -> str:
+    return os.path.join(settings.BASE_DIR, "data", "gazetteer.tsv.gz")
+
+
+_gazetteer: Optional[Gazetteer] = None
+_gazetteer_lock = threading.Lock()
+
+
+def get_gazetteer() -> Gazetteer:
+    """The bundled gazetteer, loaded on first use.
+
+    Returns:
+        The gazetteer, or an empty one if the file is missing or unreadable
+    """
+    global _gazetteer
+
+    with _gazetteer_lock:
+        if _gazetteer is None:
+            path = gazetteer_path()
+            try:
+                _gazetteer = Gazetteer.from_file(path)
+                logger.info(f"Loaded gazetteer of {len(_gazetteer)} cities from {path}")
+            except (OSError, ValueError) as e:
+                logger.error(f"Could not load gazetteer from {path}, geocoding with AWS only: {e}")
+                _gazetteer = Gazetteer([], [], [])
+        return _gazetteer
+
+
+def reset_gazetteer() -> None:
+    """Drop the loaded gazetteer, so the file is read again on next use."""
+    global _gazetteer
+
+    with _gazetteer_lock:
+        _gazetteer = None
+
+
+def lookup(location: str) -> Optional[tuple[float, float]]:
+    """(latitude, longitude) of a location resolved offline, or None."""
+    return get_gazetteer().lookup(location)
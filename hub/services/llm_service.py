@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import Optional
+import hashlib
 import logging
 import json
-import os
 import re
 from difflib import SequenceMatcher
 import anthropic
@@ -11,6 +12,7 @@ from django.conf import settings
 from django.core.mail import mail_admins
 
 from hub.models import LLMPrompt, Reading, Feast
+from hub.services.feast_catalog import get_feast_catalog
 
 logger = logging.getLogger(__name__)
 
@@ -168,6 +170,7 @@ def _find_all_matching_feasts(feast) -> list[dict]:
     Search feasts.json for ALL matching feast entries.
 
     Uses name similarity as primary criterion with optional date boost.
+    Only catalog candidates (see ``FeastCatalog.candidates``) are scored.
     This handles both:
     - Fixed dates with multiple commemorations
     - Moveable feasts that shift year-to-year
@@ -179,19 +182,8 @@ def _find_all_matching_feasts(feast) -> list[dict]:
         List of matching feast dictionaries, sorted by score (descending).
         Returns empty list if no matches found.
     """
-    # Get the base directory (project root)
-    base_dir = settings.BASE_DIR
-    feasts_file_path = os.path.join(base_dir, 'data', 'feasts.json')
-
-    if not os.path.exists(feasts_file_path):
-        logger.warning(f"Feasts reference file not found at {feasts_file_path}")
-        return []
-
-    try:
-        with open(feasts_file_path, 'r', encoding='utf-8') as f:
-            feasts_data = json.load(f)
-    except (json.JSONDecodeError, IOError) as e:
-        logger.error(f"Error reading feasts reference file: {e}")
+    catalog = get_feast_catalog()
+    if catalog is None:
         return []
 
     # Extract feast date components if available (for confidence boost)
@@ -218,9 +210,11 @@ def _find_all_matching_feasts(feast) -> list[dict]:
     # Collect all matches above threshold
     matches = []
 
-    for entry in feasts_data:
-        entry_name = entry.get('name', '')
-        entry_name_lower = entry_name.lower()
+    # Only score entries sharing the most trigrams with the names, or the date
+    query_names = [feast_name_lower] + ([feast_name_hy_lower] if feast_name_hy_lower else [])
+    for index in catalog.candidates(query_names, feast_month, feast_day):
+        entry = catalog.entries[index]
+        entry_name_lower = catalog.names[index]
 
         # Calculate name similarity
         name_score = _calculate_similarity(feast_name_lower, entry_name_lower)
@@ -486,6 +480,153 @@ def _parse_feast_context_json(response_text: str) -> Optional[dict]:
     return None
 
 
+def _feast_context_message(feast: Feast, improvement_instructions: str = None) -> str:
+    """Build the user message asking for a feast's context, before language instructions.
+
+    Args:
+        feast: The Feast to describe
+        improvement_instructions: Optional instructions to improve the generated content
+
+    Returns:
+        User message requesting JSON with 'text' and 'short_text'
+    """
+    # Include Armenian name if available
+    feast_info = f"Feast: {feast.name}"
+    if feast.name_hy:
+        feast_info += f"\nArmenian name: {feast.name_hy}"
+
+    base_message = (
+        f"Provide context for the following feast:\n{feast_info}\n\n"
+        "Return your response as JSON with two fields:\n"
+        '- "short_text": A 2-sentence summary\n'
+        '- "text": A detailed explanation (multiple paragraphs)\n\n'
+        "Return ONLY the JSON object, no markdown code blocks.\n"
+        r"IMPORTANT: If you need paragraph breaks, encode them as \n in the JSON string values (do not include literal newlines inside quoted strings)."
+    )
+
+    # Search for matching feast in reference data
+    try:
+        feast_references = _find_all_matching_feasts(feast)
+        if feast_references:
+            if len(feast_references) == 1:
+                # Single match - keep existing format for backward compatibility
+                ref = feast_references[0]
+                logger.debug(f"Found reference data for feast: {ref.get('name', 'N/A')}")
+                reference_context = (
+                    f"\n\nREFERENCE INFORMATION (use as canonical source):\n"
+                    f"Feast Name: {ref.get('name', 'N/A')}\n"
+                    f"Description: {ref.get('description', 'N/A')}"
+                )
+            else:
+                # Multiple matches - synthesize all
+                logger.debug(f"Found {len(feast_references)} reference commemorations for feast")
+                reference_context = (
+                    f"\n\nREFERENCE INFORMATION (use as canonical source):\n"
+                    f"This feast may include {len(feast_references)} related commemorations. "
+                    f"Synthesize the most relevant information:\n\n"
+                )
+                for i, ref in enumerate(feast_references, 1):
+                    reference_context += (
+                        f"=== COMMEMORATION {i}: {ref.get('name', 'N/A')} ===\n"
+                        f"{ref.get('description', 'N/A')}\n\n"
+                    )
+
+                # Add synthesis instruction
+                reference_context += (
+                    "INSTRUCTION: Analyze all commemorations above. If the feast name clearly "
+                    "corresponds to one commemoration, prioritize it. Otherwise, synthesize "
+                    "information from all that are liturgically connected to this date."
+                )
+
+            base_message += reference_context
+    except Exception as e:
+        logger.error(f"Error during feast reference lookup: {e}", exc_info=True)
+
+    # Add improvement instructions if provided
+    if improvement_instructions:
+        base_message += (
+            f"\n\nIMPROVEMENT INSTRUCTIONS:\n{improvement_instructions}"
+        )
+
+    return base_message
+
+
+_DESIGNATION_OPTIONS = [
+    'Sundays, Dominical Feast Days',
+    'St. Gregory the Illuminator, St. Hripsime and her companions, the Apostles, the Prophets',
+    'Patriarchs, Vartapets',
+    'Nativity of Christ, Feasts of the Mother of God, Presentation of the Lord',
+    'Martyrs',
+    'Fast',
+]
+
+_DESIGNATION_SYSTEM_PROMPT = (
+    "You are a classification expert for Armenian Orthodox Church feasts. "
+    "Determine the appropriate designation category for a feast based solely on its name. "
+    "IMPORTANT: Any name that follows the pattern '[ordinal/number] day of [Fast/Lent]' "
+    "(e.g. 'Nineteenth day of Great Lent', 'Twenty Ninth day of Great Lent', 'Third day of the Fast') "
+    "is always classified as 'Fast' — it is a generic fasting day with no specific commemoration. "
+    "EXCEPTION: Names in the pattern '[ordinal] day of Easter' (e.g. 'Second day of Easter', "
+    "'Fourth day of Easter') are NOT fasting days. The 50 days after Easter are a sacred feast "
+    "period in the Armenian Apostolic Church, not a fast. Classify these as 'Sundays, Dominical Feast Days'."
+)
+
+
+def _designation_user_message(feast: Feast) -> str:
+    """Build the user message asking which designation a feast belongs to."""
+    feast_info = f"Feast name: {feast.name}"
+    if feast.name_hy:
+        feast_info += f"\nArmenian name: {feast.name_hy}"
+
+    return (
+        f"{feast_info}\n\n"
+        "Based on the feast name above, determine which of the following designation categories it belongs to:\n"
+        f"1. {_DESIGNATION_OPTIONS[0]} — Sundays and major feast days of the Lord (Christmas, Easter, Ascension, etc.), "
+        f"and the 50-day Easter season including days named '[ordinal] day of Easter'\n"
+        f"2. {_DESIGNATION_OPTIONS[1]} — St. Gregory the Illuminator, Apostles, Prophets, and their companions\n"
+        f"3. {_DESIGNATION_OPTIONS[2]} — Patriarchs, Catholicos, and Vartapets (vardapets) of the Armenian Church\n"
+        f"4. {_DESIGNATION_OPTIONS[3]} — Nativity, Theophany, Presentation, and Marian feasts\n"
+        f"5. {_DESIGNATION_OPTIONS[4]} — Holy martyrs who died for the faith\n"
+        f"6. {_DESIGNATION_OPTIONS[5]} — A generic numbered day within a fasting period (Great Lent, Advent Fast, etc.), "
+        f"with NO specific saint or feast named (e.g. 'Nineteenth day of Great Lent', 'Twenty Ninth day of Great Lent'). "
+        f"NEVER choose this for days of Easter — those are feast days, not fast days.\n\n"
+        "Return ONLY the exact designation text from the list above, with no additional explanation or formatting."
+    )
+
+
+def _match_designation(response_text: str) -> Optional[str]:
+    """Match an LLM designation answer to one of the designation options.
+
+    Returns:
+        The matching option, or None if the answer matches none of them
+    """
+    # Clean up the response and check if it matches one of the options
+    response_text = response_text.strip('"\'')  # Remove quotes if present
+    # Check if response matches any of the valid options
+    for option in _DESIGNATION_OPTIONS:
+        if option.lower() == response_text.lower():
+            return option
+    # Try partial match
+    for option in _DESIGNATION_OPTIONS:
+        if option.lower() in response_text.lower() or response_text.lower() in option.lower():
+            logger.info(f"Partial match found: '{response_text}' -> '{option}'")
+            return option
+    logger.warning(f"Could not match designation response: '{response_text}'")
+    return None
+
+
+@dataclass
+class BatchRequest:
+    """One prompt of an LLM batch; results are keyed by ``custom_id``."""
+
+    custom_id: str
+    model: str
+    system_prompt: str
+    user_message: str
+    max_tokens: int
+    temperature: float
+
+
 class LLMService(ABC):
     """Base class for LLM services."""
 
@@ -537,6 +678,84 @@ class LLMService(ABC):
         """
         pass
 
+    def _system_text(self, llm_prompt: LLMPrompt) -> str:
+        """System prompt text for ``llm_prompt`` (before language instructions)."""
+        return llm_prompt.prompt
+
+    def _reading_message(self, reading: Reading) -> str:
+        """User message asking for the context of ``reading`` (before language instructions)."""
+        return f"Please provide context for the following passage: {reading.passage_reference}"
+
+    # --- Batch mode -----------------------------------------------------------
+    # Bulk regeneration submits every prompt through the provider's batch API
+    # (half the token price, no per-request rate limiting); a Celery task polls
+    # the stored batch ID until it has ended (see hub.tasks.llm_tasks).  The
+    # shared system prompt is marked for prompt caching.
+
+    def reading_context_request(self, custom_id: str, reading: Reading, llm_prompt: LLMPrompt, language_code: str = 'en') -> BatchRequest:
+        """Batch request generating the context of a reading (see ``generate_context``)."""
+        system_prompt, user_message = _build_language_prompts(
+            self._reading_message(reading), self._system_text(llm_prompt), language_code
+        )
+        return BatchRequest(custom_id, llm_prompt.model, system_prompt, user_message, max_tokens=1000, temperature=0.35)
+
+    def feast_context_request(self, custom_id: str, feast: Feast, llm_prompt: LLMPrompt, language_code: str = 'en', improvement_instructions: str = None) -> BatchRequest:
+        """Batch request generating the JSON context of a feast (see ``generate_feast_context``)."""
+        system_prompt, user_message = _build_language_prompts(
+            _feast_context_message(feast, improvement_instructions), self._system_text(llm_prompt), language_code
+        )
+        return BatchRequest(custom_id, llm_prompt.model, system_prompt, user_message, max_tokens=2000, temperature=0.35)
+
+    def designation_request(self, custom_id: str, feast: Feast, model_name: str) -> BatchRequest:
+        """Batch request classifying a feast (see ``determine_feast_designation``)."""
+        return BatchRequest(
+            custom_id, model_name, _DESIGNATION_SYSTEM_PROMPT, _designation_user_message(feast),
+            max_tokens=200, temperature=0.1,
+        )
+
+    def run_batch(self, requests: list[BatchRequest]) -> dict[str, Optional[str]]:
+        """Send many requests one at a time (the 'local' ``LLM_BATCH_BACKEND``).
+
+        Returns:
+            Dict mapping every request's custom_id to its response text, or to
+            None if that request failed
+        """
+        return {request.custom_id: self._complete(request) for request in requests}
+
+    @abstractmethod
+    def _complete(self, request: BatchRequest) -> Optional[str]:
+        """Send a single batch request synchronously.
+
+        Returns:
+            The response text, or None if the request failed
+        """
+        pass
+
+    @abstractmethod
+    def submit_batch(self, requests: list[BatchRequest]) -> Optional[str]:
+        """Submit ``requests`` as one provider batch.
+
+        Returns:
+            The provider's batch ID, or None if the submission failed
+        """
+        pass
+
+    @abstractmethod
+    def batch_results(self, batch_id: str) -> Optional[dict[str, str]]:
+        """Collect the successful responses of a submitted batch by ``custom_id``.
+
+        Returns:
+            The response texts once the batch has ended (requests that failed
+            are left out), or None while it is still processing
+        """
+        pass
+
+    @abstractmethod
+    def cancel_batch(self, batch_id: str) -> None:
+        """Cancel a submitted batch that is still processing."""
+        pass
+
+
 class AnthropicService(LLMService):
     """Service for Anthropic's Claude API."""
 
@@ -555,9 +774,8 @@ class AnthropicService(LLMService):
                 logger.error("No active LLM prompt found for readings.")
                 return None
 
-        base_message = f"Please provide context for the following passage: {reading.passage_reference}"
         system_prompt, user_message = _build_language_prompts(
-            base_message, llm_prompt.prompt, language_code
+            self._reading_message(reading), self._system_text(llm_prompt), language_code
         )
 
         try:
@@ -590,66 +808,10 @@ class AnthropicService(LLMService):
                 logger.error("No active LLM prompt found for feasts.")
                 return None
 
-        # Include Armenian name if available
-        feast_info = f"Feast: {feast.name}"
-        if feast.name_hy:
-            feast_info += f"\nArmenian name: {feast.name_hy}"
-
-        base_message = (
-            f"Provide context for the following feast:\n{feast_info}\n\n"
-            "Return your response as JSON with two fields:\n"
-            '- "short_text": A 2-sentence summary\n'
-            '- "text": A detailed explanation (multiple paragraphs)\n\n'
-            "Return ONLY the JSON object, no markdown code blocks.\n"
-            r"IMPORTANT: If you need paragraph breaks, encode them as \n in the JSON string values (do not include literal newlines inside quoted strings)."
-        )
-
-        # Search for matching feast in reference data
-        try:
-            feast_references = _find_all_matching_feasts(feast)
-            if feast_references:
-                if len(feast_references) == 1:
-                    # Single match - keep existing format for backward compatibility
-                    ref = feast_references[0]
-                    logger.debug(f"Found reference data for feast: {ref.get('name', 'N/A')}")
-                    reference_context = (
-                        f"\n\nREFERENCE INFORMATION (use as canonical source):\n"
-                        f"Feast Name: {ref.get('name', 'N/A')}\n"
-                        f"Description: {ref.get('description', 'N/A')}"
-                    )
-                else:
-                    # Multiple matches - synthesize all
-                    logger.debug(f"Found {len(feast_references)} reference commemorations for feast")
-                    reference_context = (
-                        f"\n\nREFERENCE INFORMATION (use as canonical source):\n"
-                        f"This feast may include {len(feast_references)} related commemorations. "
-                        f"Synthesize the most relevant information:\n\n"
-                    )
-                    for i, ref in enumerate(feast_references, 1):
-                        reference_context += (
-                            f"=== COMMEMORATION {i}: {ref.get('name', 'N/A')} ===\n"
-                            f"{ref.get('description', 'N/A')}\n\n"
-                        )
-
-                    # Add synthesis instruction
-                    reference_context += (
-                        "INSTRUCTION: Analyze all commemorations above. If the feast name clearly "
-                        "corresponds to one commemoration, prioritize it. Otherwise, synthesize "
-                        "information from all that are liturgically connected to this date."
-                    )
-
-                base_message += reference_context
-        except Exception as e:
-            logger.error(f"Error during feast reference lookup: {e}", exc_info=True)
-
-        # Add improvement instructions if provided
-        if improvement_instructions:
-            base_message += (
-                f"\n\nIMPROVEMENT INSTRUCTIONS:\n{improvement_instructions}"
-            )
+        base_message = _feast_context_message(feast, improvement_instructions)
 
         system_prompt, user_message = _build_language_prompts(
-            base_message, llm_prompt.prompt, language_code
+            base_message, self._system_text(llm_prompt), language_code
         )
         user_content = [
             {
@@ -692,45 +854,8 @@ class AnthropicService(LLMService):
             else:
                 model_name = 'claude-sonnet-4-5-20250929'  # Default fallback
 
-        # Hardcoded prompt for designation determination
-        designation_options = [
-            'Sundays, Dominical Feast Days',
-            'St. Gregory the Illuminator, St. Hripsime and her companions, the Apostles, the Prophets',
-            'Patriarchs, Vartapets',
-            'Nativity of Christ, Feasts of the Mother of God, Presentation of the Lord',
-            'Martyrs',
-            'Fast',
-        ]
-
-        feast_info = f"Feast name: {feast.name}"
-        if feast.name_hy:
-            feast_info += f"\nArmenian name: {feast.name_hy}"
-
-        system_prompt = (
-            "You are a classification expert for Armenian Orthodox Church feasts. "
-            "Determine the appropriate designation category for a feast based solely on its name. "
-            "IMPORTANT: Any name that follows the pattern '[ordinal/number] day of [Fast/Lent]' "
-            "(e.g. 'Nineteenth day of Great Lent', 'Twenty Ninth day of Great Lent', 'Third day of the Fast') "
-            "is always classified as 'Fast' — it is a generic fasting day with no specific commemoration. "
-            "EXCEPTION: Names in the pattern '[ordinal] day of Easter' (e.g. 'Second day of Easter', "
-            "'Fourth day of Easter') are NOT fasting days. The 50 days after Easter are a sacred feast "
-            "period in the Armenian Apostolic Church, not a fast. Classify these as 'Sundays, Dominical Feast Days'."
-        )
-
-        user_message = (
-            f"{feast_info}\n\n"
-            "Based on the feast name above, determine which of the following designation categories it belongs to:\n"
-            f"1. {designation_options[0]} — Sundays and major feast days of the Lord (Christmas, Easter, Ascension, etc.), "
-            f"and the 50-day Easter season including days named '[ordinal] day of Easter'\n"
-            f"2. {designation_options[1]} — St. Gregory the Illuminator, Apostles, Prophets, and their companions\n"
-            f"3. {designation_options[2]} — Patriarchs, Catholicos, and Vartapets (vardapets) of the Armenian Church\n"
-            f"4. {designation_options[3]} — Nativity, Theophany, Presentation, and Marian feasts\n"
-            f"5. {designation_options[4]} — Holy martyrs who died for the faith\n"
-            f"6. {designation_options[5]} — A generic numbered day within a fasting period (Great Lent, Advent Fast, etc.), "
-            f"with NO specific saint or feast named (e.g. 'Nineteenth day of Great Lent', 'Twenty Ninth day of Great Lent'). "
-            f"NEVER choose this for days of Easter — those are feast days, not fast days.\n\n"
-            "Return ONLY the exact designation text from the list above, with no additional explanation or formatting."
-        )
+        system_prompt = _DESIGNATION_SYSTEM_PROMPT
+        user_message = _designation_user_message(feast)
 
         try:
             response = self.client.messages.create(
@@ -744,25 +869,69 @@ class AnthropicService(LLMService):
             )
             if response and response.content:
                 response_text = response.content[0].text.strip()
-                # Clean up the response and check if it matches one of the options
-                response_text = response_text.strip('"\'')  # Remove quotes if present
-                # Check if response matches any of the valid options
-                for option in designation_options:
-                    if option.lower() == response_text.lower():
-                        return option
-                # Try partial match
-                for option in designation_options:
-                    if option.lower() in response_text.lower() or response_text.lower() in option.lower():
-                        logger.info(f"Partial match found: '{response_text}' -> '{option}'")
-                        return option
-                logger.warning(f"Could not match designation response: '{response_text}'")
-                return None
+                return _match_designation(response_text)
             logger.error("No content returned from Claude API for designation.")
             return None
         except Exception as e:
             logger.error(f"Error determining feast designation with Claude: {e}")
             return None
 
+    def _message_params(self, request: BatchRequest) -> dict:
+        # The system prompt is shared by every request of a language, so cache it
+        return {
+            "model": request.model,
+            "system": [
+                {"type": "text", "text": request.system_prompt, "cache_control": {"type": "ephemeral"}}
+            ],
+            "messages": [{"role": "user", "content": request.user_message}],
+            "max_tokens": request.max_tokens,
+            "temperature": request.temperature,
+        }
+
+    def _complete(self, request: BatchRequest) -> Optional[str]:
+        if not settings.ANTHROPIC_API_KEY:
+            logger.error("ANTHROPIC_API_KEY is not configured.")
+            return None
+        try:
+            response = self.client.messages.create(**self._message_params(request))
+            if response and response.content:
+                return response.content[0].text.strip()
+            logger.error("No content returned from Claude API for %s.", request.custom_id)
+        except Exception as e:
+            logger.error(f"Error running Claude request {request.custom_id}: {e}")
+        return None
+
+    def submit_batch(self, requests: list[BatchRequest]) -> Optional[str]:
+        if not settings.ANTHROPIC_API_KEY:
+            logger.error("ANTHROPIC_API_KEY is not configured.")
+            return None
+        try:
+            batch = self.client.messages.batches.create(requests=[
+                {"custom_id": request.custom_id, "params": self._message_params(request)}
+                for request in requests
+            ])
+        except Exception as e:
+            logger.error(f"Error submitting Claude batch: {e}")
+            return None
+        logger.info("Submitted Claude batch %s with %d requests.", batch.id, len(requests))
+        return batch.id
+
+    def batch_results(self, batch_id: str) -> Optional[dict[str, str]]:
+        batches = self.client.messages.batches
+        if batches.retrieve(batch_id).processing_status != "ended":
+            return None
+        results = {}
+        for entry in batches.results(batch_id):
+            if entry.result.type == "succeeded" and entry.result.message.content:
+                results[entry.custom_id] = entry.result.message.content[0].text.strip()
+            else:
+                logger.warning("Claude batch request %s %s.", entry.custom_id, entry.result.type)
+        return results
+
+    def cancel_batch(self, batch_id: str) -> None:
+        self.client.messages.batches.cancel(batch_id)
+
+
 class OpenAIService(LLMService):
     """Service for OpenAI's API."""
 
@@ -781,10 +950,8 @@ class OpenAIService(LLMService):
                 logger.error("No active LLM prompt found for readings.")
                 return None
 
-        base_prompt = f"Contextualize the passage {reading.passage_reference}, by summarizing the passages preceding it."
-        llm_prompt_text = f"{llm_prompt.role}\n\n{llm_prompt.prompt}"
         system_prompt, user_message = _build_language_prompts(
-            base_prompt, llm_prompt_text, language_code
+            self._reading_message(reading), self._system_text(llm_prompt), language_code
         )
 
         try:
@@ -820,67 +987,10 @@ class OpenAIService(LLMService):
                 logger.error("No active LLM prompt found for feasts.")
                 return None
 
-        # Include Armenian name if available
-        feast_info = f"Feast: {feast.name}"
-        if feast.name_hy:
-            feast_info += f"\nArmenian name: {feast.name_hy}"
-
-        base_prompt = (
-            f"Provide context for the following feast:\n{feast_info}\n\n"
-            "Return your response as JSON with two fields:\n"
-            '- "short_text": A 2-sentence summary\n'
-            '- "text": A detailed explanation (multiple paragraphs)\n\n'
-            "Return ONLY the JSON object, no markdown code blocks.\n"
-            r"IMPORTANT: If you need paragraph breaks, encode them as \n in the JSON string values (do not include literal newlines inside quoted strings)."
-        )
-
-        # Search for matching feast in reference data
-        try:
-            feast_references = _find_all_matching_feasts(feast)
-            if feast_references:
-                if len(feast_references) == 1:
-                    # Single match - keep existing format for backward compatibility
-                    ref = feast_references[0]
-                    logger.debug(f"Found reference data for feast: {ref.get('name', 'N/A')}")
-                    reference_context = (
-                        f"\n\nREFERENCE INFORMATION (use as canonical source):\n"
-                        f"Feast Name: {ref.get('name', 'N/A')}\n"
-                        f"Description: {ref.get('description', 'N/A')}"
-                    )
-                else:
-                    # Multiple matches - synthesize all
-                    logger.debug(f"Found {len(feast_references)} reference commemorations for feast")
-                    reference_context = (
-                        f"\n\nREFERENCE INFORMATION (use as canonical source):\n"
-                        f"This feast may include {len(feast_references)} related commemorations. "
-                        f"Synthesize the most relevant information:\n\n"
-                    )
-                    for i, ref in enumerate(feast_references, 1):
-                        reference_context += (
-                            f"=== COMMEMORATION {i}: {ref.get('name', 'N/A')} ===\n"
-                            f"{ref.get('description', 'N/A')}\n\n"
-                        )
-
-                    # Add synthesis instruction
-                    reference_context += (
-                        "INSTRUCTION: Analyze all commemorations above. If the feast name clearly "
-                        "corresponds to one commemoration, prioritize it. Otherwise, synthesize "
-                        "information from all that are liturgically connected to this date."
-                    )
-
-                base_prompt += reference_context
-        except Exception as e:
-            logger.error(f"Error during feast reference lookup: {e}", exc_info=True)
-
-        # Add improvement instructions if provided
-        if improvement_instructions:
-            base_prompt += (
-                f"\n\nIMPROVEMENT INSTRUCTIONS:\n{improvement_instructions}"
-            )
+        base_prompt = _feast_context_message(feast, improvement_instructions)
 
-        llm_prompt_text = f"{llm_prompt.role}\n\n{llm_prompt.prompt}"
         system_prompt, user_message = _build_language_prompts(
-            base_prompt, llm_prompt_text, language_code
+            base_prompt, self._system_text(llm_prompt), language_code
         )
 
         try:
@@ -920,45 +1030,8 @@ class OpenAIService(LLMService):
             else:
                 model_name = 'gpt-4o-mini'  # Default fallback
 
-        # Hardcoded prompt for designation determination
-        designation_options = [
-            'Sundays, Dominical Feast Days',
-            'St. Gregory the Illuminator, St. Hripsime and her companions, the Apostles, the Prophets',
-            'Patriarchs, Vartapets',
-            'Nativity of Christ, Feasts of the Mother of God, Presentation of the Lord',
-            'Martyrs',
-            'Fast',
-        ]
-
-        feast_info = f"Feast name: {feast.name}"
-        if feast.name_hy:
-            feast_info += f"\nArmenian name: {feast.name_hy}"
-
-        system_prompt = (
-            "You are a classification expert for Armenian Orthodox Church feasts. "
-            "Determine the appropriate designation category for a feast based solely on its name. "
-            "IMPORTANT: Any name that follows the pattern '[ordinal/number] day of [Fast/Lent]' "
-            "(e.g. 'Nineteenth day of Great Lent', 'Twenty Ninth day of Great Lent', 'Third day of the Fast') "
-            "is always classified as 'Fast' — it is a generic fasting day with no specific commemoration. "
-            "EXCEPTION: Names in the pattern '[ordinal] day of Easter' (e.g. 'Second day of Easter', "
-            "'Fourth day of Easter') are NOT fasting days. The 50 days after Easter are a sacred feast "
-            "period in the Armenian Apostolic Church, not a fast. Classify these as 'Sundays, Dominical Feast Days'."
-        )
-
-        user_message = (
-            f"{feast_info}\n\n"
-            "Based on the feast name above, determine which of the following designation categories it belongs to:\n"
-            f"1. {designation_options[0]} — Sundays and major feast days of the Lord (Christmas, Easter, Ascension, etc.), "
-            f"and the 50-day Easter season including days named '[ordinal] day of Easter'\n"
-            f"2. {designation_options[1]} — St. Gregory the Illuminator, Apostles, Prophets, and their companions\n"
-            f"3. {designation_options[2]} — Patriarchs, Catholicos, and Vartapets (vardapets) of the Armenian Church\n"
-            f"4. {designation_options[3]} — Nativity, Theophany, Presentation, and Marian feasts\n"
-            f"5. {designation_options[4]} — Holy martyrs who died for the faith\n"
-            f"6. {designation_options[5]} — A generic numbered day within a fasting period (Great Lent, Advent Fast, etc.), "
-            f"with NO specific saint or feast named (e.g. 'Nineteenth day of Great Lent', 'Twenty Ninth day of Great Lent'). "
-            f"NEVER choose this for days of Easter — those are feast days, not fast days.\n\n"
-            "Return ONLY the exact designation text from the list above, with no additional explanation or formatting."
-        )
+        system_prompt = _DESIGNATION_SYSTEM_PROMPT
+        user_message = _designation_user_message(feast)
 
         try:
             if not self.client:
@@ -975,25 +1048,105 @@ class OpenAIService(LLMService):
             )
             if response.choices:
                 response_text = response.choices[0].message.content.strip()
-                # Clean up the response and check if it matches one of the options
-                response_text = response_text.strip('"\'')  # Remove quotes if present
-                # Check if response matches any of the valid options
-                for option in designation_options:
-                    if option.lower() == response_text.lower():
-                        return option
-                # Try partial match
-                for option in designation_options:
-                    if option.lower() in response_text.lower() or response_text.lower() in option.lower():
-                        logger.info(f"Partial match found: '{response_text}' -> '{option}'")
-                        return option
-                logger.warning(f"Could not match designation response: '{response_text}'")
-                return None
+                return _match_designation(response_text)
             logger.error("OpenAI response contained no choices for designation.")
             return None
         except Exception as exc:
             logger.exception("OpenAI API call failed for designation: %s", exc)
         return None
 
+    def _system_text(self, llm_prompt: LLMPrompt) -> str:
+        return f"{llm_prompt.role}\n\n{llm_prompt.prompt}"
+
+    def _reading_message(self, reading: Reading) -> str:
+        return f"Contextualize the passage {reading.passage_reference}, by summarizing the passages preceding it."
+
+    def _chat_body(self, request: BatchRequest) -> dict:
+        # OpenAI caches repeated prompt prefixes automatically; the cache key
+        # routes requests sharing a system prompt to the same cache
+        return {
+            "model": request.model,
+            "messages": [
+                {"role": "system", "content": request.system_prompt},
+                {"role": "user", "content": request.user_message},
+            ],
+            "max_tokens": request.max_tokens,
+            "temperature": request.temperature,
+            "top_p": 1,
+            "prompt_cache_key": hashlib.sha256(request.system_prompt.encode()).hexdigest()[:32],
+        }
+
+    def _complete(self, request: BatchRequest) -> Optional[str]:
+        if not settings.OPENAI_API_KEY:
+            logger.error("OPENAI_API_KEY is not configured.")
+            return None
+        try:
+            if not self.client:
+                self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
+            response = self.client.chat.completions.create(**self._chat_body(request))
+            if response.choices:
+                return response.choices[0].message.content.strip()
+            logger.error("OpenAI response contained no choices for %s", request.custom_id)
+        except Exception as exc:
+            logger.exception("OpenAI API call failed for %s: %s", request.custom_id, exc)
+        return None
+
+    def _batch_client(self) -> OpenAI:
+        if not self.client:
+            self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        return self.client
+
+    def submit_batch(self, requests: list[BatchRequest]) -> Optional[str]:
+        if not settings.OPENAI_API_KEY:
+            logger.error("OPENAI_API_KEY is not configured.")
+            return None
+        try:
+            client = self._batch_client()
+            lines = "\n".join(
+                json.dumps({
+                    "custom_id": request.custom_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": self._chat_body(request),
+                })
+                for request in requests
+            )
+            input_file = client.files.create(file=("llm_batch.jsonl", lines.encode("utf-8")), purpose="batch")
+            batch = client.batches.create(
+                input_file_id=input_file.id, endpoint="/v1/chat/completions", completion_window="24h"
+            )
+        except Exception as exc:
+            logger.exception("OpenAI batch submission failed: %s", exc)
+            return None
+        logger.info("Submitted OpenAI batch %s with %d requests.", batch.id, len(requests))
+        return batch.id
+
+    def batch_results(self, batch_id: str) -> Optional[dict[str, str]]:
+        client = self._batch_client()
+        batch = client.batches.retrieve(batch_id)
+        if batch.status not in ("completed", "failed", "expired", "cancelled"):
+            return None
+        # Expired batches still return the requests that completed
+        if not batch.output_file_id:
+            logger.error("OpenAI batch %s ended with status %s and no output.", batch_id, batch.status)
+            return {}
+
+        results = {}
+        for line in client.files.content(batch.output_file_id).text.splitlines():
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            response = entry.get("response") or {}
+            choices = (response.get("body") or {}).get("choices")
+            if response.get("status_code") == 200 and choices:
+                results[entry["custom_id"]] = choices[0]["message"]["content"].strip()
+            else:
+                logger.warning("OpenAI batch request %s failed: %s", entry.get("custom_id"), entry.get("error"))
+        return results
+
+    def cancel_batch(self, batch_id: str) -> None:
+        self._batch_client().batches.cancel(batch_id)
+
 def get_llm_service(model_name: str) -> LLMService:
     """Factory function to get the appropriate LLM service based on model name."""
     if "gpt" in model_name:
@@ -0,0 +1,247 @@
+"""Multi-resolution participant density for the fast maps.
+
+Each fast's participants with coordinates are counted per cell of a
+longitude/latitude grid at every zoom in ``DENSITY_ZOOMS``.  A cell at zoom
+``z`` is ``cell_size(z)`` degrees wide; cell ``(x, y)`` spans longitudes
+``-180 + x * size`` to ``-180 + (x + 1) * size`` and latitudes
+``-90 + y * size`` upwards.  Cells also keep coordinate sums, so clusters are
+drawn at the centroid of their participants.
+
+``ParticipantDensityCell`` rows are maintained incrementally by hub.signals
+(``add_participant`` / ``remove_participant``) as profiles join or leave
+fasts or change coordinates, and rebuilt in bulk with vectorized NumPy
+binning by ``rebuild_density`` (the ``rebuild_participant_density``
+management command).  ``density_geojson`` serves them to clients that render
+interactive maps themselves.
+"""
+
+import logging
+import math
+from collections import Counter, defaultdict
+from typing import Iterable, Optional
+
+from django.db import IntegrityError, transaction
+from django.db.models import F, Q
+
+from hub.models import Fast, ParticipantDensityCell, Profile
+
+logger = logging.getLogger(__name__)
+
+DENSITY_ZOOMS = (0, 2, 4, 6, 8, 10)
+
+
+def cell_size(zoom: int) -> float:
+    """Cell width in degrees: 45° at zoom 0, halving every zoom level (~5 km at 10)."""
+    return 360.0 / 2 ** (zoom + 3)
+
+
+def is_valid_location(longitude, latitude) -> bool:
+    """Coordinates worth mapping: set, finite, in range and not (0, 0)."""
+    if longitude is None or latitude is None:
+        return False
+    if math.isnan(longitude) or math.isnan(latitude) or (longitude == 0 and latitude == 0):
+        return False
+    return -180 <= longitude <= 180 and -90 <= latitude <= 90
+
+
+def _cells(longitude: float, latitude: float) -> list[tuple[int, int, int]]:
+    """(zoom, x, y) of the cells containing a location at every zoom."""
+    cells = []
+    for zoom in DENSITY_ZOOMS:
+        size = cell_size(zoom)
+        cells.append((zoom, int((longitude + 180) // size), int((latitude + 90) // size)))
+    return cells
+
+
+def _cell_filter(cells) -> Q:
+    match = Q()
+    for zoom, x, y in cells:
+        match |= Q(zoom=zoom, x=x, y=y)
+    return match
+
+
+def _shift(fast_ids: list[int], cells, delta: int, longitude: float, latitude: float):
+    return ParticipantDensityCell.objects.filter(fast_id__in=fast_ids).filter(_cell_filter(cells)).update(
+        count=F('count') + delta,
+        longitude_sum=F('longitude_sum') + delta * longitude,
+        latitude_sum=F('latitude_sum') + delta * latitude,
+    )
+
+
+def _by_multiplicity(fast_ids: Iterable[int]) -> dict[int, list[int]]:
+    """``{n: fast IDs listed n times}``, so each group is one UPDATE."""
+    groups = defaultdict(list)
+    for fast_id, n in Counter(fast_ids).items():
+        groups[n].append(fast_id)
+    return groups
+
+
+def add_participant(fast_ids: Iterable[int], longitude, latitude) -> None:
+    """Count a participant at (longitude, latitude) in the cells of each fast.
+
+    A fast listed several times counts the participant that many times.
+    """
+    if not is_valid_location(longitude, latitude):
+        return
+    cells = _cells(longitude, latitude)
+    for n, ids in _by_multiplicity(fast_ids).items():
+        for fast_id in ids:
+            if _shift([fast_id], cells, n, longitude, latitude) == len(cells):
+                continue
+            present = set(
+                ParticipantDensityCell.objects.filter(fast_id=fast_id).filter(_cell_filter(cells))
+                .values_list('zoom', 'x', 'y')
+            )
+            missing = [cell for cell in cells if cell not in present]
+            try:
+                with transaction.atomic():
+                    ParticipantDensityCell.objects.bulk_create([
+                        ParticipantDensityCell(
+                            fast_id=fast_id, zoom=zoom, x=x, y=y,
+                            count=n, longitude_sum=n * longitude, latitude_sum=n * latitude,
+                        )
+                        for zoom, x, y in missing
+                    ])
+            except IntegrityError:
+                # Created concurrently in the meantime
+                _shift([fast_id], missing, n, longitude, latitude)
+
+
+def remove_participant(fast_ids: Iterable[int], longitude, latitude) -> None:
+    """Uncount a participant at (longitude, latitude) from the cells of each fast.
+
+    A fast listed several times uncounts the participant that many times.
+    """
+    if not is_valid_location(longitude, latitude):
+        return
+    cells = _cells(longitude, latitude)
+    fast_ids = list(fast_ids)
+    for n, ids in _by_multiplicity(fast_ids).items():
+        _shift(ids, cells, -n, longitude, latitude)
+    if fast_ids:
+        ParticipantDensityCell.objects.filter(fast_id__in=fast_ids, count__lte=0).delete()
+
+
+def bin_locations(locations) -> dict[int, tuple]:
+    """Bin (longitude, latitude) pairs into the grid of every zoom.
+
+    Returns:
+        ``{zoom: (cells, counts, longitude_sums, latitude_sums)}`` with
+        ``cells`` an (N, 2) array of (x, y)
+    """
+    import numpy as np
+
+    points = np.array(
+        [(lon, lat) for lon, lat in locations if is_valid_location(lon, lat)], dtype=float
+    ).reshape(-1, 2)
+    binned = {}
+    for zoom in DENSITY_ZOOMS:
+        indices = np.floor((points + (180, 90)) / cell_size(zoom)).astype(np.int64)
+        cells, inverse, counts = np.unique(indices, axis=0, return_inverse=True, return_counts=True)
+        inverse = inverse.reshape(-1)
+        binned[zoom] = (
+            cells,
+            counts,
+            np.bincount(inverse, weights=points[:, 0], minlength=len(cells)),
+            np.bincount(inverse, weights=points[:, 1], minlength=len(cells)),
+        )
+    return binned
+
+
+def rebuild_density(fast: Fast, profile_model=Profile, cell_model=ParticipantDensityCell) -> int:
+    """Recompute every density cell of ``fast`` from its participants.
+
+    Args:
+        fast: The fast
+        profile_model, cell_model: The models to use; migrations pass their
+            historical ones
+
+    Returns:
+        Number of participants with valid coordinates
+    """
+    locations = list(
+        profile_model.objects.filter(fasts=fast, latitude__isnull=False, longitude__isnull=False)
+        .values_list('longitude', 'latitude')
+    )
+    binned = bin_locations(locations)
+    rows = [
+        cell_model(
+            fast_id=fast.pk, zoom=zoom, x=int(x), y=int(y),
+            count=int(count), longitude_sum=float(lon_sum), latitude_sum=float(lat_sum),
+        )
+        for zoom, (cells, counts, lon_sums, lat_sums) in binned.items()
+        for (x, y), count, lon_sum, lat_sum in zip(cells, counts, lon_sums, lat_sums)
+    ]
+    with transaction.atomic():
+        cell_model.objects.filter(fast_id=fast.pk).delete()
+        cell_model.objects.bulk_create(rows, batch_size=1000)
+    participants = int(binned[DENSITY_ZOOMS[0]][1].sum())
+    logger.info("Rebuilt participant density of fast %s: %d participants, %d cells", fast.pk, participants, len(rows))
+    return participants
+
+
+def nearest_zoom(zoom: Optional[int]) -> int:
+    """The highest available zoom not above ``zoom`` (the lowest for None)."""
+    if zoom is None:
+        return DENSITY_ZOOMS[0]
+    return max([z for z in DENSITY_ZOOMS if z <= zoom], default=DENSITY_ZOOMS[0])
+
+
+def density_geojson(fast: Fast, zoom: int, bbox: Optional[tuple[float, float, float, float]] = None) -> dict:
+    """The fast's density cells at ``zoom`` as a GeoJSON FeatureCollection.
+
+    Each feature is a point at the centroid of the cell's participants with
+    the participant ``count`` and the ``cell`` bounds as
+    [min_lon, min_lat, max_lon, max_lat].
+
+    Args:
+        fast: The fast
+        zoom: One of DENSITY_ZOOMS
+        bbox: Optional (min_lon, min_lat, max_lon, max_lat) to restrict cells to
+    """
+    size = cell_size(zoom)
+    cells = ParticipantDensityCell.objects.filter(fast=fast, zoom=zoom, count__gt=0)
+    if bbox:
+        # Clamped to the world, so far-out bounds do not overflow the cell indices
+        min_lon, max_lon = (min(max(lon, -180.0), 180.0) for lon in (bbox[0], bbox[2]))
+        min_lat, max_lat = (min(max(lat, -90.0), 90.0) for lat in (bbox[1], bbox[3]))
+        cells = cells.filter(
+            x__gte=math.floor((min_lon + 180) / size), x__lte=math.floor((max_lon + 180) / size),
+            y__gte=math.floor((min_lat + 90) / size), y__lte=math.floor((max_lat + 90) / size),
+        )
+
+    features = []
+    total = 0
+    for x, y, count, lon_sum, lat_sum in cells.order_by('x', 'y').values_list(
+        'x', 'y', 'count', 'longitude_sum', 'latitude_sum'
+    ):
+        total += count
+        features.append({
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [round(lon_sum / count, 5), round(lat_sum / count, 5)]},
+            "properties": {
+                "count": count,
+                "cell": [
+                    -180 + x * size, -90 + y * size,
+                    -180 + (x + 1) * size, -90 + (y + 1) * size,
+                ],
+            },
+        })
+    return {
+        "type": "FeatureCollection",
+        "features": features,
+        "properties": {
+            "fast_id": fast.pk,
+            "zoom": zoom,
+            "zooms": list(DENSITY_ZOOMS),
+            "cell_size": size,
+            "participants": total,
+        },
+    }
+
+
+def member_locations(memberships) -> list[tuple[int, float, float]]:
+    """(fast_id, longitude, latitude) of the Profile.fasts rows whose member has coordinates."""
+    return list(memberships.filter(
+        profile__latitude__isnull=False, profile__longitude__isnull=False,
+    ).values_list('fast_id', 'profile__longitude', 'profile__latitude'))
@@ -0,0 +1,140 @@
+"""SVG rendering of the fast participant maps.
+
+Maps are written directly as SVG: the basemap outlines come pre-projected
+from ``hub.services.basemap`` and participants are drawn as circles, grouped
+into clusters on a grid of ``clustering_distance`` degrees.  Rendering needs
+only NumPy, no plotting library.
+
+``locations_hash`` fingerprints the participant coordinates (and the
+renderer and basemap) so that ``generate_participant_map`` can skip fasts
+whose maps would not change.
+"""
+
+import hashlib
+import math
+from typing import Iterable, Optional
+
+import numpy as np
+
+from hub.services.basemap import US_BOUNDS, get_basemap, project, view_size
+
+# Bump when the rendered output changes, so existing maps are re-rendered
+RENDERER_VERSION = 1
+# Coordinates are hashed at ~10 m precision
+HASH_DECIMALS = 4
+
+LAND_COLOR = "#771831"
+POINT_COLOR = "#FFB700"
+# Circle radii in SVG units (the map is VIEW_WIDTH units wide)
+POINT_RADIUS = 4.3
+MIN_CLUSTER_RADIUS = 5.3
+MAX_CLUSTER_RADIUS = 9.6
+
+
+def normalize_locations(locations: Iterable[tuple]) -> np.ndarray:
+    """Valid (longitude, latitude) pairs as an (N, 2) array.
+
+    Drops (0, 0), non-numeric and NaN coordinates and wraps longitudes into
+    [-180, 180].
+    """
+    valid = [
+        (lon, lat) for lon, lat in locations
+        if isinstance(lon, (int, float)) and isinstance(lat, (int, float))
+        and (lon != 0 or lat != 0) and not (math.isnan(lon) or math.isnan(lat))
+    ]
+    points = np.array(valid, dtype=float).reshape(-1, 2)
+    points[:, 0] = np.where(points[:, 0] > 180, points[:, 0] - 360, points[:, 0])
+    points[:, 0] = np.where(points[:, 0] < -180, points[:, 0] + 360, points[:, 0])
+    return points
+
+
+def locations_hash(locations: Iterable[tuple]) -> str:
+    """SHA-256 of the sorted, rounded valid coordinates, the renderer version and the basemap.
+
+    Rebuilding ``data/world_basemap.geojson`` changes the hash, so every map
+    is re-rendered with the new outlines.
+    """
+    points = np.round(normalize_locations(locations), HASH_DECIMALS)
+    points = points[np.lexsort((points[:, 1], points[:, 0]))]
+    digest = hashlib.sha256(f"v{RENDERER_VERSION}:{get_basemap().digest}:".encode())
+    digest.update(np.ascontiguousarray(points).tobytes())
+    return digest.hexdigest()
+
+
+def cluster_locations(
+    points: np.ndarray,
+    clustering_distance: float = 0.5,
+    min_cluster_size: int = 3,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Group points by grid cell of ``clustering_distance`` degrees.
+
+    Returns:
+        (cluster centers, cluster sizes, unclustered points); cells with at
+        least ``min_cluster_size`` points become clusters centered on their
+        mean, the points of the other cells are kept as they are
+    """
+    if not len(points):
+        return np.empty((0, 2)), np.empty(0, dtype=int), points
+    cells = np.floor(points / clustering_distance).astype(np.int64)
+    _, inverse, counts = np.unique(cells, axis=0, return_inverse=True, return_counts=True)
+    inverse = inverse.reshape(-1)
+    clustered = counts[inverse] >= min_cluster_size
+
+    cluster_ids, cluster_inverse = np.unique(inverse[clustered], return_inverse=True)
+    sizes = counts[cluster_ids]
+    centers = np.zeros((len(cluster_ids), 2))
+    np.add.at(centers, cluster_inverse, points[clustered])
+    centers /= sizes[:, None]
+    return centers, sizes, points[~clustered]
+
+
+def _circles(xy: np.ndarray, radii: np.ndarray) -> str:
+    return "".join(f'<circle cx="{x:.1f}" cy="{y:.1f}" r="{r:.1f}"/>' for (x, y), r in zip(xy, radii))
+
+
+def render_participant_map_svg(
+    locations: Iterable[tuple],
+    clustering_distance: float = 0.5,
+    min_cluster_size: int = 3,
+    width: Optional[int] = None,
+) -> str:
+    """Render the participant map of ``locations`` as an SVG document.
+
+    Args:
+        locations: (longitude, latitude) pairs; invalid ones are skipped
+        clustering_distance: Grid cell size (in degrees) for clustering points
+        min_cluster_size: Minimum number of points in a cell to form a cluster
+        width: Optional width attribute in pixels (the SVG scales otherwise)
+
+    Returns:
+        The SVG markup
+    """
+    points = normalize_locations(locations)
+    min_lon, min_lat, max_lon, max_lat = US_BOUNDS
+    us_only = bool(len(points)) and bool(np.all(
+        (points[:, 0] >= min_lon) & (points[:, 0] <= max_lon)
+        & (points[:, 1] >= min_lat) & (points[:, 1] <= max_lat)
+    ))
+    basemap = get_basemap()
+    view = "us" if us_only and basemap.paths["us"] else "world"
+    view_width, view_height = view_size(view)
+
+    centers, sizes, singles = cluster_locations(points, clustering_distance, min_cluster_size)
+    if len(sizes):
+        spread = max(1, sizes.max() - sizes.min())
+        cluster_radii = MIN_CLUSTER_RADIUS + (sizes - sizes.min()) * (MAX_CLUSTER_RADIUS - MIN_CLUSTER_RADIUS) / spread
+    else:
+        cluster_radii = np.empty(0)
+
+    size_attrs = ""
+    if width:
+        size_attrs = f' width="{width}" height="{round(width * view_height / view_width)}"'
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {view_width:g} {view_height:g}"{size_attrs}>'
+        f'<path d="{basemap.paths[view]}" fill="{LAND_COLOR}" fill-opacity="0.8" fill-rule="evenodd" '
+        f'stroke="{LAND_COLOR}" stroke-width="0.8" stroke-linejoin="round"/>'
+        f'<g fill="{POINT_COLOR}" fill-opacity="0.8">'
+        f'{_circles(project(singles, view), np.full(len(singles), POINT_RADIUS))}'
+        f'{_circles(project(centers, view), cluster_radii)}'
+        '</g></svg>'
+    )
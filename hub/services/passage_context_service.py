@@ -0,0 +1,115 @@
+"""Passage-keyed store of generated reading contexts.
+
+The lectionary repeats every year, but contexts hang off ``Reading`` rows
+that are created per day (and pruned by the weekly text refresh).
+``PassageContext`` keeps each generated context keyed by normalized book,
+verse range, prompt, model and a digest of the prompt's text, so a new
+Reading of a known passage copies the stored context instead of calling the
+LLM.  Activating a different ``LLMPrompt``, changing its model or editing
+its role or prompt text misses the store and generates anew.
+"""
+
+import hashlib
+import logging
+
+from django.conf import settings
+
+from hub.constants import normalize_book_name
+from hub.models import LLMPrompt, PassageContext, Reading, ReadingContext
+
+logger = logging.getLogger(__name__)
+
+AVAILABLE_LANGUAGES = getattr(settings, 'MODELTRANS_AVAILABLE_LANGUAGES', ['en', 'hy'])
+
+
+def _text_field(lang: str) -> str:
+    return "text" if lang == "en" else f"text_{lang}"
+
+
+def passage_key(reading: Reading) -> dict:
+    """Lookup fields identifying the passage of ``reading``."""
+    return {
+        "book_key": normalize_book_name(reading.book) or "",
+        "start_chapter": reading.start_chapter,
+        "start_verse": reading.start_verse,
+        "end_chapter": reading.end_chapter,
+        "end_verse": reading.end_verse,
+    }
+
+
+def prompt_digest(prompt: LLMPrompt) -> str:
+    """SHA-256 of the prompt's role and text, which shape every context it generates."""
+    return hashlib.sha256(f"{prompt.role}\0{prompt.prompt}".encode()).hexdigest()
+
+
+def _prompt_key(prompt: LLMPrompt) -> dict:
+    """Lookup fields identifying the prompt as it is now."""
+    return {"prompt": prompt, "model": prompt.model, "prompt_digest": prompt_digest(prompt)}
+
+
+def get_active_reading_prompt() -> LLMPrompt | None:
+    return LLMPrompt.objects.filter(active=True, applies_to='readings').first()
+
+
+def context_translations(context) -> dict[str, str]:
+    """Non-empty context texts of a ReadingContext or PassageContext, by language."""
+    translations = {}
+    for lang in AVAILABLE_LANGUAGES:
+        text = getattr(context, _text_field(lang), None)
+        if text and text.strip():
+            translations[lang] = text
+    return translations
+
+
+def find_passage_context(reading: Reading, prompt: LLMPrompt) -> dict[str, str] | None:
+    """Stored context translations for the passage of ``reading``, if complete for ``prompt``."""
+    entry = PassageContext.objects.filter(**passage_key(reading), **_prompt_key(prompt)).first()
+    if entry is None:
+        return None
+    translations = context_translations(entry)
+    return translations if len(translations) == len(AVAILABLE_LANGUAGES) else None
+
+
+def store_passage_context(reading: Reading, prompt: LLMPrompt, context: ReadingContext) -> PassageContext | None:
+    """Record the context of ``reading`` for its passage (replacing any earlier one).
+
+    Contexts missing a language are not stored.
+    """
+    translations = context_translations(context)
+    if len(translations) < len(AVAILABLE_LANGUAGES):
+        return None
+
+    entry, _ = PassageContext.objects.get_or_create(
+        **passage_key(reading), **_prompt_key(prompt), defaults={"text": translations["en"]},
+    )
+    for lang, text in translations.items():
+        setattr(entry, _text_field(lang), text)
+    entry.save()
+    return entry
+
+
+def reuse_passage_context(reading: Reading, prompt: LLMPrompt | None = None) -> ReadingContext | None:
+    """Give ``reading`` a copy of the stored context of its passage, if there is one.
+
+    Args:
+        reading: A saved Reading without an active context.
+        prompt: The active readings prompt (looked up when omitted).
+
+    Returns:
+        The new active ReadingContext, or None if the store has no complete
+        context for this passage, prompt and model.
+    """
+    prompt = prompt or get_active_reading_prompt()
+    if prompt is None:
+        return None
+
+    translations = find_passage_context(reading, prompt)
+    if translations is None:
+        return None
+
+    context = ReadingContext(reading=reading, prompt=prompt)
+    for lang, text in translations.items():
+        setattr(context, _text_field(lang), text)
+    context.save()
+    logger.info("Reused stored context for Reading %s (%s).", reading.pk, reading.passage_reference)
+    return context
@@ -0,0 +1,153 @@
+"""Quote-of-the-day selection for ``PatristicQuoteOfTheDayView``.
+
+The ordered IDs of the quotes matching a (fast, tag set) filter are cached
+under the ``patristic_quotes`` content version, so a new day, timezone or
+language only hashes into that list and loads one quote by primary key
+instead of counting and OFFSET-scanning the filtered multi-join.
+
+Rendered quotes are cached per date, filter and language.
+``prerender_quotes_of_the_day`` fills that cache ahead of time for the
+filter combinations requested recently and for the fasts observed on the
+day, in every language; ``prerender_quotes_of_the_day_task`` runs it nightly.
+"""
+
+import hashlib
+import logging
+from datetime import date, timedelta
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import translation
+
+from hub.models import Day, PatristicQuote
+from hub.serializers import PatristicQuoteSerializer
+from hub.utils import get_content_version
+
+logger = logging.getLogger(__name__)
+
+QUOTE_OF_THE_DAY_TTL = 60 * 60 * 24
+QUOTE_IDS_TTL = 60 * 60 * 24 * 7
+
+# Recently requested (fast, tags) filters, pre-rendered by the nightly job
+RECENT_FILTERS_KEY = "bahk:patristic_quote_filters"
+RECENT_FILTERS_DAYS = 7
+MAX_RECENT_FILTERS = 100
+
+
+def parse_tags(tags_param: Optional[str]) -> list[str]:
+    """Lowercased, sorted tag names from a comma-separated parameter."""
+    if not tags_param:
+        return []
+    return sorted(tag.strip().lower() for tag in tags_param.split(','))
+
+
+def _filter_strings(fast_id: Optional[int], tag_list: list[str]) -> tuple[str, str]:
+    return (str(fast_id) if fast_id else 'none'), (','.join(tag_list) if tag_list else 'none')
+
+
+def quote_of_the_day_cache_key(date_str: str, fast_id: Optional[int], tag_list: list[str], lang: str) -> str:
+    fast_str, tags_str = _filter_strings(fast_id, tag_list)
+    version = get_content_version('patristic_quotes')
+    return f'patristic_quote_of_day:{date_str}:{fast_str}:{tags_str}:{lang}:{version}'
+
+
+def quote_ids(fast_id: Optional[int], tag_list: list[str]) -> list[int]:
+    """IDs of the quotes matching the filter, in ``id`` order (cached per catalog version)."""
+    fast_str, tags_str = _filter_strings(fast_id, tag_list)
+    cache_key = f"bahk:patristic_quote_ids:{get_content_version('patristic_quotes')}:{fast_str}:{tags_str}"
+    ids = cache.get(cache_key)
+    if ids is None:
+        queryset = PatristicQuote.objects.all()
+        if fast_id:
+            queryset = queryset.filter(fasts__id=fast_id)
+        for tag in tag_list:
+            queryset = queryset.filter(tags__name__iexact=tag)
+        ids = list(queryset.distinct().order_by('id').values_list('id', flat=True))
+        cache.set(cache_key, ids, QUOTE_IDS_TTL)
+    return ids
+
+
+def select_quote_id(ids: list[int], date_str: str, fast_id: Optional[int], tag_list: list[str]) -> int:
+    """Deterministically pick the day's quote: md5 of date, fast and tags, modulo the count."""
+    fast_str, tags_str = _filter_strings(fast_id, tag_list)
+    seed = f"{date_str}-{fast_str}-{tags_str}"
+    hash_int = int(hashlib.md5(seed.encode()).hexdigest(), 16)
+    return ids[hash_int % len(ids)]
+
+
+def render_quote_of_the_day(
+    on_date: date,
+    fast_id: Optional[int],
+    tag_list: list[str],
+    lang: str,
+    request=None,
+) -> Optional[dict]:
+    """The serialized quote of the day, from the cache or rendered and cached.
+
+    Returns:
+        The serialized quote, or None if no quote matches the filter
+    """
+    date_str = on_date.strftime('%Y-%m-%d')
+    cache_key = quote_of_the_day_cache_key(date_str, fast_id, tag_list, lang)
+    cached_quote = cache.get(cache_key)
+    if cached_quote:
+        return cached_quote
+
+    ids = quote_ids(fast_id, tag_list)
+    if not ids:
+        return None
+    quote = PatristicQuote.objects.prefetch_related('churches', 'fasts', 'tags').get(
+        pk=select_quote_id(ids, date_str, fast_id, tag_list)
+    )
+    with translation.override(lang):
+        response_data = PatristicQuoteSerializer(quote, context={'request': request, 'lang': lang}).data
+    cache.set(cache_key, response_data, QUOTE_OF_THE_DAY_TTL)
+    return response_data
+
+
+def record_quote_filter(fast_id: Optional[int], tag_list: list[str], on_date: date) -> None:
+    """Remember a requested filter so the nightly job pre-renders it."""
+    filter_key = _filter_strings(fast_id, tag_list)
+    recent = cache.get(RECENT_FILTERS_KEY) or {}
+    date_str = on_date.isoformat()
+    if recent.get(filter_key) == date_str:
+        return
+    recent[filter_key] = date_str
+    if len(recent) > MAX_RECENT_FILTERS:
+        recent = dict(sorted(recent.items(), key=lambda item: item[1])[-MAX_RECENT_FILTERS:])
+    cache.set(RECENT_FILTERS_KEY, recent, None)
+
+
+def common_quote_filters(on_date: date) -> list[tuple[Optional[int], list[str]]]:
+    """Filters worth pre-rendering for ``on_date``.
+
+    These are the unfiltered quote, each fast observed on the date, and the
+    filters requested within the last RECENT_FILTERS_DAYS days.
+    """
+    filters = {('none', 'none')}
+    for fast_id in Day.objects.filter(date=on_date, fast__isnull=False).values_list('fast_id', flat=True):
+        filters.add((str(fast_id), 'none'))
+    cutoff = (on_date - timedelta(days=RECENT_FILTERS_DAYS)).isoformat()
+    for filter_key, last_requested in (cache.get(RECENT_FILTERS_KEY) or {}).items():
+        if last_requested >= cutoff:
+            filters.add(tuple(filter_key))
+    return [
+        (None if fast_str == 'none' else int(fast_str), [] if tags_str == 'none' else tags_str.split(','))
+        for fast_str, tags_str in sorted(filters)
+    ]
+
+
+def prerender_quotes_of_the_day(on_date: date) -> dict:
+    """Render and cache ``on_date``'s quote for the common filters in every language."""
+    rendered = empty = 0
+    languages = [code for code, _ in settings.LANGUAGES]
+    for fast_id, tag_list in common_quote_filters(on_date):
+        for lang in languages:
+            if render_quote_of_the_day(on_date, fast_id, tag_list, lang) is None:
+                empty += 1
+                break
+            rendered += 1
+    summary = {"date": on_date.isoformat(), "rendered": rendered, "empty_filters": empty}
+    logger.info("Pre-rendered quotes of the day: %s", summary)
+    return summary
@@ -0,0 +1,168 @@
+"""Look-ahead ("horizon") prefetch of the per-day content served by the API.
+
+Opening a date for the first time used to scrape sacredtradition.am, call
+API.Bible and enqueue LLM context generation while the user waited.
+``prefetch_horizon`` does that work ahead of time for the next N days of every
+supported church, so the request path only reads from the database:
+
+    1. Readings are scraped and stored (``import_readings_for_day``), copying
+       the stored context of passages seen in earlier years.
+    2. Missing reading texts are fetched in every language.
+    3. The day's feast is scraped (``get_or_create_feast_for_date``).
+    4. Context generation is queued for readings and feasts that lack one.
+
+Days are independent and I/O bound, so they run on a bounded thread pool.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, timedelta
+from typing import Any, Iterable
+
+from django.conf import settings
+from django.db import connections
+from django.utils import timezone
+
+from hub.models import Church, Day, Reading
+from hub.services.context_generation_service import enqueue_feast_context, enqueue_reading_context
+from hub.services.passage_context_service import get_active_reading_prompt, reuse_passage_context
+from hub.services.reading_text_service import fetch_all_reading_texts, prepare_shared_resources
+from hub.utils import SUPPORTED_CHURCHES, get_or_create_feast_for_date, scrape_readings
+
+logger = logging.getLogger(__name__)
+
+
+def import_readings_for_day(day: Day, church: Church) -> list[Reading]:
+    """Scrape the readings of ``day`` and store them with their text in every language.
+
+    Returns:
+        The newly created readings.
+    """
+    scraped_readings = scrape_readings(day.date, church)
+    new_reading_objs = []
+    for reading in scraped_readings:
+        # Extract and remove all book-related fields to handle them separately
+        book_en = reading.pop("book_en", reading.get("book"))
+        book_hy = reading.pop("book_hy", None)
+
+        # Use explicit lookup with book_en to match the uniqueness constraint
+        # (modeltrans treats 'book' as 'book_en' in the database)
+        reading_obj, created = Reading.objects.get_or_create(
+            day=day,
+            book=book_en,  # This becomes book_en in the database
+            start_chapter=reading["start_chapter"],
+            start_verse=reading["start_verse"],
+            end_chapter=reading["end_chapter"],
+            end_verse=reading["end_verse"]
+        )
+
+        # Set translations if they are missing
+        if book_hy and not reading_obj.book_hy:
+            reading_obj.book_hy = book_hy
+            reading_obj.save(update_fields=['i18n'])
+
+        # Track newly created readings that need text fetched
+        if created:
+            new_reading_objs.append(reading_obj)
+
+    # Shared resources (API session, scraped pages, etc.) are created once for the whole batch
+    if new_reading_objs:
+        shared = prepare_shared_resources(day.date, church)
+        for reading_obj in new_reading_objs:
+            fetch_all_reading_texts(reading_obj, **shared)
+
+        # Passages seen in earlier years get their stored context instead of an LLM job
+        prompt = get_active_reading_prompt()
+        if prompt is not None:
+            for reading_obj in new_reading_objs:
+                reuse_passage_context(reading_obj, prompt)
+
+    return new_reading_objs
+
+
+def _has_all_translations(context, fields: Iterable[str]) -> bool:
+    """Whether every field of ``context`` is filled in every available language."""
+    available_languages = getattr(settings, 'MODELTRANS_AVAILABLE_LANGUAGES', ['en', 'hy'])
+    for lang in available_languages:
+        for field in fields:
+            value = getattr(context, field if lang == 'en' else f"{field}_{lang}", None)
+            if not value or not value.strip():
+                return False
+    return True
+
+
+def prefetch_day(date_obj: date, church: Church) -> dict[str, Any]:
+    """Make sure readings, reading texts, the feast and LLM contexts exist for one day.
+
+    Returns:
+        Counts of what had to be created or queued.
+    """
+    summary = {"date": str(date_obj), "church": church.pk, "readings_created": 0, "texts_fetched": 0,
+               "feast": None, "contexts_queued": 0}
+
+    day, _ = Day.objects.get_or_create(date=date_obj, church=church)
+    if not day.readings.exists():
+        summary["readings_created"] = len(import_readings_for_day(day, church))
+
+    missing_text = list(day.readings.filter(text_fetched_at__isnull=True))
+    if missing_text:
+        shared = prepare_shared_resources(date_obj, church)
+        for reading in missing_text:
+            fetch_all_reading_texts(reading, **shared)
+        summary["texts_fetched"] = len(missing_text)
+
+    for reading in day.readings.all():
+        context = reading.active_context
+        if context is None or not _has_all_translations(context, ("text",)):
+            summary["contexts_queued"] += enqueue_reading_context(reading.id)
+
+    feast, _, status = get_or_create_feast_for_date(date_obj, church, check_fast=False)
+    summary["feast"] = status.get("reason", status.get("status"))
+    # Fasts listed as feasts get no generated context (same rule as GetFeastForDate)
+    if feast is not None and feast.name and "Fast" not in feast.name:
+        context = feast.active_context
+        if context is None or not _has_all_translations(context, ("text", "short_text")):
+            summary["contexts_queued"] += enqueue_feast_context(feast.id)
+
+    return summary
+
+
+def _safe_prefetch_day(date_obj: date, church: Church, in_thread: bool = False) -> dict[str, Any]:
+    """Run ``prefetch_day`` without raising, so one failing day can't stop the horizon.
+
+    Pool threads also close their own database connection when done.
+    """
+    try:
+        return prefetch_day(date_obj, church)
+    except Exception as e:
+        logger.error("Prefetch failed for %s (%s): %s", date_obj, church, e, exc_info=True)
+        return {"date": str(date_obj), "church": church.pk, "error": str(e)}
+    finally:
+        if in_thread:
+            connections.close_all()
+
+
+def prefetch_horizon(days: int, workers: int = 1, start_date: date | None = None) -> list[dict[str, Any]]:
+    """Prefetch ``days`` days from ``start_date`` (default today) for every supported church.
+
+    Args:
+        days: Number of days to prefetch, starting with ``start_date``.
+        workers: Days processed concurrently; ``1`` runs inline on this thread.
+        start_date: First day to prefetch.
+
+    Returns:
+        One ``prefetch_day`` summary per (day, church), or ``{"error": ...}`` for failures.
+    """
+    start_date = start_date or timezone.localdate()
+    jobs = [
+        (start_date + timedelta(days=offset), church)
+        for church in SUPPORTED_CHURCHES.all()
+        for offset in range(days)
+    ]
+
+    if workers <= 1:
+        return [_safe_prefetch_day(date_obj, church) for date_obj, church in jobs]
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_safe_prefetch_day, date_obj, church, True) for date_obj, church in jobs]
+        return [future.result() for future in as_completed(futures)]
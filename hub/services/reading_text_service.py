@@ -8,18 +8,26 @@ them all for a given Reading.  Adding a new language is a three-step process:
     3. (Optional) Register a resource preparer in ``RESOURCE_PREPARERS`` if the
        fetcher benefits from batch-level shared state (e.g. a scraped page or
        HTTP session that can be reused across multiple readings).
+    4. (Optional) Register a bulk fetcher in ``BULK_FIELD_FETCHERS`` that
+       returns the fields of many readings without saving them.
 
 The view calls ``prepare_shared_resources`` once per batch, then
-``fetch_all_reading_texts`` once per reading.  ``get_reading_text_fields``
+``fetch_all_reading_texts`` once per reading.  The scheduled refresh uses
+``refresh_reading_texts``, which runs every language of ``TEXT_FETCHERS``
+over many readings and saves them with a single bulk update; languages
+without a bulk fetcher fall back to their per-reading fetcher.  ``get_reading_text_fields``
 resolves model fields for the API response without hard-coding language names.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+from django.conf import settings
 from django.utils import timezone
 
 from hub.services.bible_api_service import BibleAPIService
+from hub.services.sacredtradition_service import ARMENIAN_TEXT, get_client
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +38,43 @@ ARMENIAN_TEXT_VERSION = "\u0546\u0578\u0580 \u0537\u057b\u0574\u056b\u0561\u056e
 #  Individual language fetchers
 # ------------------------------------------------------------------ #
 
+def _english_text_fields(reading, service: BibleAPIService) -> dict[str, Any] | None:
+    """Call API.Bible for one Reading and return its English text fields.
+
+    Only does network I/O (no database access), so it can run on a worker
+    thread.  Failures are logged and return None.
+    """
+    try:
+        usfm_id = BibleAPIService.resolve_book_name(reading.book)
+        result = service.get_passage(
+            usfm_id,
+            reading.start_chapter,
+            reading.start_verse,
+            reading.end_chapter,
+            reading.end_verse,
+        )
+    except ValueError as exc:
+        logger.error(
+            "Book name mapping failed for Reading %s ('%s'): %s",
+            reading.pk, reading.book, exc,
+        )
+        return None
+    except Exception as exc:
+        logger.error(
+            "API call failed for Reading %s (%s): %s",
+            reading.pk, reading.passage_reference, exc,
+        )
+        return None
+
+    return {
+        "text": result["content"],
+        "text_copyright": result["copyright"],
+        "text_version": result["version"],
+        "text_fetched_at": timezone.now(),
+        "fums_token": result.get("fums_token", ""),
+    }
+
+
 def fetch_english_text(reading, *, service: BibleAPIService | None = None, **_kwargs) -> bool:
     """Fetch English Bible text from API.Bible for a single Reading.
 
@@ -45,6 +90,7 @@ def fetch_english_text(reading, *, service: BibleAPIService | None = None, **_kw
         True if text was successfully fetched, False otherwise.
     """
     from hub.models import Reading as ReadingModel
+    from hub.utils import bump_content_version
 
     if service is None:
         try:
@@ -53,41 +99,32 @@ def fetch_english_text(reading, *, service: BibleAPIService | None = None, **_kw
             logger.error("Cannot initialize BibleAPIService: %s", exc)
             return False
 
-    try:
-        usfm_id = BibleAPIService.resolve_book_name(reading.book)
-        result = service.get_passage(
-            usfm_id,
-            reading.start_chapter,
-            reading.start_verse,
-            reading.end_chapter,
-            reading.end_verse,
-        )
-
-        ReadingModel.objects.filter(pk=reading.pk).update(
-            text=result["content"],
-            text_copyright=result["copyright"],
-            text_version=result["version"],
-            text_fetched_at=timezone.now(),
-            fums_token=result.get("fums_token", ""),
-        )
-        logger.info(
-            "Fetched EN text for Reading %s (%s).",
-            reading.pk, reading.passage_reference,
-        )
-        return True
-    except ValueError as exc:
-        logger.error(
-            "Book name mapping failed for Reading %s ('%s'): %s",
-            reading.pk, reading.book, exc,
-        )
-        return False
-    except Exception as exc:
-        logger.error(
-            "API call failed for Reading %s (%s): %s",
-            reading.pk, reading.passage_reference, exc,
-        )
+    fields = _english_text_fields(reading, service)
+    if fields is None:
         return False
 
+    ReadingModel.objects.filter(pk=reading.pk).update(**fields)
+    # QuerySet.update() skips the post_save signal that normally bumps this
+    bump_content_version("readings")
+    logger.info(
+        "Fetched EN text for Reading %s (%s).",
+        reading.pk, reading.passage_reference,
+    )
+    return True
+
+
+def _match_armenian_text(reading, armenian_texts: list[dict[str, Any]]) -> str | None:
+    """The scraped Armenian text whose chapter/verse range is the Reading's."""
+    for entry in armenian_texts:
+        if (
+            entry["start_chapter"] == reading.start_chapter
+            and entry["start_verse"] == reading.start_verse
+            and entry["end_chapter"] == reading.end_chapter
+            and entry["end_verse"] == reading.end_verse
+        ):
+            return entry["text_hy"]
+    return None
+
 
 def fetch_armenian_text(
     reading,
@@ -133,17 +170,7 @@ def fetch_armenian_text(
         )
         return False
 
-    matched_text = None
-    for entry in armenian_texts:
-        if (
-            entry["start_chapter"] == reading.start_chapter
-            and entry["start_verse"] == reading.start_verse
-            and entry["end_chapter"] == reading.end_chapter
-            and entry["end_verse"] == reading.end_verse
-        ):
-            matched_text = entry["text_hy"]
-            break
-
+    matched_text = _match_armenian_text(reading, armenian_texts)
     if not matched_text:
         logger.warning(
             "No matching Armenian text found for Reading %s (%s).",
@@ -265,6 +292,130 @@ def fetch_all_reading_texts(reading, **shared_resources) -> dict[str, bool]:
     return results
 
 
+# ------------------------------------------------------------------ #
+#  Bulk refresh
+# ------------------------------------------------------------------ #
+
+def _armenian_texts_by_date(readings) -> dict:
+    """Scrape the Armenian text page of every date once, a few dates at a time."""
+    from hub.utils import SUPPORTED_CHURCHES
+
+    supported = set(SUPPORTED_CHURCHES.values_list("pk", flat=True))
+    dates = sorted({reading.day.date for reading in readings if reading.day.church_id in supported})
+    if not dates:
+        return {}
+
+    client = get_client()
+    workers = min(len(dates), getattr(settings, "SACREDTRADITION_MAX_CONCURRENCY", 2))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pages = pool.map(lambda day: client.get_page(day.strftime("%Y%m%d"), ARMENIAN_TEXT), dates)
+        return {day: (page or {}).get("texts", []) for day, page in zip(dates, pages)}
+
+
+def fetch_english_fields(readings, *, service: BibleAPIService | None = None, **_kwargs) -> list[dict | None]:
+    """English text fields of many Readings, one API.Bible call each.
+
+    Calls run ``BIBLE_API_MAX_CONCURRENCY`` at a time, so each Reading still
+    receives a unique FUMS token.  Without a ``service`` nothing is fetched.
+    """
+    if service is None:
+        return [None] * len(readings)
+    workers = getattr(settings, "BIBLE_API_MAX_CONCURRENCY", 4)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(lambda reading: _english_text_fields(reading, service), readings))
+
+
+def fetch_armenian_fields(readings, **_kwargs) -> list[dict | None]:
+    """Armenian text fields of many Readings, scraping the page of each date once.
+
+    Pages are scraped ``SACREDTRADITION_MAX_CONCURRENCY`` at a time.
+    """
+    armenian_texts = _armenian_texts_by_date(readings)
+    now = timezone.now()
+    fields = []
+    for reading in readings:
+        text_hy = _match_armenian_text(reading, armenian_texts.get(reading.day.date, []))
+        fields.append({
+            "text_hy": text_hy,
+            "text_hy_version": ARMENIAN_TEXT_VERSION,
+            "text_hy_fetched_at": now,
+        } if text_hy else None)
+    return fields
+
+
+# Bulk counterparts of TEXT_FETCHERS: given many Readings, return each one's
+# model fields (None on failure) without touching the database
+BULK_FIELD_FETCHERS: dict[str, callable] = {
+    "en": fetch_english_fields,
+    "hy": fetch_armenian_fields,
+}
+
+
+def _update_field(model, name: str) -> str:
+    """The column to bulk_update for ``name``; translated fields live in ``i18n``."""
+    return name if model._meta.get_field(name).concrete else "i18n"
+
+
+def refresh_reading_texts(readings, **shared_resources) -> dict[int, dict[str, bool]]:
+    """Fetch the text of many Readings in every language and save it in bulk.
+
+    Every language of ``TEXT_FETCHERS`` is fetched with its entry of
+    ``BULK_FIELD_FETCHERS``, which runs the network calls on bounded thread
+    pools and never touches the database; the results are written back with
+    one ``bulk_update``.  A language without a bulk fetcher is fetched and
+    saved one Reading at a time by its ``TEXT_FETCHERS`` entry.
+
+    Args:
+        readings: Saved Reading instances with ``day`` loaded.
+        **shared_resources: Forwarded to the fetchers, e.g. ``service``, the
+            shared BibleAPIService (English text is skipped without one).
+
+    Returns:
+        Dict mapping Reading pk to ``{language: success}``.
+    """
+    from hub.models import Reading as ReadingModel
+    from hub.utils import bump_content_version
+
+    readings = list(readings)
+    if not readings:
+        return {}
+
+    results = {reading.pk: {} for reading in readings}
+    updated = {}
+    update_fields = set()
+    for lang, fetcher in TEXT_FETCHERS.items():
+        bulk_fetcher = BULK_FIELD_FETCHERS.get(lang)
+        if bulk_fetcher is None:
+            for reading in readings:
+                try:
+                    results[reading.pk][lang] = fetcher(reading, **shared_resources)
+                except Exception:
+                    logger.exception("Unhandled error fetching %s text for Reading %s", lang, reading.pk)
+                    results[reading.pk][lang] = False
+            continue
+
+        try:
+            fetched = bulk_fetcher(readings, **shared_resources)
+        except Exception:
+            logger.exception("Unhandled error fetching %s text of %d readings", lang, len(readings))
+            fetched = [None] * len(readings)
+        for reading, fields in zip(readings, fetched):
+            results[reading.pk][lang] = fields is not None
+            if fields is None:
+                continue
+            for name, value in fields.items():
+                setattr(reading, name, value)
+                update_fields.add(_update_field(ReadingModel, name))
+            updated[reading.pk] = reading
+
+    if updated:
+        ReadingModel.objects.bulk_update(list(updated.values()), sorted(update_fields), batch_size=500)
+        # bulk_update() skips the post_save signal that normally bumps this
+        bump_content_version("readings")
+    logger.info("Refreshed text of %d of %d readings.", len(updated), len(readings))
+    return results
+
+
 # ------------------------------------------------------------------ #
 #  Response field resolution
 # ------------------------------------------------------------------ #
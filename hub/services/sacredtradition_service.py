@@ -0,0 +1,350 @@
+"""Client for scraping the lectionary pages of sacredtradition.am.
+
+Readings and the feast name of a date come from the same calendar page in
+English (``iL=2``) and Armenian (``iL=3``); the Armenian Bible text comes from
+the Armenian-script page (``iL=0``).  ``SacredTraditionClient``:
+
+    - keeps one pooled keep-alive ``requests.Session`` per process, with
+      urllib3 retries (backoff, ``Retry-After`` on 429) instead of sleeping
+      in a loop,
+    - fetches the pages of a date concurrently (``get_pages``),
+    - caches what was *parsed* from each page, so ``scrape_readings`` and
+      ``scrape_feast`` share one fetch per language and a cache hit does no
+      parsing; past its freshness window the parsed page is still served as
+      a stale fallback when the site is down,
+    - keeps a per-URL circuit breaker that stops hammering the site after
+      repeated failures.
+
+The base URL comes from ``SACREDTRADITION_BASE_URL`` so the client can be run
+against a local fixture server.
+"""
+
+import hashlib
+import logging
+import re
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import requests
+import sentry_sdk
+from django.conf import settings
+from django.core.cache import cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+PARSER_REGEX = r"^([\w\u0531-\u058A\u0400-\u04FF1-4\'\.\s]+) ([0-9]+\.)?([0-9]+)\-?([0-9]+\.)?([0-9]+)?$"
+
+DEFAULT_BASE_URL = "https://sacredtradition.am"
+USER_AGENT = "Mozilla/5.0 (compatible; BahkBot/1.0)"
+
+# Page languages (the ``iL`` query parameter)
+ARMENIAN_TEXT = 0
+ENGLISH = 2
+ARMENIAN = 3
+
+# Circuit breaker state: key = "circuit_breaker:{url_hash}" (store in cache)
+# After 3 consecutive failures in 15 min, block further attempts for 15 min
+SCRAPE_CIRCUIT_BREAKER_CACHE_TIMEOUT = 900  # 15 min
+SCRAPE_CIRCUIT_BREAKER_MAX_FAILURES = 3
+# Parsed pages are re-fetched after SCRAPE_CACHE_TIMEOUT, but kept for
+# SCRAPE_STALE_TIMEOUT as a fallback for when the site is unreachable
+SCRAPE_CACHE_TIMEOUT = 21600  # 6 hours
+SCRAPE_STALE_TIMEOUT = 60 * 60 * 24 * 7
+
+MAX_NUM_READINGS = 40
+
+
+def _stable_url_key(url: str) -> str:
+    """Stable hash for URL cache keys (unlike Python's salted hash())."""
+    return hashlib.md5(url.encode()).hexdigest()[:16]
+
+
+def _parse_reference(reference: str) -> tuple[str, int, int, int, int] | None:
+    """Split a reference such as ``"Matthew 6.22-33"`` into book, chapters and verses."""
+    if "," in reference:
+        # TODO: if comma found, second reading appended to first, as for Daniel 3.1-23 and Azariah 1-68
+        # for now, omit second reading
+        reference = reference.split(",")[0]
+
+    groups = re.search(PARSER_REGEX, reference)
+    if groups is None:
+        return None
+
+    book = groups.group(1)
+    # remove decimal if start chapter provided; otherwise, part of book with 1 chapter
+    start_chapter = int(groups.group(2).strip(".")) if groups.group(2) is not None else 1
+    start_verse = int(groups.group(3))
+    # remove decimal if end chapter provided; otherwise, must be the same as the start chapter
+    end_chapter = int(groups.group(4).strip(".")) if groups.group(4) is not None else start_chapter
+    end_verse = int(groups.group(5)) if groups.group(5) is not None else start_verse
+    return book, start_chapter, start_verse, end_chapter, end_verse
+
+
+def parse_readings(html_content: str, url: str = "", max_num_readings: int = MAX_NUM_READINGS) -> list[dict]:
+    """Parse the reading references (``<b>...</b>``) of a calendar page."""
+    book_start = html_content.find("<b>")
+
+    readings = []
+    ct = 0
+    while book_start != -1:
+        # prevent infinite loop
+        if ct > max_num_readings:
+            logger.error("Reached maximum number of readings: %d. Breaking to avoid infinite loop.", max_num_readings)
+            break
+        ct += 1
+
+        i1 = book_start + len("<b>")
+        i2 = html_content.find("</b>")
+        reading_str = html_content[i1:i2]
+
+        # advance to next section of web text early to prevent infinite loop in case of failure later on
+        html_content = html_content[i2 + 1:]
+        book_start = html_content.find("<b>")
+
+        try:
+            parsed = _parse_reference(reading_str)
+        except Exception:
+            logger.error(
+                "Could not parse reading with text %s with regex %s from %s. Skipping.",
+                reading_str, PARSER_REGEX, url, exc_info=True
+            )
+            continue
+
+        # skip reading if does not match parser regex
+        if parsed is None:
+            logger.error("Could not parse reading %s at %s with regex %s", reading_str, url, PARSER_REGEX)
+            continue
+
+        book, start_chapter, start_verse, end_chapter, end_verse = parsed
+        readings.append({
+            "book": book,
+            "start_chapter": start_chapter,
+            "start_verse": start_verse,
+            "end_chapter": end_chapter,
+            "end_verse": end_verse,
+        })
+
+    return readings
+
+
+def parse_feast_name(html_content: str) -> str | None:
+    """Parse the feast name (the element with ``class=dname``) of a calendar page."""
+    # First, find the opening tag with class=dname (handles both quoted and unquoted)
+    opening_pattern = r'<([a-z]+)[^>]*class=["\']?dname["\']?[^>]*>'
+    opening_match = re.search(opening_pattern, html_content, re.DOTALL | re.IGNORECASE)
+    if not opening_match:
+        return None
+
+    tag_name = opening_match.group(1)
+    start_pos = opening_match.end()
+
+    # Find the corresponding closing tag
+    closing_match = re.search(f'</{tag_name}>', html_content[start_pos:], re.IGNORECASE)
+    if not closing_match:
+        return None
+
+    # Extract content between opening and closing tags, removing any nested HTML tags
+    feast_html = html_content[start_pos:start_pos + closing_match.start()]
+    feast_name = re.sub(r'<[^>]+>', '', feast_html).strip()
+
+    return feast_name if feast_name else None
+
+
+def parse_armenian_texts(html_content: str, url: str = "") -> list[dict]:
+    """Parse the Armenian verse text of each reading block of the ``iL=0`` page.
+
+    Each block is delimited by a ``<b>`` reference tag and the next ``<hr>``
+    separator.
+    """
+    # Extract body content between comment markers
+    body_start = html_content.find("<!--body-->")
+    body_end = html_content.find("<!--/body-->")
+    if body_start == -1 or body_end == -1:
+        logger.error("Could not find body markers in Armenian readings page %s", url)
+        return []
+
+    body = html_content[body_start:body_end]
+
+    results = []
+    pos = 0
+    while True:
+        # Find next <b> tag (reading reference)
+        b_open = body.find("<b>", pos)
+        if b_open == -1:
+            break
+        b_close = body.find("</b>", b_open)
+        if b_close == -1:
+            break
+
+        reference = body[b_open + 3:b_close]
+        try:
+            parsed = _parse_reference(reference)
+        except Exception:
+            logger.error(
+                "Could not parse chapter/verse from Armenian reference '%s' at %s",
+                reference, url, exc_info=True,
+            )
+            pos = b_close + 1
+            continue
+
+        if parsed is None:
+            logger.error("Could not parse Armenian reading reference '%s' from %s", reference, url)
+            pos = b_close + 1
+            continue
+
+        _, start_chapter, start_verse, end_chapter, end_verse = parsed
+
+        # Extract text after </b> until the next <center><hr (or the end of the body)
+        text_start = b_close + len("</b>")
+        next_sep = body.find("<center><hr", text_start)
+        if next_sep == -1:
+            next_sep = len(body)
+
+        raw_text = body[text_start:next_sep]
+
+        # Clean up the text: remove <br> tags and extra whitespace
+        clean_text = re.sub(r"<br\s*/?>", " ", raw_text)
+        clean_text = re.sub(r"<[^>]+>", "", clean_text)  # Remove any remaining HTML tags
+        clean_text = re.sub(r"\s+", " ", clean_text).strip()
+
+        # Wrap verse/chapter numbers in brackets: "16 Լ..." -> "[16] Լ..."
+        # Matches standalone digits followed by Armenian characters (U+0531-U+058A)
+        clean_text = re.sub(r"(^|\s)(\d+)(?=\s[\u0531-\u058A])", r"\1[\2]", clean_text)
+
+        if clean_text:
+            results.append({
+                "start_chapter": start_chapter,
+                "start_verse": start_verse,
+                "end_chapter": end_chapter,
+                "end_verse": end_verse,
+                "text_hy": clean_text,
+            })
+
+        pos = next_sep + 1
+
+    return results
+
+
+def _parse_calendar_page(html_content: str, url: str) -> dict[str, Any]:
+    return {"readings": parse_readings(html_content, url), "feast": parse_feast_name(html_content)}
+
+
+def _parse_text_page(html_content: str, url: str) -> dict[str, Any]:
+    return {"texts": parse_armenian_texts(html_content, url)}
+
+
+PAGE_PARSERS = {
+    ENGLISH: _parse_calendar_page,
+    ARMENIAN: _parse_calendar_page,
+    ARMENIAN_TEXT: _parse_text_page,
+}
+
+
+class SacredTraditionClient:
+    """Pooled, cached and circuit-broken access to the sacredtradition.am calendar."""
+
+    def __init__(self, base_url: str | None = None, timeout: int | None = None, retries: int | None = None):
+        self.base_url = (base_url or getattr(settings, "SACREDTRADITION_BASE_URL", DEFAULT_BASE_URL)).rstrip("/")
+        self.host = urllib.parse.urlparse(self.base_url).netloc
+        self.timeout = timeout if timeout is not None else getattr(settings, "SACREDTRADITION_TIMEOUT", 10)
+        retries = retries if retries is not None else getattr(settings, "SACREDTRADITION_RETRIES", 2)
+
+        retry = Retry(
+            total=retries,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=("GET",),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=len(PAGE_PARSERS), max_retries=retry)
+        self.session = requests.Session()
+        self.session.headers.update({"User-Agent": USER_AGENT})
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def page_url(self, date_str: str, language: int) -> str:
+        return f"{self.base_url}/Calendar/nter.php?NM=0&iM=1103&iL={language}&ymd={date_str}"
+
+    def fetch(self, url: str) -> str | None:
+        """Fetch a page of the site, or return None if it failed or the circuit is open."""
+        # URL validation
+        if not self.host or urllib.parse.urlparse(url).netloc != self.host:
+            logger.error("Invalid URL for %s scrape: %s", self.host, url)
+            return None
+
+        circuit_key = f"circuit_breaker:{_stable_url_key(url)}"
+        if cache.get(circuit_key):
+            logger.warning("Circuit breaker open for %s, skipping scrape", url)
+            return None
+
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            self._record_failure(url, circuit_key, e)
+            return None
+
+        # Reset circuit breaker + failure counter on success
+        cache.delete_many([circuit_key, circuit_key + ":failures"])
+        return response.content.decode("utf-8")
+
+    def _record_failure(self, url: str, circuit_key: str, error: Exception) -> None:
+        logger.warning("Scrape failed for %s: %s", url, error)
+        failures_key = circuit_key + ":failures"
+        failure_count = cache.get(failures_key, 0) + 1
+        cache.set(failures_key, failure_count, SCRAPE_CIRCUIT_BREAKER_CACHE_TIMEOUT)
+        if failure_count >= SCRAPE_CIRCUIT_BREAKER_MAX_FAILURES:
+            cache.set(circuit_key, True, SCRAPE_CIRCUIT_BREAKER_CACHE_TIMEOUT)
+            sentry_sdk.capture_exception(Exception(f"Circuit breaker tripped for {url}"))
+        sentry_sdk.capture_exception(Exception(f"Scrape failed for {url}: {error}"))
+
+    def get_page(self, date_str: str, language: int) -> dict[str, Any] | None:
+        """Parsed content of one page, from the cache when fresh.
+
+        Returns:
+            ``{"readings": [...], "feast": str | None}`` for the English and
+            Armenian calendar pages, ``{"texts": [...]}`` for the Armenian text
+            page, or None if the page could not be fetched and was never cached.
+        """
+        cache_key = f"sacredtradition:page:{language}:{date_str}"
+        cached = cache.get(cache_key)
+        if cached and time.time() - cached["fetched_at"] < SCRAPE_CACHE_TIMEOUT:
+            return cached["data"]
+
+        url = self.page_url(date_str, language)
+        html_content = self.fetch(url)
+        if html_content is None:
+            # Stale cached data as fallback (or None if never cached)
+            return cached["data"] if cached else None
+
+        data = PAGE_PARSERS[language](html_content, url)
+        cache.set(cache_key, {"data": data, "fetched_at": time.time()}, SCRAPE_STALE_TIMEOUT)
+        return data
+
+    def get_pages(self, date_str: str, languages) -> dict[int, dict[str, Any] | None]:
+        """Parsed content of several pages of one date, fetched concurrently."""
+        languages = list(languages)
+        if len(languages) == 1:
+            return {languages[0]: self.get_page(date_str, languages[0])}
+        with ThreadPoolExecutor(max_workers=len(languages), thread_name_prefix="sacredtradition") as pool:
+            pages = pool.map(lambda language: self.get_page(date_str, language), languages)
+            return dict(zip(languages, pages))
+
+
+_clients: dict[str, SacredTraditionClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_client() -> SacredTraditionClient:
+    """The process-wide client for the configured base URL (sharing its connection pool)."""
+    base_url = getattr(settings, "SACREDTRADITION_BASE_URL", DEFAULT_BASE_URL)
+    with _clients_lock:
+        client = _clients.get(base_url)
+        if client is None:
+            client = _clients[base_url] = SacredTraditionClient(base_url)
+        return client
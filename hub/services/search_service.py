@@ -0,0 +1,169 @@
+"""Shared full-text search over devotionals, learning resources and prayers.
+
+Every model listed in ``SEARCH_SOURCES`` has one ``SearchDocument`` row holding
+its title and body text in English and Armenian.  Saves and deletes keep the
+rows current (see hub.signals); ``rebuild_search_index`` backs the
+``rebuild_search_index`` management command for bulk changes.  Migration
+0055 indexed the objects that existed when the documents were introduced.
+
+On PostgreSQL the documents carry weighted ``tsvector`` columns (title A, body
+B) with GIN indexes, and ``search`` matches prefix queries against them and
+annotates ``search_rank``.  Other databases (SQLite in tests) match every term
+as a word prefix of the lowercased text columns instead, with a constant rank
+(and without the English stemming).
+"""
+
+import logging
+import re
+from typing import Iterable, Optional
+
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import connection
+from django.db.models import F, FloatField, OuterRef, Q, Subquery, TextField, Value
+from django.db.models.functions import Greatest
+
+from hub.models import SearchDocument
+
+logger = logging.getLogger(__name__)
+
+# model label -> (title fields, body fields); dotted paths follow relations
+SEARCH_SOURCES = {
+    "hub.Devotional": (("video.title",), ("description", "video.description")),
+    "learning_resources.Video": (("title",), ("description",)),
+    "learning_resources.Article": (("title",), ("body",)),
+    "learning_resources.Recipe": (("title",), ("description", "ingredients", "directions")),
+    "prayers.Prayer": (("title",), ("text",)),
+    "prayers.PrayerSet": (("title",), ("description",)),
+}
+
+# model label -> (dependent model label, relation to the model); saving the
+# model changes the documents of the dependents
+SEARCH_DEPENDENTS = {
+    "learning_resources.Video": ("hub.Devotional", "video"),
+}
+
+# Text search configuration per language (PostgreSQL has no Armenian one)
+SEARCH_CONFIGS = {"en": "english", "hy": "simple"}
+
+_TERM_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def _field_text(obj, path: str, lang: str) -> str:
+    *relations, field = path.split(".")
+    for relation in relations:
+        obj = getattr(obj, relation, None)
+        if obj is None:
+            return ""
+    # English is the models' source language; other languages are modeltrans fields
+    return getattr(obj, field if lang == "en" else f"{field}_{lang}", None) or ""
+
+
+def _join(obj, paths, lang: str) -> str:
+    return " ".join(text for text in (_field_text(obj, path, lang) for path in paths) if text)
+
+
+def index_object(obj) -> None:
+    """Create or refresh the search document of ``obj``."""
+    title_paths, body_paths = SEARCH_SOURCES[obj._meta.label]
+    texts = {
+        lang: (_join(obj, title_paths, lang), _join(obj, body_paths, lang))
+        for lang in SEARCH_CONFIGS
+    }
+    document, _ = SearchDocument.objects.update_or_create(
+        content_type=ContentType.objects.get_for_model(obj),
+        object_id=obj.pk,
+        defaults={
+            f"text_{lang}": f"{title} {body}".strip().lower()
+            for lang, (title, body) in texts.items()
+        },
+    )
+    if connection.vendor == "postgresql":
+        SearchDocument.objects.filter(pk=document.pk).update(**{
+            f"vector_{lang}": (
+                SearchVector(Value(title, output_field=TextField()), config=SEARCH_CONFIGS[lang], weight="A")
+                + SearchVector(Value(body, output_field=TextField()), config=SEARCH_CONFIGS[lang], weight="B")
+            )
+            for lang, (title, body) in texts.items()
+        })
+
+
+def index_dependents(obj) -> None:
+    """Refresh the documents that include text of ``obj`` (e.g. a devotional's video)."""
+    dependent = SEARCH_DEPENDENTS.get(obj._meta.label)
+    if dependent is None:
+        return
+    label, relation = dependent
+    model = apps.get_model(label)
+    for related in model.objects.filter(**{relation: obj}).select_related(relation):
+        index_object(related)
+
+
+def remove_object(obj) -> None:
+    SearchDocument.objects.filter(
+        content_type=ContentType.objects.get_for_model(obj), object_id=obj.pk,
+    ).delete()
+
+
+def rebuild_search_index(labels: Optional[Iterable[str]] = None) -> dict:
+    """Re-index every object of the given (default: all) searchable models.
+
+    Returns:
+        ``{model label: number of indexed objects}``
+    """
+    counts = {}
+    for label in labels or SEARCH_SOURCES:
+        model = apps.get_model(label)
+        title_paths, body_paths = SEARCH_SOURCES[label]
+        relations = {path.rsplit(".", 1)[0] for path in title_paths + body_paths if "." in path}
+        count = 0
+        for obj in model.objects.select_related(*relations).iterator(chunk_size=500):
+            index_object(obj)
+            count += 1
+        counts[label] = count
+        logger.info("Indexed %d %s objects for search", count, label)
+    return counts
+
+
+def search_terms(term: str) -> list[str]:
+    return _TERM_RE.findall(term.lower())
+
+
+def search(queryset, term: str):
+    """Filter ``queryset`` to objects matching every word of ``term``.
+
+    Words match as prefixes ("garb" finds "garbanzo") in English or
+    Armenian text.  The result is annotated with ``search_rank`` (higher
+    is better) but not reordered.
+    """
+    terms = search_terms(term)
+    if not terms:
+        return queryset.annotate(search_rank=Value(0.0, output_field=FloatField()))
+
+    documents = SearchDocument.objects.filter(content_type=ContentType.objects.get_for_model(queryset.model))
+    if connection.vendor == "postgresql":
+        # Terms are \w+ tokens, so the raw tsquery syntax is safe
+        raw_query = " & ".join(f"{word}:*" for word in terms)
+        queries = {
+            lang: SearchQuery(raw_query, config=config, search_type="raw")
+            for lang, config in SEARCH_CONFIGS.items()
+        }
+        match = Q()
+        for lang, query in queries.items():
+            match |= Q(**{f"vector_{lang}": query})
+        documents = documents.filter(match)
+        rank = Greatest(*(SearchRank(F(f"vector_{lang}"), query) for lang, query in queries.items()))
+    else:
+        for word in terms:
+            # Word prefixes, like the tsquery "word:*"
+            prefix = rf"\b{word}"
+            documents = documents.filter(Q(text_en__regex=prefix) | Q(text_hy__regex=prefix))
+        rank = Value(0.0, output_field=FloatField())
+
+    return queryset.filter(pk__in=documents.values("object_id")).annotate(
+        search_rank=Subquery(
+            documents.filter(object_id=OuterRef("pk")).annotate(rank=rank).values("rank")[:1],
+            output_field=FloatField(),
+        )
+    )
@@ -0,0 +1,185 @@
+"""Background thumbnail generation for models with a cached ImageSpecField URL.
+
+Models listed in ``THUMBNAIL_SOURCES`` store the URL of their generated
+thumbnail in ``cached_thumbnail_url``/``cached_thumbnail_updated``.  Saves and
+serializers never process images themselves: they call ``sync_thumbnail`` /
+``request_thumbnail``, which only enqueue ``generate_thumbnail_task``, and read
+the cached URL.  Jobs are deduplicated per object while they wait in the queue.
+
+``warm_thumbnails`` generates a batch on a process pool; it backs the
+``update_thumbnail_cache`` management command.
+"""
+
+import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import timedelta
+from typing import Iterable, Iterator
+
+from django.apps import apps
+from django.core.cache import cache
+from django.db import connections, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from hub.constants import DAYS_TO_CACHE_THUMBNAIL
+
+logger = logging.getLogger(__name__)
+
+# model label -> (source image field, ImageSpecField thumbnail)
+THUMBNAIL_SOURCES = {
+    "hub.Fast": ("image", "image_thumbnail"),
+    "hub.Profile": ("profile_image", "profile_image_thumbnail"),
+    "hub.DevotionalSet": ("image", "thumbnail"),
+    "prayers.PrayerSet": ("image", "thumbnail"),
+    "prayers.PrayerRequest": ("image", "thumbnail"),
+    "learning_resources.Video": ("thumbnail", "thumbnail_small"),
+    "learning_resources.Article": ("image", "thumbnail"),
+    "learning_resources.Recipe": ("image", "thumbnail"),
+    "icons.Icon": ("image", "thumbnail"),
+}
+
+# How long a queued job blocks duplicates; bounds the damage of a lost message
+THUMBNAIL_PENDING_TTL = 60 * 10
+
+CACHE_FIELDS = ["cached_thumbnail_url", "cached_thumbnail_updated"]
+
+
+def _pending_key(model_label: str, pk) -> str:
+    return f"bahk:thumbnail_pending:{model_label}:{pk}"
+
+
+def is_thumbnail_stale(obj) -> bool:
+    """Whether the cached thumbnail URL is missing or older than DAYS_TO_CACHE_THUMBNAIL."""
+    return (
+        not obj.cached_thumbnail_url
+        or not obj.cached_thumbnail_updated
+        or (timezone.now() - obj.cached_thumbnail_updated).days >= DAYS_TO_CACHE_THUMBNAIL
+    )
+
+
+def enqueue_thumbnail(model_label: str, pk) -> bool:
+    """Queue generation for one object unless a job for it is already waiting.
+
+    The task is sent once the current transaction commits, so the worker sees
+    the saved image.
+
+    Returns:
+        True if a job was queued, False if one was already pending.
+    """
+    if not cache.add(_pending_key(model_label, pk), True, THUMBNAIL_PENDING_TTL):
+        return False
+
+    from hub.tasks import generate_thumbnail_task  # deferred to avoid circular import
+
+    transaction.on_commit(lambda: generate_thumbnail_task.delay(model_label, pk))
+    return True
+
+
+def request_thumbnail(obj, force: bool = False) -> bool:
+    """Queue a thumbnail for ``obj`` if it has a source image and its cache is stale.
+
+    Args:
+        obj: Instance of a model in ``THUMBNAIL_SOURCES`` (others are ignored).
+        force: Queue even if the cached URL is fresh (e.g. the image changed).
+    """
+    label = obj._meta.label
+    if label not in THUMBNAIL_SOURCES or obj.pk is None:
+        return False
+    source_field, _ = THUMBNAIL_SOURCES[label]
+    if not getattr(obj, source_field, None):
+        return False
+    if not force and not is_thumbnail_stale(obj):
+        return False
+    return enqueue_thumbnail(label, obj.pk)
+
+
+def sync_thumbnail(obj, image_changed: bool = False) -> None:
+    """Bring the thumbnail cache of a just-saved ``obj`` in line with its image.
+
+    Called at the end of ``save()``: queues generation when the image changed or
+    the cache is stale, and clears the cached URL when the image was removed.
+    """
+    source_field, _ = THUMBNAIL_SOURCES[obj._meta.label]
+    if getattr(obj, source_field, None):
+        request_thumbnail(obj, force=image_changed)
+    elif obj.cached_thumbnail_url or obj.cached_thumbnail_updated:
+        obj.cached_thumbnail_url = None
+        obj.cached_thumbnail_updated = None
+        type(obj).objects.filter(pk=obj.pk).update(cached_thumbnail_url=None, cached_thumbnail_updated=None)
+
+
+def generate_thumbnail(model_label: str, pk) -> str | None:
+    """Generate (and upload) the thumbnail of one object and cache its URL.
+
+    Saves only the cache fields, through ``save()`` so that the model's
+    post_save cache invalidation sees the new URL.
+
+    Returns:
+        The thumbnail URL, or None if the object or its source image is gone.
+    """
+    # Release the dedup slot first: changes made while this job runs queue a new one
+    cache.delete(_pending_key(model_label, pk))
+
+    model = apps.get_model(model_label)
+    source_field, spec_field = THUMBNAIL_SOURCES[model_label]
+    obj = model.objects.filter(pk=pk).first()
+    if obj is None or not getattr(obj, source_field, None):
+        return None
+
+    spec = getattr(obj, spec_field)
+    spec.generate()
+    obj.cached_thumbnail_url = spec.url
+    obj.cached_thumbnail_updated = timezone.now()
+    obj.save(update_fields=CACHE_FIELDS)
+    return obj.cached_thumbnail_url
+
+
+def stale_thumbnail_ids(model_label: str, force: bool = False) -> list:
+    """IDs of objects with a source image whose cached thumbnail URL is stale.
+
+    Args:
+        force: Return every object with a source image.
+    """
+    model = apps.get_model(model_label)
+    source_field, _ = THUMBNAIL_SOURCES[model_label]
+    queryset = model.objects.exclude(**{f"{source_field}__isnull": True}).exclude(**{source_field: ""})
+    if not force:
+        cutoff = timezone.now() - timedelta(days=DAYS_TO_CACHE_THUMBNAIL)
+        queryset = queryset.filter(
+            Q(cached_thumbnail_url__isnull=True)
+            | Q(cached_thumbnail_url="")
+            | Q(cached_thumbnail_updated__isnull=True)
+            | Q(cached_thumbnail_updated__lte=cutoff)
+        )
+    return list(queryset.order_by("pk").values_list("pk", flat=True))
+
+
+def _generate_for_pool(model_label: str, pk):
+    """Process-pool entry point: never raises, so one bad image can't stop the batch."""
+    try:
+        return generate_thumbnail(model_label, pk), None
+    except Exception as e:
+        return None, str(e)
+
+
+def warm_thumbnails(jobs: Iterable[tuple[str, int]], workers: int = 1) -> Iterator[tuple[str, int, str | None, str | None]]:
+    """Generate thumbnails for ``(model_label, pk)`` jobs.
+
+    Image decoding and resizing are CPU-bound, so with ``workers > 1`` the jobs
+    run on a process pool (forked from this process, which must therefore drop
+    its database connections first).
+
+    Yields:
+        ``(model_label, pk, url, error)`` for each job, in completion order.
+    """
+    jobs = list(jobs)
+    if workers <= 1:
+        for model_label, pk in jobs:
+            yield (model_label, pk, *_generate_for_pool(model_label, pk))
+        return
+
+    connections.close_all()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(_generate_for_pool, model_label, pk): (model_label, pk) for model_label, pk in jobs}
+        for future in as_completed(futures):
+            yield (*futures[future], *future.result())
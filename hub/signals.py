@@ -1,11 +1,23 @@
 import logging
+from collections import Counter, defaultdict
 
-from django.db.models.signals import m2m_changed, post_save
+from django.db.models import F
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
 from django.dispatch import receiver
 from django.core.cache import cache
-from hub.models import Profile, Feast
+from hub.models import (
+    Church, Day, Devotional, Fast, Feast, FeastContext, PatristicQuote, Profile, ProfileFastStats,
+    Reading, ReadingContext,
+)
+from hub.services import participant_density, search_service
 from hub.tasks.llm_tasks import determine_feast_designation_task
 from hub.tasks.icon_tasks import match_icon_to_feast_task
+from hub.utils import (
+    bump_content_version,
+    invalidate_fast_calendar_cache,
+    invalidate_fast_detail_cache,
+    invalidate_joined_fast_ids_cache,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +55,271 @@ def handle_fast_participant_change(sender, instance, action, **kwargs):
                 cache.delete_many(keys)
 
 
+def _memberships(instance, reverse, pk_set):
+    """Profile.fasts rows of the profile/fast being changed, limited to ``pk_set`` if given."""
+    memberships = Profile.fasts.through.objects.all()
+    if reverse:
+        memberships = memberships.filter(fast_id=instance.pk)
+        if pk_set is not None:
+            memberships = memberships.filter(profile_id__in=pk_set)
+    else:
+        memberships = memberships.filter(profile_id=instance.pk)
+        if pk_set is not None:
+            memberships = memberships.filter(fast_id__in=pk_set)
+    return memberships
+
+
+def _existing_membership_counts(instance, reverse, pk_set):
+    """Count existing Profile.fasts rows per fast for the profile/fast being changed."""
+    return Counter(_memberships(instance, reverse, pk_set).values_list('fast_id', flat=True))
+
+
+def _apply_participant_count_deltas(deltas):
+    """Atomically shift Fast.participant_count by the given per-fast deltas."""
+    fast_ids_by_delta = defaultdict(list)
+    for fast_id, delta in deltas.items():
+        if delta:
+            fast_ids_by_delta[delta].append(fast_id)
+    for delta, fast_ids in fast_ids_by_delta.items():
+        Fast.objects.filter(pk__in=fast_ids).update(
+            participant_count=F('participant_count') + delta
+        )
+        invalidate_fast_detail_cache(fast_ids)
+
+
+@receiver(m2m_changed, sender=Profile.fasts.through)
+def update_fast_participant_counts(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Keep Fast.participant_count in step with the Profile.fasts relationship.
+
+    Works from either side of the relation (``profile.fasts.add(...)`` and
+    ``fast.profiles.add(...)``). Django only reports newly created rows on add,
+    but reports every requested id on remove, so removals and clears count the
+    rows that actually exist in the pre_* phase and apply the decrement in post_*.
+    """
+    if action == 'post_add' and pk_set:
+        if reverse:
+            deltas = {instance.pk: len(pk_set)}
+        else:
+            deltas = {fast_id: 1 for fast_id in pk_set}
+        _apply_participant_count_deltas(deltas)
+    elif action in ('pre_remove', 'pre_clear'):
+        instance._participant_count_removals = _existing_membership_counts(
+            instance, reverse, pk_set if action == 'pre_remove' else None
+        )
+    elif action in ('post_remove', 'post_clear'):
+        removals = getattr(instance, '_participant_count_removals', None)
+        if removals:
+            _apply_participant_count_deltas({fast_id: -count for fast_id, count in removals.items()})
+            del instance._participant_count_removals
+
+
+@receiver(m2m_changed, sender=Profile.fasts.through)
+def update_profile_fast_stats(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Keep ProfileFastStats in step with the Profile.fasts relationship.
+
+    A profile joining or leaving fasts recomputes its own row right away. Changes
+    made from the fast side (e.g. admin bulk edits) only mark the members' rows
+    stale, so each is recomputed on that user's next read.
+    """
+    if not reverse:
+        changed = action == 'post_clear' or (action in ('post_add', 'post_remove') and pk_set)
+        if changed and ProfileFastStats.objects.filter(profile=instance).exists():
+            ProfileFastStats.refresh(instance)
+    elif action in ('post_add', 'post_remove') and pk_set:
+        ProfileFastStats.objects.filter(profile_id__in=pk_set).update(as_of=None)
+    elif action == 'pre_clear':
+        ProfileFastStats.objects.filter(profile__fasts=instance).update(as_of=None)
+
+
+@receiver(m2m_changed, sender=Profile.fasts.through)
+def invalidate_joined_fast_ids(sender, instance, action, reverse, pk_set, **kwargs):
+    """Drop the cached joined fast IDs (the per-user overlay) of affected users."""
+    if not reverse:
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            invalidate_joined_fast_ids_cache([instance.user_id])
+    elif action in ('post_add', 'post_remove') and pk_set:
+        invalidate_joined_fast_ids_cache(
+            Profile.objects.filter(pk__in=pk_set).values_list('user_id', flat=True)
+        )
+    elif action == 'pre_clear':
+        instance._joined_fast_ids_user_ids = list(instance.profiles.values_list('user_id', flat=True))
+    elif action == 'post_clear':
+        invalidate_joined_fast_ids_cache(getattr(instance, '_joined_fast_ids_user_ids', []))
+
+
+@receiver(pre_delete, sender=Profile)
+def decrement_participant_counts_on_profile_delete(sender, instance, **kwargs):
+    """Join rows removed by cascade don't emit m2m_changed, so release them here."""
+    removals = _existing_membership_counts(instance, reverse=False, pk_set=None)
+    _apply_participant_count_deltas({fast_id: -count for fast_id, count in removals.items()})
+
+
+def _apply_density_changes(rows, apply):
+    by_location = defaultdict(list)
+    for fast_id, longitude, latitude in rows:
+        by_location[(longitude, latitude)].append(fast_id)
+    for (longitude, latitude), fast_ids in by_location.items():
+        apply(fast_ids, longitude, latitude)
+
+
+@receiver(m2m_changed, sender=Profile.fasts.through)
+def update_participant_density_on_membership_change(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Keep the participant density cells in step with the Profile.fasts relationship.
+
+    As with the participant counts, additions are applied for the newly created
+    rows only, and removals for the rows that exist in the pre_* phase.
+    """
+    if action == 'post_add' and pk_set:
+        if reverse:
+            rows = [
+                (instance.pk, longitude, latitude)
+                for longitude, latitude in Profile.objects.filter(pk__in=pk_set).values_list('longitude', 'latitude')
+            ]
+        else:
+            rows = [(fast_id, instance.longitude, instance.latitude) for fast_id in pk_set]
+        _apply_density_changes(rows, participant_density.add_participant)
+    elif action in ('pre_remove', 'pre_clear'):
+        instance._density_removals = participant_density.member_locations(
+            _memberships(instance, reverse, pk_set if action == 'pre_remove' else None)
+        )
+    elif action in ('post_remove', 'post_clear'):
+        removals = getattr(instance, '_density_removals', None)
+        if removals:
+            _apply_density_changes(removals, participant_density.remove_participant)
+            del instance._density_removals
+
+
+@receiver(post_save, sender=Profile)
+def update_participant_density_on_geocode(sender, instance, created, raw=False, **kwargs):
+    """Move a profile between density cells when its coordinates change."""
+    if raw or created:
+        return
+    if not (instance.tracker.has_changed('latitude') or instance.tracker.has_changed('longitude')):
+        return
+    fast_ids = list(Profile.fasts.through.objects.filter(profile_id=instance.pk).values_list('fast_id', flat=True))
+    if fast_ids:
+        participant_density.remove_participant(
+            fast_ids, instance.tracker.previous('longitude'), instance.tracker.previous('latitude'),
+        )
+        participant_density.add_participant(fast_ids, instance.longitude, instance.latitude)
+
+
+@receiver(pre_delete, sender=Profile)
+def release_participant_density_on_profile_delete(sender, instance, **kwargs):
+    """Join rows removed by cascade don't emit m2m_changed, so release them here."""
+    _apply_density_changes(
+        participant_density.member_locations(_memberships(instance, reverse=False, pk_set=None)),
+        participant_density.remove_participant,
+    )
+
+
+@receiver(post_save, sender=Fast)
+@receiver(post_delete, sender=Fast)
+def invalidate_fast_calendar_on_fast_change(sender, instance, **kwargs):
+    """Drop cached calendar months when a fast's payload or church changes."""
+    invalidate_fast_calendar_cache({instance.church_id, instance.tracker.previous('church')})
+
+
+@receiver(post_save, sender=Day)
+@receiver(post_delete, sender=Day)
+def invalidate_fast_calendar_on_day_change(sender, instance, **kwargs):
+    """Drop cached calendar months when a day is added to, moved or removed from a fast."""
+    fast_ids = {instance.fast_id, instance.tracker.previous('fast')} - {None}
+    if fast_ids:
+        invalidate_fast_calendar_cache(
+            Fast.objects.filter(pk__in=fast_ids).values_list('church_id', flat=True)
+        )
+
+
+@receiver(post_save, sender=Fast)
+@receiver(post_delete, sender=Fast)
+def bump_fast_content_versions(sender, instance, **kwargs):
+    """Fast payloads are embedded in the fast detail and devotional set responses."""
+    invalidate_fast_detail_cache([instance.pk])
+    bump_content_version('learning_resources')
+
+
+@receiver(post_save, sender=Day)
+@receiver(post_delete, sender=Day)
+def bump_day_fast_content_versions(sender, instance, **kwargs):
+    """A fast's days determine its date span and day counts."""
+    invalidate_fast_detail_cache({instance.fast_id, instance.tracker.previous('fast')})
+
+
+@receiver(post_save, sender=Reading)
+@receiver(post_delete, sender=Reading)
+@receiver(post_save, sender=ReadingContext)
+@receiver(post_delete, sender=ReadingContext)
+def bump_readings_content_version(sender, **kwargs):
+    bump_content_version('readings')
+
+
+@receiver(post_save, sender=Feast)
+@receiver(post_delete, sender=Feast)
+@receiver(post_save, sender=FeastContext)
+@receiver(post_delete, sender=FeastContext)
+@receiver(post_save, sender='prayers.FeastPrayer')
+@receiver(post_delete, sender='prayers.FeastPrayer')
+@receiver(post_save, sender='icons.Icon')
+@receiver(post_delete, sender='icons.Icon')
+def bump_feasts_content_version(sender, **kwargs):
+    bump_content_version('feasts')
+
+
+@receiver(post_save, sender=Devotional)
+@receiver(post_delete, sender=Devotional)
+def bump_devotionals_content_version(sender, **kwargs):
+    bump_content_version('devotionals', 'learning_resources')
+
+
+@receiver(post_save, sender=PatristicQuote)
+@receiver(post_delete, sender=PatristicQuote)
+@receiver(m2m_changed, sender=PatristicQuote.churches.through)
+@receiver(m2m_changed, sender=PatristicQuote.fasts.through)
+@receiver(m2m_changed, sender=PatristicQuote.tags.through)
+def bump_patristic_quotes_content_version(sender, action=None, **kwargs):
+    if action is None or action.startswith('post_'):
+        bump_content_version('patristic_quotes')
+
+
+@receiver(post_save, sender=Devotional)
+@receiver(post_save, sender='learning_resources.Video')
+@receiver(post_save, sender='learning_resources.Article')
+@receiver(post_save, sender='learning_resources.Recipe')
+@receiver(post_save, sender='prayers.Prayer')
+@receiver(post_save, sender='prayers.PrayerSet')
+def update_search_document(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw:
+        return
+    if update_fields:
+        # Skip saves that cannot change the indexed text (e.g. cached thumbnail URLs)
+        title_paths, body_paths = search_service.SEARCH_SOURCES[sender._meta.label]
+        indexed = {path.split('.')[0] for path in title_paths + body_paths} | {'i18n'}
+        if indexed.isdisjoint(update_fields):
+            return
+    search_service.index_object(instance)
+    search_service.index_dependents(instance)
+
+
+@receiver(post_delete, sender=Devotional)
+@receiver(post_delete, sender='learning_resources.Video')
+@receiver(post_delete, sender='learning_resources.Article')
+@receiver(post_delete, sender='learning_resources.Recipe')
+@receiver(post_delete, sender='prayers.Prayer')
+@receiver(post_delete, sender='prayers.PrayerSet')
+def remove_search_document(sender, instance, **kwargs):
+    search_service.remove_object(instance)
+
+
+@receiver(post_save, sender=Church)
+@receiver(post_delete, sender=Church)
+def bump_churches_content_version(sender, **kwargs):
+    bump_content_version('churches')
+
+
 @receiver(post_save, sender=Feast)
 def handle_feast_save(sender, instance, created, **kwargs):
     """
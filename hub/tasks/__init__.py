@@ -6,11 +6,23 @@ This module exposes all Celery tasks from the separate task modules.
 from .email_tasks import test_email_task, send_fast_reminder_task
 from .mapping_tasks import generate_participant_map, update_current_fast_maps
 from .geocoding_tasks import batch_geocode_profiles, geocode_profile_location
-from .llm_tasks import generate_reading_context_task, generate_feast_context_task
-from .icon_tasks import match_icon_to_feast_task
+from .llm_tasks import (
+    generate_reading_context_task,
+    generate_feast_context_task,
+    regenerate_reading_contexts_batch_task,
+    regenerate_feast_contexts_batch_task,
+    determine_feast_designations_batch_task,
+    poll_llm_batch_task,
+    resume_llm_batch_polling_task,
+)
+from .icon_tasks import match_icon_to_feast_task, prewarm_icon_match_cache_task
 from .feast_tasks import create_feast_date_task
 from .bible_api_tasks import fetch_reading_text_task, refresh_all_reading_texts_task
 from .armenian_text_tasks import fetch_armenian_reading_text_task
+from .stats_tasks import rollover_profile_fast_stats_task
+from .thumbnail_tasks import generate_thumbnail_task, refresh_stale_thumbnails_task
+from .prefetch_tasks import prefetch_upcoming_days_task
+from .patristic_quote_tasks import prerender_quotes_of_the_day_task
 from celery import shared_task
 
 @shared_task
@@ -27,10 +39,21 @@ __all__ = [
     'geocode_profile_location',
     'generate_reading_context_task',
     'generate_feast_context_task',
+    'regenerate_reading_contexts_batch_task',
+    'regenerate_feast_contexts_batch_task',
+    'determine_feast_designations_batch_task',
+    'poll_llm_batch_task',
+    'resume_llm_batch_polling_task',
     'match_icon_to_feast_task',
+    'prewarm_icon_match_cache_task',
     'create_feast_date_task',
     'fetch_reading_text_task',
     'refresh_all_reading_texts_task',
     'fetch_armenian_reading_text_task',
+    'rollover_profile_fast_stats_task',
+    'generate_thumbnail_task',
+    'refresh_stale_thumbnails_task',
+    'prefetch_upcoming_days_task',
+    'prerender_quotes_of_the_day_task',
     'add'
 ]
@@ -12,7 +12,6 @@ as required by API.Bible's Fair Use Management System terms of use.
 """
 
 import logging
-import time
 from datetime import timedelta
 
 from celery import shared_task
@@ -23,8 +22,8 @@ from django.utils import timezone
 from hub.models import Reading
 from hub.services.bible_api_service import BibleAPIService
 from hub.services.reading_text_service import (
-    fetch_all_reading_texts,
     fetch_english_text,
+    refresh_reading_texts,
 )
 
 logger = logging.getLogger(__name__)
@@ -65,7 +64,8 @@ def refresh_all_reading_texts_task(self):
     Scheduled weekly via Celery Beat. Steps:
         1. Cleanup: Delete oldest readings if count exceeds MAX_READINGS.
         2. Find stale readings (text_fetched_at is NULL or older than threshold).
-        3. Fetch: Call every registered language fetcher per reading.
+        3. Fetch: ``refresh_reading_texts`` fetches every language on bounded
+           thread pools (one API.Bible call per reading) and saves in bulk.
         4. Log a structured error summary.
     """
     # --- Step 1: Cleanup old readings ---
@@ -101,31 +101,29 @@ def refresh_all_reading_texts_task(self):
         stale_count, refresh_days,
     )
 
-    # --- Step 3: Fetch each reading (all languages) ---
-    shared: dict = {}
+    # --- Step 3: Fetch all readings (all languages) concurrently, save in bulk ---
+    service = None
     try:
-        shared["service"] = BibleAPIService()
+        service = BibleAPIService()
     except ValueError as exc:
         logger.error("Cannot initialize BibleAPIService: %s. English text will be skipped.", exc)
 
+    readings = list(stale_readings)
+    results = refresh_reading_texts(readings, service=service)
+
     api_calls = 0
     failures = []
-
-    for reading in stale_readings.iterator():
-        results = fetch_all_reading_texts(reading, **shared)
-        if all(results.values()):
+    for reading in readings:
+        reading_results = results[reading.pk]
+        if all(reading_results.values()):
             api_calls += 1
         else:
-            failed_langs = [lang for lang, ok in results.items() if not ok]
             failures.append({
                 "reading_id": reading.pk,
                 "passage": reading.passage_reference,
-                "failed_langs": failed_langs,
+                "failed_langs": [lang for lang, ok in reading_results.items() if not ok],
             })
 
-        # Small delay between API calls to avoid rate limiting
-        time.sleep(0.5)
-
     # --- Step 4: Error summary ---
     logger.info(
         "Refresh complete: %d fully successful, %d with failures.",
@@ -2,9 +2,11 @@
 Geocoding tasks for the hub app.
 """
 from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
 from celery import shared_task
 from celery.utils.log import get_task_logger
-from hub.models import Profile, GeocodingCache
+from hub.models import Fast, Profile, GeocodingCache
 from hub.services.aws_geocoding import geocoder
 
 # Set up logging for Celery tasks
@@ -45,7 +47,19 @@ def geocode_profile_location(self, profile_id, location):
             logger.info(f"Profile location changed since task was scheduled, using current value: {profile.location}")
             location = profile.location
         
-        # First check the cache
+        # Known places are resolved offline, without the cache or AWS
+        coordinates = geocoder.geocode_offline(location)
+        if coordinates:
+            profile.latitude, profile.longitude = coordinates
+            profile.save(update_fields=['latitude', 'longitude'])
+            logger.info(f"Updated Profile {profile_id} with offline coordinates: {coordinates}")
+            return {
+                "status": "success",
+                "source": "offline",
+                "coordinates": coordinates
+            }
+        
+        # Then check the cache
         normalized = location.lower().strip()
         cache_entry = GeocodingCache.objects.filter(
             location_text=normalized,
@@ -105,19 +119,64 @@ def geocode_profile_location(self, profile_id, location):
         self.retry(exc=e, countdown=2 ** self.request.retries * 60)  # 1min, 2min, 4min, etc.
         return {"status": "error", "reason": str(e)}
 
+def _store_geocoding_results(results):
+    """
+    Upsert geocoding results into GeocodingCache in bulk.
+    
+    Args:
+        results: Dict mapping normalized location text to (latitude, longitude),
+                 or None when geocoding failed
+    """
+    now = timezone.now()
+    found = [
+        GeocodingCache(
+            location_text=normalized, latitude=coordinates[0], longitude=coordinates[1],
+            error_count=0, last_updated=now,
+        )
+        for normalized, coordinates in results.items() if coordinates
+    ]
+    if found:
+        GeocodingCache.objects.bulk_create(
+            found,
+            update_conflicts=True,
+            unique_fields=['location_text'],
+            update_fields=['latitude', 'longitude', 'error_count', 'last_updated'],
+        )
+
+    failed = [normalized for normalized, coordinates in results.items() if not coordinates]
+    if failed:
+        existing = GeocodingCache.objects.filter(location_text__in=failed)
+        known = set(existing.values_list('location_text', flat=True))
+        existing.update(error_count=F('error_count') + 1, last_updated=now)
+        GeocodingCache.objects.bulk_create(
+            [
+                GeocodingCache(location_text=normalized, latitude=0, longitude=0, error_count=1, last_updated=now)
+                for normalized in failed if normalized not in known
+            ],
+            ignore_conflicts=True,
+        )
+
+
 @shared_task(bind=True, max_retries=3, name='hub.tasks.batch_geocode_profiles')
-def batch_geocode_profiles(self, update_all=False):
+def batch_geocode_profiles(self, update_all=False, batch_size=500):
     """
     Batch geocode all profiles with locations that don't have coordinates.
     
     Uses AWS Location Service to geocode locations and updates Profile coordinates.
+    Profiles are walked in primary key order (keyset pagination), each distinct
+    normalized location is looked up once per run, locations known offline are
+    resolved without the cache or AWS, uncached ones are geocoded concurrently,
+    and the cache and profiles are written in bulk.
     
     Args:
         update_all: If True, update all profiles regardless of existing coordinates
+        batch_size: Number of profiles read and updated per query
         
     Returns:
         Dict with status and statistics
     """
+    from hub.services.participant_density import rebuild_density
+
     logger.info(f"Starting batch geocoding task (update_all={update_all})")
     
     try:
@@ -130,99 +189,90 @@ def batch_geocode_profiles(self, update_all=False):
                 latitude__isnull=True, 
                 longitude__isnull=True
             ).exclude(location='')
-            
-        logger.info(f"Found {profiles.count()} profiles to geocode")
+        
+        total = profiles.count()
+        logger.info(f"Found {total} profiles to geocode")
         
         # Track statistics
         stats = {
-            "total": profiles.count(),
+            "total": total,
             "successful": 0,
             "failed": 0,
             "cached": 0,
+            "offline": 0,
             "locations_processed": []
         }
         
-        # Process in smaller batches to avoid memory issues
-        batch_size = 50
-        for i in range(0, profiles.count(), batch_size):
-            batch = profiles[i:i+batch_size]
+        # Coordinates (or None) of every normalized location seen in this run
+        resolved = {}
+        moved_profile_ids = []
+        last_pk = 0
+        batch_number = 0
+        while True:
+            batch = list(
+                profiles.filter(pk__gt=last_pk).order_by('pk').only('pk', 'location', 'latitude', 'longitude')[:batch_size]
+            )
+            if not batch:
+                break
+            last_pk = batch[-1].pk
+            batch_number += 1
             
-            # Get unique locations to geocode
-            unique_locations = {p.location.strip().lower(): p.location for p in batch if p.location}
-            logger.info(f"Batch {i//batch_size + 1}: Processing {len(unique_locations)} unique locations")
+            # Get the locations not seen earlier in the run
+            new_locations = {}
+            for profile in batch:
+                normalized = profile.location.strip().lower()
+                if normalized and normalized not in resolved:
+                    new_locations.setdefault(normalized, profile.location)
+            logger.info(f"Batch {batch_number}: {len(batch)} profiles, {len(new_locations)} new locations")
             
-            # Find existing cache entries
-            normalized_locations = list(unique_locations.keys())
-            cached_entries = {
-                entry.location_text: (entry.latitude, entry.longitude) 
-                for entry in GeocodingCache.objects.filter(
-                    location_text__in=normalized_locations,
-                    error_count__lt=5
-                )
-            }
+            # Resolve the locations known offline
+            for normalized, location in list(new_locations.items()):
+                coordinates = geocoder.geocode_offline(location)
+                if coordinates:
+                    resolved[normalized] = coordinates
+                    del new_locations[normalized]
+                    stats["offline"] += 1
             
-            # Identify locations that need geocoding
-            to_geocode = [
-                location for normalized, location in unique_locations.items() 
-                if normalized not in cached_entries
-            ]
+            # Find existing cache entries; entries that failed before are
+            # retried until they have failed five times
+            for entry in GeocodingCache.objects.filter(location_text__in=list(new_locations), error_count__lt=5):
+                if entry.error_count == 0:
+                    resolved[entry.location_text] = (entry.latitude, entry.longitude)
+                    del new_locations[entry.location_text]
+            for entry in GeocodingCache.objects.filter(location_text__in=list(new_locations), error_count__gte=5):
+                resolved[entry.location_text] = None
+                del new_locations[entry.location_text]
             
-            # Geocode missing locations
-            if to_geocode:
-                geocoded_results = geocoder.batch_geocode(to_geocode)
-                
-                # Update cache with new results
+            # Geocode missing locations concurrently
+            if new_locations:
+                geocoded = geocoder.batch_geocode(list(new_locations.values()))
+                results = {normalized: geocoded.get(location) for normalized, location in new_locations.items()}
                 with transaction.atomic():
-                    for location, coordinates in geocoded_results.items():
-                        if not location:
-                            continue
-                            
-                        normalized = location.strip().lower()
-                        
-                        if coordinates:
-                            # Successfully geocoded
-                            GeocodingCache.objects.update_or_create(
-                                location_text=normalized,
-                                defaults={
-                                    'latitude': coordinates[0],
-                                    'longitude': coordinates[1],
-                                    'error_count': 0
-                                }
-                            )
-                            cached_entries[normalized] = coordinates
-                            stats["successful"] += 1
-                        else:
-                            # Failed to geocode
-                            cache_entry, created = GeocodingCache.objects.get_or_create(
-                                location_text=normalized,
-                                defaults={
-                                    'latitude': 0,
-                                    'longitude': 0,
-                                    'error_count': 1
-                                }
-                            )
-                            if not created:
-                                cache_entry.error_count += 1
-                                cache_entry.save()
-                            stats["failed"] += 1
-                        
-                        stats["locations_processed"].append(location)
+                    _store_geocoding_results(results)
+                resolved.update(results)
+                stats["successful"] += sum(1 for coordinates in results.values() if coordinates)
+                stats["failed"] += sum(1 for coordinates in results.values() if not coordinates)
+                stats["locations_processed"].extend(new_locations.values())
             
             # Update profiles with coordinates
-            with transaction.atomic():
-                for profile in batch:
-                    if not profile.location:
-                        continue
-                        
-                    normalized = profile.location.strip().lower()
-                    if normalized in cached_entries:
-                        coordinates = cached_entries[normalized]
-                        if coordinates:
-                            profile.latitude, profile.longitude = coordinates
-                            profile.save(update_fields=['latitude', 'longitude'])
-                            stats["cached"] += 1
+            changed = []
+            for profile in batch:
+                coordinates = resolved.get(profile.location.strip().lower())
+                if coordinates and (profile.latitude, profile.longitude) != tuple(coordinates):
+                    profile.latitude, profile.longitude = coordinates
+                    changed.append(profile)
+            if changed:
+                Profile.objects.bulk_update(changed, ['latitude', 'longitude'])
+                moved_profile_ids.extend(profile.pk for profile in changed)
+                stats["cached"] += len(changed)
             
-            logger.info(f"Completed batch {i//batch_size + 1}")
+            logger.info(f"Completed batch {batch_number}")
+        
+        # bulk_update skips the signals that maintain the participant density cells
+        if moved_profile_ids:
+            fasts = Fast.objects.filter(profiles__pk__in=moved_profile_ids).distinct()
+            for fast in fasts:
+                rebuild_density(fast)
         
         return {
             "status": "success",
@@ -235,4 +285,4 @@ def batch_geocode_profiles(self, update_all=False):
         return {
             "status": "error",
             "message": str(e)
-        } 
\ No newline at end of file
+        }
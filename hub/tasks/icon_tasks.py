@@ -1,285 +1,28 @@
 """Tasks for icon matching."""
-import json
 import logging
-import re
+from datetime import timedelta
 
 from celery import shared_task
 from django.conf import settings
+from django.utils import timezone
 
 from hub.constants import ICON_MATCH_CONFIDENCE_THRESHOLD
 from hub.models import Feast
+from icons.matching import icon_match_cache_stats, is_icon_match_cached, match_icons
 from icons.models import Icon
 
 logger = logging.getLogger(__name__)
 
 
-def _simple_match_icons(icons, prompt, max_results):
-    """Simple fallback matching based on title and tag keywords."""
-    prompt_lower = prompt.lower()
-    scored_icons = []
-    
-    for icon in icons:
-        score = 0
-        title_lower = icon.title.lower()
-        tags_lower = [tag.name.lower() for tag in icon.tags.all()]
-        
-        # Check title matches
-        if prompt_lower in title_lower or title_lower in prompt_lower:
-            score += 10
-        
-        # Check tag matches
-        for tag in tags_lower:
-            if tag in prompt_lower or prompt_lower in tag:
-                score += 5
-        
-        if score > 0:
-            scored_icons.append((score, icon.id))
-    
-    # Sort by score descending and return IDs
-    scored_icons.sort(reverse=True, key=lambda x: x[0])
-    return [icon_id for _, icon_id in scored_icons[:max_results]]
-
-
-def _match_icons_with_llm(icons, prompt, max_results=3):
-    """
-    Match icons using LLM-based matching.
-    
-    Returns a list of dicts with 'id' and 'confidence' keys.
-    """
-    # Format icon data for LLM
-    icon_descriptions = []
-    for icon in icons:
-        tags = ', '.join([tag.name for tag in icon.tags.all()])
-        description = f"Icon ID: {icon.id}, Title: {icon.title}, Tags: {tags}"
-        icon_descriptions.append(description)
-    
-    # Create LLM prompt
-    system_prompt = """
-You match a user's natural-language request to the most relevant icons.
-
-INPUT:
-- A list of icons. Each icon has: ID, Title, and Tags.
-- A user request.
-- A maximum number of results (N).
-
-OUTPUT FORMAT (STRICT):
-Return a JSON array of match objects. Each object must follow this exact format:
-
-[
-  {
-    "id": 3,
-    "confidence": "high"
-  },
-  {
-    "id": 12,
-    "confidence": "medium"
-  }
-]
-
-Rules for Output:
-- Do NOT include any text outside the JSON.
-- Do NOT include extra keys or commentary.
-- If no icons are meaningfully relevant, return: []
-- Return at most N matches.
-
-CONFIDENCE SCORING:
-Assign confidence based on clarity of match:
-- "high": The icon's title or tags clearly and directly match the request, with minimal ambiguity.
-- "medium": The match is plausible and relevant, but not exact.
-- "low": Only return "low" confidence if it is still clearly related; otherwise do not return it at all.
-
-RELEVANCE RULES:
-- Prefer icons whose Title strongly matches the user request.
-- Next, consider strong Tag matches.
-- Ignore weak or tangential keyword overlap.
-- Only return IDs that appear in the provided list.
-- NEVER guess or invent icons.
-
-TIEBREAKERS:
-If multiple icons seem similar in relevance:
-1) Exact title match or near-synonym wins.
-2) More specific tags beat general tags.
-3) Well-known canonical association beats broad thematic similarity.
-
-If unsure whether an icon is relevant:
-DO NOT RETURN IT.
-"""
-    
-    allowed_ids = [icon.id for icon in icons]
-    
-    user_message = f"""User request: "{prompt}"
-Allowed icon IDs: {allowed_ids}
-
-Available icons (ID, Title, Tags):
-{chr(10).join(icon_descriptions)}
-
-Return up to {max_results} most relevant icons as a JSON array of objects with "id" and "confidence" fields."""
-    
-    try:
-        # Check if OpenAI API key is configured
-        from openai import OpenAI
-        from openai import APIError
-        
-        if not settings.OPENAI_API_KEY:
-            logger.warning("OPENAI_API_KEY not configured, falling back to simple tag matching")
-            # Fallback to simple tag/title matching
-            matched_ids = _simple_match_icons(icons, prompt, max_results)
-            # Convert to expected format with default confidence
-            return [
-                {'id': icon_id, 'confidence': 'medium'}
-                for icon_id in matched_ids
-            ]
-        
-        client = OpenAI(api_key=settings.OPENAI_API_KEY)
-        
-        # Try models in order of preference, falling back if one fails
-        models_to_try = ['gpt-5-mini', 'gpt-4.1-nano', 'gpt-4o-mini', 'gpt-4.1-mini']
-        response = None
-        last_error = None
-        
-        for model in models_to_try:
-            try:
-                response = client.chat.completions.create(
-                    model=model,
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_message},
-                    ],
-                    max_completion_tokens=500
-                )
-                logger.info(f"Successfully used model: {model}")
-                break
-            except APIError as api_error:
-                last_error = api_error
-                error_body = getattr(api_error, 'body', {}) or {}
-                error_code = error_body.get('error', {}).get('code', '')
-                error_message = str(api_error)
-                
-                # Check if it's a model access error (403 or model_not_found)
-                if api_error.status_code == 403 or 'model_not_found' in error_code or 'does not have access' in error_message:
-                    logger.warning(f"Model {model} not available (status: {api_error.status_code}), trying next model...")
-                    continue
-                # Check if it's a temperature unsupported error
-                elif api_error.status_code == 400 and ('unsupported_value' in error_code or 'temperature' in error_message.lower()):
-                    logger.warning(f"Model {model} doesn't support custom temperature, retrying without temperature parameter...")
-                    try:
-                        # Retry without temperature parameter (uses default)
-                        response = client.chat.completions.create(
-                            model=model,
-                            messages=[
-                                {"role": "system", "content": system_prompt},
-                                {"role": "user", "content": user_message},
-                            ],
-                            max_completion_tokens=500,
-                        )
-                        logger.info(f"Successfully used model: {model} (without temperature)")
-                        break
-                    except Exception as retry_error:
-                        logger.warning(f"Retry without temperature also failed for {model}, trying next model...")
-                        last_error = retry_error
-                        continue
-                else:
-                    # For other API errors, re-raise immediately
-                    raise
-            except Exception as model_error:
-                last_error = model_error
-                error_str = str(model_error)
-                # Check if it's a model access error
-                if 'model_not_found' in error_str or 'does not have access' in error_str:
-                    logger.warning(f"Model {model} not available, trying next model...")
-                    continue
-                # Check if it's a temperature error
-                elif 'temperature' in error_str.lower() and 'unsupported' in error_str.lower():
-                    logger.warning(f"Model {model} doesn't support custom temperature, retrying without temperature parameter...")
-                    try:
-                        # Retry without temperature parameter
-                        response = client.chat.completions.create(
-                            model=model,
-                            messages=[
-                                {"role": "system", "content": system_prompt},
-                                {"role": "user", "content": user_message},
-                            ],
-                            max_completion_tokens=500,
-                        )
-                        logger.info(f"Successfully used model: {model} (without temperature)")
-                        break
-                    except Exception as retry_error:
-                        logger.warning(f"Retry without temperature also failed for {model}, trying next model...")
-                        last_error = retry_error
-                        continue
-                else:
-                    # For other errors, re-raise immediately
-                    raise
-        
-        if not response:
-            raise last_error if last_error else Exception("No models available")
-        
-        # Parse the response
-        llm_response = response.choices[0].message.content.strip()
-        
-        # Try to parse as JSON array
-        try:
-            parsed_response = json.loads(llm_response)
-            if not isinstance(parsed_response, list):
-                parsed_response = [parsed_response]
-            
-            # Handle new format: array of objects with 'id' and 'confidence'
-            matched_results = []
-            valid_confidence_levels = {'high', 'medium', 'low'}
-            for item in parsed_response:
-                if isinstance(item, dict):
-                    # New format: {"id": 3, "confidence": "high"}
-                    if 'id' in item:
-                        confidence = item.get('confidence', 'medium')
-                        # Validate confidence level
-                        if confidence not in valid_confidence_levels:
-                            logger.warning(f"Invalid confidence '{confidence}', defaulting to 'medium'")
-                            confidence = 'medium'
-                        matched_results.append({
-                            'id': item['id'],
-                            'confidence': confidence
-                        })
-                elif isinstance(item, (int, str)):
-                    # Backward compatibility: just an ID
-                    matched_results.append({
-                        'id': int(item),
-                        'confidence': 'medium'  # Default if not provided
-                    })
-            
-            # Limit to max_results
-            matched_results = matched_results[:max_results]
-            return matched_results
-            
-        except json.JSONDecodeError:
-            # Fallback: extract numbers from response
-            matched_ids = [int(x) for x in re.findall(r'\d+', llm_response)]
-            return [
-                {'id': icon_id, 'confidence': 'medium'}
-                for icon_id in matched_ids[:max_results]
-            ]
-    
-    except Exception as e:
-        logger.error(f"Error in LLM icon matching: {e}", exc_info=True)
-        # Fallback to simple matching if LLM fails
-        try:
-            matched_ids = _simple_match_icons(icons, prompt, max_results)
-            # Convert to expected format with default confidence
-            return [
-                {'id': icon_id, 'confidence': 'medium'}
-                for icon_id in matched_ids
-            ]
-        except Exception as fallback_error:
-            logger.error(f"Fallback matching also failed: {fallback_error}")
-            return []
-
-
 @shared_task(bind=True, max_retries=3, default_retry_delay=60)
-def match_icon_to_feast_task(self, feast_id: int):
+def match_icon_to_feast_task(self, feast_id: int, force: bool = False):
     """
     Match an icon to a feast using AI-powered icon matching.
     
     Args:
         feast_id: ID of the Feast to match an icon for
+        force: Recompute the match instead of using the cached one (and
+            replace the cache entry), for re-matches requested by an admin
     """
     try:
         feast = Feast.objects.select_related('day', 'day__church').get(pk=feast_id)
@@ -298,10 +41,7 @@ def match_icon_to_feast_task(self, feast_id: int):
         logger.warning("Feast %s has no associated church, cannot match icons.", feast_id)
         return
     
-    # Get icons for this church
-    icons = list(Icon.objects.filter(church=church).select_related('church').prefetch_related('tags'))
-    
-    if not icons:
+    if not Icon.objects.filter(church=church).exists():
         logger.info("No icons found for church %s, cannot match icon for feast %s.", church.id, feast_id)
         return
     
@@ -310,7 +50,7 @@ def match_icon_to_feast_task(self, feast_id: int):
     
     try:
         # Perform icon matching
-        matched_results = _match_icons_with_llm(icons, prompt, max_results=1)
+        matched_results = match_icons(prompt, church_id=church.id, max_results=1, use_cache=not force)
         
         if not matched_results:
             logger.info("No icon matches found for feast %s (%s).", feast_id, prompt)
@@ -349,3 +89,49 @@ def match_icon_to_feast_task(self, feast_id: int):
         # Don't retry on general exceptions, just log the error
         # Feasts can exist without icons, so this is not a critical failure
 
+
+@shared_task
+def prewarm_icon_match_cache_task(feast_ids=None, days=None):
+    """
+    Compute and cache icon matches for feasts before they are requested.
+
+    Args:
+        feast_ids: Feasts to prewarm (default: all feasts of the coming days)
+        days: Horizon starting today when no feast_ids are given
+            (default: settings.PREFETCH_HORIZON_DAYS)
+
+    Returns:
+        Dict with the number of feasts seen, warmed, already cached and
+        failed, plus the cache's hit/miss counts
+    """
+    feasts = Feast.objects.select_related('day')
+    if feast_ids is not None:
+        feasts = feasts.filter(pk__in=feast_ids)
+    else:
+        days = days or getattr(settings, "PREFETCH_HORIZON_DAYS", 14)
+        today = timezone.localdate()
+        feasts = feasts.filter(day__date__gte=today, day__date__lt=today + timedelta(days=days))
+
+    warmed = already_cached = failed = 0
+    for feast in feasts:
+        # Same key as match_icon_to_feast_task uses
+        if is_icon_match_cached(feast.name, church_id=feast.day.church_id, max_results=1):
+            already_cached += 1
+            continue
+        try:
+            # Already known to be a miss: compute and store without counting a lookup
+            match_icons(feast.name, church_id=feast.day.church_id, max_results=1, use_cache=False)
+            warmed += 1
+        except Exception as e:
+            logger.error(f"Error prewarming icon match for feast {feast.id}: {e}", exc_info=True)
+            failed += 1
+
+    summary = {
+        "feasts": warmed + already_cached + failed,
+        "warmed": warmed,
+        "already_cached": already_cached,
+        "failed": failed,
+        **icon_match_cache_stats(),
+    }
+    logger.info("Icon match cache prewarm finished: %s", summary)
+    return summary
@@ -1,15 +1,31 @@
 import logging
 import re
+from datetime import timedelta
 
 from celery import shared_task
 from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
 
-from hub.models import LLMPrompt, Reading, ReadingContext, Feast, FeastContext
-from hub.services.llm_service import get_llm_service
+from hub.models import LLMBatch, LLMPrompt, Reading, ReadingContext, Feast, FeastContext
+from hub.services.context_generation_service import FEAST, READING, held_context_claim
+from hub.services.passage_context_service import find_passage_context, store_passage_context
+from hub.utils import bump_content_version
 
 logger = logging.getLogger(__name__)
 
 AVAILABLE_LANGUAGES = getattr(settings, 'MODELTRANS_AVAILABLE_LANGUAGES', ['en', 'hy'])
+DEFAULT_DESIGNATION_MODEL = 'claude-sonnet-4-5-20250929'
+
+
+# hub.services.llm_service loads the OpenAI and Anthropic SDKs, which take
+# seconds and tens of MB to import.  Web processes import this module only to
+# queue tasks, so the service is imported when a task actually runs.
+
+def get_llm_service(model_name: str):
+    from hub.services.llm_service import get_llm_service as _get_llm_service
+    return _get_llm_service(model_name)
 
 
 def _check_all_translations_present(context: ReadingContext, languages: list[str]) -> bool:
@@ -31,6 +47,16 @@ def _update_context_translations(
     force_regeneration: bool
 ) -> None:
     """Update existing context with missing or regenerated translations."""
+    _apply_context_translations(context, generated_contexts, force_regeneration)
+    context.save()
+
+
+def _apply_context_translations(
+    context: ReadingContext,
+    generated_contexts: dict[str, str],
+    force_regeneration: bool
+) -> None:
+    """Set missing or regenerated translations on a context without saving it."""
     for lang, context_text in generated_contexts.items():
         if lang == 'en':
             if not context.text or not context.text.strip() or force_regeneration:
@@ -39,7 +65,6 @@ def _update_context_translations(
             existing_text = getattr(context, f'text_{lang}', None)
             if not existing_text or not existing_text.strip() or force_regeneration:
                 setattr(context, f'text_{lang}', context_text)
-    context.save()
 
 
 def _create_context_with_translations(
@@ -48,6 +73,17 @@ def _create_context_with_translations(
     generated_contexts: dict[str, str]
 ) -> ReadingContext:
     """Create new context with all translations."""
+    context = _build_context_with_translations(reading, llm_prompt, generated_contexts)
+    context.save()
+    return context
+
+
+def _build_context_with_translations(
+    reading: Reading,
+    llm_prompt: LLMPrompt,
+    generated_contexts: dict[str, str]
+) -> ReadingContext:
+    """Build an unsaved context with all translations."""
     english_text = generated_contexts.get('en', '')
     context = ReadingContext(
         reading=reading,
@@ -58,8 +94,6 @@ def _create_context_with_translations(
     for lang, context_text in generated_contexts.items():
         if lang != 'en':
             setattr(context, f'text_{lang}', context_text)
-    
-    context.save()
     return context
 
 
@@ -80,59 +114,74 @@ def generate_reading_context_task(
             "All languages are now generated automatically."
         )
 
-    try:
-        reading = Reading.objects.get(pk=reading_id)
-    except Reading.DoesNotExist:
-        logger.error("Reading with id %s not found.", reading_id)
-        return
+    # Releases the claim taken by enqueue_reading_context once this job is done
+    with held_context_claim(READING, reading_id, force_regeneration):
+        try:
+            reading = Reading.objects.get(pk=reading_id)
+        except Reading.DoesNotExist:
+            logger.error("Reading with id %s not found.", reading_id)
+            return
+
+        active_context = reading.active_context
+        if active_context and not force_regeneration:
+            if _check_all_translations_present(active_context, AVAILABLE_LANGUAGES):
+                logger.info(
+                    "Reading %s already has context for all languages, skipping.",
+                    reading_id
+                )
+                return
 
-    active_context = reading.active_context
-    if active_context and not force_regeneration:
-        if _check_all_translations_present(active_context, AVAILABLE_LANGUAGES):
-            logger.info(
-                "Reading %s already has context for all languages, skipping.",
-                reading_id
-            )
+        llm_prompt = LLMPrompt.objects.filter(active=True, applies_to='readings').first()
+        if not llm_prompt:
+            logger.error("No active LLM prompt found for readings.")
             return
 
-    llm_prompt = LLMPrompt.objects.filter(active=True, applies_to='readings').first()
-    if not llm_prompt:
-        logger.error("No active LLM prompt found for readings.")
-        return
+        # The same passage in an earlier year may already have a context from this prompt
+        stored_contexts = None if force_regeneration else find_passage_context(reading, llm_prompt)
+        if stored_contexts:
+            if active_context:
+                _update_context_translations(active_context, stored_contexts, False)
+            else:
+                _create_context_with_translations(reading, llm_prompt, stored_contexts)
+            logger.info("Reused stored passage context for Reading %s.", reading_id)
+            return
 
-    try:
-        service = llm_prompt.get_llm_service()
+        try:
+            service = llm_prompt.get_llm_service()
         
-        generated_contexts = {}
-        for lang in AVAILABLE_LANGUAGES:
-            context_text = service.generate_context(reading, llm_prompt, lang)
-            if context_text:
-                generated_contexts[lang] = context_text
-            else:
-                logger.warning(
-                    "Failed to generate context for Reading %s in language %s",
-                    reading_id, lang
-                )
+            generated_contexts = {}
+            for lang in AVAILABLE_LANGUAGES:
+                context_text = service.generate_context(reading, llm_prompt, lang)
+                if context_text:
+                    generated_contexts[lang] = context_text
+                else:
+                    logger.warning(
+                        "Failed to generate context for Reading %s in language %s",
+                        reading_id, lang
+                    )
         
-        if not generated_contexts:
-            logger.error("Failed to generate context for Reading %s in any language", reading_id)
-            raise self.retry(exc=Exception("Context generation failed for all languages"))
+            if not generated_contexts:
+                logger.error("Failed to generate context for Reading %s in any language", reading_id)
+                raise self.retry(exc=Exception("Context generation failed for all languages"))
         
-        if active_context:
-            _update_context_translations(active_context, generated_contexts, force_regeneration)
-            logger.info(
-                "Context translations updated for Reading %s (languages: %s)",
-                reading_id, ', '.join(generated_contexts.keys())
-            )
-        else:
-            _create_context_with_translations(reading, llm_prompt, generated_contexts)
-            logger.info(
-                "Context generated for Reading %s in languages: %s",
-                reading_id, ', '.join(generated_contexts.keys())
-            )
-    except ValueError as e:
-        logger.error(f"Error selecting LLM service: {e}")
-        raise self.retry(exc=e)
+            if active_context:
+                _update_context_translations(active_context, generated_contexts, force_regeneration)
+                context = active_context
+                logger.info(
+                    "Context translations updated for Reading %s (languages: %s)",
+                    reading_id, ', '.join(generated_contexts.keys())
+                )
+            else:
+                context = _create_context_with_translations(reading, llm_prompt, generated_contexts)
+                logger.info(
+                    "Context generated for Reading %s in languages: %s",
+                    reading_id, ', '.join(generated_contexts.keys())
+                )
+            # Later years' readings of this passage reuse it (a forced regeneration replaces it)
+            store_passage_context(reading, llm_prompt, context)
+        except ValueError as e:
+            logger.error(f"Error selecting LLM service: {e}")
+            raise self.retry(exc=e)
 
 
 def _check_all_feast_translations_present(context: FeastContext, languages: list[str]) -> bool:
@@ -162,6 +211,16 @@ def _update_feast_context_translations(
         generated_contexts: Dict mapping language codes to dicts with 'text' and 'short_text' keys
         force_regeneration: If True, overwrite existing translations
     """
+    _apply_feast_context_translations(context, generated_contexts, force_regeneration)
+    context.save()
+
+
+def _apply_feast_context_translations(
+    context: FeastContext,
+    generated_contexts: dict[str, dict[str, str]],
+    force_regeneration: bool
+) -> None:
+    """Set missing or regenerated translations on a feast context without saving it."""
     for lang, texts in generated_contexts.items():
         if lang == 'en':
             if not context.text or not context.text.strip() or force_regeneration:
@@ -176,7 +235,6 @@ def _update_feast_context_translations(
             existing_short = getattr(context, f'short_text_{lang}', None)
             if not existing_short or not existing_short.strip() or force_regeneration:
                 setattr(context, f'short_text_{lang}', texts['short_text'])
-    context.save()
 
 
 def _create_feast_context_with_translations(
@@ -194,6 +252,17 @@ def _create_feast_context_with_translations(
     Returns:
         Created FeastContext instance
     """
+    context = _build_feast_context_with_translations(feast, llm_prompt, generated_contexts)
+    context.save()
+    return context
+
+
+def _build_feast_context_with_translations(
+    feast: Feast,
+    llm_prompt: LLMPrompt,
+    generated_contexts: dict[str, dict[str, str]]
+) -> FeastContext:
+    """Build an unsaved feast context with all translations."""
     english_texts = generated_contexts.get('en', {'text': '', 'short_text': ''})
     context = FeastContext(
         feast=feast,
@@ -206,8 +275,6 @@ def _create_feast_context_with_translations(
         if lang != 'en':
             setattr(context, f'text_{lang}', texts['text'])
             setattr(context, f'short_text_{lang}', texts['short_text'])
-    
-    context.save()
     return context
 
 
@@ -229,66 +296,79 @@ def generate_feast_context_task(
             "All languages are now generated automatically."
         )
 
-    try:
-        feast = Feast.objects.get(pk=feast_id)
-    except Feast.DoesNotExist:
-        logger.error("Feast with id %s not found.", feast_id)
-        return
-
-    # Skip context generation for generic fast days — they are never displayed
-    if feast.designation == Feast.Designation.FAST:
-        logger.info("Feast %s is a generic fast day, skipping context generation.", feast_id)
-        return
+    # Releases the claim taken by enqueue_feast_context once this job is done
+    with held_context_claim(FEAST, feast_id, force_regeneration):
+        try:
+            feast = Feast.objects.get(pk=feast_id)
+        except Feast.DoesNotExist:
+            logger.error("Feast with id %s not found.", feast_id)
+            return
 
-    active_context = feast.active_context
-    if active_context and not force_regeneration:
-        if _check_all_feast_translations_present(active_context, AVAILABLE_LANGUAGES):
-            logger.info(
-                "Feast %s already has context for all languages, skipping.",
-                feast_id
-            )
+        # Skip context generation for generic fast days — they are never displayed
+        if feast.designation == Feast.Designation.FAST:
+            logger.info("Feast %s is a generic fast day, skipping context generation.", feast_id)
             return
 
-    llm_prompt = LLMPrompt.objects.filter(active=True, applies_to='feasts').first()
-    if not llm_prompt:
-        logger.error("No active LLM prompt found for feasts.")
-        return
+        active_context = feast.active_context
+        if active_context and not force_regeneration:
+            if _check_all_feast_translations_present(active_context, AVAILABLE_LANGUAGES):
+                logger.info(
+                    "Feast %s already has context for all languages, skipping.",
+                    feast_id
+                )
+                return
 
-    try:
-        service = llm_prompt.get_llm_service()
+        llm_prompt = LLMPrompt.objects.filter(active=True, applies_to='feasts').first()
+        if not llm_prompt:
+            logger.error("No active LLM prompt found for feasts.")
+            return
+
+        try:
+            service = llm_prompt.get_llm_service()
         
-        generated_contexts = {}
-        for lang in AVAILABLE_LANGUAGES:
-            # Generate both text and short_text in a single call
-            context_dict = service.generate_feast_context(feast, llm_prompt, lang, improvement_instructions)
+            generated_contexts = {}
+            for lang in AVAILABLE_LANGUAGES:
+                # Generate both text and short_text in a single call
+                context_dict = service.generate_feast_context(feast, llm_prompt, lang, improvement_instructions)
             
-            if context_dict and 'text' in context_dict and 'short_text' in context_dict:
-                generated_contexts[lang] = context_dict
-            else:
-                logger.warning(
-                    "Failed to generate complete context for Feast %s in language %s",
-                    feast_id, lang
-                )
+                if context_dict and 'text' in context_dict and 'short_text' in context_dict:
+                    generated_contexts[lang] = context_dict
+                else:
+                    logger.warning(
+                        "Failed to generate complete context for Feast %s in language %s",
+                        feast_id, lang
+                    )
         
-        if not generated_contexts:
-            logger.error("Failed to generate context for Feast %s in any language", feast_id)
-            raise self.retry(exc=Exception("Context generation failed for all languages"))
+            if not generated_contexts:
+                logger.error("Failed to generate context for Feast %s in any language", feast_id)
+                raise self.retry(exc=Exception("Context generation failed for all languages"))
         
-        if active_context:
-            _update_feast_context_translations(active_context, generated_contexts, force_regeneration)
-            logger.info(
-                "Context translations updated for Feast %s (languages: %s)",
-                feast_id, ', '.join(generated_contexts.keys())
-            )
-        else:
-            _create_feast_context_with_translations(feast, llm_prompt, generated_contexts)
-            logger.info(
-                "Context generated for Feast %s in languages: %s",
-                feast_id, ', '.join(generated_contexts.keys())
-            )
-    except ValueError as e:
-        logger.error(f"Error selecting LLM service: {e}")
-        raise self.retry(exc=e)
+            if active_context:
+                _update_feast_context_translations(active_context, generated_contexts, force_regeneration)
+                logger.info(
+                    "Context translations updated for Feast %s (languages: %s)",
+                    feast_id, ', '.join(generated_contexts.keys())
+                )
+            else:
+                _create_feast_context_with_translations(feast, llm_prompt, generated_contexts)
+                logger.info(
+                    "Context generated for Feast %s in languages: %s",
+                    feast_id, ', '.join(generated_contexts.keys())
+                )
+        except ValueError as e:
+            logger.error(f"Error selecting LLM service: {e}")
+            raise self.retry(exc=e)
+
+
+def _is_generic_fast_day(name: str) -> bool:
+    """Whether a feast name is a generic numbered fast day, e.g. "Seventeenth day of Great Lent"."""
+    return bool(re.match(r'^[\w\s]+ day of ', name, re.IGNORECASE) and re.search(
+        r'fast|lent', name, re.IGNORECASE
+    ) and not re.search(
+        r'Mijink|Median', name, re.IGNORECASE
+    ) and not re.search(
+        r'Saint|Martyr|Blessed|Holy\s+(?!Cross)|Prophet|Apostle|Patriarch|Vartapet', name, re.IGNORECASE
+    ))
 
 
 @shared_task(bind=True, max_retries=3, default_retry_delay=60)
@@ -313,13 +393,7 @@ def determine_feast_designation_task(self, feast_id: int):
     # These never commemorate a specific saint so the LLM is not needed.
     # Require "fast" or "lent" in the name to avoid false positives.
     # Explicitly exclude Mijink (Median day of Great Lent) — a named feast, not a generic fast day.
-    if re.match(r'^[\w\s]+ day of ', feast.name, re.IGNORECASE) and re.search(
-        r'fast|lent', feast.name, re.IGNORECASE
-    ) and not re.search(
-        r'Mijink|Median', feast.name, re.IGNORECASE
-    ) and not re.search(
-        r'Saint|Martyr|Blessed|Holy\s+(?!Cross)|Prophet|Apostle|Patriarch|Vartapet', feast.name, re.IGNORECASE
-    ):
+    if _is_generic_fast_day(feast.name):
         feast.designation = Feast.Designation.FAST
         feast.save(update_fields=['designation'])
         logger.info("Regex fast-day pattern matched, assigned 'Fast' to Feast %s (%s)", feast_id, feast.name)
@@ -332,7 +406,7 @@ def determine_feast_designation_task(self, feast_id: int):
         model_name = llm_prompt.model
     
     try:
-        service = get_llm_service(model_name if model_name else 'claude-sonnet-4-5-20250929')
+        service = get_llm_service(model_name if model_name else DEFAULT_DESIGNATION_MODEL)
         designation = service.determine_feast_designation(feast, model_name)
         
         if designation:
@@ -358,3 +432,359 @@ def determine_feast_designation_task(self, feast_id: int):
     except Exception as e:
         logger.exception(f"Error determining designation for Feast {feast_id}: {e}")
         # Don't retry on general exceptions, just log the error
+
+
+def _batch_translations(responses: dict, prefix: str, parse=None) -> dict:
+    """Collect the successful responses for ``prefix`` by language."""
+    generated = {}
+    for lang in AVAILABLE_LANGUAGES:
+        response = responses.get(f"{prefix}-{lang}")
+        value = parse(response) if parse and response else response
+        if value:
+            generated[lang] = value
+    return generated
+
+
+def _parse_complete_feast_context(response_text: str) -> dict | None:
+    from hub.services.llm_service import _parse_feast_context_json
+    context_dict = _parse_feast_context_json(response_text)
+    if context_dict and 'text' in context_dict and 'short_text' in context_dict:
+        return context_dict
+    return None
+
+
+def _run_batch(service, kind: str, model_name: str, requests: list, params: dict):
+    """Run ``requests`` and write their results with the ``kind``'s writer.
+
+    With ``LLM_BATCH_BACKEND = 'local'`` the requests are sent one at a time
+    and written right away.  Otherwise they are submitted as a provider batch,
+    whose ID is stored on an LLMBatch; ``poll_llm_batch_task`` writes the
+    results once it has ended, so no worker waits for the batch.
+    """
+    if getattr(settings, 'LLM_BATCH_BACKEND', 'provider') == 'local':
+        return BATCH_WRITERS[kind](params, service.run_batch(requests))
+
+    provider_batch_id = service.submit_batch(requests)
+    if not provider_batch_id:
+        return None
+    batch = LLMBatch.objects.create(
+        kind=kind, model=model_name, provider_batch_id=provider_batch_id, params=params
+    )
+    poll_llm_batch_task.apply_async(
+        args=[batch.pk], countdown=getattr(settings, 'LLM_BATCH_POLL_INTERVAL', 30)
+    )
+    return {"batch": batch.pk}
+
+
+def _write_reading_contexts(params: dict, responses: dict) -> dict:
+    """Write the reading contexts of a finished batch with one bulk update and one bulk insert."""
+    llm_prompt = LLMPrompt.objects.filter(pk=params["prompt_id"]).first()
+    if not llm_prompt:
+        logger.error("LLM prompt %s of the reading context batch no longer exists.", params["prompt_id"])
+        return {"updated": 0, "created": 0}
+    force_regeneration = params["force_regeneration"]
+
+    readings = list(Reading.objects.filter(pk__in=params["reading_ids"]))
+    active_contexts = {
+        context.reading_id: context
+        for context in ReadingContext.objects.filter(reading__in=readings, active=True)
+    }
+    updated, created = [], []
+    for reading in readings:
+        generated_contexts = _batch_translations(responses, f"reading-{reading.pk}")
+        if not generated_contexts:
+            logger.error("Failed to generate context for Reading %s in any language", reading.pk)
+            continue
+        context = active_contexts.get(reading.pk)
+        if context:
+            _apply_context_translations(context, generated_contexts, force_regeneration)
+            updated.append(context)
+        else:
+            created.append(_build_context_with_translations(reading, llm_prompt, generated_contexts))
+
+    with transaction.atomic():
+        ReadingContext.objects.bulk_update(updated, ['text', 'i18n'], batch_size=500)
+        ReadingContext.objects.bulk_create(created, batch_size=500)
+    # Bulk writes skip the post_save signal that bumps the version
+    bump_content_version('readings')
+
+    for context in updated + created:
+        store_passage_context(context.reading, llm_prompt, context)
+
+    logger.info(
+        "Batch context generation for %d readings: %d updated, %d created",
+        len(readings), len(updated), len(created)
+    )
+    return {"updated": len(updated), "created": len(created)}
+
+
+def _write_feast_contexts(params: dict, responses: dict) -> dict:
+    """Write the feast contexts of a finished batch with one bulk update and one bulk insert."""
+    llm_prompt = LLMPrompt.objects.filter(pk=params["prompt_id"]).first()
+    if not llm_prompt:
+        logger.error("LLM prompt %s of the feast context batch no longer exists.", params["prompt_id"])
+        return {"updated": 0, "created": 0}
+    force_regeneration = params["force_regeneration"]
+
+    feasts = list(Feast.objects.filter(pk__in=params["feast_ids"]))
+    active_contexts = {
+        context.feast_id: context
+        for context in FeastContext.objects.filter(feast__in=feasts, active=True)
+    }
+    updated, created = [], []
+    for feast in feasts:
+        generated_contexts = _batch_translations(responses, f"feast-{feast.pk}", _parse_complete_feast_context)
+        if not generated_contexts:
+            logger.error("Failed to generate context for Feast %s in any language", feast.pk)
+            continue
+        context = active_contexts.get(feast.pk)
+        if context:
+            _apply_feast_context_translations(context, generated_contexts, force_regeneration)
+            updated.append(context)
+        else:
+            created.append(_build_feast_context_with_translations(feast, llm_prompt, generated_contexts))
+
+    with transaction.atomic():
+        FeastContext.objects.bulk_update(updated, ['text', 'short_text', 'i18n'], batch_size=500)
+        FeastContext.objects.bulk_create(created, batch_size=500)
+    bump_content_version('feasts')
+
+    logger.info(
+        "Batch context generation for %d feasts: %d updated, %d created",
+        len(feasts), len(updated), len(created)
+    )
+    return {"updated": len(updated), "created": len(created)}
+
+
+def _write_feast_designations(params: dict, responses: dict) -> dict:
+    """Write the designations of a finished batch, skipping feasts designated in the meantime."""
+    from hub.services.llm_service import _match_designation
+
+    feasts = Feast.objects.filter(pk__in=params["feast_ids"]).filter(Q(designation__isnull=True) | Q(designation=''))
+    valid_choices = [choice[0] for choice in Feast.Designation.choices]
+    designated = []
+    for feast in feasts:
+        response = responses.get(f"feast-{feast.pk}")
+        designation = _match_designation(response) if response else None
+        if designation in valid_choices:
+            feast.designation = designation
+            designated.append(feast)
+        else:
+            logger.warning("Could not determine designation for Feast %s (%s)", feast.pk, feast.name)
+
+    if designated:
+        Feast.objects.bulk_update(designated, ['designation'], batch_size=500)
+        bump_content_version('feasts')
+    logger.info("Batch designation: %d of %d feasts designated", len(designated), len(params["feast_ids"]))
+    return {"designated": len(designated)}
+
+
+BATCH_WRITERS = {
+    LLMBatch.Kind.READING_CONTEXTS: _write_reading_contexts,
+    LLMBatch.Kind.FEAST_CONTEXTS: _write_feast_contexts,
+    LLMBatch.Kind.FEAST_DESIGNATIONS: _write_feast_designations,
+}
+
+
+@shared_task
+def regenerate_reading_contexts_batch_task(reading_ids: list[int], force_regeneration: bool = True):
+    """Generate contexts for many readings through the LLM provider's batch API.
+
+    All (reading, language) prompts go into one batch; once it has ended the
+    contexts are written with one bulk update and one bulk insert.
+
+    Args:
+        reading_ids: IDs of the Readings to generate context for
+        force_regeneration: If False, skip readings whose context has all languages
+    """
+    llm_prompt = LLMPrompt.objects.filter(active=True, applies_to='readings').first()
+    if not llm_prompt:
+        logger.error("No active LLM prompt found for readings.")
+        return
+
+    readings = list(Reading.objects.filter(pk__in=reading_ids))
+    if not force_regeneration:
+        active_contexts = {
+            context.reading_id: context
+            for context in ReadingContext.objects.filter(reading__in=readings, active=True)
+        }
+        readings = [
+            reading for reading in readings
+            if reading.pk not in active_contexts
+            or not _check_all_translations_present(active_contexts[reading.pk], AVAILABLE_LANGUAGES)
+        ]
+    if not readings:
+        return
+
+    try:
+        service = llm_prompt.get_llm_service()
+    except ValueError as e:
+        logger.error(f"Error selecting LLM service: {e}")
+        return
+
+    requests = [
+        service.reading_context_request(f"reading-{reading.pk}-{lang}", reading, llm_prompt, lang)
+        for reading in readings
+        for lang in AVAILABLE_LANGUAGES
+    ]
+    params = {
+        "reading_ids": [reading.pk for reading in readings],
+        "prompt_id": llm_prompt.pk,
+        "force_regeneration": force_regeneration,
+    }
+    return _run_batch(service, LLMBatch.Kind.READING_CONTEXTS, llm_prompt.model, requests, params)
+
+
+@shared_task
+def regenerate_feast_contexts_batch_task(
+    feast_ids: list[int], force_regeneration: bool = True, improvement_instructions: str = None
+):
+    """Generate contexts for many feasts through the LLM provider's batch API.
+
+    Args:
+        feast_ids: IDs of the Feasts to generate context for
+        force_regeneration: If False, skip feasts whose context has all languages
+        improvement_instructions: Optional instructions to improve the generated content
+    """
+    llm_prompt = LLMPrompt.objects.filter(active=True, applies_to='feasts').first()
+    if not llm_prompt:
+        logger.error("No active LLM prompt found for feasts.")
+        return
+
+    # Generic fast days are never displayed
+    feasts = list(Feast.objects.filter(pk__in=feast_ids).exclude(designation=Feast.Designation.FAST))
+    if not force_regeneration:
+        active_contexts = {
+            context.feast_id: context
+            for context in FeastContext.objects.filter(feast__in=feasts, active=True)
+        }
+        feasts = [
+            feast for feast in feasts
+            if feast.pk not in active_contexts
+            or not _check_all_feast_translations_present(active_contexts[feast.pk], AVAILABLE_LANGUAGES)
+        ]
+    if not feasts:
+        return
+
+    try:
+        service = llm_prompt.get_llm_service()
+    except ValueError as e:
+        logger.error(f"Error selecting LLM service: {e}")
+        return
+
+    requests = [
+        service.feast_context_request(f"feast-{feast.pk}-{lang}", feast, llm_prompt, lang, improvement_instructions)
+        for feast in feasts
+        for lang in AVAILABLE_LANGUAGES
+    ]
+    params = {
+        "feast_ids": [feast.pk for feast in feasts],
+        "prompt_id": llm_prompt.pk,
+        "force_regeneration": force_regeneration,
+    }
+    return _run_batch(service, LLMBatch.Kind.FEAST_CONTEXTS, llm_prompt.model, requests, params)
+
+
+@shared_task
+def determine_feast_designations_batch_task(feast_ids: list[int]):
+    """Determine designations for many feasts with one LLM batch.
+
+    Feasts that already have a designation are skipped, as in
+    ``determine_feast_designation_task``.  Generic fast days are designated
+    right away without asking the LLM.
+    """
+    feasts = list(
+        Feast.objects.filter(pk__in=feast_ids).filter(Q(designation__isnull=True) | Q(designation=''))
+    )
+    fast_days, pending = [], []
+    for feast in feasts:
+        if _is_generic_fast_day(feast.name):
+            feast.designation = Feast.Designation.FAST
+            fast_days.append(feast)
+        else:
+            pending.append(feast)
+
+    if fast_days:
+        Feast.objects.bulk_update(fast_days, ['designation'], batch_size=500)
+        bump_content_version('feasts')
+    result = {"designated": len(fast_days)}
+    if not pending:
+        return result
+
+    llm_prompt = LLMPrompt.objects.filter(active=True, applies_to='feasts').first()
+    model_name = llm_prompt.model if llm_prompt else DEFAULT_DESIGNATION_MODEL
+    try:
+        service = get_llm_service(model_name)
+    except ValueError as e:
+        logger.error(f"Error selecting LLM service for designation: {e}")
+        return result
+
+    requests = [service.designation_request(f"feast-{feast.pk}", feast, model_name) for feast in pending]
+    outcome = _run_batch(
+        service, LLMBatch.Kind.FEAST_DESIGNATIONS, model_name, requests,
+        {"feast_ids": [feast.pk for feast in pending]},
+    )
+    if outcome:
+        result["designated"] += outcome.pop("designated", 0)
+        result.update(outcome)
+    return result
+
+
+@shared_task
+def poll_llm_batch_task(batch_pk: int):
+    """Check on a submitted LLM batch: write its results once it has ended, or poll again later.
+
+    Batches that have not ended within ``LLM_BATCH_TIMEOUT`` are cancelled.
+    """
+    poll_interval = getattr(settings, 'LLM_BATCH_POLL_INTERVAL', 30)
+    now = timezone.now()
+    # Keep a single poll chain per batch: a poll queued by
+    # resume_llm_batch_polling_task while the chain is still alive stops here
+    claimed = LLMBatch.objects.filter(pk=batch_pk, status=LLMBatch.Status.PENDING).filter(
+        Q(last_polled_at__isnull=True) | Q(last_polled_at__lte=now - timedelta(seconds=poll_interval / 2))
+    ).update(last_polled_at=now)
+    if not claimed:
+        return
+    batch = LLMBatch.objects.get(pk=batch_pk)
+    service = get_llm_service(batch.model)
+
+    try:
+        responses = service.batch_results(batch.provider_batch_id)
+    except Exception as e:
+        logger.warning("Could not check LLM batch %s: %s", batch.provider_batch_id, e)
+        responses = None
+
+    if responses is None:
+        if now >= batch.submitted_at + timedelta(seconds=getattr(settings, 'LLM_BATCH_TIMEOUT', 86400)):
+            logger.error("LLM batch %s did not end in time, cancelling it.", batch.provider_batch_id)
+            try:
+                service.cancel_batch(batch.provider_batch_id)
+            except Exception as e:
+                logger.error("Error cancelling LLM batch %s: %s", batch.provider_batch_id, e)
+            LLMBatch.objects.filter(pk=batch.pk).update(status=LLMBatch.Status.EXPIRED, finished_at=now)
+            return
+        poll_llm_batch_task.apply_async(args=[batch.pk], countdown=poll_interval)
+        return
+
+    with transaction.atomic():
+        # Write the results once, even if two polls saw the batch end
+        if not LLMBatch.objects.filter(pk=batch.pk, status=LLMBatch.Status.PENDING).update(
+            status=LLMBatch.Status.COMPLETED, finished_at=timezone.now()
+        ):
+            return
+        return BATCH_WRITERS[batch.kind](batch.params, responses)
+
+
+@shared_task(name='hub.tasks.resume_llm_batch_polling_task')
+def resume_llm_batch_polling_task():
+    """Poll pending LLM batches again whose poll chain was lost, e.g. to a worker restart."""
+    poll_interval = getattr(settings, 'LLM_BATCH_POLL_INTERVAL', 30)
+    stale = timezone.now() - timedelta(seconds=max(3 * poll_interval, 300))
+    batch_pks = list(
+        LLMBatch.objects.filter(status=LLMBatch.Status.PENDING)
+        .filter(Q(last_polled_at__lt=stale) | Q(last_polled_at__isnull=True, submitted_at__lt=stale))
+        .values_list('pk', flat=True)
+    )
+    for batch_pk in batch_pks:
+        poll_llm_batch_task.delay(batch_pk)
+    return {"resumed": len(batch_pks)}
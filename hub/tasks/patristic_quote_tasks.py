@@ -0,0 +1,31 @@
+"""
+Quote-of-the-day pre-rendering tasks for the hub app.
+"""
+import logging
+from datetime import timedelta
+
+from celery import shared_task
+from django.utils import timezone
+import sentry_sdk
+
+from hub.services.patristic_quote_service import prerender_quotes_of_the_day
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(name='hub.tasks.prerender_quotes_of_the_day_task')
+@sentry_sdk.monitor(monitor_slug='nightly-quote-of-the-day-prerender')
+def prerender_quotes_of_the_day_task(days=2):
+    """
+    Render and cache the quote of the day ahead of users' local midnights.
+
+    Users east of the server reach the next date hours before the server does,
+    so today's and the following days' quotes are rendered, for the unfiltered
+    quote, the fasts observed on each day and recently requested filters, in
+    every language.
+
+    Args:
+        days: Number of dates to render, starting with the server's today
+    """
+    today = timezone.localdate()
+    return [prerender_quotes_of_the_day(today + timedelta(days=offset)) for offset in range(days)]
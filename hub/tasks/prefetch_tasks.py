@@ -0,0 +1,46 @@
+"""
+Look-ahead prefetch tasks for the hub app.
+
+See hub.services.prefetch_service for what is prefetched for each day.
+"""
+import logging
+
+from celery import shared_task
+from django.conf import settings
+import sentry_sdk
+
+from hub.services.prefetch_service import prefetch_horizon
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(name='hub.tasks.prefetch_upcoming_days_task')
+@sentry_sdk.monitor(monitor_slug='nightly-horizon-prefetch')
+def prefetch_upcoming_days_task(days=None, workers=None):
+    """
+    Prefetch readings, reading texts, feasts and LLM contexts for the coming days.
+
+    Covers today and the following PREFETCH_HORIZON_DAYS - 1 days for every
+    supported church, so user requests never wait on third-party scraping.
+
+    Args:
+        days: Horizon length in days (default: settings.PREFETCH_HORIZON_DAYS)
+        workers: Days processed concurrently (default: settings.PREFETCH_HORIZON_WORKERS)
+    """
+    days = days or getattr(settings, "PREFETCH_HORIZON_DAYS", 14)
+    workers = workers or getattr(settings, "PREFETCH_HORIZON_WORKERS", 4)
+
+    results = prefetch_horizon(days, workers=workers)
+
+    failures = [result for result in results if "error" in result]
+    summary = {
+        "days": len(results),
+        "readings_created": sum(result.get("readings_created", 0) for result in results),
+        "texts_fetched": sum(result.get("texts_fetched", 0) for result in results),
+        "contexts_queued": sum(result.get("contexts_queued", 0) for result in results),
+        "failures": len(failures),
+    }
+    logger.info("Horizon prefetch finished: %s", summary)
+    if failures:
+        logger.error("Horizon prefetch failed for %d days: %s", len(failures), failures)
+    return summary
@@ -0,0 +1,41 @@
+"""
+Per-user fast statistics tasks for the hub app.
+"""
+import logging
+
+from celery import shared_task
+import sentry_sdk
+
+from hub.models import ProfileFastStats
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(name='hub.tasks.rollover_profile_fast_stats_task')
+@sentry_sdk.monitor(monitor_slug='hourly-profile-fast-stats-rollover')
+def rollover_profile_fast_stats_task():
+    """
+    Roll ProfileFastStats rows over to each user's new local date.
+
+    Completed fasts and past fast days change when a day ends, not when a user
+    acts, so rows computed for an earlier date (or marked stale after a fast's
+    days changed) are recomputed here instead of on the user's next read.
+
+    Runs hourly so every timezone's midnight is picked up soon after it passes;
+    a row is only recomputed once per local day.
+    """
+    refreshed = 0
+    rows = ProfileFastStats.objects.select_related('profile').iterator(chunk_size=500)
+    for stats in rows:
+        today = ProfileFastStats.local_today(stats.profile)
+        if stats.as_of == today:
+            continue
+        try:
+            ProfileFastStats.refresh(stats.profile, as_of=today)
+            refreshed += 1
+        except Exception as e:
+            logger.error(f"Error rolling over fast stats for profile {stats.profile_id}: {e}")
+            sentry_sdk.capture_exception(e)
+
+    logger.info(f"Rolled over fast stats for {refreshed} profiles")
+    return refreshed
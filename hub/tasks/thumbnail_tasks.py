@@ -0,0 +1,52 @@
+"""
+Background thumbnail tasks for the hub app.
+
+See hub.services.thumbnail_service for how jobs are queued and deduplicated.
+"""
+import logging
+
+from celery import shared_task
+import sentry_sdk
+
+from hub.services.thumbnail_service import (
+    THUMBNAIL_SOURCES,
+    enqueue_thumbnail,
+    generate_thumbnail,
+    stale_thumbnail_ids,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=60, name='hub.tasks.generate_thumbnail_task')
+def generate_thumbnail_task(self, model_label, pk):
+    """
+    Generate the thumbnail of one object and cache its URL.
+
+    Args:
+        model_label: Model label from THUMBNAIL_SOURCES, e.g. "hub.Fast"
+        pk: Primary key of the object
+    """
+    try:
+        return generate_thumbnail(model_label, pk)
+    except Exception as exc:
+        logger.warning(f"Error generating thumbnail for {model_label} {pk}: {exc}")
+        raise self.retry(exc=exc)
+
+
+@shared_task(name='hub.tasks.refresh_stale_thumbnails_task')
+@sentry_sdk.monitor(monitor_slug='daily-thumbnail-refresh')
+def refresh_stale_thumbnails_task():
+    """
+    Queue thumbnails whose cached URL is missing or older than DAYS_TO_CACHE_THUMBNAIL.
+
+    Serializers only read the cached URL, so this keeps it fresh for objects
+    that are not re-saved.
+    """
+    queued = 0
+    for model_label in THUMBNAIL_SOURCES:
+        for pk in stale_thumbnail_ids(model_label):
+            queued += enqueue_thumbnail(model_label, pk)
+
+    logger.info(f"Queued {queued} stale thumbnails for refresh")
+    return queued
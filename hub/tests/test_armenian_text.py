@@ -5,13 +5,16 @@ Tests cover:
     - fetch_armenian_reading_text_task (task behavior, matching, error handling)
 """
 from datetime import date
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
+import requests
+from django.core.cache import cache
 from django.test import TestCase, override_settings
 
 from hub.models import Church, Day, Reading
 from hub.tasks.armenian_text_tasks import fetch_armenian_reading_text_task
 from hub.utils import scrape_armenian_reading_texts
+from tests.fixtures.sacredtradition import fake_response
 
 
 def _create_reading(day, book="Genesis", start_ch=1, start_v=1, end_ch=1, end_v=5, **kwargs):
@@ -81,14 +84,6 @@ EMPTY_READINGS_HTML = """
 """.encode("utf-8")
 
 
-def _mock_urlopen(html_bytes):
-    """Create a mock response object that returns the given HTML bytes."""
-    mock_response = MagicMock()
-    mock_response.status = 200
-    mock_response.read.return_value = html_bytes
-    return mock_response
-
-
 # ------------------------------------------------------------------ #
 #  scrape_armenian_reading_texts Tests
 # ------------------------------------------------------------------ #
@@ -97,13 +92,14 @@ class ScrapeArmenianReadingTextsTests(TestCase):
     """Tests for the scrape_armenian_reading_texts utility function."""
 
     def setUp(self):
+        cache.clear()
         self.church = Church.objects.get(pk=Church.get_default_pk())
         self.test_date = date(2026, 2, 16)
 
-    @patch("hub.utils.urllib.request.urlopen")
-    def test_single_reading_parsed(self, mock_urlopen):
+    @patch("requests.Session.get")
+    def test_single_reading_parsed(self, mock_get):
         """Test that a single reading's text is extracted correctly."""
-        mock_urlopen.return_value = _mock_urlopen(SINGLE_READING_HTML)
+        mock_get.return_value = fake_response(SINGLE_READING_HTML)
 
         results = scrape_armenian_reading_texts(self.test_date, self.church)
 
@@ -116,10 +112,10 @@ class ScrapeArmenianReadingTextsTests(TestCase):
         # Verse number should be wrapped in brackets
         self.assertTrue(results[0]["text_hy"].startswith("[16]"))
 
-    @patch("hub.utils.urllib.request.urlopen")
-    def test_multiple_readings_parsed(self, mock_urlopen):
+    @patch("requests.Session.get")
+    def test_multiple_readings_parsed(self, mock_get):
         """Test that multiple readings are all extracted."""
-        mock_urlopen.return_value = _mock_urlopen(MULTI_READING_HTML)
+        mock_get.return_value = fake_response(MULTI_READING_HTML)
 
         results = scrape_armenian_reading_texts(self.test_date, self.church)
 
@@ -146,31 +142,28 @@ class ScrapeArmenianReadingTextsTests(TestCase):
         self.assertEqual(results[2]["end_verse"], 26)
         self.assertIn("Third reading cross-chapter text", results[2]["text_hy"])
 
-    @patch("hub.utils.urllib.request.urlopen")
-    def test_empty_page_returns_empty_list(self, mock_urlopen):
+    @patch("requests.Session.get")
+    def test_empty_page_returns_empty_list(self, mock_get):
         """Test that a page with no readings returns an empty list."""
-        mock_urlopen.return_value = _mock_urlopen(EMPTY_READINGS_HTML)
+        mock_get.return_value = fake_response(EMPTY_READINGS_HTML)
 
         results = scrape_armenian_reading_texts(self.test_date, self.church)
 
         self.assertEqual(results, [])
 
-    @patch("hub.utils.urllib.request.urlopen")
-    def test_url_error_returns_empty_list(self, mock_urlopen):
+    @patch("requests.Session.get")
+    def test_url_error_returns_empty_list(self, mock_get):
         """Test that a URL error returns an empty list."""
-        import urllib.error
-        mock_urlopen.side_effect = urllib.error.URLError("Connection refused")
+        mock_get.side_effect = requests.ConnectionError("Connection refused")
 
         results = scrape_armenian_reading_texts(self.test_date, self.church)
 
         self.assertEqual(results, [])
 
-    @patch("hub.utils.urllib.request.urlopen")
-    def test_non_200_status_returns_empty_list(self, mock_urlopen):
+    @patch("requests.Session.get")
+    def test_non_200_status_returns_empty_list(self, mock_get):
         """Test that a non-200 response returns an empty list."""
-        mock_response = MagicMock()
-        mock_response.status = 500
-        mock_urlopen.return_value = mock_response
+        mock_get.return_value = fake_response("", 500)
 
         results = scrape_armenian_reading_texts(self.test_date, self.church)
 
@@ -184,10 +177,10 @@ class ScrapeArmenianReadingTextsTests(TestCase):
 
         self.assertEqual(results, [])
 
-    @patch("hub.utils.urllib.request.urlopen")
-    def test_html_tags_stripped_from_text(self, mock_urlopen):
+    @patch("requests.Session.get")
+    def test_html_tags_stripped_from_text(self, mock_get):
         """Test that HTML tags are properly stripped from verse text."""
-        mock_urlopen.return_value = _mock_urlopen(SINGLE_READING_HTML)
+        mock_get.return_value = fake_response(SINGLE_READING_HTML)
 
         results = scrape_armenian_reading_texts(self.test_date, self.church)
 
@@ -196,8 +189,8 @@ class ScrapeArmenianReadingTextsTests(TestCase):
         self.assertNotIn("<br>", results[0]["text_hy"])
         self.assertNotIn("<b>", results[0]["text_hy"])
 
-    @patch("hub.utils.urllib.request.urlopen")
-    def test_verse_numbers_wrapped_in_brackets(self, mock_urlopen):
+    @patch("requests.Session.get")
+    def test_verse_numbers_wrapped_in_brackets(self, mock_get):
         """Test that verse numbers are wrapped in brackets before Armenian text."""
         # HTML with multiple Armenian verses (verse 16, 17, 18)
         multi_verse_html = (
@@ -212,7 +205,7 @@ class ScrapeArmenianReadingTextsTests(TestCase):
             '<br><br><center><hr color="#152451" width="70%" size="1"></center>'
             '<br><br><!--/body--></td></body></html>'
         ).encode("utf-8")
-        mock_urlopen.return_value = _mock_urlopen(multi_verse_html)
+        mock_get.return_value = fake_response(multi_verse_html)
 
         results = scrape_armenian_reading_texts(self.test_date, self.church)
 
@@ -226,14 +219,14 @@ class ScrapeArmenianReadingTextsTests(TestCase):
         self.assertNotRegex(text, r"(?<!\[)16(?!\])")
         self.assertNotRegex(text, r"(?<!\[)17(?!\])")
 
-    @patch("hub.utils.urllib.request.urlopen")
-    def test_correct_url_constructed(self, mock_urlopen):
+    @patch("requests.Session.get")
+    def test_correct_url_constructed(self, mock_get):
         """Test that the correct URL is constructed for the Armenian page."""
-        mock_urlopen.return_value = _mock_urlopen(EMPTY_READINGS_HTML)
+        mock_get.return_value = fake_response(EMPTY_READINGS_HTML)
 
         scrape_armenian_reading_texts(date(2026, 2, 16), self.church)
 
-        args = mock_urlopen.call_args
+        args = mock_get.call_args
         url = args[0][0]
         self.assertIn("iL=0", url)
         self.assertIn("ymd=20260216", url)
@@ -4,14 +4,17 @@ Tests cover:
     - BibleAPIService (book name resolution, bible ID selection)
     - fetch_text_for_reading (synchronous single-reading fetch, unique FUMS token)
     - fetch_reading_text_task (Celery wrapper, used for management commands)
-    - refresh_all_reading_texts_task (per-reading refresh, cleanup, error summary)
+    - refresh_all_reading_texts_task (per-reading refresh, bulk save, cleanup, error summary)
     - Synchronous text fetch in GetDailyReadingsForDate view
     - API response (includes text fields)
 """
 from datetime import date, timedelta
 from unittest.mock import patch, MagicMock
 
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
 from hub.constants import (
@@ -27,6 +30,7 @@ from hub.services.bible_api_service import (
     BibleAPIService,
     fetch_text_for_reading,
 )
+from hub.services.reading_text_service import TEXT_FETCHERS, refresh_reading_texts
 from hub.tasks.bible_api_tasks import (
     fetch_reading_text_task,
     refresh_all_reading_texts_task,
@@ -252,6 +256,19 @@ class BibleAPIServiceInitTests(TestCase):
         service = BibleAPIService()
         self.assertEqual(service.api_key, "test-api-key")
 
+    @patch('hub.services.bible_api_service.config', return_value="test-api-key")
+    def test_session_backs_off_on_rate_limit_with_timeout(self, mock_config):
+        """Requests time out and 429 responses are retried with backoff."""
+        service = BibleAPIService()
+        retry = service.session.get_adapter("https://rest.api.bible").max_retries
+        self.assertIn(429, retry.status_forcelist)
+        self.assertGreater(retry.backoff_factor, 0)
+
+        with patch.object(service.session, 'get') as mock_get:
+            mock_get.return_value.json.return_value = {"data": {"content": ""}}
+            service.get_passage("GEN", 1, 1, 1, 5)
+        self.assertEqual(mock_get.call_args.kwargs["timeout"], service.timeout)
+
 
 # ------------------------------------------------------------------ #
 #  fetch_text_for_reading (synchronous) Tests
@@ -602,6 +619,55 @@ class RefreshAllReadingTextsTaskTests(TestCase):
         log_output = "\n".join(log.output)
         self.assertIn("API call failed", log_output)
 
+    @patch('hub.services.sacredtradition_service.SacredTraditionClient.get_page')
+    @patch('hub.services.bible_api_service.BibleAPIService.get_passage')
+    @patch('hub.services.bible_api_service.BibleAPIService.resolve_book_name', return_value="GEN")
+    @patch('hub.services.bible_api_service.config', return_value="test-key")
+    def test_refresh_scrapes_each_date_once_and_saves_in_bulk(
+        self, mock_config, mock_resolve, mock_get_passage, mock_get_page,
+    ):
+        """Armenian pages are scraped once per date and all readings are saved with one UPDATE."""
+        mock_get_passage.return_value = self.mock_api_response
+        mock_get_page.return_value = {"texts": [
+            {"start_chapter": 1, "start_verse": 1, "end_chapter": 1, "end_verse": 5, "text_hy": "Ի սկզբանէ"},
+            {"start_chapter": 2, "start_verse": 1, "end_chapter": 2, "end_verse": 5, "text_hy": "Եւ կատարեցան"},
+        ]}
+        day = Day.objects.create(date=date(2025, 3, 15), church=self.church)
+        first = _create_reading(day, book="Genesis", start_ch=1, start_v=1, end_ch=1, end_v=5)
+        second = _create_reading(day, book="Genesis", start_ch=2, start_v=1, end_ch=2, end_v=5)
+
+        with CaptureQueriesContext(connection) as queries:
+            refresh_all_reading_texts_task()
+
+        mock_get_page.assert_called_once()
+        self.assertEqual(mock_get_passage.call_count, 2)
+        updates = [q for q in queries.captured_queries if q["sql"].startswith('UPDATE "hub_reading"')]
+        self.assertEqual(len(updates), 1)
+        first.refresh_from_db()
+        second.refresh_from_db()
+        self.assertEqual((first.text, first.text_hy), ("Test verse content.", "Ի սկզբանէ"))
+        self.assertEqual((second.fums_token, second.text_hy), ("test-fums-token", "Եւ կատարեցան"))
+
+    @patch('hub.services.sacredtradition_service.SacredTraditionClient.get_page', return_value=None)
+    @patch('hub.services.bible_api_service.BibleAPIService.get_passage')
+    @patch('hub.services.bible_api_service.BibleAPIService.resolve_book_name', return_value="GEN")
+    @patch('hub.services.bible_api_service.config', return_value="test-key")
+    def test_refresh_covers_every_registered_language(
+        self, mock_config, mock_resolve, mock_get_passage, mock_get_page,
+    ):
+        """A language without a bulk fetcher is refreshed by its per-reading fetcher."""
+        mock_get_passage.return_value = self.mock_api_response
+        day = Day.objects.create(date=date(2025, 3, 15), church=self.church)
+        reading = _create_reading(day, book="Genesis", start_ch=1, start_v=1, end_ch=1, end_v=5)
+        fetch_french_text = MagicMock(return_value=True)
+
+        with patch.dict(TEXT_FETCHERS, {"fr": fetch_french_text}):
+            results = refresh_reading_texts([reading], service=BibleAPIService())
+
+        fetch_french_text.assert_called_once()
+        self.assertEqual(fetch_french_text.call_args.args, (reading,))
+        self.assertEqual(results, {reading.pk: {"en": True, "hy": False, "fr": True}})
+
     @patch('hub.services.bible_api_service.config', return_value="")
     def test_no_api_key_aborts_refresh(self, mock_config):
         """Test that refresh aborts gracefully when API key is missing."""
@@ -620,13 +686,14 @@ class ViewSynchronousTextFetchTests(TestCase):
     """Tests that GetDailyReadingsForDate fetches Bible text synchronously."""
 
     def setUp(self):
+        cache.clear()
         self.church = Church.objects.get(pk=Church.get_default_pk())
         self.test_date = date(2025, 4, 1)
 
-    @patch('hub.views.readings.fetch_all_reading_texts')
-    @patch('hub.views.readings.prepare_shared_resources')
-    @patch('hub.views.readings.scrape_readings')
-    @patch('hub.views.readings.generate_reading_context_task')
+    @patch('hub.services.prefetch_service.fetch_all_reading_texts')
+    @patch('hub.services.prefetch_service.prepare_shared_resources')
+    @patch('hub.services.prefetch_service.scrape_readings')
+    @patch('hub.tasks.generate_reading_context_task')
     def test_view_calls_fetch_all_for_new_readings(
         self, mock_context_task, mock_scrape, mock_prepare, mock_fetch_all,
     ):
@@ -662,10 +729,10 @@ class ViewSynchronousTextFetchTests(TestCase):
         self.assertEqual(call_kwargs.kwargs.get('service'), "mock_svc")
         self.assertEqual(call_kwargs.kwargs.get('armenian_texts'), [])
 
-    @patch('hub.views.readings.fetch_all_reading_texts')
-    @patch('hub.views.readings.prepare_shared_resources')
-    @patch('hub.views.readings.scrape_readings')
-    @patch('hub.views.readings.generate_reading_context_task')
+    @patch('hub.services.prefetch_service.fetch_all_reading_texts')
+    @patch('hub.services.prefetch_service.prepare_shared_resources')
+    @patch('hub.services.prefetch_service.scrape_readings')
+    @patch('hub.tasks.generate_reading_context_task')
     def test_view_does_not_fetch_text_for_existing_readings(
         self, mock_context_task, mock_scrape, mock_prepare, mock_fetch_all,
     ):
@@ -694,10 +761,10 @@ class ViewSynchronousTextFetchTests(TestCase):
         mock_fetch_all.assert_not_called()
         mock_prepare.assert_not_called()
 
-    @patch('hub.views.readings.fetch_all_reading_texts')
-    @patch('hub.views.readings.prepare_shared_resources')
-    @patch('hub.views.readings.scrape_readings')
-    @patch('hub.views.readings.generate_reading_context_task')
+    @patch('hub.services.prefetch_service.fetch_all_reading_texts')
+    @patch('hub.services.prefetch_service.prepare_shared_resources')
+    @patch('hub.services.prefetch_service.scrape_readings')
+    @patch('hub.tasks.generate_reading_context_task')
     def test_view_graceful_when_prepare_partial(
         self, mock_context_task, mock_scrape, mock_prepare, mock_fetch_all,
     ):
@@ -739,11 +806,12 @@ class ReadingTextAPIResponseTests(TestCase):
     """Tests for text fields in the GetDailyReadingsForDate API response."""
 
     def setUp(self):
+        cache.clear()
         self.church = Church.objects.get(pk=Church.get_default_pk())
         self.test_date = date(2025, 5, 1)
 
-    @patch('hub.views.readings.scrape_readings')
-    @patch('hub.views.readings.generate_reading_context_task')
+    @patch('hub.services.prefetch_service.scrape_readings')
+    @patch('hub.tasks.generate_reading_context_task')
     def test_response_includes_text_fields(self, mock_context_task, mock_scrape):
         """Test that API response includes text, textCopyright, textVersion fields."""
         from rest_framework.test import APIRequestFactory
@@ -775,8 +843,8 @@ class ReadingTextAPIResponseTests(TestCase):
         self.assertEqual(reading_data["textCopyright"], "NKJV (c) 1982 Thomas Nelson.")
         self.assertEqual(reading_data["textVersion"], "NKJV")
 
-    @patch('hub.views.readings.scrape_readings')
-    @patch('hub.views.readings.generate_reading_context_task')
+    @patch('hub.services.prefetch_service.scrape_readings')
+    @patch('hub.tasks.generate_reading_context_task')
     def test_response_empty_text_when_not_fetched(self, mock_context_task, mock_scrape):
         """Test that API response returns empty strings when text has not been fetched."""
         from rest_framework.test import APIRequestFactory
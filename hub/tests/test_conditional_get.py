@@ -0,0 +1,139 @@
+"""Tests for conditional GET (ETag / Last-Modified) on read-mostly endpoints."""
+from datetime import date
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from hub.models import Church, Day, PatristicQuote, Reading
+from tests.fixtures.test_data import TestDataFactory
+
+
+class ConditionalGetTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.church = TestDataFactory.create_church(name="Conditional Church")
+
+    def _revalidate(self, url, response, **params):
+        return self.client.get(url, params, HTTP_IF_NONE_MATCH=response['ETag'])
+
+    def test_unchanged_list_revalidates_without_queries(self):
+        url = reverse('church-list')
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('ETag', response)
+        self.assertIn('Last-Modified', response)
+
+        with self.assertNumQueries(0):
+            not_modified = self._revalidate(url, response)
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(not_modified['ETag'], response['ETag'])
+
+        not_modified = self.client.get(url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_content_change_and_query_params_change_the_validator(self):
+        url = reverse('church-list')
+        response = self.client.get(url)
+
+        self.assertEqual(self.client.get(url, {'page': 1}, HTTP_IF_NONE_MATCH=response['ETag']).status_code,
+                         status.HTTP_200_OK)
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'],
+                                         HTTP_ACCEPT_LANGUAGE='hy').status_code,
+                         status.HTTP_200_OK)
+
+        self.church.name = "Renamed Church"
+        self.church.save()
+        changed = self._revalidate(url, response)
+        self.assertEqual(changed.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(changed['ETag'], response['ETag'])
+        self.assertIn("Renamed Church", [church['name'] for church in changed.data['results']])
+
+    def test_authenticated_responses_depend_on_profile_and_skip_last_modified(self):
+        user = TestDataFactory.create_user(username="conditional@example.com")
+        profile = TestDataFactory.create_profile(user=user, church=self.church)
+        self.client.force_authenticate(user=user)
+        url = reverse('church-list')
+
+        response = self.client.get(url)
+        self.assertNotIn('Last-Modified', response)
+        self.assertEqual(self._revalidate(url, response).status_code, status.HTTP_304_NOT_MODIFIED)
+
+        profile.timezone = 'Asia/Yerevan'
+        profile.save()
+        user.refresh_from_db()
+        self.client.force_authenticate(user=user)
+        self.assertEqual(self._revalidate(url, response).status_code, status.HTTP_200_OK)
+
+    @patch('hub.tasks.generate_reading_context_task.delay')
+    def test_readings_validator_follows_reading_changes(self, mock_delay):
+        day = Day.objects.create(date=date(2025, 3, 1), church=Church.objects.get(pk=Church.get_default_pk()))
+        reading = Reading.objects.create(
+            day=day, book="John", start_chapter=3, start_verse=16, end_chapter=3, end_verse=18
+        )
+        url = reverse('daily-readings')
+        response = self.client.get(url, {'date': '2025-03-01'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            self._revalidate(url, response, date='2025-03-01').status_code, status.HTTP_304_NOT_MODIFIED
+        )
+
+        reading.end_verse = 21
+        reading.save()
+        changed = self._revalidate(url, response, date='2025-03-01')
+        self.assertEqual(changed.status_code, status.HTTP_200_OK)
+        self.assertEqual(changed.data['readings'][0]['endVerse'], 21)
+
+    def test_fast_detail_validator_follows_joined_state_and_participants(self):
+        fast = TestDataFactory.create_fast(church=self.church, name="Conditional Fast")
+        user = TestDataFactory.create_user(username="joiner@example.com")
+        profile = TestDataFactory.create_profile(user=user, church=self.church)
+        self.client.force_authenticate(user=user)
+        url = reverse('fast-detail', kwargs={'pk': fast.pk})
+
+        response = self.client.get(url)
+        self.assertEqual(self._revalidate(url, response).status_code, status.HTTP_304_NOT_MODIFIED)
+
+        profile.fasts.add(fast)
+        joined = self._revalidate(url, response)
+        self.assertEqual(joined.status_code, status.HTTP_200_OK)
+        self.assertTrue(joined.data['joined'])
+        self.assertEqual(joined.data['participant_count'], 1)
+
+        other = TestDataFactory.create_profile(
+            user=TestDataFactory.create_user(username="other@example.com"), church=self.church
+        )
+        other.fasts.add(fast)
+        changed = self._revalidate(url, joined)
+        self.assertEqual(changed.status_code, status.HTTP_200_OK)
+        self.assertEqual(changed.data['participant_count'], 2)
+
+    def test_quote_of_the_day_cache_follows_quote_edits(self):
+        quote = PatristicQuote.objects.create(text="Original text", attribution="St. Test")
+        quote.churches.add(self.church)
+        url = reverse('patristic-quote-of-the-day')
+        response = self.client.get(url)
+        self.assertEqual(response.data['text'], "Original text")
+
+        quote.text = "Edited text"
+        quote.save()
+        changed = self._revalidate(url, response)
+        self.assertEqual(changed.status_code, status.HTTP_200_OK)
+        self.assertEqual(changed.data['text'], "Edited text")
+
+    def test_learning_resource_validator_follows_user_bookmarks(self):
+        user = TestDataFactory.create_user(username="reader@example.com")
+        TestDataFactory.create_profile(user=user, church=self.church)
+        article = TestDataFactory.create_article(title="Conditional Article")
+        self.client.force_authenticate(user=user)
+        url = reverse('article-list')
+
+        response = self.client.get(url)
+        self.assertEqual(self._revalidate(url, response).status_code, status.HTTP_304_NOT_MODIFIED)
+
+        TestDataFactory.create_bookmark(user=user, content_object=article)
+        self.assertEqual(self._revalidate(url, response).status_code, status.HTTP_200_OK)
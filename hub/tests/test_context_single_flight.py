@@ -0,0 +1,73 @@
+"""Tests for single-flight enqueueing of LLM context generation."""
+from datetime import date
+from unittest.mock import patch
+
+from celery.exceptions import Retry
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from hub.models import Church, Day, LLMPrompt, Reading
+from hub.services.context_generation_service import (
+    READING,
+    enqueue_reading_context,
+    held_context_claim,
+    is_context_generation_in_flight,
+)
+from hub.tasks import generate_reading_context_task
+
+
+class ContextSingleFlightTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        church = Church.objects.get(pk=Church.get_default_pk())
+        day = Day.objects.create(date=date(2025, 7, 1), church=church)
+        self.reading = Reading.objects.create(
+            day=day, book="John", start_chapter=1, start_verse=1, end_chapter=1, end_verse=5
+        )
+
+    @patch('hub.tasks.generate_reading_context_task.delay')
+    def test_concurrent_requests_enqueue_one_job(self, mock_delay):
+        self.assertTrue(enqueue_reading_context(self.reading.id))
+        self.assertFalse(enqueue_reading_context(self.reading.id))
+        self.assertTrue(is_context_generation_in_flight(READING, self.reading.id))
+
+        # A forced regeneration is tracked separately, and also only once
+        self.assertTrue(enqueue_reading_context(self.reading.id, force_regeneration=True))
+        self.assertFalse(enqueue_reading_context(self.reading.id, force_regeneration=True))
+        self.assertEqual(mock_delay.call_count, 2)
+
+    @patch('hub.tasks.generate_reading_context_task.delay')
+    def test_readings_endpoint_reports_pending_context_without_requeueing(self, mock_delay):
+        url = reverse('daily-readings')
+        first = self.client.get(url, {'date': '2025-07-01'})
+        # Another language misses the payload cache and rebuilds it while the job is in flight
+        second = self.client.get(url, {'date': '2025-07-01', 'lang': 'hy'})
+
+        self.assertEqual(first.data['readings'][0]['context_status'], "pending")
+        self.assertEqual(second.data['readings'][0]['context_status'], "pending")
+        mock_delay.assert_called_once_with(self.reading.id, force_regeneration=False)
+
+    def test_task_releases_the_claim_when_it_finishes(self):
+        LLMPrompt.objects.create(model="gpt-4o-mini", role="Test role", prompt="Test prompt", active=True)
+        with patch('hub.services.llm_service.OpenAIService.generate_context', return_value="Generated"):
+            self.assertTrue(enqueue_reading_context(self.reading.id))  # runs eagerly in tests
+
+        self.assertFalse(is_context_generation_in_flight(READING, self.reading.id))
+        self.assertEqual(self.reading.active_context.text, "Generated")
+
+    def test_claim_is_kept_while_a_retry_is_pending(self):
+        with patch.object(generate_reading_context_task, 'delay'):
+            enqueue_reading_context(self.reading.id)
+
+        with self.assertRaises(Retry):
+            with held_context_claim(READING, self.reading.id):
+                raise Retry()
+        self.assertTrue(is_context_generation_in_flight(READING, self.reading.id))
+
+        with self.assertRaises(ValueError):
+            with held_context_claim(READING, self.reading.id):
+                raise ValueError("LLM unavailable")
+        self.assertFalse(is_context_generation_in_flight(READING, self.reading.id))
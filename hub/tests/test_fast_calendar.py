@@ -0,0 +1,96 @@
+"""Tests for the batched fast calendar endpoint."""
+from datetime import date
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from hub.models import Day
+from tests.fixtures.test_data import TestDataFactory
+
+
+class FastCalendarViewTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.url = reverse('fast-calendar')
+        self.church = TestDataFactory.create_church(name="Calendar Church")
+        self.other_church = TestDataFactory.create_church(name="Other Calendar Church")
+
+        self.lent = TestDataFactory.create_fast(church=self.church, name="Lent")
+        self.weekly = TestDataFactory.create_fast(church=self.church, name="Weekly")
+        self.other = TestDataFactory.create_fast(church=self.other_church, name="Other")
+
+        for day in range(27, 32):
+            Day.objects.create(date=date(2025, 3, day), church=self.church, fast=self.lent)
+        for day in range(1, 4):
+            Day.objects.create(date=date(2025, 4, day), church=self.church, fast=self.lent)
+        Day.objects.create(date=date(2025, 3, 28), church=self.church, fast=self.weekly)
+        Day.objects.create(date=date(2025, 3, 29), church=self.church)
+        Day.objects.create(date=date(2025, 3, 28), church=self.other_church, fast=self.other)
+
+    def _get(self, start, end, **params):
+        return self.client.get(self.url, {
+            'start_date': start, 'end_date': end, 'church_id': self.church.id, **params
+        })
+
+    def test_range_spanning_months(self):
+        response = self._get('2025-03-28', '2025-04-02')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+
+        self.assertEqual(data['days'], {
+            '2025-03-28': [self.lent.id, self.weekly.id],
+            '2025-03-29': [self.lent.id],
+            '2025-03-30': [self.lent.id],
+            '2025-03-31': [self.lent.id],
+            '2025-04-01': [self.lent.id],
+            '2025-04-02': [self.lent.id],
+        })
+        self.assertEqual(set(data['fasts']), {str(self.lent.id), str(self.weekly.id)})
+
+        lent = data['fasts'][str(self.lent.id)]
+        self.assertEqual(lent['name'], "Lent")
+        self.assertEqual(lent['start_date'], '2025-03-27')
+        self.assertEqual(lent['end_date'], '2025-04-03')
+        self.assertEqual(lent['total_number_of_days'], 8)
+
+    def test_fast_table_only_contains_fasts_in_range(self):
+        data = self._get('2025-04-01', '2025-04-30').json()
+        self.assertEqual(set(data['fasts']), {str(self.lent.id)})
+        self.assertNotIn('2025-03-28', data['days'])
+
+    def test_cached_month_served_with_one_query_per_request(self):
+        self._get('2025-03-01', '2025-04-30')
+        # Only the church lookup is left; months come from the cache
+        with self.assertNumQueries(1):
+            response = self._get('2025-03-01', '2025-04-30')
+        self.assertIn('2025-03-28', response.json()['days'])
+
+    def test_day_changes_invalidate_cached_months(self):
+        self._get('2025-03-01', '2025-03-31')
+
+        Day.objects.create(date=date(2025, 3, 10), church=self.church, fast=self.weekly)
+        data = self._get('2025-03-01', '2025-03-31').json()
+        self.assertEqual(data['days']['2025-03-10'], [self.weekly.id])
+
+        self.weekly.days.filter(date=date(2025, 3, 10)).delete()
+        data = self._get('2025-03-01', '2025-03-31').json()
+        self.assertNotIn('2025-03-10', data['days'])
+
+    def test_fast_rename_invalidates_cached_months(self):
+        self._get('2025-03-01', '2025-03-31')
+        self.weekly.name = "Renamed"
+        self.weekly.save()
+
+        data = self._get('2025-03-01', '2025-03-31').json()
+        self.assertEqual(data['fasts'][str(self.weekly.id)]['name'], "Renamed")
+
+    def test_invalid_ranges(self):
+        self.assertEqual(self._get('2025-04-01', '2025-03-01').status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self._get('2025-01-01', '2026-06-01').status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self._get('2025-13-01', '2025-12-01').status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.get(self.url, {'church_id': self.church.id, 'end_date': '2025-03-01'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
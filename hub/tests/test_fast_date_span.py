@@ -0,0 +1,67 @@
+"""Tests for the stored Fast.start_date / end_date / total_days columns."""
+from datetime import date
+
+from django.test import TestCase
+
+from hub.models import Day, Fast
+from tests.fixtures.test_data import TestDataFactory
+
+
+class FastDateSpanTests(TestCase):
+    def setUp(self):
+        self.church = TestDataFactory.create_church(name="Span Church")
+        self.fast = TestDataFactory.create_fast(church=self.church, name="Span Fast")
+        self.other_fast = TestDataFactory.create_fast(church=self.church, name="Other Span Fast")
+
+    def _create_day(self, day_date, fast=None):
+        return Day.objects.create(date=day_date, church=self.church, fast=fast)
+
+    def _span(self, fast):
+        fast = Fast.objects.get(pk=fast.pk)
+        return fast.start_date, fast.end_date, fast.total_days
+
+    def test_new_fast_has_empty_span(self):
+        self.assertEqual(self._span(self.fast), (None, None, 0))
+
+    def test_day_create_and_delete(self):
+        self._create_day(date(2025, 3, 2), fast=self.fast)
+        last = self._create_day(date(2025, 3, 5), fast=self.fast)
+        self._create_day(date(2025, 3, 3), fast=self.fast)
+        self.assertEqual(self._span(self.fast), (date(2025, 3, 2), date(2025, 3, 5), 3))
+
+        last.delete()
+        self.assertEqual(self._span(self.fast), (date(2025, 3, 2), date(2025, 3, 3), 2))
+
+    def test_moving_day_updates_both_fasts(self):
+        day = self._create_day(date(2025, 3, 2), fast=self.fast)
+        self._create_day(date(2025, 3, 3), fast=self.fast)
+
+        day.fast = self.other_fast
+        day.save()
+
+        self.assertEqual(self._span(self.fast), (date(2025, 3, 3), date(2025, 3, 3), 1))
+        self.assertEqual(self._span(self.other_fast), (date(2025, 3, 2), date(2025, 3, 2), 1))
+
+    def test_reverse_relation_add_and_set(self):
+        days = [self._create_day(date(2025, 4, d)) for d in (1, 2, 3)]
+
+        self.fast.days.add(*days)
+        self.assertEqual(self._span(self.fast), (date(2025, 4, 1), date(2025, 4, 3), 3))
+
+        self.other_fast.days.set(days[1:])
+        self.assertEqual(self._span(self.fast), (date(2025, 4, 1), date(2025, 4, 1), 1))
+        self.assertEqual(self._span(self.other_fast), (date(2025, 4, 2), date(2025, 4, 3), 2))
+
+    def test_queryset_update_of_date(self):
+        self._create_day(date(2025, 5, 1), fast=self.fast)
+        Day.objects.filter(fast=self.fast).update(date=date(2025, 5, 9))
+        self.assertEqual(self._span(self.fast), (date(2025, 5, 9), date(2025, 5, 9), 1))
+
+    def test_saving_stale_instance_does_not_overwrite_span(self):
+        stale = Fast.objects.get(pk=self.fast.pk)
+        self._create_day(date(2025, 6, 1), fast=self.fast)
+
+        stale.description = "Updated description"
+        stale.save()
+
+        self.assertEqual(self._span(self.fast), (date(2025, 6, 1), date(2025, 6, 1), 1))
@@ -6,6 +6,8 @@ from hub.views.fast import FastListView, FastByFeastDateView
 from django.contrib.auth.models import AnonymousUser
 from rest_framework.test import APIRequestFactory
 from rest_framework.test import force_authenticate
+from rest_framework.test import APIClient
+from django.urls import reverse
 from datetime import timedelta
 from django.core.cache import cache
 from tests.fixtures.test_data import TestDataFactory
@@ -653,4 +655,46 @@ class FastSerializerDayNumberTest(TestCase):
             day_offsets=[1, 2, 3],  # all in the future
         )
         data = self._serialize(fast)
-        self.assertIsNone(data['current_day_number'])
\ No newline at end of file
+        self.assertIsNone(data['current_day_number'])
+
+class SharedFastPayloadTests(TestCase):
+    """Fast detail/by-date payloads are cached once and `joined` is overlaid per user."""
+
+    def setUp(self):
+        cache.clear()
+        self.church = TestDataFactory.create_church(name="Shared Church")
+        self.fast = TestDataFactory.create_fast(church=self.church, name="Shared Fast")
+        self.today = timezone.now().date()
+        Day.objects.create(date=self.today, church=self.church, fast=self.fast)
+        self.users = []
+        for i in range(2):
+            user = TestDataFactory.create_user(username=f"shared{i}@example.com")
+            TestDataFactory.create_profile(user=user, church=self.church)
+            self.users.append(user)
+        self.users[0].profile.fasts.add(self.fast)
+        self.client = APIClient()
+
+    def _get_as(self, user, url, params=None):
+        self.client.force_authenticate(user=user)
+        return self.client.get(url, params or {})
+
+    def test_detail_payload_shared_between_users(self):
+        url = reverse('fast-detail', kwargs={'pk': self.fast.pk})
+        self.assertTrue(self._get_as(self.users[0], url).data['joined'])
+
+        # Second user is served from the shared entry; only its joined IDs are loaded
+        with self.assertNumQueries(1):
+            response = self._get_as(self.users[1], url)
+        self.assertFalse(response.data['joined'])
+
+    def test_joined_overlay_follows_membership_changes(self):
+        url = reverse('fast-by-date')
+        params = {'date': self.today.isoformat()}
+        self.assertFalse(self._get_as(self.users[1], url, params).data['results'][0]['joined'])
+
+        self.users[1].profile.fasts.add(self.fast)
+        self.assertTrue(self._get_as(self.users[1], url, params).data['results'][0]['joined'])
+
+        self.fast.profiles.clear()
+        for user in self.users:
+            self.assertFalse(self._get_as(user, url, params).data['results'][0]['joined'])
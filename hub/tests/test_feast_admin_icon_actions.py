@@ -94,6 +94,8 @@ class FeastAdminIconActionsTests(TestCase):
         self.assertIsNone(self.feast_with_icon.icon)
         self.assertIsNone(self.feast_without_icon.icon)
         self.assertEqual(mock_delay.call_count, 2)
+        for call in mock_delay.call_args_list:
+            self.assertEqual(call.kwargs, {"force": True})
 
     def test_match_icon_if_missing_action_enqueues_only_when_missing(self):
         request = self._admin_request()
@@ -120,7 +122,7 @@ class FeastAdminIconActionsTests(TestCase):
         self.assertEqual(response.status_code, 302)
         self.feast_with_icon.refresh_from_db()
         self.assertIsNone(self.feast_with_icon.icon)
-        mock_delay.assert_called_once_with(self.feast_with_icon.pk)
+        mock_delay.assert_called_once_with(self.feast_with_icon.pk, force=True)
 
     def test_rematch_icon_if_missing_view_skips_when_icon_present(self):
         self.client.force_login(self.admin_user)
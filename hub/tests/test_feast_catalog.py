@@ -0,0 +1,59 @@
+"""Tests for the in-memory feast reference catalog."""
+import json
+import os
+import tempfile
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, override_settings
+
+from hub.services.feast_catalog import FeastCatalog, get_feast_catalog, reset_feast_catalog
+
+ENTRIES = [
+    {"name": "Saint Gregory the Illuminator", "month": "January", "day": "21"},
+    {"name": "Saints Cyricus and Julitta", "month": "July", "day": "15"},
+    {"name": "Feast of the Holy Cross", "month": "September", "day": "14"},
+    {"name": "Holy Translators", "month": "October", "day": "11"},
+]
+
+
+class FeastCatalogTests(SimpleTestCase):
+    def setUp(self):
+        reset_feast_catalog()
+        self.addCleanup(reset_feast_catalog)
+        self.base_dir = tempfile.mkdtemp()
+        os.mkdir(os.path.join(self.base_dir, "data"))
+        self.path = os.path.join(self.base_dir, "data", "feasts.json")
+
+    def _write(self, entries, mtime):
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(entries, f)
+        os.utime(self.path, (mtime, mtime))
+
+    def test_candidates_share_trigrams_or_the_date(self):
+        catalog = FeastCatalog(ENTRIES)
+
+        self.assertEqual(catalog.candidates(["st. gregory the illuminator"], limit=1), [0])
+        self.assertEqual(catalog.candidates(["st. gregory the illuminator"], "October", "11", limit=1), [0, 3])
+        self.assertEqual(catalog.candidates(["զատիկ"]), [])
+
+    def test_loads_once_and_reloads_when_the_file_changes(self):
+        self._write(ENTRIES, mtime=1_000_000)
+        with override_settings(BASE_DIR=self.base_dir), \
+                patch("hub.services.feast_catalog.FeastCatalog", wraps=FeastCatalog) as build:
+            first = get_feast_catalog()
+            self.assertIs(get_feast_catalog(), first)
+            self.assertEqual(build.call_count, 1)
+
+            self._write(ENTRIES[:2], mtime=2_000_000)
+            reloaded = get_feast_catalog()
+
+        self.assertEqual(build.call_count, 2)
+        self.assertEqual(len(reloaded), 2)
+
+    def test_unreadable_file_is_not_cached(self):
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write("{not json")
+        with override_settings(BASE_DIR=self.base_dir):
+            self.assertIsNone(get_feast_catalog())
+            self._write(ENTRIES, mtime=os.path.getmtime(self.path))
+            self.assertEqual(len(get_feast_catalog()), 4)
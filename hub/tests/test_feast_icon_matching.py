@@ -1,14 +1,16 @@
 """Tests for feast icon matching functionality."""
-from datetime import date
+from datetime import date, timedelta
 from unittest.mock import patch
 from django.test import TestCase, override_settings
+from django.utils import timezone
 from django.test.utils import tag
 from django.db.models.signals import post_save
 from django.core.files.uploadedfile import SimpleUploadedFile
 
 from hub.models import Church, Day, Feast
-from hub.tasks.icon_tasks import match_icon_to_feast_task, _simple_match_icons
+from hub.tasks.icon_tasks import match_icon_to_feast_task, prewarm_icon_match_cache_task
 from hub.signals import handle_feast_save
+from icons.matching import icon_match_cache_stats, reset_icon_match_cache_stats, simple_match_icons
 from icons.models import Icon
 
 
@@ -44,7 +46,7 @@ class FeastIconMatchingTaskTests(TestCase):
         )
 
         # Mock the matching function to ensure it's not called
-        with patch('hub.tasks.icon_tasks._match_icons_with_llm') as mock_match:
+        with patch('hub.tasks.icon_tasks.match_icons') as mock_match:
             match_icon_to_feast_task(feast.id)
             # Matching should not be called since icon is already set
             mock_match.assert_not_called()
@@ -94,7 +96,7 @@ class FeastIconMatchingTaskTests(TestCase):
         )
 
         # Mock the matching function to return high confidence match
-        with patch('hub.tasks.icon_tasks._match_icons_with_llm') as mock_match:
+        with patch('hub.tasks.icon_tasks.match_icons') as mock_match:
             mock_match.return_value = [
                 {'id': icon.id, 'confidence': 'high'}
             ]
@@ -122,7 +124,7 @@ class FeastIconMatchingTaskTests(TestCase):
         )
 
         # Mock the matching function to return medium confidence match
-        with patch('hub.tasks.icon_tasks._match_icons_with_llm') as mock_match:
+        with patch('hub.tasks.icon_tasks.match_icons') as mock_match:
             mock_match.return_value = [
                 {'id': icon.id, 'confidence': 'medium'}
             ]
@@ -151,7 +153,7 @@ class FeastIconMatchingTaskTests(TestCase):
         )
 
         # Mock the matching function to return low confidence match
-        with patch('hub.tasks.icon_tasks._match_icons_with_llm') as mock_match:
+        with patch('hub.tasks.icon_tasks.match_icons') as mock_match:
             mock_match.return_value = [
                 {'id': icon.id, 'confidence': 'low'}
             ]
@@ -180,7 +182,7 @@ class FeastIconMatchingTaskTests(TestCase):
         )
 
         # Mock the matching function to return no matches
-        with patch('hub.tasks.icon_tasks._match_icons_with_llm') as mock_match:
+        with patch('hub.tasks.icon_tasks.match_icons') as mock_match:
             mock_match.return_value = []
             match_icon_to_feast_task(feast.id)
 
@@ -212,17 +214,17 @@ class FeastIconMatchingTaskTests(TestCase):
         icons = [icon1, icon2]
 
         # Test exact title match
-        result = _simple_match_icons(icons, "Nativity Scene", max_results=1)
+        result = simple_match_icons(icons, "Nativity Scene", max_results=1)
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0], icon1.id)
 
         # Test partial match
-        result = _simple_match_icons(icons, "Nativity", max_results=1)
+        result = simple_match_icons(icons, "Nativity", max_results=1)
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0], icon1.id)
 
         # Test no match
-        result = _simple_match_icons(icons, "Christmas", max_results=1)
+        result = simple_match_icons(icons, "Christmas", max_results=1)
         self.assertEqual(len(result), 0)
 
 
@@ -464,3 +466,66 @@ class FeastIconAPITests(TestCase):
         self.assertIn('icon', response.data['feast'])
         self.assertIsNone(response.data['feast']['icon'])
 
+
+@override_settings(OPENAI_API_KEY='test-key')
+@patch('icons.matching.rerank_with_llm')
+class IconMatchCachePrewarmTests(TestCase):
+    """Tests for prewarming the icon match cache for upcoming feasts."""
+
+    def setUp(self):
+        self.church = Church.objects.get(pk=Church.get_default_pk())
+        # Feast creation would otherwise match icons eagerly
+        post_save.disconnect(handle_feast_save, sender=Feast)
+        self.addCleanup(post_save.connect, handle_feast_save, sender=Feast)
+        self.icon = Icon.objects.create(
+            title="Baptism of Christ",
+            church=self.church,
+            image=SimpleUploadedFile(name='icon.jpg', content=b'fake image content', content_type='image/jpeg'),
+        )
+        reset_icon_match_cache_stats()
+        today = timezone.localdate()
+        self.upcoming = Feast.objects.create(
+            day=Day.objects.create(date=today + timedelta(days=1), church=self.church), name="Theophany",
+        )
+        self.later = Feast.objects.create(
+            day=Day.objects.create(date=today + timedelta(days=30), church=self.church), name="Transfiguration",
+        )
+
+    def test_prewarm_covers_upcoming_feasts_and_serves_the_feast_task(self, mock_rerank):
+        mock_rerank.return_value = [{'id': self.icon.id, 'confidence': 'high'}]
+
+        summary = prewarm_icon_match_cache_task(days=7)
+        self.assertEqual((summary['feasts'], summary['warmed']), (1, 1))
+        self.assertEqual(prewarm_icon_match_cache_task(days=7)['already_cached'], 1)
+
+        match_icon_to_feast_task(self.upcoming.id)
+
+        mock_rerank.assert_called_once()
+        self.upcoming.refresh_from_db()
+        self.assertEqual(self.upcoming.icon, self.icon)
+        # Prewarming is not counted; the feast task's lookup is a hit
+        self.assertEqual((summary['hits'], summary['misses']), (0, 0))
+        self.assertEqual(icon_match_cache_stats(), {'hits': 1, 'misses': 0, 'hit_rate': 1.0})
+
+    def test_forced_match_skips_the_cached_result(self, mock_rerank):
+        mock_rerank.return_value = [{'id': self.icon.id, 'confidence': 'low'}]
+        prewarm_icon_match_cache_task(days=7)
+
+        mock_rerank.return_value = [{'id': self.icon.id, 'confidence': 'high'}]
+        match_icon_to_feast_task(self.upcoming.id)
+        self.upcoming.refresh_from_db()
+        self.assertIsNone(self.upcoming.icon)
+
+        match_icon_to_feast_task(self.upcoming.id, force=True)
+
+        self.assertEqual(mock_rerank.call_count, 2)
+        self.upcoming.refresh_from_db()
+        self.assertEqual(self.upcoming.icon, self.icon)
+
+    def test_prewarm_selected_feasts(self, mock_rerank):
+        mock_rerank.return_value = []
+
+        summary = prewarm_icon_match_cache_task(feast_ids=[self.later.id])
+
+        self.assertEqual(summary['warmed'], 1)
+        self.assertEqual(mock_rerank.call_args[0][1], "Transfiguration")
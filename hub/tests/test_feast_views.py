@@ -1,14 +1,21 @@
 """Tests for feast view resilience: degraded responses, caching, circuit breaker."""
 from datetime import date
-from unittest.mock import Mock, patch
-import urllib.error
+from unittest.mock import patch
+
+import requests
 
 from django.core.cache import cache
 from django.test import TestCase
 from rest_framework.test import APIRequestFactory
 
 from hub.models import Church, Day, Feast
-from hub.utils import _fetch_sacredtradition, _stable_url_key
+from hub.services.sacredtradition_service import (
+    ENGLISH,
+    SCRAPE_CACHE_TIMEOUT,
+    SacredTraditionClient,
+    _stable_url_key,
+)
+from tests.fixtures.sacredtradition import fake_response
 
 
 class FeastViewDegradedResponseTests(TestCase):
@@ -123,137 +130,110 @@ class FeastViewCacheTests(TestCase):
 
 
 class CircuitBreakerTests(TestCase):
-    """Tests for the circuit breaker in _fetch_sacredtradition."""
+    """Tests for the circuit breaker and stale fallback of the sacredtradition.am client."""
+
+    url = "https://sacredtradition.am/Calendar/nter.php?NM=0&iM=1103&iL=2&ymd=20251225"
 
     def setUp(self):
         cache.clear()
+        self.scraper = SacredTraditionClient("https://sacredtradition.am")
+        self.circuit_key = f"circuit_breaker:{_stable_url_key(self.url)}"
 
     def test_url_validation_invalid(self):
-        """_fetch_sacredtradition returns None for invalid URLs."""
+        """fetch returns None for URLs of other hosts."""
         # Wrong domain
-        result = _fetch_sacredtradition("https://evil.example.com/page")
+        result = self.scraper.fetch("https://evil.example.com/page")
         self.assertIsNone(result)
 
         # No netloc
-        result = _fetch_sacredtradition("not-a-url")
+        result = self.scraper.fetch("not-a-url")
         self.assertIsNone(result)
 
-    @patch('urllib.request.urlopen')
-    def test_circuit_breaker_trips_after_failures(self, mock_urlopen):
+    @patch('requests.Session.get')
+    def test_circuit_breaker_trips_after_failures(self, mock_get):
         """After 3+ failures, circuit breaker opens and subsequent calls return None."""
-        url = "https://sacredtradition.am/Calendar/nter.php?NM=0&iM=1103&iL=2&ymd=20251225"
-
         # Simulate 3 consecutive failures
-        mock_urlopen.side_effect = urllib.error.URLError("Connection timeout")
+        mock_get.side_effect = requests.ConnectionError("Connection timeout")
 
         # First 3 calls should fail
         for _ in range(3):
-            result = _fetch_sacredtradition(url)
+            result = self.scraper.fetch(self.url)
             self.assertIsNone(result)
 
         # Circuit breaker should now be open
-        circuit_key = f"circuit_breaker:{_stable_url_key(url)}"
-        self.assertTrue(cache.get(circuit_key))
+        self.assertTrue(cache.get(self.circuit_key))
 
         # Fourth call should return None immediately (circuit open)
-        mock_urlopen.reset_mock()
-        result = _fetch_sacredtradition(url)
+        mock_get.reset_mock()
+        result = self.scraper.fetch(self.url)
         self.assertIsNone(result)
-        # urlopen should NOT have been called (circuit breaker blocked it)
-        mock_urlopen.assert_not_called()
+        # The session should NOT have been used (circuit breaker blocked it)
+        mock_get.assert_not_called()
 
-    @patch('urllib.request.urlopen')
-    def test_circuit_breaker_resets_on_success(self, mock_urlopen):
+    @patch('requests.Session.get')
+    def test_circuit_breaker_resets_on_success(self, mock_get):
         """A successful call resets the circuit breaker."""
-        url = "https://sacredtradition.am/Calendar/nter.php?NM=0&iM=1103&iL=2&ymd=20251225"
-
-        # Use a side_effect function to simulate failures then success
-        call_count = [0]
-        def _side_effect(*args, **kwargs):
-            call_count[0] += 1
-            if call_count[0] <= 6:  # 2 calls × 3 retries each
-                raise urllib.error.URLError("Connection timeout")
-            mock_resp = Mock()
-            mock_resp.status = 200
-            mock_resp.read.return_value = b'<html><div class="dname">Test</div></html>'
-            return mock_resp
+        mock_get.side_effect = requests.ConnectionError("Connection timeout")
+        self.scraper.fetch(self.url)
+        self.scraper.fetch(self.url)
 
-        mock_urlopen.side_effect = _side_effect
-
-        _fetch_sacredtradition(url)
-        _fetch_sacredtradition(url)
-
-        circuit_key = f"circuit_breaker:{_stable_url_key(url)}"
         # After 2 failures (< max), circuit should NOT be open
-        self.assertIsNone(cache.get(circuit_key))
+        self.assertIsNone(cache.get(self.circuit_key))
 
-        # Now the third call should succeed (side_effect function returns success for call_count > 6)
-        mock_html = b'<html><div class="dname">Test</div></html>'
-        mock_response = Mock()
-        mock_response.status = 200
-        mock_response.read.return_value = mock_html
-        mock_urlopen.side_effect = [mock_response]
+        # Now the third call succeeds
+        mock_get.side_effect = None
+        mock_get.return_value = fake_response('<html><div class="dname">Test</div></html>')
 
-        result = _fetch_sacredtradition(url)
+        result = self.scraper.fetch(self.url)
         self.assertIsNotNone(result)
 
-        circuit_key = f"circuit_breaker:{_stable_url_key(url)}"
         # Circuit breaker should be cleared
-        self.assertIsNone(cache.get(circuit_key))
-
-    @patch('urllib.request.urlopen')
-    def test_cache_returns_stale_on_failure(self, mock_urlopen):
-        """When scrape fails, cached stale data is returned as fallback."""
-        url = "https://sacredtradition.am/Calendar/nter.php?NM=0&iM=1103&iL=2&ymd=20251225"
-
-        # First, a successful fetch that caches the result
-        mock_html = b'<html><div class="dname">Cached Feast</div></html>'
-        mock_response = Mock()
-        mock_response.status = 200
-        mock_response.read.return_value = mock_html
-        mock_urlopen.return_value = mock_response
-
-        result1 = _fetch_sacredtradition(url)
-        self.assertIsNotNone(result1)
-        self.assertIn("Cached Feast", result1)
-
-        # Now simulate 3 consecutive failures
-        mock_urlopen.side_effect = urllib.error.URLError("Connection timeout")
+        self.assertIsNone(cache.get(self.circuit_key))
+
+    @patch('requests.Session.get')
+    def test_cache_returns_stale_on_failure(self, mock_get):
+        """When the page can't be fetched again, the stale parsed page is returned."""
+        # First, a successful fetch that caches the parsed page
+        mock_get.return_value = fake_response('<html><div class="dname">Cached Feast</div></html>')
+        page = self.scraper.get_page("20251225", ENGLISH)
+        self.assertEqual(page["feast"], "Cached Feast")
+
+        # A fresh page is served from the cache without fetching
+        mock_get.reset_mock()
+        self.assertEqual(self.scraper.get_page("20251225", ENGLISH)["feast"], "Cached Feast")
+        mock_get.assert_not_called()
+
+        # Age the cached page past its freshness window, then simulate failures
+        cache_key = f"sacredtradition:page:{ENGLISH}:20251225"
+        entry = cache.get(cache_key)
+        entry["fetched_at"] -= SCRAPE_CACHE_TIMEOUT + 1
+        cache.set(cache_key, entry)
+        mock_get.side_effect = requests.ConnectionError("Connection timeout")
 
         for _ in range(3):
-            result = _fetch_sacredtradition(url)
+            page = self.scraper.get_page("20251225", ENGLISH)
             # Should return cached data even on failure
-            self.assertIsNotNone(result)
-            self.assertIn("Cached Feast", result)
+            self.assertIsNotNone(page)
+            self.assertEqual(page["feast"], "Cached Feast")
+        self.assertEqual(mock_get.call_count, 3)
 
-
-    @patch('urllib.request.urlopen')
-    def test_failure_counter_resets_on_success(self, mock_urlopen):
+    @patch('requests.Session.get')
+    def test_failure_counter_resets_on_success(self, mock_get):
         """Failure counter is cleared when a fetch succeeds (before circuit trips)."""
-        url = "https://sacredtradition.am/Calendar/nter.php?NM=0&iM=1103&iL=2&ymd=20251225"
-        circuit_key = f"circuit_breaker:{_stable_url_key(url)}"
-        circuit_failures_key = circuit_key + ":failures"
-
-        mock_html = b'<html><div class="dname">Test Feast</div></html>'
-        mock_success = Mock()
-        mock_success.status = 200
-        mock_success.read.return_value = mock_html
-
-        # Set up: cache some data for stale fallback, prime counter at 2
-        cache.set(f"scrape_result:{_stable_url_key(url)}", '<html><div class="dname">Test Feast</div></html>', 21600)
+        circuit_failures_key = self.circuit_key + ":failures"
         cache.set(circuit_failures_key, 2, 900)  # 2 prior failures
 
         # Success resets the counter (even though circuit isn't open yet)
-        mock_urlopen.return_value = mock_success
-        result = _fetch_sacredtradition(url)
+        mock_get.return_value = fake_response('<html><div class="dname">Test Feast</div></html>')
+        result = self.scraper.fetch(self.url)
         self.assertIsNotNone(result)
         # Counter should be reset by success
         self.assertIsNone(cache.get(circuit_failures_key))
-        self.assertIsNone(cache.get(circuit_key))
+        self.assertIsNone(cache.get(self.circuit_key))
 
         # Now 2 failures: should land at count 2, not 4 (reset works)
-        mock_urlopen.side_effect = urllib.error.URLError("Connection timeout")
+        mock_get.side_effect = requests.ConnectionError("Connection timeout")
         for _ in range(2):
-            _fetch_sacredtradition(url)
+            self.scraper.fetch(self.url)
         self.assertEqual(cache.get(circuit_failures_key), 2)
-        self.assertIsNone(cache.get(circuit_key))  # not tripped yet
+        self.assertIsNone(cache.get(self.circuit_key))  # not tripped yet
@@ -0,0 +1,113 @@
+"""Tests for the offline city gazetteer."""
+import os
+import tempfile
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import SimpleTestCase
+
+from hub.services.gazetteer import Gazetteer, get_gazetteer, normalize_name
+
+COUNTRIES = [("US", "USA", "United States"), ("FR", "FRA", "France"), ("AM", "ARM", "Armenia"), ("CO", "COL", "Colombia")]
+ADMIN1 = [("US.TX", "Texas"), ("US.IL", "Illinois"), ("US.MO", "Missouri"), ("FR.11", "Ile-de-France")]
+PLACES = [
+    ("Paris", "FR", "11", 48.85341, 2.3488, 2138551, ["paris", "lutece"]),
+    ("Paris", "US", "TX", 33.66094, -95.55551, 25171, ["paris"]),
+    ("Springfield", "US", "IL", 39.80172, -89.64371, 116250, ["springfield"]),
+    ("Springfield", "US", "MO", 37.21533, -93.29824, 166810, ["springfield"]),
+    ("Yerevan", "AM", "11", 40.17765, 44.5126, 1093485, ["yerevan", "erevan"]),
+    ("Armenia", "CO", "24", 4.53389, -75.68111, 315328, ["armenia"]),
+]
+
+
+class GazetteerTests(SimpleTestCase):
+    def setUp(self):
+        self.gazetteer = Gazetteer(COUNTRIES, ADMIN1, PLACES)
+
+    def test_normalize_name(self):
+        self.assertEqual(normalize_name("  São  Paulo "), "sao paulo")
+        self.assertEqual(normalize_name("St. Louis"), "saint louis")
+        self.assertEqual(normalize_name("Łódź"), "lodz")
+        self.assertEqual(normalize_name("Ереван"), "")
+
+    def test_names_aliases_and_prefixes(self):
+        self.assertEqual(self.gazetteer.lookup("Yerevan"), (40.17765, 44.5126))
+        # Aliases and prefixes need a qualifier
+        self.assertIsNone(self.gazetteer.lookup("EREVAN"))
+        self.assertIsNone(self.gazetteer.lookup("Yerev"))
+        self.assertEqual(self.gazetteer.lookup("EREVAN, Armenia"), (40.17765, 44.5126))
+        self.assertEqual(self.gazetteer.lookup("Yerev, AM"), (40.17765, 44.5126))
+        self.assertIsNone(self.gazetteer.lookup("Yer, AM"))
+        self.assertIsNone(self.gazetteer.lookup("Hobbiton"))
+
+    def test_country_and_state_qualifiers(self):
+        self.assertEqual(self.gazetteer.lookup("Paris, TX"), (33.66094, -95.55551))
+        self.assertEqual(self.gazetteer.lookup("Paris Texas"), (33.66094, -95.55551))
+        self.assertEqual(self.gazetteer.lookup("Paris, France"), (48.85341, 2.3488))
+        self.assertEqual(self.gazetteer.lookup("Springfield, IL 62701"), (39.80172, -89.64371))
+        self.assertEqual(self.gazetteer.lookup("Springfield, Missouri, USA"), (37.21533, -93.29824))
+        self.assertIsNone(self.gazetteer.lookup("Paris, Illinois"))
+        self.assertIsNone(self.gazetteer.lookup("Paris, Middle Earth"))
+
+    def test_ambiguous_locations_are_left_to_aws(self):
+        # The most populous match of a country wins only when it dominates
+        self.assertIsNone(self.gazetteer.lookup("Springfield"))
+        # Places of the same name in several countries need a qualifier
+        self.assertIsNone(self.gazetteer.lookup("Paris"))
+        # A country on its own is not the city of the same name
+        self.assertIsNone(self.gazetteer.lookup("Armenia"))
+        self.assertEqual(self.gazetteer.lookup("Armenia, Colombia"), (4.53389, -75.68111))
+        self.assertIsNone(self.gazetteer.lookup(""))
+
+    def test_bundled_gazetteer(self):
+        gazetteer = get_gazetteer()
+
+        self.assertGreater(len(gazetteer), 30000)
+        self.assertEqual(gazetteer.lookup("Gyumri, Armenia"), (40.79305, 43.84635))
+        self.assertEqual(gazetteer.lookup("Toronto, ON"), (43.70643, -79.39864))
+        self.assertEqual(gazetteer.lookup("Zurich"), gazetteer.lookup("Zürich"))
+        self.assertIsNone(gazetteer.lookup("Glendale"))
+        self.assertEqual(gazetteer.lookup("Portland"), gazetteer.lookup("Portland, Oregon"))
+
+    def test_armenian_towns_are_not_matched_to_lookalikes(self):
+        gazetteer = get_gazetteer()
+
+        # Aliases or namesakes of Tallinn, Xixiang, Çermik and Armavir (Russia)
+        for town in ("Talin", "Sisian", "Jermuk", "Armavir"):
+            with self.subTest(town=town):
+                self.assertIsNone(gazetteer.lookup(town))
+        self.assertEqual(gazetteer.lookup("Armavir, Armenia"), (40.15553, 44.0388))
+
+    def test_build_command(self):
+        cities = [
+            "616052\tYerevan\tYerevan\tErevan,Ереван,Jerewan\t40.18111\t44.51361\tP\tPPLC\tAM\t\t11\t\t\t\t1093485\t\t\tAsia/Yerevan\t2020-01-01",
+            "616635\tGyumri\tGyumri\tLeninakan,Alexandropol\t40.7942\t43.84528\tP\tPPLA\tAM\t\t07\t\t\t\t121976\t\t\tAsia/Yerevan\t2020-01-01",
+            "1234567\tAni\tAni\t\t40.5075\t43.5725\tP\tPPLQ\tTR\t\t38\t\t\t\t50000\t\t\tEurope/Istanbul\t2020-01-01",
+            "7654321\tDilijan\tDilijan\t\t40.7406\t44.8631\tP\tPPL\tAM\t\t09\t\t\t\t14000\t\t\tAsia/Yerevan\t2020-01-01",
+        ]
+        with tempfile.TemporaryDirectory() as directory:
+            def write(name, lines):
+                path = os.path.join(directory, name)
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write("\n".join(lines) + "\n")
+                return path
+
+            source = write("cities15000.txt", cities)
+            countries = write("countryInfo.txt", [
+                "#ISO\tISO3\tISO-Numeric\tfips\tCountry",
+                "AM\tARM\t051\tAM\tArmenia\tYerevan",
+                "TR\tTUR\t792\tTU\tTurkey\tAnkara",
+            ])
+            admin1 = write("admin1CodesASCII.txt", ["AM.07\tShirak\tShirak\t828262"])
+            output = os.path.join(directory, "gazetteer.tsv.gz")
+
+            with patch("hub.management.commands.build_gazetteer.gazetteer_path", return_value=output):
+                call_command("build_gazetteer", source, "--countries", countries, "--admin1", admin1, stdout=StringIO())
+            gazetteer = Gazetteer.from_file(output)
+
+        self.assertEqual(len(gazetteer), 2)
+        self.assertEqual(gazetteer.lookup("Jerewan, Armenia"), (40.18111, 44.51361))
+        self.assertIsNone(gazetteer.lookup("Ереван"))
+        self.assertEqual(gazetteer.lookup("Leninakan, Shirak"), (40.7942, 43.84528))
+        self.assertIsNone(gazetteer.lookup("Ani"))
@@ -0,0 +1,141 @@
+"""Tests for concurrent batch geocoding and the offline gazetteer tier."""
+import threading
+import time
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, TestCase
+
+from hub.models import GeocodingCache, ParticipantDensityCell, Profile
+from hub.services.aws_geocoding import AWSLocationServiceGeocoder, TokenBucket
+from hub.tasks.geocoding_tasks import batch_geocode_profiles, geocode_profile_location
+from tests.fixtures.test_data import TestDataFactory
+
+# Fictional places, unknown to the offline gazetteer, as geocoded by "AWS"
+COORDINATES = {
+    "hobbiton": (-37.8721, 175.6829),
+    "rivendell": (-41.1333, 175.0333),
+}
+YEREVAN = (40.17765, 44.5126)
+
+
+class TokenBucketTests(SimpleTestCase):
+    def test_concurrent_callers_share_the_rate(self):
+        bucket = TokenBucket(rate=50, capacity=1)
+        start = time.monotonic()
+
+        threads = [threading.Thread(target=bucket.acquire) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # One token up front, then one every 20 ms
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+
+class BatchGeocodeTests(SimpleTestCase):
+    def test_each_remote_location_is_geocoded_once_concurrently(self):
+        geocoder = AWSLocationServiceGeocoder()
+        threads = set()
+
+        def geocode(location):
+            threads.add(threading.current_thread().name)
+            time.sleep(0.05)
+            return COORDINATES.get(location.strip().lower())
+
+        with patch.object(geocoder, 'geocode', side_effect=geocode) as mock_geocode:
+            results = geocoder.batch_geocode(
+                ["Hobbiton", " hobbiton ", "Rivendell", "Mordor", "", "Yerevan, Armenia"], max_workers=3,
+            )
+
+        self.assertEqual(sorted(call.args[0] for call in mock_geocode.call_args_list), ["Hobbiton", "Mordor", "Rivendell"])
+        self.assertGreater(len(threads), 1)
+        self.assertEqual(results, {
+            "Hobbiton": COORDINATES["hobbiton"],
+            " hobbiton ": COORDINATES["hobbiton"],
+            "Rivendell": COORDINATES["rivendell"],
+            "Mordor": None,
+            "": None,
+            "Yerevan, Armenia": YEREVAN,
+        })
+
+    def test_geocode_tries_the_gazetteer_before_aws(self):
+        geocoder = AWSLocationServiceGeocoder()
+
+        with patch.object(geocoder, '_create_client') as mock_client:
+            self.assertEqual(geocoder.geocode("Yerevan"), YEREVAN)
+            with patch('hub.services.aws_geocoding.GAZETTEER_ENABLED', False):
+                mock_client.return_value.search_place_index_for_text.return_value = {'Results': []}
+                self.assertIsNone(geocoder.geocode("Yerevan"))
+
+        mock_client.return_value.search_place_index_for_text.assert_called_once()
+
+
+@patch('hub.models.Profile.geocode_location')
+class BatchGeocodeProfilesTests(TestCase):
+    def setUp(self):
+        self.church = TestDataFactory.create_church(name="Geocoding Church")
+        self.fast = TestDataFactory.create_fast(church=self.church, name="Geocoding Fast")
+
+    def _profiles(self, locations):
+        profiles = []
+        for i, location in enumerate(locations):
+            profile = TestDataFactory.create_profile(
+                user=TestDataFactory.create_user(username=f"geo{i}@example.com"), church=self.church,
+            )
+            Profile.objects.filter(pk=profile.pk).update(location=location)
+            profile.fasts.add(self.fast)
+            profiles.append(profile)
+        return profiles
+
+    def _batch_geocode(self, locations):
+        return {location: COORDINATES.get(location.strip().lower()) for location in locations}
+
+    def test_geocodes_distinct_locations_once_and_writes_in_bulk(self, mock_geocode_location):
+        profiles = self._profiles(["Hobbiton", "hobbiton", "Rivendell", "Mordor", "Bree", "HOBBITON ", "Yerevan"])
+        GeocodingCache.objects.create(location_text="bree", latitude=-41.29, longitude=174.78)
+        GeocodingCache.objects.create(location_text="mordor", latitude=0, longitude=0, error_count=2)
+
+        with patch('hub.tasks.geocoding_tasks.geocoder.batch_geocode', side_effect=self._batch_geocode) as mock_batch:
+            result = batch_geocode_profiles.apply(kwargs={'batch_size': 2}).get()
+
+        geocoded = [location.strip().lower() for call in mock_batch.call_args_list for location in call.args[0]]
+        self.assertEqual(sorted(geocoded), ["hobbiton", "mordor", "rivendell"])
+        self.assertEqual(result['stats']['successful'], 2)
+        self.assertEqual(result['stats']['failed'], 1)
+        self.assertEqual(result['stats']['offline'], 1)
+        self.assertEqual(result['stats']['cached'], 6)
+
+        coordinates = dict(Profile.objects.values_list('pk', 'latitude'))
+        self.assertEqual(
+            [coordinates[p.pk] for p in profiles], [-37.8721, -37.8721, -41.1333, None, -41.29, -37.8721, YEREVAN[0]],
+        )
+        self.assertEqual(GeocodingCache.objects.get(location_text="hobbiton").longitude, 175.6829)
+        self.assertEqual(GeocodingCache.objects.get(location_text="mordor").error_count, 3)
+        # Offline results are not cached
+        self.assertFalse(GeocodingCache.objects.filter(location_text="yerevan").exists())
+        # bulk_update skips the signals, so the density cells are rebuilt
+        self.assertEqual(
+            sum(ParticipantDensityCell.objects.filter(fast=self.fast, zoom=0).values_list('count', flat=True)), 6,
+        )
+
+    def test_locations_that_failed_five_times_are_not_retried(self, mock_geocode_location):
+        self._profiles(["Mordor"])
+        GeocodingCache.objects.create(location_text="mordor", latitude=0, longitude=0, error_count=5)
+
+        with patch('hub.tasks.geocoding_tasks.geocoder.batch_geocode') as mock_batch:
+            batch_geocode_profiles.apply().get()
+
+        mock_batch.assert_not_called()
+        self.assertIsNone(Profile.objects.get().latitude)
+
+    def test_single_profile_resolved_offline(self, mock_geocode_location):
+        profile = self._profiles(["Austin, TX 78701"])[0]
+
+        with patch('hub.tasks.geocoding_tasks.geocoder.geocode') as mock_geocode:
+            result = geocode_profile_location.apply(args=[profile.pk, "Austin, TX 78701"]).get()
+
+        mock_geocode.assert_not_called()
+        self.assertEqual(result['source'], 'offline')
+        profile.refresh_from_db()
+        self.assertEqual((profile.latitude, profile.longitude), (30.26715, -97.74306))
@@ -0,0 +1,285 @@
+"""Tests for batch-mode LLM regeneration of contexts and designations."""
+import json
+from datetime import date, timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from django.db import connection
+from django.db.models.signals import post_save
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from hub.models import Church, Day, Feast, FeastContext, LLMBatch, LLMPrompt, PassageContext, Reading, ReadingContext
+from hub.services.llm_service import AnthropicService, BatchRequest, OpenAIService
+from hub.signals import handle_feast_save
+from hub.tasks.llm_tasks import (
+    determine_feast_designations_batch_task,
+    poll_llm_batch_task,
+    regenerate_feast_contexts_batch_task,
+    regenerate_reading_contexts_batch_task,
+    resume_llm_batch_polling_task,
+)
+
+
+def _answer(request):
+    """Stub batch response: echo the custom_id (feasts get JSON)."""
+    if request.custom_id.startswith("feast-"):
+        return json.dumps({"text": f"text {request.custom_id}", "short_text": f"short {request.custom_id}"})
+    return f"context {request.custom_id}"
+
+
+@override_settings(LLM_BATCH_BACKEND='local', OPENAI_API_KEY='test-key')
+@patch('hub.services.llm_service.OpenAIService._complete', side_effect=_answer)
+class BatchRegenerationTaskTests(TestCase):
+    def setUp(self):
+        self.church = Church.objects.get(pk=Church.get_default_pk())
+        self.day = Day.objects.create(date=date(2025, 3, 2), church=self.church)
+        # Feast creation would otherwise run the designation and icon tasks eagerly
+        post_save.disconnect(handle_feast_save, sender=Feast)
+
+    def tearDown(self):
+        post_save.connect(handle_feast_save, sender=Feast)
+
+    def _day(self, day_date):
+        return Day.objects.create(date=day_date, church=self.church)
+
+    def _reading(self, chapter):
+        return Reading.objects.create(
+            day=self.day, book="Isaiah", start_chapter=chapter, start_verse=1, end_chapter=chapter, end_verse=5,
+        )
+
+    def test_reading_contexts_are_written_in_bulk(self, mock_complete):
+        prompt = LLMPrompt.objects.create(model="gpt-4o-mini", role="Role", prompt="Prompt", active=True)
+        fresh, existing = self._reading(1), self._reading(2)
+        old_context = ReadingContext.objects.create(reading=existing, text="old", prompt=prompt)
+
+        with CaptureQueriesContext(connection) as queries:
+            result = regenerate_reading_contexts_batch_task([fresh.id, existing.id])
+
+        self.assertEqual(result, {"updated": 1, "created": 1})
+        self.assertEqual(mock_complete.call_count, 4)  # 2 readings x (en, hy)
+        writes = [q["sql"] for q in queries.captured_queries if '"hub_readingcontext"' in q["sql"]]
+        self.assertEqual(sum(sql.startswith("UPDATE") for sql in writes), 1)
+        self.assertEqual(sum(sql.startswith("INSERT") for sql in writes), 1)
+
+        old_context.refresh_from_db()
+        self.assertEqual(old_context.text, f"context reading-{existing.id}-en")
+        created = fresh.active_context
+        self.assertEqual(created.text_hy, f"context reading-{fresh.id}-hy")
+        self.assertEqual(created.prompt, prompt)
+        self.assertEqual(PassageContext.objects.count(), 2)
+
+    def test_unforced_reading_batch_skips_complete_contexts(self, mock_complete):
+        prompt = LLMPrompt.objects.create(model="gpt-4o-mini", role="Role", prompt="Prompt", active=True)
+        reading = self._reading(1)
+        context = ReadingContext(reading=reading, text="en", prompt=prompt)
+        context.text_hy = "hy"
+        context.save()
+
+        regenerate_reading_contexts_batch_task([reading.id], force_regeneration=False)
+
+        mock_complete.assert_not_called()
+
+    def test_feast_contexts_skip_fast_days_and_failed_languages(self, mock_complete):
+        LLMPrompt.objects.create(
+            model="gpt-4o-mini", role="Role", prompt="Prompt", active=True, applies_to='feasts',
+        )
+        feast = Feast.objects.create(day=self.day, name="Saint Stephen")
+        fast_day = Feast.objects.create(
+            day=self._day(date(2025, 3, 3)),
+            name="Second day of Great Lent", designation=Feast.Designation.FAST,
+        )
+        mock_complete.side_effect = lambda request: None if request.custom_id.endswith("-hy") else _answer(request)
+
+        regenerate_feast_contexts_batch_task([feast.id, fast_day.id])
+
+        context = FeastContext.objects.get()
+        self.assertEqual(context.feast, feast)
+        self.assertEqual(context.short_text, f"short feast-{feast.id}-en")
+        self.assertFalse(context.short_text_hy)
+        self.assertEqual(mock_complete.call_count, 2)
+
+    def test_designations_use_the_regex_then_one_batch(self, mock_complete):
+        LLMPrompt.objects.create(
+            model="gpt-4o-mini", role="Role", prompt="Prompt", active=True, applies_to='feasts',
+        )
+        martyr = Feast.objects.create(day=self.day, name="Saint Stephen the Protomartyr")
+        lent = Feast.objects.create(day=self._day(date(2025, 3, 20)), name="Nineteenth day of Great Lent")
+        kept = Feast.objects.create(
+            day=self._day(date(2025, 12, 25)), name="Christmas", designation=Feast.Designation.NATIVITY_MOTHER_OF_GOD,
+        )
+        mock_complete.side_effect = lambda request: '"Martyrs"'
+
+        result = determine_feast_designations_batch_task([martyr.id, lent.id, kept.id])
+
+        self.assertEqual(result, {"designated": 2})
+        self.assertEqual(mock_complete.call_count, 1)
+        request = mock_complete.call_args[0][0]
+        self.assertEqual((request.custom_id, request.model), (f"feast-{martyr.id}", "gpt-4o-mini"))
+        for feast, designation in (
+            (martyr, Feast.Designation.MARTYRS),
+            (lent, Feast.Designation.FAST),
+            (kept, Feast.Designation.NATIVITY_MOTHER_OF_GOD),
+        ):
+            feast.refresh_from_db()
+            self.assertEqual(feast.designation, designation)
+
+
+@override_settings(LLM_BATCH_BACKEND='provider', LLM_BATCH_POLL_INTERVAL=0, ANTHROPIC_API_KEY='test-key')
+@patch('hub.tasks.llm_tasks.poll_llm_batch_task.apply_async')
+@patch('hub.services.llm_service.anthropic.Anthropic')
+class ProviderBatchPollingTests(TestCase):
+    def setUp(self):
+        church = Church.objects.get(pk=Church.get_default_pk())
+        self.reading = Reading.objects.create(
+            day=Day.objects.create(date=date(2025, 3, 2), church=church),
+            book="Isaiah", start_chapter=1, start_verse=1, end_chapter=1, end_verse=5,
+        )
+        LLMPrompt.objects.create(model="claude-sonnet-4-5-20250929", role="Role", prompt="Prompt", active=True)
+
+    def _submit(self):
+        with patch.object(AnthropicService, 'submit_batch', return_value="batch_1") as mock_submit:
+            result = regenerate_reading_contexts_batch_task([self.reading.id])
+        self.assertEqual(len(mock_submit.call_args[0][0]), 2)  # (en, hy)
+        return LLMBatch.objects.get(pk=result["batch"])
+
+    def _submit_another(self, provider_batch_id):
+        return LLMBatch.objects.create(
+            kind=LLMBatch.Kind.READING_CONTEXTS, model="claude-sonnet-4-5-20250929",
+            provider_batch_id=provider_batch_id, params={},
+        )
+
+    def test_submission_stores_the_batch_and_schedules_a_poll(self, mock_anthropic, mock_apply_async):
+        batch = self._submit()
+
+        self.assertEqual(
+            (batch.kind, batch.model, batch.provider_batch_id, batch.status),
+            (LLMBatch.Kind.READING_CONTEXTS, "claude-sonnet-4-5-20250929", "batch_1", LLMBatch.Status.PENDING),
+        )
+        self.assertEqual(batch.params["reading_ids"], [self.reading.id])
+        mock_apply_async.assert_called_once_with(args=[batch.pk], countdown=0)
+        self.assertFalse(ReadingContext.objects.exists())
+
+    def test_poll_reschedules_until_the_batch_has_ended(self, mock_anthropic, mock_apply_async):
+        batch = self._submit()
+        responses = {f"reading-{self.reading.id}-en": "context en", f"reading-{self.reading.id}-hy": "context hy"}
+
+        with patch.object(AnthropicService, 'batch_results', side_effect=[None, responses]) as mock_results:
+            self.assertIsNone(poll_llm_batch_task(batch.pk))
+            self.assertEqual(mock_apply_async.call_count, 2)
+            self.assertFalse(ReadingContext.objects.exists())
+
+            result = poll_llm_batch_task(batch.pk)
+            # A late duplicate poll does not write the results again
+            poll_llm_batch_task(batch.pk)
+
+        self.assertEqual(result, {"updated": 0, "created": 1})
+        self.assertEqual(mock_results.call_count, 2)
+        self.assertEqual(mock_apply_async.call_count, 2)
+        self.assertEqual(self.reading.active_context.text_hy, "context hy")
+        batch.refresh_from_db()
+        self.assertEqual(batch.status, LLMBatch.Status.COMPLETED)
+
+    @override_settings(LLM_BATCH_TIMEOUT=0)
+    def test_cancels_a_batch_that_does_not_end_in_time(self, mock_anthropic, mock_apply_async):
+        batch = self._submit()
+
+        with patch.object(AnthropicService, 'batch_results', return_value=None), \
+                patch.object(AnthropicService, 'cancel_batch') as mock_cancel:
+            poll_llm_batch_task(batch.pk)
+
+        mock_cancel.assert_called_once_with("batch_1")
+        self.assertEqual(mock_apply_async.call_count, 1)  # only the submission's
+        batch.refresh_from_db()
+        self.assertEqual(batch.status, LLMBatch.Status.EXPIRED)
+
+    @override_settings(LLM_BATCH_POLL_INTERVAL=30)
+    def test_lost_poll_chains_are_resumed_once(self, mock_anthropic, mock_apply_async):
+        batch = self._submit()
+        recent = self._submit_another("batch_2")
+        LLMBatch.objects.filter(pk=batch.pk).update(last_polled_at=timezone.now() - timedelta(hours=1))
+        LLMBatch.objects.filter(pk=recent.pk).update(last_polled_at=timezone.now())
+
+        with patch('hub.tasks.llm_tasks.poll_llm_batch_task.delay') as mock_delay:
+            self.assertEqual(resume_llm_batch_polling_task(), {"resumed": 1})
+        mock_delay.assert_called_once_with(batch.pk)
+
+        # A poll arriving while another chain polled moments ago stops there
+        with patch.object(AnthropicService, 'batch_results') as mock_results:
+            poll_llm_batch_task(recent.pk)
+        mock_results.assert_not_called()
+
+
+@override_settings(ANTHROPIC_API_KEY='test-key')
+@patch('hub.services.llm_service.anthropic.Anthropic')
+class AnthropicBatchTests(TestCase):
+    REQUESTS = [
+        BatchRequest("a-1", "claude-sonnet-4-5-20250929", "System", "First", 200, 0.1),
+        BatchRequest("a-2", "claude-sonnet-4-5-20250929", "System", "Second", 200, 0.1),
+    ]
+
+    def test_submits_and_collects_results_once_ended(self, mock_anthropic):
+        batches = mock_anthropic.return_value.messages.batches
+        batches.create.return_value = SimpleNamespace(id="batch_1")
+        batches.retrieve.side_effect = [
+            SimpleNamespace(processing_status="in_progress"),
+            SimpleNamespace(processing_status="ended"),
+        ]
+        batches.results.return_value = [
+            SimpleNamespace(custom_id="a-1", result=SimpleNamespace(
+                type="succeeded", message=SimpleNamespace(content=[SimpleNamespace(text=" Martyrs ")]),
+            )),
+            SimpleNamespace(custom_id="a-2", result=SimpleNamespace(type="errored")),
+        ]
+        service = AnthropicService()
+
+        self.assertEqual(service.submit_batch(self.REQUESTS), "batch_1")
+        self.assertIsNone(service.batch_results("batch_1"))
+        self.assertEqual(service.batch_results("batch_1"), {"a-1": "Martyrs"})
+        batches.retrieve.assert_called_with("batch_1")
+        params = batches.create.call_args.kwargs["requests"][0]["params"]
+        self.assertEqual(params["system"][0]["cache_control"], {"type": "ephemeral"})
+        self.assertEqual(params["messages"], [{"role": "user", "content": "First"}])
+
+    def test_failed_submission_returns_none(self, mock_anthropic):
+        mock_anthropic.return_value.messages.batches.create.side_effect = RuntimeError("overloaded")
+
+        self.assertIsNone(AnthropicService().submit_batch(self.REQUESTS))
+
+
+@override_settings(OPENAI_API_KEY='test-key')
+@patch('hub.services.llm_service.OpenAI')
+class OpenAIBatchTests(TestCase):
+    def test_uploads_jsonl_and_reads_the_output_file(self, mock_openai):
+        client = mock_openai.return_value
+        client.files.create.return_value = SimpleNamespace(id="file_in")
+        client.batches.create.return_value = SimpleNamespace(id="batch_1")
+        client.batches.retrieve.side_effect = [
+            SimpleNamespace(status="in_progress", output_file_id=None),
+            SimpleNamespace(status="completed", output_file_id="file_out"),
+        ]
+        client.files.content.return_value = MagicMock(text="\n".join([
+            json.dumps({"custom_id": "o-1", "response": {
+                "status_code": 200, "body": {"choices": [{"message": {"content": "Context "}}]},
+            }}),
+            json.dumps({"custom_id": "o-2", "response": {"status_code": 500, "body": {}}}),
+        ]))
+        requests = [
+            BatchRequest("o-1", "gpt-4o-mini", "System", "First", 1000, 0.35),
+            BatchRequest("o-2", "gpt-4o-mini", "System", "Second", 1000, 0.35),
+        ]
+        service = OpenAIService()
+
+        self.assertEqual(service.submit_batch(requests), "batch_1")
+        self.assertIsNone(service.batch_results("batch_1"))
+        self.assertEqual(service.batch_results("batch_1"), {"o-1": "Context"})
+        _, upload = client.files.create.call_args.kwargs["file"]
+        lines = [json.loads(line) for line in upload.decode().splitlines()]
+        self.assertEqual([line["custom_id"] for line in lines], ["o-1", "o-2"])
+        self.assertEqual(lines[0]["url"], "/v1/chat/completions")
+        # Requests sharing a system prompt share a prompt cache key
+        self.assertEqual(lines[0]["body"]["prompt_cache_key"], lines[1]["body"]["prompt_cache_key"])
+        client.batches.create.assert_called_once_with(
+            input_file_id="file_in", endpoint="/v1/chat/completions", completion_window="24h",
+        )
@@ -6,6 +6,7 @@ import json
 from django.test import TestCase
 
 from hub.models import Church, Day, Feast
+from hub.services.feast_catalog import reset_feast_catalog
 from hub.services.llm_service import _find_all_matching_feasts
 
 
@@ -13,6 +14,9 @@ class FindAllMatchingFeastsTests(TestCase):
     """Unit tests for _find_all_matching_feasts function."""
 
     def setUp(self):
+        # Each test patches in its own feasts.json contents
+        reset_feast_catalog()
+        self.addCleanup(reset_feast_catalog)
         self.church = Church.objects.get(pk=Church.get_default_pk())
         self.test_date = date(2025, 1, 21)
         self.day = Day.objects.create(date=self.test_date, church=self.church)
@@ -0,0 +1,90 @@
+"""Tests for the denormalized Fast.participant_count counter."""
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from hub.models import Fast
+from tests.fixtures.test_data import TestDataFactory
+
+
+class FastParticipantCountTests(TestCase):
+    def setUp(self):
+        self.church = TestDataFactory.create_church(name="Counter Church")
+        self.fast = TestDataFactory.create_fast(church=self.church, name="Counter Fast")
+        self.other_fast = TestDataFactory.create_fast(church=self.church, name="Other Fast")
+        self.profiles = [
+            TestDataFactory.create_profile(
+                user=TestDataFactory.create_user(username=f"counter{i}@example.com"),
+                church=self.church,
+            )
+            for i in range(3)
+        ]
+
+    def _count(self, fast):
+        return Fast.objects.get(pk=fast.pk).participant_count
+
+    def test_join_and_leave_from_profile_side(self):
+        self.profiles[0].fasts.add(self.fast, self.other_fast)
+        self.profiles[1].fasts.add(self.fast)
+        self.assertEqual(self._count(self.fast), 2)
+        self.assertEqual(self._count(self.other_fast), 1)
+
+        self.profiles[0].fasts.remove(self.fast)
+        self.assertEqual(self._count(self.fast), 1)
+        self.assertEqual(self._count(self.other_fast), 1)
+
+    def test_join_and_leave_from_fast_side(self):
+        self.fast.profiles.add(*self.profiles)
+        self.assertEqual(self._count(self.fast), 3)
+
+        self.fast.profiles.remove(self.profiles[0], self.profiles[1])
+        self.assertEqual(self._count(self.fast), 1)
+
+    def test_duplicate_add_and_missing_remove_are_ignored(self):
+        self.profiles[0].fasts.add(self.fast)
+        self.profiles[0].fasts.add(self.fast)
+        self.profiles[1].fasts.remove(self.fast)
+        self.assertEqual(self._count(self.fast), 1)
+
+    def test_clear_from_either_side(self):
+        for profile in self.profiles:
+            profile.fasts.add(self.fast, self.other_fast)
+
+        self.profiles[0].fasts.clear()
+        self.assertEqual(self._count(self.fast), 2)
+        self.assertEqual(self._count(self.other_fast), 2)
+
+        self.fast.profiles.clear()
+        self.assertEqual(self._count(self.fast), 0)
+        self.assertEqual(self._count(self.other_fast), 2)
+
+    def test_profile_deletion_releases_membership(self):
+        self.profiles[0].fasts.add(self.fast)
+        self.profiles[1].fasts.add(self.fast)
+
+        self.profiles[0].user.delete()
+        self.assertEqual(self._count(self.fast), 1)
+
+    def test_saving_stale_instance_does_not_overwrite_counter(self):
+        stale = Fast.objects.get(pk=self.fast.pk)
+        self.profiles[0].fasts.add(self.fast)
+
+        stale.description = "Updated description"
+        stale.save()
+
+        refreshed = Fast.objects.get(pk=self.fast.pk)
+        self.assertEqual(refreshed.participant_count, 1)
+        self.assertEqual(refreshed.description, "Updated description")
+
+    def test_reconcile_command_repairs_drift(self):
+        self.fast.profiles.add(*self.profiles)
+        Fast.objects.filter(pk=self.fast.pk).update(participant_count=42)
+
+        out = StringIO()
+        call_command("reconcile_participant_counts", "--dry-run", stdout=out)
+        self.assertIn("stored 42, actual 3", out.getvalue())
+        self.assertEqual(self._count(self.fast), 42)
+
+        call_command("reconcile_participant_counts", stdout=StringIO())
+        self.assertEqual(self._count(self.fast), 3)
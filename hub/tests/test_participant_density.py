@@ -0,0 +1,151 @@
+"""Tests for the incrementally maintained participant density cells."""
+from importlib import import_module
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.db.migrations.loader import MigrationLoader
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from hub.models import ParticipantDensityCell
+from hub.services.participant_density import DENSITY_ZOOMS, bin_locations, rebuild_density
+from tests.fixtures.test_data import TestDataFactory
+
+YEREVAN = (44.5152, 40.1872)
+GYUMRI = (43.8453, 40.7942)
+BOSTON = (-71.0589, 42.3601)
+
+
+class ParticipantDensityTests(APITestCase):
+    def setUp(self):
+        self.church = TestDataFactory.create_church(name="Density Church")
+        self.fast = TestDataFactory.create_fast(church=self.church, name="Density Fast")
+        self.other_fast = TestDataFactory.create_fast(church=self.church, name="Other Density Fast")
+
+    def _profile(self, location, name):
+        profile = TestDataFactory.create_profile(
+            user=TestDataFactory.create_user(username=f"{name}@example.com"), church=self.church,
+        )
+        profile.longitude, profile.latitude = location
+        profile.save(update_fields=['longitude', 'latitude'])
+        return profile
+
+    def _cells(self, fast=None):
+        return {
+            (cell.zoom, cell.x, cell.y): (cell.count, round(cell.longitude_sum, 6), round(cell.latitude_sum, 6))
+            for cell in ParticipantDensityCell.objects.filter(fast=fast or self.fast)
+        }
+
+    def _rebuilt_cells(self, fast=None):
+        rebuild_density(fast or self.fast)
+        return self._cells(fast)
+
+    def test_joining_and_leaving_from_either_side(self):
+        yerevan = self._profile(YEREVAN, "yerevan")
+        gyumri = self._profile(GYUMRI, "gyumri")
+        boston = self._profile(BOSTON, "boston")
+
+        yerevan.fasts.add(self.fast, self.other_fast)
+        self.fast.profiles.add(gyumri, boston)
+        coarsest = {key: value[0] for key, value in self._cells().items() if key[0] == 0}
+        self.assertEqual(sorted(coarsest.values()), [1, 2])
+        incremental = self._cells()
+        self.assertEqual(incremental, self._rebuilt_cells())
+
+        self.fast.profiles.remove(boston)
+        yerevan.fasts.clear()
+
+        self.assertEqual(sum(count for (zoom, _, _), (count, _, _) in self._cells().items() if zoom == 0), 1)
+        self.assertFalse(ParticipantDensityCell.objects.filter(fast=self.other_fast).exists())
+        self.assertFalse(ParticipantDensityCell.objects.filter(count__lte=0).exists())
+        incremental = self._cells()
+        self.assertEqual(incremental, self._rebuilt_cells())
+
+    def test_geocoding_moves_the_participant(self):
+        profile = TestDataFactory.create_profile(
+            user=TestDataFactory.create_user(username="mover@example.com"), church=self.church,
+        )
+        profile.fasts.add(self.fast)
+        self.assertFalse(ParticipantDensityCell.objects.exists())
+
+        profile.longitude, profile.latitude = YEREVAN
+        profile.save(update_fields=['longitude', 'latitude'])
+        self.assertEqual(len(self._cells()), len(DENSITY_ZOOMS))
+
+        profile.longitude, profile.latitude = BOSTON
+        profile.save(update_fields=['longitude', 'latitude'])
+        incremental = self._cells()
+        self.assertEqual(len(incremental), len(DENSITY_ZOOMS))
+        self.assertEqual(incremental, self._rebuilt_cells())
+
+    def test_deleting_a_profile_releases_its_cells(self):
+        profile = self._profile(YEREVAN, "leaver")
+        profile.fasts.add(self.fast)
+
+        profile.delete()
+
+        self.assertFalse(ParticipantDensityCell.objects.exists())
+
+    def test_binning_matches_the_incremental_cells(self):
+        locations = [YEREVAN, GYUMRI, BOSTON, (0, 0), (None, 1.0)]
+
+        binned = bin_locations(locations)
+
+        for name, location in zip(("a", "b", "c"), locations[:3]):
+            self._profile(location, name).fasts.add(self.fast)
+        expected = {key: value[0] for key, value in self._cells().items()}
+        actual = {
+            (zoom, int(x), int(y)): int(count)
+            for zoom, (cells, counts, _, _) in binned.items()
+            for (x, y), count in zip(cells, counts)
+        }
+        self.assertEqual(actual, expected)
+
+    def test_endpoint_serves_geojson_clusters(self):
+        for name, location in (("a", YEREVAN), ("b", GYUMRI), ("c", BOSTON)):
+            self._profile(location, name).fasts.add(self.fast)
+        self.client.force_authenticate(TestDataFactory.create_user(username="viewer@example.com"))
+        url = reverse('fast-participants-density', args=[self.fast.id])
+
+        world = self.client.get(url, {'zoom': 1})
+        armenia = self.client.get(url, {'zoom': 20, 'bbox': '43,39,47,42'})
+
+        self.assertEqual(world.status_code, status.HTTP_200_OK)
+        self.assertEqual(world.data['type'], 'FeatureCollection')
+        self.assertEqual(world.data['properties']['zoom'], 0)
+        self.assertEqual(sorted(f['properties']['count'] for f in world.data['features']), [1, 2])
+        self.assertEqual(armenia.data['properties']['zoom'], DENSITY_ZOOMS[-1])
+        self.assertEqual(armenia.data['properties']['participants'], 2)
+        self.assertEqual(
+            sorted(tuple(f['geometry']['coordinates']) for f in armenia.data['features']),
+            sorted([GYUMRI, YEREVAN]),
+        )
+        for bbox in ('1,2', 'nan,39,47,42', '43,-inf,47,42', '47,39,43,42', '43,42,47,39'):
+            with self.subTest(bbox=bbox):
+                self.assertEqual(self.client.get(url, {'bbox': bbox}).status_code, status.HTTP_400_BAD_REQUEST)
+        everywhere = self.client.get(url, {'bbox': '-1e300,-1e300,1e300,1e300'})
+        self.assertEqual(everywhere.data['properties']['participants'], 3)
+
+    def test_rebuild_command(self):
+        self._profile(YEREVAN, "bulk").fasts.add(self.fast)
+        ParticipantDensityCell.objects.all().delete()
+
+        call_command('rebuild_participant_density', '--fast', str(self.fast.id), stdout=StringIO())
+
+        self.assertEqual(len(self._cells()), len(DENSITY_ZOOMS))
+
+    def test_migration_bins_existing_participants(self):
+        for name, location in (("a", YEREVAN), ("b", GYUMRI)):
+            self._profile(location, name).fasts.add(self.fast)
+        self._profile(BOSTON, "c").fasts.add(self.other_fast)
+        expected = self._cells(), self._cells(self.other_fast)
+        # Memberships that existed before the cells did
+        ParticipantDensityCell.objects.all().delete()
+
+        migration = ("hub", "0057_participant_density_cell")
+        historical_apps = MigrationLoader(connection).project_state(migration).apps
+        import_module("hub.migrations.0057_participant_density_cell").bin_existing_participants(historical_apps, None)
+
+        self.assertEqual((self._cells(), self._cells(self.other_fast)), expected)
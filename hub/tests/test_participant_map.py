@@ -0,0 +1,153 @@
+"""Tests for the participant map basemap and SVG generation."""
+import json
+import os
+import tempfile
+from unittest.mock import patch
+
+import numpy as np
+from celery.exceptions import Retry
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from hub.models import FastParticipantMap
+from hub.services.basemap import VIEWS, get_basemap, reset_basemap
+from hub.services.participant_map import cluster_locations, locations_hash, render_participant_map_svg
+from hub.tasks.mapping_tasks import generate_participant_map, generate_participant_map_svg
+from tests.fixtures.test_data import TestDataFactory
+
+
+class BasemapTests(SimpleTestCase):
+    def setUp(self):
+        reset_basemap()
+        self.addCleanup(reset_basemap)
+
+    def test_loads_the_bundled_file_once(self):
+        with patch('hub.services.basemap.json.load', wraps=json.load) as load:
+            basemap = get_basemap()
+            self.assertIs(get_basemap(), basemap)
+
+        self.assertEqual(load.call_count, 1)
+        self.assertGreater(len(basemap), 100)
+
+    def test_view_outlines_are_precomputed(self):
+        basemap = get_basemap()
+
+        self.assertTrue(basemap.rings['us'])
+        for view, (min_lon, min_lat, max_lon, max_lat) in VIEWS.items():
+            self.assertTrue(basemap.paths[view].startswith('M'))
+            for ring in basemap.rings[view]:
+                self.assertTrue((ring[:, 0] >= min_lon).all() and (ring[:, 0] <= max_lon).all())
+                self.assertTrue((ring[:, 1] >= min_lat).all() and (ring[:, 1] <= max_lat).all())
+
+    def test_missing_file_falls_back_to_a_rectangle(self):
+        with override_settings(BASE_DIR=tempfile.mkdtemp()):
+            basemap = get_basemap()
+
+        self.assertEqual(len(basemap), 1)
+        self.assertEqual(basemap.paths['us'], '')
+
+
+class ParticipantMapSvgTests(SimpleTestCase):
+    def setUp(self):
+        reset_basemap()
+        self.addCleanup(reset_basemap)
+        fd, self.path = tempfile.mkstemp(suffix='.svg')
+        os.close(fd)
+        self.addCleanup(os.unlink, self.path)
+
+    @patch('urllib.request.urlopen', side_effect=AssertionError("network access"))
+    def test_generates_without_network_access(self, mock_urlopen):
+        locations = [(-74.0, 40.7), (-74.01, 40.71), (-73.99, 40.69), (-118.2, 34.05)]
+
+        generate_participant_map_svg(locations, self.path, dpi=50)
+
+        with open(self.path, encoding='utf-8') as f:
+            self.assertIn('<svg', f.read())
+        mock_urlopen.assert_not_called()
+
+
+class ParticipantMapRendererTests(SimpleTestCase):
+    def test_hash_ignores_order_and_invalid_coordinates(self):
+        locations = [(-74.0, 40.7), (44.5, 40.2)]
+
+        self.assertEqual(locations_hash(locations), locations_hash(locations[::-1] + [(0, 0), (float('nan'), 1.0)]))
+        self.assertNotEqual(locations_hash(locations), locations_hash(locations[:1]))
+
+    def test_hash_changes_with_the_basemap(self):
+        locations = [(-74.0, 40.7), (44.5, 40.2)]
+        reset_basemap()
+        self.addCleanup(reset_basemap)
+        bundled = locations_hash(locations)
+
+        reset_basemap()
+        with override_settings(BASE_DIR=tempfile.mkdtemp()):
+            self.assertNotEqual(locations_hash(locations), bundled)
+
+    def test_cells_with_enough_points_become_clusters(self):
+        points = np.array([(-74.1, 40.7), (-74.2, 40.8), (-74.3, 40.9), (44.5, 40.2)])
+
+        centers, sizes, singles = cluster_locations(points, clustering_distance=0.5, min_cluster_size=3)
+
+        np.testing.assert_allclose(centers, [(-74.2, 40.8)])
+        self.assertEqual(list(sizes), [3])
+        np.testing.assert_array_equal(singles, [(44.5, 40.2)])
+
+    def test_us_only_locations_use_the_us_view(self):
+        us_svg = render_participant_map_svg([(-74.0, 40.7), (-118.2, 34.05)])
+        world_svg = render_participant_map_svg([(-74.0, 40.7), (44.5, 40.2)])
+
+        self.assertIn(get_basemap().paths['us'], us_svg)
+        self.assertIn(get_basemap().paths['world'], world_svg)
+        self.assertEqual(world_svg.count('<circle'), 2)
+
+
+class GenerateParticipantMapTests(TestCase):
+    def setUp(self):
+        church = TestDataFactory.create_church(name="Map Church")
+        self.fast = TestDataFactory.create_fast(church=church, name="Map Fast")
+        self.profiles = []
+        for i, (lon, lat) in enumerate([(-74.0, 40.7), (44.5, 40.2)]):
+            profile = TestDataFactory.create_profile(
+                user=TestDataFactory.create_user(username=f"mapper{i}@example.com"), church=church,
+            )
+            profile.longitude, profile.latitude = lon, lat
+            profile.save()
+            profile.fasts.add(self.fast)
+            self.profiles.append(profile)
+
+    def test_unchanged_locations_keep_the_existing_map(self):
+        first = generate_participant_map.apply(args=[self.fast.id]).get()
+        with patch('hub.services.participant_map.render_participant_map_svg') as render:
+            second = generate_participant_map.apply(args=[self.fast.id]).get()
+
+        render.assert_not_called()
+        self.assertTrue(first['changed'])
+        self.assertFalse(second['changed'])
+        self.assertEqual(second['map_url'], first['map_url'])
+        self.assertEqual(second['participants'], 2)
+
+    def test_moved_participant_rerenders_the_map(self):
+        first = generate_participant_map.apply(args=[self.fast.id]).get()
+        self.profiles[1].latitude = 41.0
+        self.profiles[1].save()
+
+        second = generate_participant_map.apply(args=[self.fast.id]).get()
+
+        self.assertTrue(second['changed'])
+        self.assertNotEqual(second['map_url'], first['map_url'])
+        participant_map = FastParticipantMap.objects.get(fast=self.fast)
+        self.assertEqual(participant_map.locations_hash, locations_hash([(-74.0, 40.7), (44.5, 41.0)]))
+        self.assertIn(b'<svg', participant_map.map_file.read())
+
+    def test_failed_render_is_not_recorded_as_current(self):
+        with patch('hub.services.participant_map.render_participant_map_svg', side_effect=RuntimeError("no basemap")):
+            with self.assertRaises(Retry):
+                generate_participant_map.apply(args=[self.fast.id]).get()
+
+        participant_map = FastParticipantMap.objects.get(fast=self.fast)
+        self.assertEqual(participant_map.locations_hash, "")
+        self.assertFalse(participant_map.map_file)
+
+        result = generate_participant_map.apply(args=[self.fast.id]).get()
+
+        self.assertTrue(result['changed'])
+        self.assertEqual(result['participants'], 2)
@@ -0,0 +1,102 @@
+"""Tests for passage-keyed reuse of LLM reading contexts."""
+from datetime import date
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from hub.models import Church, Day, LLMPrompt, PassageContext, Reading
+from hub.services.passage_context_service import find_passage_context
+from hub.services.prefetch_service import import_readings_for_day
+from hub.tasks import generate_reading_context_task
+
+
+def _generate(reading, prompt, lang):
+    return f"{lang} context for {reading.passage_reference}"
+
+
+@patch('hub.services.llm_service.OpenAIService.generate_context', side_effect=_generate)
+class PassageContextTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.church = Church.objects.get(pk=Church.get_default_pk())
+        self.prompt = LLMPrompt.objects.create(model="gpt-4o-mini", role="Role", prompt="Prompt", active=True)
+
+    def _reading(self, day_date, book="St. Paul's Epistle to the Romans"):
+        day = Day.objects.create(date=day_date, church=self.church)
+        return Reading.objects.create(day=day, book=book, start_chapter=8, start_verse=1, end_chapter=8, end_verse=11)
+
+    def test_same_passage_in_a_later_year_reuses_the_context(self, mock_generate):
+        first = self._reading(date(2025, 3, 2))
+        generate_reading_context_task(first.id)
+        self.assertEqual(mock_generate.call_count, 2)  # en + hy
+        self.assertEqual(PassageContext.objects.count(), 1)
+
+        # Scrapers sometimes return curly quotes; the passage key is normalized
+        later = self._reading(date(2026, 3, 22), book="St. Paul’s Epistle to the Romans")
+        generate_reading_context_task(later.id)
+
+        self.assertEqual(mock_generate.call_count, 2)
+        context = later.active_context
+        self.assertEqual(context.text, first.active_context.text)
+        self.assertEqual(context.text_hy, first.active_context.text_hy)
+        self.assertEqual(context.prompt, self.prompt)
+
+    def test_new_active_prompt_generates_again(self, mock_generate):
+        generate_reading_context_task(self._reading(date(2025, 3, 2)).id)
+        self.prompt.active = False
+        self.prompt.save()
+        LLMPrompt.objects.create(model="gpt-4o-mini", role="Role", prompt="New prompt", active=True)
+
+        generate_reading_context_task(self._reading(date(2026, 3, 22)).id)
+
+        self.assertEqual(mock_generate.call_count, 4)
+        self.assertEqual(PassageContext.objects.count(), 2)
+
+    def test_editing_the_prompt_text_generates_again(self, mock_generate):
+        generate_reading_context_task(self._reading(date(2025, 3, 2)).id)
+        self.prompt.prompt = "Prompt, now with more historical background"
+        self.prompt.save()
+
+        later = self._reading(date(2026, 3, 22))
+        generate_reading_context_task(later.id)
+
+        self.assertEqual(mock_generate.call_count, 4)
+        self.assertEqual(PassageContext.objects.count(), 2)
+        self.assertIsNone(find_passage_context(later, LLMPrompt(
+            pk=self.prompt.pk, model=self.prompt.model, role="Edited role", prompt=self.prompt.prompt,
+        )))
+
+    def test_forced_regeneration_replaces_the_stored_context(self, mock_generate):
+        reading = self._reading(date(2025, 3, 2))
+        generate_reading_context_task(reading.id)
+        mock_generate.side_effect = lambda reading, prompt, lang: f"better {lang}"
+
+        generate_reading_context_task(reading.id, force_regeneration=True)
+
+        entry = PassageContext.objects.get()
+        self.assertEqual((entry.text, entry.text_hy), ("better en", "better hy"))
+
+    def test_stored_context_outlives_pruned_readings(self, mock_generate):
+        reading = self._reading(date(2025, 3, 2))
+        generate_reading_context_task(reading.id)
+        reading.delete()
+
+        self.assertEqual(PassageContext.objects.count(), 1)
+
+    @patch('hub.services.prefetch_service.fetch_all_reading_texts')
+    @patch('hub.services.prefetch_service.prepare_shared_resources', return_value={})
+    @patch('hub.services.prefetch_service.scrape_readings')
+    def test_imported_readings_get_the_stored_context(self, mock_scrape, mock_prepare, mock_fetch, mock_generate):
+        generate_reading_context_task(self._reading(date(2025, 3, 2)).id)
+        mock_generate.reset_mock()
+        mock_scrape.return_value = [{
+            "book": "St. Paul's Epistle to the Romans", "book_en": "St. Paul's Epistle to the Romans",
+            "start_chapter": 8, "start_verse": 1, "end_chapter": 8, "end_verse": 11,
+        }]
+        day = Day.objects.create(date=date(2026, 3, 22), church=self.church)
+
+        new_readings = import_readings_for_day(day, self.church)
+
+        self.assertEqual(new_readings[0].active_context.text, "en context for St. Paul's Epistle to the Romans 8:1-11")
+        mock_generate.assert_not_called()
@@ -1,15 +1,18 @@
 """Tests for patristic quotes feature."""
 import hashlib
-from datetime import datetime
+from datetime import date, datetime
 from unittest.mock import patch
 
 from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework.test import APITestCase
 from rest_framework import status
 
-from hub.models import Church, Fast, PatristicQuote
+from hub.models import Church, Day, Fast, PatristicQuote
+from hub.services.patristic_quote_service import prerender_quotes_of_the_day
 
 
 class PatristicQuoteModelTests(TestCase):
@@ -397,3 +400,59 @@ class PatristicQuoteOfTheDayTests(APITestCase):
             self.assertEqual(response.status_code, status.HTTP_200_OK)
             self.assertEqual(response.data['id'], expected_quote.id)
 
+
+class PatristicQuoteOfTheDaySelectionTests(APITestCase):
+    """Test cases for the cached quote ID lists and nightly pre-rendering."""
+
+    def setUp(self):
+        cache.clear()
+        self.church = Church.objects.create(name='Test Church')
+        self.fast = Fast.objects.create(name='Great Fast', church=self.church)
+        for i in range(5):
+            quote = PatristicQuote.objects.create(text=f'Quote {i}', attribution=f'Saint {i}')
+            quote.fasts.add(self.fast)
+            quote.tags.add('prayer')
+        self.url = reverse('patristic-quote-of-the-day')
+
+    def _get_on(self, day, **params):
+        with patch('hub.views.patristic_quotes.datetime') as mock_datetime:
+            mock_datetime.now.return_value = datetime(day.year, day.month, day.day, 12, 0, 0)
+            return self.client.get(self.url, params)
+
+    def test_new_date_reuses_the_cached_id_list(self):
+        self._get_on(date(2024, 1, 1), fast_id=self.fast.pk)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self._get_on(date(2024, 1, 2), fast_id=self.fast.pk)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        sql = [query['sql'] for query in queries.captured_queries]
+        self.assertFalse(any('COUNT(' in statement or 'OFFSET' in statement for statement in sql))
+        # The day's quote is loaded by primary key rather than by filtering the quotes
+        quote_queries = [statement for statement in sql if 'FROM "hub_patristicquote" ' in statement]
+        self.assertEqual(len(quote_queries), 1)
+        self.assertIn('"hub_patristicquote"."id" = ', quote_queries[0])
+
+    def test_id_list_is_invalidated_when_quotes_change(self):
+        only = PatristicQuote.objects.create(text='Only quote', attribution='Saint Nerses')
+        only.tags.add('humility')
+        self.assertEqual(self._get_on(date(2024, 1, 1), tags='humility').data['id'], only.id)
+
+        newer = PatristicQuote.objects.create(text='Another quote', attribution='Saint Gregory')
+        newer.tags.add('humility')
+        ids = {self._get_on(date(2024, 1, day), tags='humility').data['id'] for day in range(1, 15)}
+
+        self.assertEqual(ids, {only.id, newer.id})
+
+    def test_prerender_renders_fasts_of_the_day_and_requested_filters(self):
+        Day.objects.create(date=date(2024, 3, 1), fast=self.fast, church=self.church)
+        self._get_on(date(2024, 2, 28), tags='Prayer')
+
+        summary = prerender_quotes_of_the_day(date(2024, 3, 1))
+
+        # (no filter, fast, tags) x (en, hy)
+        self.assertEqual(summary['rendered'], 6)
+        with CaptureQueriesContext(connection) as queries:
+            for params in ({}, {'fast_id': self.fast.pk}, {'tags': 'prayer', 'lang': 'hy'}):
+                self.assertEqual(self._get_on(date(2024, 3, 1), **params).status_code, status.HTTP_200_OK)
+        self.assertFalse(any('hub_patristicquote' in query['sql'] for query in queries.captured_queries))
@@ -0,0 +1,87 @@
+"""Tests for the look-ahead prefetch of readings, texts, feasts and contexts."""
+from datetime import date
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+
+from hub.models import Church, Day, Feast, Reading
+from hub.services.prefetch_service import prefetch_horizon
+from hub.tasks import prefetch_upcoming_days_task
+
+
+def _scraped_readings(date_obj, church):
+    return [
+        {"book": "Matthew", "book_en": "Matthew", "book_hy": "Մատթէոս",
+         "start_chapter": date_obj.day, "start_verse": 1, "end_chapter": date_obj.day, "end_verse": 12},
+    ]
+
+
+def _mark_text_fetched(reading, **shared):
+    Reading.objects.filter(pk=reading.pk).update(text="Text", text_fetched_at=timezone.now())
+    return {"en": True, "hy": True}
+
+
+@patch('hub.tasks.generate_feast_context_task.delay')
+@patch('hub.tasks.generate_reading_context_task.delay')
+@patch('hub.services.prefetch_service.fetch_all_reading_texts', side_effect=_mark_text_fetched)
+@patch('hub.services.prefetch_service.prepare_shared_resources', return_value={})
+@patch('hub.utils.scrape_feast', return_value={"name": "Feast", "name_en": "Feast", "name_hy": "Տօն"})
+@patch('hub.services.prefetch_service.scrape_readings', side_effect=_scraped_readings)
+class PrefetchHorizonTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.church = Church.objects.get(pk=Church.get_default_pk())
+        self.start = date(2025, 6, 1)
+
+    def test_prefetches_every_day_of_the_horizon(
+        self, mock_scrape, mock_scrape_feast, mock_prepare, mock_fetch, mock_reading_ctx, mock_feast_ctx,
+    ):
+        results = prefetch_horizon(3, start_date=self.start)
+
+        self.assertEqual(len(results), 3)
+        self.assertEqual(Day.objects.filter(church=self.church).count(), 3)
+        self.assertEqual(Reading.objects.filter(day__church=self.church).count(), 3)
+        self.assertEqual(Feast.objects.filter(day__church=self.church).count(), 3)
+        self.assertFalse(Reading.objects.filter(text_fetched_at__isnull=True).exists())
+        self.assertEqual(mock_reading_ctx.call_count, 3)
+        self.assertEqual(mock_feast_ctx.call_count, 3)
+
+    def test_second_run_does_not_scrape_again(
+        self, mock_scrape, mock_scrape_feast, mock_prepare, mock_fetch, mock_reading_ctx, mock_feast_ctx,
+    ):
+        prefetch_horizon(2, start_date=self.start)
+        mock_scrape.reset_mock()
+        mock_scrape_feast.reset_mock()
+        mock_fetch.reset_mock()
+
+        results = prefetch_horizon(2, start_date=self.start)
+
+        mock_scrape.assert_not_called()
+        mock_scrape_feast.assert_not_called()
+        mock_fetch.assert_not_called()
+        self.assertTrue(all(result["readings_created"] == 0 for result in results))
+
+    def test_failing_day_does_not_stop_the_horizon(
+        self, mock_scrape, mock_scrape_feast, mock_prepare, mock_fetch, mock_reading_ctx, mock_feast_ctx,
+    ):
+        def scrape(date_obj, church):
+            if date_obj == self.start:
+                raise RuntimeError("sacredtradition.am is down")
+            return _scraped_readings(date_obj, church)
+        mock_scrape.side_effect = scrape
+
+        results = prefetch_horizon(2, start_date=self.start)
+
+        self.assertEqual([result.get("error") for result in results], ["sacredtradition.am is down", None])
+        self.assertTrue(Reading.objects.filter(day__date=date(2025, 6, 2)).exists())
+
+    def test_task_reports_a_summary(
+        self, mock_scrape, mock_scrape_feast, mock_prepare, mock_fetch, mock_reading_ctx, mock_feast_ctx,
+    ):
+        summary = prefetch_upcoming_days_task(days=2, workers=1)
+
+        self.assertEqual(summary["days"], 2)
+        self.assertEqual(summary["readings_created"], 2)
+        self.assertEqual(summary["failures"], 0)
@@ -0,0 +1,101 @@
+"""Tests for the incrementally maintained ProfileFastStats row."""
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from events.models import EventType
+from hub.models import Day, ProfileFastStats
+from hub.tasks import rollover_profile_fast_stats_task
+from tests.fixtures.test_data import TestDataFactory
+
+
+class ProfileFastStatsTests(TestCase):
+    def setUp(self):
+        self.today = timezone.localdate(timezone=timezone.utc)
+        self.church = TestDataFactory.create_church(name="Stats Church")
+        self.user = TestDataFactory.create_user(username="stats@example.com")
+        self.profile = TestDataFactory.create_profile(user=self.user, church=self.church)
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+        # Ended yesterday: 3 past days
+        self.past_fast = self._make_fast("Past Fast", range(-3, 0))
+        # Ongoing: 2 past days (yesterday, today) and 2 future days
+        self.current_fast = self._make_fast("Current Fast", range(-1, 3))
+
+    def _make_fast(self, name, offsets):
+        fast = TestDataFactory.create_fast(church=self.church, name=name)
+        for offset in offsets:
+            Day.objects.create(date=self.today + timedelta(days=offset), church=self.church, fast=fast)
+        return fast
+
+    def _stats(self):
+        return ProfileFastStats.objects.get(profile=self.profile)
+
+    def test_endpoint_builds_row_and_reads_it(self):
+        self.profile.fasts.add(self.past_fast, self.current_fast)
+
+        response = self.client.get(reverse('fast-stats'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['total_fasts'], 2)
+        self.assertEqual(response.data['completed_fasts'], 1)
+        self.assertEqual(response.data['total_fast_days'], 5)
+        self.assertEqual(response.data['checklist_uses'], 0)
+        self.assertEqual(sorted(response.data['joined_fasts']), sorted([self.past_fast.id, self.current_fast.id]))
+
+        # The stats row and the joined id list (user and profile are already loaded)
+        with self.assertNumQueries(2):
+            self.client.get(reverse('fast-stats'))
+
+    def test_join_and_leave_update_existing_row(self):
+        ProfileFastStats.for_profile(self.profile)
+
+        self.profile.fasts.add(self.current_fast)
+        self.assertEqual(self._stats().joined_count, 1)
+        self.assertEqual(self._stats().past_fast_days, 2)
+
+        self.profile.fasts.add(self.past_fast)
+        self.assertEqual(self._stats().completed_count, 1)
+
+        self.profile.fasts.remove(self.current_fast)
+        stats = self._stats()
+        self.assertEqual((stats.joined_count, stats.completed_count, stats.past_fast_days), (1, 1, 3))
+
+    def test_fast_side_changes_mark_row_stale(self):
+        ProfileFastStats.for_profile(self.profile)
+
+        self.current_fast.profiles.add(self.profile)
+        self.assertIsNone(self._stats().as_of)
+        self.assertEqual(ProfileFastStats.for_profile(self.profile).joined_count, 1)
+
+        Day.objects.create(date=self.today - timedelta(days=2), church=self.church, fast=self.current_fast)
+        self.assertIsNone(self._stats().as_of)
+        self.assertEqual(ProfileFastStats.for_profile(self.profile).past_fast_days, 3)
+
+    def test_checklist_endpoint_increments_row(self):
+        EventType.get_or_create_default_types()
+        ProfileFastStats.for_profile(self.profile)
+
+        for _ in range(2):
+            response = self.client.post(reverse('events:track-checklist-used'), {}, format='json')
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self._stats().checklist_uses, 2)
+
+    def test_rollover_task_recomputes_rows_for_new_local_date(self):
+        self.profile.fasts.add(self.current_fast)
+        stats = ProfileFastStats.for_profile(self.profile)
+        self.assertEqual(stats.past_fast_days, 2)
+        self.assertEqual(rollover_profile_fast_stats_task(), 0)
+
+        tomorrow = self.today + timedelta(days=1)
+        with patch.object(ProfileFastStats, 'local_today', return_value=tomorrow):
+            self.assertEqual(rollover_profile_fast_stats_task(), 1)
+
+        stats = self._stats()
+        self.assertEqual(stats.as_of, tomorrow)
+        self.assertEqual(stats.past_fast_days, 3)
@@ -1,6 +1,7 @@
 from datetime import date
 from unittest.mock import patch
 
+from django.core.cache import cache
 from django.conf import settings
 from django.test import TestCase
 from django.urls import reverse
@@ -133,6 +134,7 @@ class DailyReadingsAPITests(APITestCase):
     """Tests for the GetDailyReadingsForDate API, including context fields."""
 
     def setUp(self):
+        cache.clear()
         self.church = Church.objects.get(pk=Church.get_default_pk())
         self.day = TestDataFactory.create_day(date=date.today(), church=self.church)
         self.reading = Reading.objects.create(
@@ -198,7 +200,7 @@ class FeedbackEndpointTests(APITestCase):
         self.context.refresh_from_db()
         self.assertEqual(self.reading.active_context.thumbs_up, 1)
 
-    @patch("hub.views.readings.generate_reading_context_task.delay")
+    @patch("hub.tasks.generate_reading_context_task.delay")
     def test_feedback_endpoint_down_triggers_regeneration(self, mock_delay):
         settings.READING_CONTEXT_REGENERATION_THRESHOLD = 2
         # Start with one down vote
@@ -217,6 +219,7 @@ class ReadingTranslationTests(APITestCase):
     """Tests for reading translation handling when scraping readings."""
 
     def setUp(self):
+        cache.clear()
         self.church = Church.objects.get(pk=Church.get_default_pk())
         self.prompt = LLMPrompt.objects.create(
             model="gpt-4.1-mini",
@@ -225,8 +228,8 @@ class ReadingTranslationTests(APITestCase):
             active=True
         )
 
-    @patch("hub.views.readings.scrape_readings")
-    @patch("hub.views.readings.generate_reading_context_task.delay")
+    @patch("hub.services.prefetch_service.scrape_readings")
+    @patch("hub.tasks.generate_reading_context_task.delay")
     def test_readings_with_translations_are_saved_correctly(self, mock_task, mock_scrape):
         """Test that readings with Armenian translations are saved correctly using i18n field."""
         # Mock scraped readings with translations
@@ -0,0 +1,66 @@
+"""Tests for the daily readings response cache."""
+from datetime import date
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from hub.models import Church, Day, Reading, ReadingContext
+
+
+@patch('hub.tasks.generate_reading_context_task.delay')
+class DailyReadingsCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.url = reverse('daily-readings')
+        self.church = Church.objects.get(pk=Church.get_default_pk())
+
+    def _create_day(self, day_date, count):
+        day = Day.objects.create(date=day_date, church=self.church)
+        for verse in range(1, count + 1):
+            reading = Reading.objects.create(
+                day=day, book="John", start_chapter=verse, start_verse=1, end_chapter=verse, end_verse=10
+            )
+            ReadingContext.objects.create(reading=reading, text=f"Context {verse}", text_hy=f"Hy {verse}")
+        return day
+
+    def _cold_query_count(self, day_date):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, {'date': day_date.isoformat()})
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def test_cold_path_query_count_does_not_grow_with_readings(self, mock_delay):
+        self._create_day(date(2025, 5, 1), 1)
+        self._create_day(date(2025, 5, 2), 4)
+
+        self.assertEqual(self._cold_query_count(date(2025, 5, 1)), self._cold_query_count(date(2025, 5, 2)))
+        mock_delay.assert_not_called()
+
+    def test_cached_response_is_served_until_a_reading_changes(self, mock_delay):
+        day = self._create_day(date(2025, 5, 3), 2)
+        first = self.client.get(self.url, {'date': '2025-05-03'})
+        self.assertEqual([r['context'] for r in first.data['readings']], ["Context 1", "Context 2"])
+
+        with patch('hub.views.readings.GetDailyReadingsForDate.get_formatted_readings') as mock_build:
+            cached = self.client.get(self.url, {'date': '2025-05-03'})
+        mock_build.assert_not_called()
+        self.assertEqual(cached.data['readings'], first.data['readings'])
+
+        reading = day.readings.order_by('pk').first()
+        ReadingContext.objects.create(reading=reading, text="New context", text_hy="Hy new")
+        changed = self.client.get(self.url, {'date': '2025-05-03'})
+        self.assertEqual(changed.data['readings'][0]['context'], "New context")
+
+    def test_cache_is_per_language(self, mock_delay):
+        self._create_day(date(2025, 5, 4), 1)
+
+        english = self.client.get(self.url, {'date': '2025-05-04', 'lang': 'en'})
+        armenian = self.client.get(self.url, {'date': '2025-05-04', 'lang': 'hy'})
+        self.assertEqual(english.data['readings'][0]['context'], "Context 1")
+        self.assertEqual(armenian.data['readings'][0]['context'], "Hy 1")
@@ -0,0 +1,62 @@
+"""Tests for the sacredtradition.am client against a local fixture server."""
+from datetime import date
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from hub.models import Church
+from hub.services.sacredtradition_service import (
+    ARMENIAN,
+    ARMENIAN_TEXT,
+    ENGLISH,
+    SacredTraditionClient,
+    _stable_url_key,
+)
+from hub.utils import scrape_armenian_reading_texts, scrape_feast, scrape_readings
+from tests.fixtures.sacredtradition import FixtureServer
+
+ENGLISH_PAGE = '<html><div class="dname">Nativity of Jesus Christ</div><b>Isaiah 7.10-16</b><b>Titus 2.11-15</b></html>'
+ARMENIAN_PAGE = '<html><div class="dname">Քրիստոսի Ծնունդ</div><b>Եսայի 7.10-16</b><b>Տիտոս 2.11-15</b></html>'
+TEXT_PAGE = '<html><!--body--><b>Եսայի 7.10-16</b> 10 Եւ յաւել<center><hr><!--/body--></html>'
+
+
+class SacredTraditionClientTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.church = Church.objects.get(pk=Church.get_default_pk())
+        self.test_date = date(2025, 1, 6)
+
+    def test_scrapes_each_page_once_over_http(self):
+        with FixtureServer({ENGLISH: ENGLISH_PAGE, ARMENIAN: ARMENIAN_PAGE, ARMENIAN_TEXT: TEXT_PAGE}) as server, \
+                override_settings(SACREDTRADITION_BASE_URL=server.url):
+            readings = scrape_readings(self.test_date, self.church)
+            feast = scrape_feast(self.test_date, self.church)
+            texts = scrape_armenian_reading_texts(self.test_date, self.church)
+            # Everything is now cached
+            scrape_readings(self.test_date, self.church)
+
+        self.assertEqual([r["book_hy"] for r in readings], ["Եսայի", "Տիտոս"])
+        self.assertEqual(feast["name_hy"], "Քրիստոսի Ծնունդ")
+        self.assertEqual(texts[0]["text_hy"], "[10] Եւ յաւել")
+        self.assertEqual(sorted(path.split("iL=")[1][0] for path, _, _ in server.requests), ["0", "2", "3"])
+        self.assertTrue(all(headers["User-Agent"].startswith("Mozilla/5.0") for _, headers, _ in server.requests))
+
+    def test_reuses_the_connection(self):
+        with FixtureServer({ENGLISH: ENGLISH_PAGE}) as server:
+            scraper = SacredTraditionClient(server.url, retries=0)
+            for day in ("20250106", "20250107", "20250108"):
+                self.assertIsNotNone(scraper.fetch(scraper.page_url(day, ENGLISH)))
+
+        self.assertEqual(len(server.requests), 3)
+        self.assertEqual(len({port for _, _, port in server.requests}), 1)
+
+    def test_retries_server_errors_then_counts_a_failure(self):
+        with FixtureServer({ENGLISH: ENGLISH_PAGE}) as server:
+            server.status = 503
+            scraper = SacredTraditionClient(server.url, retries=1)
+            url = scraper.page_url("20250106", ENGLISH)
+            self.assertIsNone(scraper.get_page("20250106", ENGLISH))
+
+        self.assertEqual(len(server.requests), 2)
+        self.assertIsNone(cache.get(f"sacredtradition:page:{ENGLISH}:20250106"))
+        self.assertEqual(cache.get(f"circuit_breaker:{_stable_url_key(url)}:failures"), 1)
@@ -1,13 +1,16 @@
 """Tests for the scrape_feast utility function."""
 from datetime import date
-from unittest.mock import Mock, patch
-import urllib.error
+from unittest.mock import patch
+
+import requests
 
 from django.core.cache import cache
 from django.test import TestCase
 
 from hub.models import Church
-from hub.utils import scrape_feast
+from hub.services.sacredtradition_service import ARMENIAN, ENGLISH, get_client
+from hub.utils import scrape_feast, scrape_readings
+from tests.fixtures.sacredtradition import fake_response, page_language, pages_by_language
 
 
 class ScrapeFeastTests(TestCase):
@@ -18,8 +21,8 @@ class ScrapeFeastTests(TestCase):
         self.church = Church.objects.get(pk=Church.get_default_pk())
         self.test_date = date(2025, 12, 25)
 
-    @patch('urllib.request.urlopen')
-    def test_scrape_feast_with_both_translations(self, mock_urlopen):
+    @patch('requests.Session.get')
+    def test_scrape_feast_with_both_translations(self, mock_get):
         """Test scraping feast with both English and Armenian translations."""
         # Mock HTML responses for both languages
         english_html = '''
@@ -33,18 +36,7 @@ class ScrapeFeastTests(TestCase):
         </html>
         '''
 
-        # Create mock response objects
-        def create_mock_response(html_content):
-            mock_response = Mock()
-            mock_response.status = 200
-            mock_response.read.return_value = html_content.encode('utf-8')
-            return mock_response
-
-        # Mock urlopen to return different responses for English and Armenian
-        mock_urlopen.side_effect = [
-            create_mock_response(english_html),  # English (iL=2)
-            create_mock_response(armenian_html),  # Armenian (iL=3)
-        ]
+        mock_get.side_effect = pages_by_language({ENGLISH: english_html, ARMENIAN: armenian_html})
 
         result = scrape_feast(self.test_date, self.church)
 
@@ -55,10 +47,10 @@ class ScrapeFeastTests(TestCase):
         self.assertEqual(result["name_hy"], "Քրիստոսի Ծնունդ")
 
         # Verify both URLs were called (English and Armenian)
-        self.assertEqual(mock_urlopen.call_count, 2)
+        self.assertEqual(mock_get.call_count, 2)
 
-    @patch('urllib.request.urlopen')
-    def test_scrape_feast_english_only(self, mock_urlopen):
+    @patch('requests.Session.get')
+    def test_scrape_feast_english_only(self, mock_get):
         """Test scraping feast with only English translation."""
         english_html = '''
         <html>
@@ -71,16 +63,7 @@ class ScrapeFeastTests(TestCase):
         </html>
         '''
 
-        def create_mock_response(html_content):
-            mock_response = Mock()
-            mock_response.status = 200
-            mock_response.read.return_value = html_content.encode('utf-8')
-            return mock_response
-
-        mock_urlopen.side_effect = [
-            create_mock_response(english_html),
-            create_mock_response(armenian_html),
-        ]
+        mock_get.side_effect = pages_by_language({ENGLISH: english_html, ARMENIAN: armenian_html})
 
         result = scrape_feast(self.test_date, self.church)
 
@@ -90,8 +73,8 @@ class ScrapeFeastTests(TestCase):
         self.assertEqual(result["name_en"], "Easter Sunday")
         self.assertIsNone(result["name_hy"])
 
-    @patch('urllib.request.urlopen')
-    def test_scrape_feast_armenian_only(self, mock_urlopen):
+    @patch('requests.Session.get')
+    def test_scrape_feast_armenian_only(self, mock_get):
         """Test scraping feast with only Armenian translation."""
         english_html = '''
         <html>
@@ -104,16 +87,7 @@ class ScrapeFeastTests(TestCase):
         </html>
         '''
 
-        def create_mock_response(html_content):
-            mock_response = Mock()
-            mock_response.status = 200
-            mock_response.read.return_value = html_content.encode('utf-8')
-            return mock_response
-
-        mock_urlopen.side_effect = [
-            create_mock_response(english_html),
-            create_mock_response(armenian_html),
-        ]
+        mock_get.side_effect = pages_by_language({ENGLISH: english_html, ARMENIAN: armenian_html})
 
         result = scrape_feast(self.test_date, self.church)
 
@@ -123,8 +97,8 @@ class ScrapeFeastTests(TestCase):
         self.assertIsNone(result["name_en"])
         self.assertEqual(result["name_hy"], "Զատիկ")
 
-    @patch('urllib.request.urlopen')
-    def test_scrape_feast_no_feast_found(self, mock_urlopen):
+    @patch('requests.Session.get')
+    def test_scrape_feast_no_feast_found(self, mock_get):
         """Test scraping when no feast exists for the date."""
         no_feast_html = '''
         <html>
@@ -134,24 +108,15 @@ class ScrapeFeastTests(TestCase):
         </html>
         '''
 
-        def create_mock_response(html_content):
-            mock_response = Mock()
-            mock_response.status = 200
-            mock_response.read.return_value = html_content.encode('utf-8')
-            return mock_response
-
-        mock_urlopen.side_effect = [
-            create_mock_response(no_feast_html),
-            create_mock_response(no_feast_html),
-        ]
+        mock_get.side_effect = pages_by_language({ENGLISH: no_feast_html, ARMENIAN: no_feast_html})
 
         result = scrape_feast(self.test_date, self.church)
 
         # Verify None is returned when no feast found
         self.assertIsNone(result)
 
-    @patch('urllib.request.urlopen')
-    def test_scrape_feast_with_nested_tags(self, mock_urlopen):
+    @patch('requests.Session.get')
+    def test_scrape_feast_with_nested_tags(self, mock_get):
         """Test scraping feast with nested HTML tags in dname."""
         english_html = '''
         <html>
@@ -164,16 +129,7 @@ class ScrapeFeastTests(TestCase):
         </html>
         '''
 
-        def create_mock_response(html_content):
-            mock_response = Mock()
-            mock_response.status = 200
-            mock_response.read.return_value = html_content.encode('utf-8')
-            return mock_response
-
-        mock_urlopen.side_effect = [
-            create_mock_response(english_html),
-            create_mock_response(armenian_html),
-        ]
+        mock_get.side_effect = pages_by_language({ENGLISH: english_html, ARMENIAN: armenian_html})
 
         result = scrape_feast(self.test_date, self.church)
 
@@ -182,22 +138,20 @@ class ScrapeFeastTests(TestCase):
         self.assertEqual(result["name_en"], "St. John the Baptist")
         self.assertEqual(result["name_hy"], "Սբ. Հովհաննես Մկրտիչ")
 
-    @patch('urllib.request.urlopen')
-    def test_scrape_feast_url_error(self, mock_urlopen):
+    @patch('requests.Session.get')
+    def test_scrape_feast_url_error(self, mock_get):
         """Test handling of URL errors."""
-        mock_urlopen.side_effect = urllib.error.URLError("Connection failed")
+        mock_get.side_effect = requests.ConnectionError("Connection failed")
 
         result = scrape_feast(self.test_date, self.church)
 
         # Verify None is returned on URL error
         self.assertIsNone(result)
 
-    @patch('urllib.request.urlopen')
-    def test_scrape_feast_http_error(self, mock_urlopen):
+    @patch('requests.Session.get')
+    def test_scrape_feast_http_error(self, mock_get):
         """Test handling of HTTP error status codes."""
-        mock_response = Mock()
-        mock_response.status = 404
-        mock_urlopen.return_value = mock_response
+        mock_get.return_value = fake_response("", 404)
 
         result = scrape_feast(self.test_date, self.church)
 
@@ -216,8 +170,8 @@ class ScrapeFeastTests(TestCase):
         # Verify None is returned for unsupported church
         self.assertIsNone(result)
 
-    @patch('urllib.request.urlopen')
-    def test_scrape_feast_empty_dname(self, mock_urlopen):
+    @patch('requests.Session.get')
+    def test_scrape_feast_empty_dname(self, mock_get):
         """Test handling of empty feast name."""
         english_html = '''
         <html>
@@ -230,75 +184,55 @@ class ScrapeFeastTests(TestCase):
         </html>
         '''
 
-        def create_mock_response(html_content):
-            mock_response = Mock()
-            mock_response.status = 200
-            mock_response.read.return_value = html_content.encode('utf-8')
-            return mock_response
-
-        mock_urlopen.side_effect = [
-            create_mock_response(english_html),
-            create_mock_response(armenian_html),
-        ]
+        mock_get.side_effect = pages_by_language({ENGLISH: english_html, ARMENIAN: armenian_html})
 
         result = scrape_feast(self.test_date, self.church)
 
         # Verify None is returned when feast name is empty
         self.assertIsNone(result)
 
-    @patch('urllib.request.urlopen')
-    def test_scrape_feast_date_format(self, mock_urlopen):
+    @patch('requests.Session.get')
+    def test_scrape_feast_date_format(self, mock_get):
         """Test that date is formatted correctly in URL."""
         english_html = '<html><div class="dname">Test Feast</div></html>'
 
-        def create_mock_response(html_content):
-            mock_response = Mock()
-            mock_response.status = 200
-            mock_response.read.return_value = html_content.encode('utf-8')
-            return mock_response
-
-        mock_urlopen.side_effect = [
-            create_mock_response(english_html),
-            create_mock_response(english_html),
-        ]
+        mock_get.side_effect = pages_by_language({ENGLISH: english_html, ARMENIAN: english_html})
 
         test_date = date(2025, 1, 5)
         scrape_feast(test_date, self.church)
 
-        # Verify the date format in URL
-        calls = mock_urlopen.call_args_list
-        # Check first call (English)
-        request_obj = calls[0][0][0]
-        self.assertIn('ymd=20250105', request_obj.full_url)
-        self.assertIn('iL=2', request_obj.full_url)  # English
-        
-        # Check second call (Armenian)
-        request_obj = calls[1][0][0]
-        self.assertIn('ymd=20250105', request_obj.full_url)
-        self.assertIn('iL=3', request_obj.full_url)  # Armenian
-
-    @patch('urllib.request.urlopen')
-    def test_scrape_feast_user_agent_header(self, mock_urlopen):
+        # Verify the date format in URL (languages are fetched concurrently, in any order)
+        urls = sorted((call[0][0] for call in mock_get.call_args_list), key=page_language)
+        self.assertEqual(len(urls), 2)
+        self.assertIn('ymd=20250105', urls[0])
+        self.assertIn('iL=2', urls[0])  # English
+        self.assertIn('ymd=20250105', urls[1])
+        self.assertIn('iL=3', urls[1])  # Armenian
+
+    @patch('requests.Session.get')
+    def test_scrape_feast_user_agent_header(self, mock_get):
         """Test that User-Agent header is included in request."""
         english_html = '<html><div class="dname">Test Feast</div></html>'
 
-        def create_mock_response(html_content):
-            mock_response = Mock()
-            mock_response.status = 200
-            mock_response.read.return_value = html_content.encode('utf-8')
-            return mock_response
+        mock_get.side_effect = pages_by_language({ENGLISH: english_html, ARMENIAN: english_html})
+
+        scrape_feast(self.test_date, self.church)
+
+        # Verify User-Agent header is set on the session the requests go through
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertTrue(get_client().session.headers['User-Agent'].startswith('Mozilla/5.0'))
 
-        mock_urlopen.side_effect = [
-            create_mock_response(english_html),
-            create_mock_response(english_html),
-        ]
+    @patch('requests.Session.get')
+    def test_scrape_feast_reuses_parsed_pages(self, mock_get):
+        """Readings and feast of a date share the cached parsed pages."""
+        html = '<html><div class="dname">Test Feast</div><b>Matthew 5.1-12</b></html>'
+        mock_get.side_effect = pages_by_language({ENGLISH: html, ARMENIAN: html})
 
         scrape_feast(self.test_date, self.church)
+        readings = scrape_readings(self.test_date, self.church)
+        result = scrape_feast(self.test_date, self.church)
 
-        # Verify User-Agent header is present in the request
-        calls = mock_urlopen.call_args_list
-        for call in calls:
-            request_obj = call[0][0]
-            self.assertIn('User-agent', request_obj.headers)
-            self.assertTrue(request_obj.headers['User-agent'].startswith('Mozilla/5.0'))
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(result["name_en"], "Test Feast")
+        self.assertEqual(readings[0]["start_chapter"], 5)
 
@@ -0,0 +1,105 @@
+"""Tests for the shared full-text search documents (SQLite fallback)."""
+from datetime import date
+from importlib import import_module
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.db.migrations.loader import MigrationLoader
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from hub.models import Church, Day, Devotional, SearchDocument
+from hub.services.search_service import search
+from learning_resources.models import Article, Recipe, Video
+from prayers.models import Prayer
+
+
+class SearchServiceTests(APITestCase):
+    def setUp(self):
+        self.church = Church.objects.get(pk=Church.get_default_pk())
+
+    def test_every_word_must_match_as_a_prefix(self):
+        soup = Recipe.objects.create(
+            title="Lentil Soup", time_required="1 hour", serves="4",
+            ingredients="Red lentils, onion", directions="Simmer gently",
+        )
+        Recipe.objects.create(
+            title="Lentil Salad", time_required="20 minutes", serves="2",
+            ingredients="Green lentils, parsley", directions="Toss",
+        )
+
+        self.assertEqual(list(search(Recipe.objects.all(), "lent simmer")), [soup])
+        self.assertEqual(search(Recipe.objects.all(), "lentil").count(), 2)
+        # Only word prefixes match, as with PostgreSQL's prefix tsquery
+        self.assertFalse(search(Recipe.objects.all(), "entil").exists())
+        self.assertFalse(search(Recipe.objects.all(), "mmer").exists())
+
+    def test_armenian_translations_are_searchable(self):
+        prayer = Prayer(title="Morning Prayer", text="Glory to God", church=self.church)
+        prayer.title_hy = "Առավոտյան աղոթք"
+        prayer.save()
+
+        self.assertEqual(list(search(Prayer.objects.all(), "աղոթք")), [prayer])
+        self.assertEqual(list(search(Prayer.objects.all(), "առավ")), [prayer])
+        self.assertFalse(search(Prayer.objects.all(), "ղոթք").exists())
+
+    def test_video_changes_reach_its_devotionals(self):
+        video = Video.objects.create(title="Daily Reading", description="Routine", category="devotional")
+        devotional = Devotional.objects.create(
+            day=Day.objects.create(date=date(2026, 1, 1), church=self.church),
+            description="Reflection", video=video, order=1,
+        )
+
+        video.title = "Almsgiving"
+        video.save()
+
+        self.assertEqual(list(search(Devotional.objects.all(), "almsgiving")), [devotional])
+
+    def test_deleting_removes_the_document(self):
+        article = Article.objects.create(title="On Fasting", body="Body")
+        self.assertEqual(SearchDocument.objects.count(), 1)
+
+        article.delete()
+
+        self.assertFalse(SearchDocument.objects.exists())
+
+    def test_rebuild_command_indexes_bulk_created_objects(self):
+        Article.objects.bulk_create([Article(title="Bulk Article", body="Imported")])
+        self.assertFalse(search(Article.objects.all(), "imported").exists())
+
+        call_command("rebuild_search_index", "--model", "learning_resources.Article", stdout=StringIO())
+
+        self.assertEqual(search(Article.objects.all(), "imported").count(), 1)
+
+    def test_recipe_endpoint_searches_ingredients(self):
+        Recipe.objects.create(
+            title="Harvest Stew", time_required="1 hour", serves="4",
+            ingredients="Garbanzo beans", directions="Simmer",
+        )
+
+        response = self.client.get(reverse('recipe-list'), {'search': 'garbanzo'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([item['title'] for item in response.data['results']], ["Harvest Stew"])
+
+    def test_migration_indexes_existing_objects(self):
+        video = Video.objects.create(title="Vespers", description="Evening", category="devotional")
+        devotional = Devotional.objects.create(
+            day=Day.objects.create(date=date(2026, 1, 2), church=self.church),
+            description="Reflection", video=video, order=1,
+        )
+        prayer = Prayer(title="Night Prayer", text="Keep us", church=self.church)
+        prayer.title_hy = "Գիշերային աղոթք"
+        prayer.save()
+        # Rows that existed before the documents did
+        SearchDocument.objects.all().delete()
+
+        migration = ("hub", "0055_search_document")
+        historical_apps = MigrationLoader(connection).project_state(migration).apps
+        import_module("hub.migrations.0055_search_document").index_existing_objects(historical_apps, None)
+
+        self.assertEqual(list(search(Devotional.objects.all(), "vespers")), [devotional])
+        self.assertEqual(list(search(Video.objects.all(), "evening")), [video])
+        self.assertEqual(list(search(Prayer.objects.all(), "գիշերային")), [prayer])
@@ -0,0 +1,124 @@
+"""Tests for background thumbnail generation (hub.services.thumbnail_service)."""
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from hub.constants import DAYS_TO_CACHE_THUMBNAIL
+from hub.models import Fast
+from hub.serializers import FastSerializer
+from hub.services.thumbnail_service import generate_thumbnail, stale_thumbnail_ids
+from hub.tasks import refresh_stale_thumbnails_task
+from tests.fixtures.test_data import TestDataFactory
+
+GIF = (
+    b'\x47\x49\x46\x38\x39\x61\x01\x00\x01\x00\x00\x00\x00\x21\xf9\x04'
+    b'\x01\x0a\x00\x01\x00\x2c\x00\x00\x00\x00\x01\x00\x01\x00\x00\x02'
+    b'\x02\x4c\x01\x00\x3b'
+)
+
+
+def _image(name='fast.gif'):
+    return SimpleUploadedFile(name=name, content=GIF, content_type='image/gif')
+
+
+@patch('hub.tasks.generate_thumbnail_task.delay')
+class ThumbnailServiceTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.church = TestDataFactory.create_church(name="Thumbnail Church")
+        self.fast = TestDataFactory.create_fast(church=self.church, name="Thumbnail Fast")
+
+    def test_image_upload_queues_one_job_after_commit(self, mock_delay):
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            article = TestDataFactory.create_article(title="Thumbnail Article")
+            article.image = _image()
+            # A second save while the job is pending does not queue a duplicate
+            article.save()
+        mock_delay.assert_not_called()
+
+        for callback in callbacks:
+            callback()
+        mock_delay.assert_called_once_with('learning_resources.Article', article.pk)
+
+    def test_serializer_never_generates_thumbnails(self, mock_delay):
+        self.fast.image = _image()
+        self.fast.save()
+
+        with patch('imagekit.cachefiles.ImageCacheFile.generate') as mock_generate:
+            data = FastSerializer(self.fast).data
+        self.assertIsNone(data['thumbnail'])
+        mock_generate.assert_not_called()
+
+        self.fast.cached_thumbnail_url = 'https://example.com/thumb.jpg'
+        self.fast.cached_thumbnail_updated = timezone.now()
+        self.assertEqual(FastSerializer(self.fast).data['thumbnail'], 'https://example.com/thumb.jpg')
+
+    def test_generate_thumbnail_caches_url_and_releases_pending_slot(self, mock_delay):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.fast.image = _image()
+            self.fast.save()
+
+        with patch('imagekit.cachefiles.ImageCacheFile.generate'), \
+                patch('imagekit.cachefiles.ImageCacheFile.url', 'https://example.com/generated.jpg'):
+            url = generate_thumbnail('hub.Fast', self.fast.pk)
+
+        self.assertEqual(url, 'https://example.com/generated.jpg')
+        self.fast.refresh_from_db()
+        self.assertEqual(self.fast.cached_thumbnail_url, url)
+        self.assertEqual(stale_thumbnail_ids('hub.Fast'), [])
+
+        # The slot was released, so a new image queues a new job
+        mock_delay.reset_mock()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.fast.image = _image('other.gif')
+            self.fast.save()
+        mock_delay.assert_called_once_with('hub.Fast', self.fast.pk)
+
+    def test_removing_the_image_clears_the_cached_url(self, mock_delay):
+        Fast.objects.filter(pk=self.fast.pk).update(
+            image='fast_images/old.gif',
+            cached_thumbnail_url='https://example.com/old.jpg',
+            cached_thumbnail_updated=timezone.now(),
+        )
+        self.fast.refresh_from_db()
+        self.fast.image = None
+        self.fast.save()
+
+        self.fast.refresh_from_db()
+        self.assertIsNone(self.fast.cached_thumbnail_url)
+        mock_delay.assert_not_called()
+
+    def test_refresh_task_queues_only_stale_thumbnails(self, mock_delay):
+        fresh = TestDataFactory.create_fast(church=self.church, name="Fresh Fast")
+        Fast.objects.filter(pk=fresh.pk).update(
+            image='fast_images/fresh.gif',
+            cached_thumbnail_url='https://example.com/fresh.jpg',
+            cached_thumbnail_updated=timezone.now(),
+        )
+        Fast.objects.filter(pk=self.fast.pk).update(
+            image='fast_images/stale.gif',
+            cached_thumbnail_url='https://example.com/stale.jpg',
+            cached_thumbnail_updated=timezone.now() - timedelta(days=DAYS_TO_CACHE_THUMBNAIL + 1),
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            queued = refresh_stale_thumbnails_task()
+
+        self.assertEqual(queued, 1)
+        mock_delay.assert_called_once_with('hub.Fast', self.fast.pk)
+
+    def test_management_command_warms_stale_thumbnails(self, mock_delay):
+        Fast.objects.filter(pk=self.fast.pk).update(image='fast_images/cold.gif')
+
+        out = StringIO()
+        with patch('hub.services.thumbnail_service.generate_thumbnail', return_value='url') as mock_generate:
+            call_command('update_thumbnail_cache', '--model', 'fast', '--workers', '1', stdout=out)
+
+        mock_generate.assert_called_once_with('hub.Fast', self.fast.pk)
+        self.assertIn('1 updated, 0 failed', out.getvalue())
@@ -9,6 +9,7 @@ from .views.fast import (
     JoinFastView, 
     FastByDateView,
     FastByFeastDateView,
+    FastCalendarView,
     FastOnDate, 
     FastOnDateWithoutUser, 
     FastParticipantsView,
@@ -16,6 +17,7 @@ from .views.fast import (
     LeaveFastView, 
     FastStatsView,
     FastParticipantsMapView,
+    FastParticipantsDensityView,
 )
 from .views.day import FastDaysListView, UserDaysView
 from .views.devotionals import DevotionalByDateView, DevotionalsByFastView, DevotionalDetailView, DevotionalListView
@@ -65,10 +67,12 @@ urlpatterns = [
     path('fasts/leave/', LeaveFastView.as_view(), name='leave-fast'),
     path('fasts/by-date/', FastByDateView.as_view(), name='fast-by-date'),
     path('fasts/by-feast-date/', FastByFeastDateView.as_view(), name='fast-by-feast-date'),
+    path('fasts/calendar/', FastCalendarView.as_view(), name='fast-calendar'),
     path('fasts/<int:fast_id>/participants/', FastParticipantsView.as_view(), name='fast-participants'),
     path('fasts/<int:fast_id>/participants/paginated/', PaginatedFastParticipantsView.as_view(), name='fast-participants-paginated'),
     path('fasts/stats/', FastStatsView.as_view(), name='fast-stats'),
     path('fasts/<int:fast_id>/participants/map/', FastParticipantsMapView.as_view(), name='fast-participants-map'),
+    path('fasts/<int:fast_id>/participants/density/', FastParticipantsDensityView.as_view(), name='fast-participants-density'),
 
 
     # TODO: Remove these legacy endpoints after frontend is updated
@@ -1,12 +1,7 @@
 """Utilities for supporting backend."""
 from datetime import datetime, timedelta
 import logging
-import re
-import urllib
-import urllib.parse
-import hashlib
-
-import sentry_sdk
+import time
 
 from django.core.mail import EmailMultiAlternatives, send_mail
 from django.conf import settings
@@ -18,98 +13,14 @@ from django.core.cache import cache
 import bahk.settings as settings
 from hub.models import Church, Day, Fast, Feast, Profile
 from hub.serializers import FastSerializer
+from hub.services.sacredtradition_service import ARMENIAN, ARMENIAN_TEXT, ENGLISH, get_client
 
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-PARSER_REGEX = r"^([\w\u0531-\u058A\u0400-\u04FF1-4\'\.\s]+) ([0-9]+\.)?([0-9]+)\-?([0-9]+\.)?([0-9]+)?$"
 SUPPORTED_CHURCHES = Church.objects.filter(name=settings.DEFAULT_CHURCH_NAME)
 
-# Circuit breaker state: key = "circuit_breaker:{url_hash}" (store in cache)
-# After 3 consecutive failures in 15 min, block further attempts for 15 min
-SCRAPE_CIRCUIT_BREAKER_CACHE_TIMEOUT = 900  # 15 min
-SCRAPE_CIRCUIT_BREAKER_MAX_FAILURES = 3
-SCRAPE_CACHE_TIMEOUT = 21600  # 6 hours
-
-
-def _stable_url_key(url: str) -> str:
-    """Stable hash for URL cache keys (unlike Python's salted hash())."""
-    return hashlib.md5(url.encode()).hexdigest()[:16]
-
-
-def _fetch_sacredtradition(url: str, timeout: int = 10) -> str | None:
-    """Fetch a sacredtradition.am page with retries, circuit breaker, and caching.
-    
-    Args:
-        url: Full URL to fetch
-        timeout: Request timeout in seconds
-        
-    Returns:
-        Decoded HTML string, or None on failure (with cached data if avail)
-    """
-    # URL validation
-    parsed = urllib.parse.urlparse(url)
-    if not parsed.netloc or parsed.netloc != "sacredtradition.am":
-        logger.error("Invalid URL for sacredtradition.am scrape: %s", url)
-        return None
-    
-    url_key = _stable_url_key(url)
-    
-    # Check circuit breaker
-    circuit_key = f"circuit_breaker:{url_key}"
-    circuit_open = cache.get(circuit_key)
-    if circuit_open:
-        logger.warning("Circuit breaker open for %s, skipping scrape", url)
-        # Try cache fallback anyway
-        cached = cache.get(f"scrape_result:{url_key}")
-        if cached:
-            return cached
-        return None
-    
-    # Get any cached result to use as stale fallback
-    cache_key = f"scrape_result:{url_key}"
-    cached = cache.get(cache_key)
-    
-    # Fetch with retries
-    last_error = None
-    for attempt in range(3):
-        try:
-            req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0 (compatible; BahkBot/1.0)'})
-            response = urllib.request.urlopen(req, timeout=timeout)
-            if response.status == 200:
-                data = response.read().decode("utf-8")
-                # Cache successful result
-                cache.set(cache_key, data, SCRAPE_CACHE_TIMEOUT)
-                # Reset circuit breaker + failure counter on success
-                cache.delete(circuit_key)
-                cache.delete(circuit_key + ":failures")
-                return data
-            else:
-                last_error = f"HTTP {response.status}"
-                logger.error("sacredtradition.am returned status %d for %s", response.status, url)
-        except (urllib.error.URLError, urllib.error.HTTPError, OSError, TimeoutError) as e:
-            last_error = str(e)
-            logger.warning("Attempt %d/3 failed for %s: %s", attempt + 1, url, last_error)
-            if attempt < 2:
-                import time
-                time.sleep(1 * (attempt + 1))  # 1s, 2s backoff
-    
-    # All attempts failed — trip circuit breaker
-    failure_count = cache.get(circuit_key + ":failures", 0)
-    failure_count += 1
-    cache.set(circuit_key + ":failures", failure_count, SCRAPE_CIRCUIT_BREAKER_CACHE_TIMEOUT)
-    if failure_count >= SCRAPE_CIRCUIT_BREAKER_MAX_FAILURES:
-        cache.set(circuit_key, True, SCRAPE_CIRCUIT_BREAKER_CACHE_TIMEOUT)
-        sentry_sdk.capture_exception(Exception(f"Circuit breaker tripped for {url}"))
-    
-    # Log the final failure
-    if last_error:
-        sentry_sdk.capture_exception(Exception(f"Scrape failed for {url} after 3 attempts: {last_error}"))
-    
-    # Return stale cached data as fallback (or None if never cached)
-    return cached
-
 
 def get_user_profile_safe(user):
     """
@@ -149,103 +60,110 @@ def invalidate_fast_participants_cache(fast_id):
         cache.clear()
 
 
-def invalidate_fast_stats_cache(user):
+def get_joined_fast_ids(user):
     """
-    Invalidate the cached fast stats for a specific user.
-    
-    This should be called when:
-    - User joins or leaves a fast
-    - User completes a checklist action
-    - Any action that affects user's fast statistics
-    
-    Args:
-        user: User object whose stats cache should be invalidated
+    Return the set of fast IDs the user has joined, cached per user.
+
+    This is the per-user overlay merged into shared fast payloads (see
+    SharedFastPayloadMixin); the cache is invalidated by the Profile.fasts signal.
     """
-    # Use the same cache key format as FastStatsView
-    cache_key = f"bahk:fast_stats:{user.id}"
-    cache.delete(cache_key)
+    if not user.is_authenticated:
+        return set()
+    cache_key = f"bahk:joined_fast_ids:{user.id}"
+    fast_ids = cache.get(cache_key)
+    if fast_ids is None:
+        fast_ids = set(
+            Profile.fasts.through.objects.filter(profile__user_id=user.id).values_list('fast_id', flat=True)
+        )
+        cache.set(cache_key, fast_ids, 60 * 60 * 24)
+    return fast_ids
 
 
-def scrape_readings(date_obj, church, date_format="%Y%m%d", max_num_readings=40):
-    """Scrapes readings from sacredtradition.am in both English and Armenian."""
-    if church not in SUPPORTED_CHURCHES:
-        logging.error("Web-scraping for readings only set up for the following churches: %r. %s not supported.",
-                      SUPPORTED_CHURCHES, church)
-        return []
+def invalidate_joined_fast_ids_cache(user_ids):
+    """Invalidate the cached joined fast IDs for the given users."""
+    cache.delete_many([f"bahk:joined_fast_ids:{user_id}" for user_id in set(user_ids)])
+
 
-    date_str = date_obj.strftime(date_format)
+def get_content_versions(scopes):
+    """
+    Return ``{scope: version}`` for the given content scopes.
 
-    def scrape_language(language_code):
-        """Helper function to scrape readings for a specific language.
+    A content version is a ``time.time_ns()`` value stored without expiry and
+    bumped (see bump_content_version) whenever the scoped content changes. Cache
+    keys and HTTP validators include it, so they change with the content without
+    the content itself being read. Missing versions are created on the fly.
+    """
+    keys = {scope: f"bahk:content_version:{scope}" for scope in scopes}
+    found = cache.get_many(list(keys.values()))
+    now = time.time_ns()
+    versions, missing = {}, {}
+    for scope, key in keys.items():
+        if key in found:
+            versions[scope] = found[key]
+        else:
+            versions[scope] = missing[key] = now
+    if missing:
+        cache.set_many(missing, None)
+    return versions
 
-        Args:
-            language_code: 2 for English, 3 for Armenian
-        """
-        url = f"https://sacredtradition.am/Calendar/nter.php?NM=0&iM=1103&iL={language_code}&ymd={date_str}"
-        html_content = _fetch_sacredtradition(url)
-        if html_content is None:
-            return []
 
-        book_start = html_content.find("<b>")
+def get_content_version(scope):
+    """Return the current version of a single content scope."""
+    return get_content_versions([scope])[scope]
 
-        readings = []
-        ct = 0
-        while book_start != -1:
-            # prevent infinite loop
-            if ct > max_num_readings:
-                logging.error("Reached maximum number of readings: %d. Breaking to avoid infinite loop.", max_num_readings)
-                break
-            ct += 1
 
-            i1 = book_start + len("<b>")
-            i2 = html_content.find("</b>")
-            reading_str = html_content[i1:i2]
+def bump_content_version(*scopes):
+    """Give the given content scopes a new version, invalidating everything keyed on them."""
+    if scopes:
+        now = time.time_ns()
+        cache.set_many({f"bahk:content_version:{scope}": now for scope in scopes}, None)
 
-            # advance to next section of web text early to prevent infinite loop in case of failure later on
-            html_content = html_content[i2 + 1:]
-            book_start = html_content.find("<b>")
 
-            if "," in reading_str:
-                # TODO: if comma found, second reading appended to first, as for Daniel 3.1-23 and Azariah 1-68
-                # for now, omit second reading
-                reading_str = reading_str.split(",")[0]
+def get_fast_calendar_version(church_id):
+    """
+    Return the cache version for a church's fast calendar.
 
-            groups = re.search(PARSER_REGEX, reading_str)
+    Calendar months are cached per church, month and language; the version is
+    part of every key, so bumping it invalidates all of them at once.
+    """
+    return get_content_version(f"fast_calendar:{church_id}")
 
-            # skip reading if does not match parser regex
-            if groups is None:
-                logging.error("Could not parse reading %s at %s with regex %s", reading_str, url, PARSER_REGEX)
-                continue
 
-            try:
-                # parse groups
-                book = groups.group(1)
-                # remove decimal if start chapter provided; otherwise, part of book with 1 chapter
-                start_chapter = groups.group(2).strip(".") if groups.group(2) is not None else 1
-                start_verse = groups.group(3)
-                # remove decimal if end chapter provided; otherwise, must be the same as the start chapter
-                end_chapter = groups.group(4).strip(".") if groups.group(4) is not None else start_chapter
-                end_verse = groups.group(5) if groups.group(5) is not None else start_verse
-
-                readings.append({
-                    "book": book,
-                    "start_chapter": int(start_chapter),
-                    "start_verse": int(start_verse),
-                    "end_chapter": int(end_chapter),
-                    "end_verse": int(end_verse)
-                })
-            except Exception:
-                logging.error(
-                    "Could not parse reading with text %s with regex %s from %s. Skipping.",
-                    reading_str, PARSER_REGEX, url, exc_info=True
-                )
-                continue
+def invalidate_fast_calendar_cache(church_ids):
+    """
+    Invalidate the cached fast calendar for the given churches.
+
+    This should be called whenever a fast or one of its days changes.
+
+    Args:
+        church_ids: Iterable of church IDs (``None`` entries are ignored)
+    """
+    bump_content_version(*{
+        f"fast_calendar:{church_id}" for church_id in church_ids if church_id is not None
+    })
+
 
-        return readings
+def invalidate_fast_detail_cache(fast_ids):
+    """
+    Invalidate the cached detail payload (and its HTTP validator) of the given fasts.
+
+    Args:
+        fast_ids: Iterable of fast IDs (``None`` entries are ignored)
+    """
+    bump_content_version(*{f"fast:{fast_id}" for fast_id in fast_ids if fast_id is not None})
+
+
+def scrape_readings(date_obj, church, date_format="%Y%m%d", max_num_readings=40):
+    """Scrapes readings from sacredtradition.am in both English and Armenian."""
+    if church not in SUPPORTED_CHURCHES:
+        logging.error("Web-scraping for readings only set up for the following churches: %r. %s not supported.",
+                      SUPPORTED_CHURCHES, church)
+        return []
 
-    # Scrape English (iL=2) and Armenian (iL=3)
-    english_readings = scrape_language(2)
-    armenian_readings = scrape_language(3)
+    # Scrape English (iL=2) and Armenian (iL=3) concurrently
+    pages = get_client().get_pages(date_obj.strftime(date_format), (ENGLISH, ARMENIAN))
+    english_readings = (pages[ENGLISH] or {}).get("readings", [])[:max_num_readings]
+    armenian_readings = (pages[ARMENIAN] or {}).get("readings", [])
 
     # Combine the readings with both translations
     # Assuming the readings are in the same order, we match them by index
@@ -308,105 +226,8 @@ def scrape_armenian_reading_texts(date_obj, church, date_format="%Y%m%d"):
         )
         return []
 
-    date_str = date_obj.strftime(date_format)
-    url = f"https://sacredtradition.am/Calendar/nter.php?NM=0&iM=1103&iL=0&ymd={date_str}"
-
-    try:
-        response = urllib.request.urlopen(url)
-    except urllib.error.URLError:
-        logging.error("Invalid url %s", url)
-        return []
-
-    if response.status != 200:
-        logging.error(
-            "Could not access Armenian readings from url %s. Failed with status %r",
-            url, response.status,
-        )
-        return []
-
-    data = response.read()
-    html_content = data.decode("utf-8")
-
-    # Extract body content between comment markers
-    body_start = html_content.find("<!--body-->")
-    body_end = html_content.find("<!--/body-->")
-    if body_start == -1 or body_end == -1:
-        logging.error("Could not find body markers in Armenian readings page %s", url)
-        return []
-
-    body = html_content[body_start:body_end]
-
-    results = []
-    pos = 0
-    while True:
-        # Find next <b> tag (reading reference)
-        b_open = body.find("<b>", pos)
-        if b_open == -1:
-            break
-        b_close = body.find("</b>", b_open)
-        if b_close == -1:
-            break
-
-        reference = body[b_open + 3:b_close]
-
-        # Parse the reference to get chapter/verse numbers
-        # Handle comma-separated references the same way as scrape_readings
-        if "," in reference:
-            reference = reference.split(",")[0]
-
-        groups = re.search(PARSER_REGEX, reference)
-        if groups is None:
-            logging.error(
-                "Could not parse Armenian reading reference '%s' from %s",
-                reference, url,
-            )
-            pos = b_close + 1
-            continue
-
-        try:
-            start_chapter = int(groups.group(2).strip(".")) if groups.group(2) else 1
-            start_verse = int(groups.group(3))
-            end_chapter = int(groups.group(4).strip(".")) if groups.group(4) else start_chapter
-            end_verse = int(groups.group(5)) if groups.group(5) else start_verse
-        except Exception:
-            logging.error(
-                "Could not parse chapter/verse from Armenian reference '%s' at %s",
-                reference, url, exc_info=True,
-            )
-            pos = b_close + 1
-            continue
-
-        # Extract text after </b> until the next <center><hr or <!--/body-->
-        text_start = b_close + len("</b>")
-        # Find the next separator: <center><hr
-        next_sep = body.find("<center><hr", text_start)
-        if next_sep == -1:
-            # Fall back to end of body
-            next_sep = len(body)
-
-        raw_text = body[text_start:next_sep]
-
-        # Clean up the text: remove <br> tags and extra whitespace
-        clean_text = re.sub(r"<br\s*/?>", " ", raw_text)
-        clean_text = re.sub(r"<[^>]+>", "", clean_text)  # Remove any remaining HTML tags
-        clean_text = re.sub(r"\s+", " ", clean_text).strip()
-
-        # Wrap verse/chapter numbers in brackets: "16 Լdelays..." -> "[16] Լdelays..."
-        # Matches standalone digits followed by Armenian characters (U+0531-U+058A)
-        clean_text = re.sub(r"(^|\s)(\d+)(?=\s[\u0531-\u058A])", r"\1[\2]", clean_text)
-
-        if clean_text:
-            results.append({
-                "start_chapter": start_chapter,
-                "start_verse": start_verse,
-                "end_chapter": end_chapter,
-                "end_verse": end_verse,
-                "text_hy": clean_text,
-            })
-
-        pos = next_sep + 1
-
-    return results
+    page = get_client().get_page(date_obj.strftime(date_format), ARMENIAN_TEXT)
+    return page["texts"] if page else []
 
 
 def send_fast_reminders():
@@ -483,52 +304,11 @@ def scrape_feast(date_obj, church, date_format="%Y%m%d"):
                       SUPPORTED_CHURCHES, church)
         return None
 
-    date_str = date_obj.strftime(date_format)
-    
-    def scrape_feast_for_language(language_code):
-        """Helper function to scrape feast for a specific language.
-        
-        Args:
-            language_code: 2 for English, 3 for Armenian
-        """
-        url = f"https://sacredtradition.am/Calendar/nter.php?NM=0&iM=1103&iL={language_code}&ymd={date_str}"
-        html_content = _fetch_sacredtradition(url)
-        if html_content is None:
-            return None
-
-        # Look for elements with class="dname" or class=dname (with or without quotes)
-        # Match various HTML tags with class dname
-        import re
-        
-        # First, find the opening tag with class=dname (handles both quoted and unquoted)
-        opening_pattern = r'<([a-z]+)[^>]*class=["\']?dname["\']?[^>]*>'
-        opening_match = re.search(opening_pattern, html_content, re.DOTALL | re.IGNORECASE)
-        
-        if not opening_match:
-            return None
-        
-        tag_name = opening_match.group(1)
-        start_pos = opening_match.end()
-        
-        # Find the corresponding closing tag
-        closing_pattern = f'</{tag_name}>'
-        closing_match = re.search(closing_pattern, html_content[start_pos:], re.IGNORECASE)
-        
-        if not closing_match:
-            return None
-        
-        # Extract content between opening and closing tags
-        feast_html = html_content[start_pos:start_pos + closing_match.start()]
-        
-        # Remove any nested HTML tags
-        feast_name = re.sub(r'<[^>]+>', '', feast_html).strip()
-        
-        return feast_name if feast_name else None
-    
-    # Scrape both English and Armenian
-    name_en = scrape_feast_for_language(2)  # English
-    name_hy = scrape_feast_for_language(3)  # Armenian
-    
+    # Scrape both English and Armenian concurrently (pages shared with scrape_readings)
+    pages = get_client().get_pages(date_obj.strftime(date_format), (ENGLISH, ARMENIAN))
+    name_en = (pages[ENGLISH] or {}).get("feast")
+    name_hy = (pages[ARMENIAN] or {}).get("feast")
+
     # If no feast found in either language, return None
     if not name_en and not name_hy:
         return None
@@ -1,15 +1,17 @@
 from rest_framework import generics, permissions
 from ..serializers import ChurchSerializer
 from ..models import Church
+from .mixins import ConditionalGetMixin
 
 
-class ChurchListView(generics.ListAPIView):
+class ChurchListView(ConditionalGetMixin, generics.ListAPIView):
     """
     API view to retrieve all churches.
 
     This view allows an authenticated user to retrieve all churches.
 
     Inherits:
+        - ConditionalGetMixin: Answers If-None-Match/If-Modified-Since with 304 until a church changes.
         - ListAPIView: A view that provides GET functionality to retrieve a list of model instances.
 
     Permissions:
@@ -23,6 +25,7 @@ class ChurchListView(generics.ListAPIView):
     """
     serializer_class = ChurchSerializer
     permission_classes = [permissions.AllowAny]
+    conditional_scopes = ('churches',)
 
     def get_queryset(self):
         return Church.objects.all()
@@ -1,8 +1,6 @@
 """Views for accessing and editing daily devotionals."""
 import datetime
 import logging
-from django.conf import settings
-from django.db.models import Q
 from django.utils import timezone
 from rest_framework import generics, permissions
 from rest_framework.exceptions import ValidationError
@@ -10,9 +8,10 @@ from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 from django.utils.translation import activate, get_language_from_request
 
-from .mixins import ChurchContextMixin, TimezoneMixin
+from .mixins import ChurchContextMixin, ConditionalGetMixin, TimezoneMixin
 from hub.models import Devotional, Fast
 from hub.serializers import DevotionalSerializer
+from hub.services.search_service import search
 
 
 class LargeResultsSetPagination(PageNumberPagination):
@@ -21,13 +20,16 @@ class LargeResultsSetPagination(PageNumberPagination):
     max_page_size = 100
 
 
-class DevotionalByDateView(ChurchContextMixin, TimezoneMixin, generics.RetrieveAPIView):
+class DevotionalByDateView(ConditionalGetMixin, ChurchContextMixin, TimezoneMixin, generics.RetrieveAPIView):
     """
     API endpoint that provides details of a single devotional.
 
     If no devotional exists for the given date, returns HTTP 200 with a null body.
     Not every day has a devotional, so this is an expected, non-error response.
 
+    Supports conditional GET; the ETag changes when a devotional or video is saved
+    or the requester's local date rolls over.
+
     Permissions:
         - GET: Any user can view devotional
         - POST/PUT/PATCH/DELETE: Not supported
@@ -35,6 +37,7 @@ class DevotionalByDateView(ChurchContextMixin, TimezoneMixin, generics.RetrieveA
     serializer_class = DevotionalSerializer
     permission_classes = [permissions.AllowAny]
     queryset = Devotional.objects.all()
+    conditional_scopes = ('devotionals',)
 
     def get_object(self):
         church = self.get_church()
@@ -146,40 +149,6 @@ class DevotionalListView(ChurchContextMixin, TimezoneMixin, generics.ListAPIView
     }
     ALLOWED_ORDERING = {"day__date", "-day__date"}
 
-    def _build_search_query(self, search_term, lang):
-        """
-        Build search query across devotional/video title/description fields with
-        translation fallback support.
-        """
-        fields = [
-            "description",
-            "video__title",
-            "video__description",
-        ]
-
-        modeltrans_languages = getattr(settings, "MODELTRANS_AVAILABLE_LANGUAGES", [])
-
-        # Search requested language translations when available.
-        if lang in modeltrans_languages and lang != "en":
-            fields.extend([
-                f"description_{lang}",
-                f"video__title_{lang}",
-                f"video__description_{lang}",
-            ])
-
-        # Always include English fallback translation fields.
-        if "en" in modeltrans_languages:
-            fields.extend([
-                "description_en",
-                "video__title_en",
-                "video__description_en",
-            ])
-
-        query = Q()
-        for field in fields:
-            query |= Q(**{f"{field}__icontains": search_term})
-        return query
-
     def _get_ordering(self):
         ordering = self.request.query_params.get("ordering")
         if not ordering:
@@ -219,11 +188,13 @@ class DevotionalListView(ChurchContextMixin, TimezoneMixin, generics.ListAPIView
 
         search_term = self.request.query_params.get("search")
         if search_term:
-            qs = qs.filter(self._build_search_query(search_term, lang))
+            qs = search(qs, search_term)
 
         ordering = self._get_ordering()
         if ordering:
             qs = qs.order_by(ordering, "order")
+        elif search_term:
+            qs = qs.order_by("-search_rank", "day__date", "order")
 
         return qs
 
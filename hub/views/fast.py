@@ -1,14 +1,17 @@
 from rest_framework import generics, permissions
 from ..constants import NUMBER_PARTICIPANTS_TO_SHOW_WEB
-from ..models import Fast, Church, Profile, Day, FastParticipantMap
-from ..serializers import FastSerializer, JoinFastSerializer, ParticipantSerializer, FastStatsSerializer, FastParticipantMapSerializer
-from .mixins import ChurchContextMixin, TimezoneMixin
+from ..models import Fast, Church, ProfileFastStats, Day, FastParticipantMap
+from ..serializers import (
+    FastSerializer, FastCalendarSerializer, JoinFastSerializer, ParticipantSerializer,
+    FastStatsSerializer, FastParticipantMapSerializer,
+)
+from .mixins import ChurchContextMixin, ConditionalGetMixin, SharedFastPayloadMixin, TimezoneMixin
 from django.utils import timezone
 from rest_framework.exceptions import ValidationError
 import datetime
 from rest_framework import views, response, status
 import logging
-import pytz
+import math
 from django.utils.decorators import method_decorator
 from django.views.decorators.cache import cache_page
 from django.views.decorators.vary import vary_on_headers
@@ -16,20 +19,44 @@ from django.conf import settings
 from django.core.cache import cache
 from django.utils.encoding import force_str
 from django.shortcuts import get_object_or_404
-from django.db.models import Q, Count, Min, Max, Sum, Prefetch, Exists, OuterRef, Subquery
+from django.db.models import Count, Sum, Exists, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 from rest_framework.pagination import LimitOffsetPagination
-from ..utils import invalidate_fast_participants_cache, invalidate_fast_stats_cache
+from ..services.participant_density import density_geojson, nearest_zoom
+from ..utils import (
+    get_content_version, get_fast_calendar_version, get_joined_fast_ids, invalidate_fast_participants_cache,
+)
 from functools import wraps
 from hub.tasks import generate_participant_map
 import sentry_sdk
 
 
 CACHE_TTL = getattr(settings, 'CACHE_MIDDLEWARE_SECONDS', 60 * 15)  # 15 minutes default
+# Calendar months are invalidated explicitly (see invalidate_fast_calendar_cache)
+CALENDAR_CACHE_TTL = 60 * 60 * 24  # 24 hours
 
 def get_cache_key(prefix, *args):
     """Generate a cache key with the given prefix and arguments."""
     return f"bahk:{prefix}:{'_'.join(force_str(arg) for arg in args)}"
 
+
+def current_day_count(as_of):
+    """Correlated subquery counting a fast's days up to and including ``as_of``.
+
+    Used instead of ``Count('days', filter=...)`` so the fast queries need no
+    GROUP BY join against hub_day; the rest of the span is stored on Fast.
+    """
+    return Coalesce(
+        Subquery(
+            Day.objects.filter(fast=OuterRef('pk'), date__lte=as_of)
+            .order_by()
+            .values('fast')
+            .annotate(total=Count('pk'))
+            .values('total')
+        ),
+        0,
+    )
+
 class FastListView(ChurchContextMixin, TimezoneMixin, generics.ListAPIView):
     """
     API view to list all fasts for a specific church within a configurable date range.
@@ -67,11 +94,9 @@ class FastListView(ChurchContextMixin, TimezoneMixin, generics.ListAPIView):
         count = cache.get(count_key)
         
         if count is None:
-            # Calculate the sum of participants across all fasts for this church
+            # Sum the denormalized per-fast counters for this church
             count = Fast.objects.filter(
                 church_id=church_id
-            ).annotate(
-                participant_count=Count('profiles', distinct=True)
             ).aggregate(
                 total=Sum('participant_count')
             )['total'] or 0
@@ -147,21 +172,16 @@ class FastListView(ChurchContextMixin, TimezoneMixin, generics.ListAPIView):
             date__gte=today
         ).order_by('date').values('date')[:1]
 
-        # If not in cache, generate queryset
+        # If not in cache, generate queryset. The stored date span narrows the
+        # candidates with an indexed range predicate before the Exists check.
         queryset = Fast.objects.annotate(
-            participant_count=Count('profiles', distinct=True),
-            total_days=Count('days', distinct=True),
-            start_date=Min('days__date'),
-            end_date=Max('days__date'),
-            current_day_count=Count(
-                'days',
-                filter=Q(days__date__lte=today),
-                distinct=True
-            ),
+            current_day_count=current_day_count(today),
             next_fast_date=Subquery(next_day_subq)
         ).filter(
             Exists(days_in_range),
             church=church,
+            start_date__lte=end_date,
+            end_date__gte=start_date,
         ).select_related(
             'church'
         )
@@ -189,25 +209,26 @@ class FastListView(ChurchContextMixin, TimezoneMixin, generics.ListAPIView):
 
 
 @method_decorator(vary_on_headers('Authorization'), name='dispatch')
-class FastDetailView(TimezoneMixin, generics.RetrieveAPIView):
+class FastDetailView(ConditionalGetMixin, SharedFastPayloadMixin, TimezoneMixin, generics.RetrieveAPIView):
     """
     API view to retrieve detailed information about a specific fast.
 
     This view allows authenticated users to retrieve the details of a specific fast by its ID.
-    The response is cached for 15 minutes to improve performance, with separate cache entries
-    for authenticated and unauthenticated users to prevent data leakage.
+    One user-independent payload is cached for 15 minutes and shared by all users; the
+    per-user `joined` flag is overlaid from the user's cached joined fast IDs.
 
     Cache keys are generated based on:
-    - Fast ID
-    - User authentication status
-    - Timezone
-    
-    Cache invalidation should occur when:
-    - The fast is updated
-    - A user joins/leaves the fast
-    - The fast's church information changes
+    - Fast ID and its content version (bumped when the fast, its days or its
+      participant count change)
+    - Timezone and the current date in it
+    - Language
+
+    The same content version, the date and the user's joined state make up the
+    ETag, so unchanged fasts are revalidated with a 304.
 
     Inherits:
+        - ConditionalGetMixin: Answers conditional GETs with 304 Not Modified.
+        - SharedFastPayloadMixin: Renders shared payloads and overlays per-user fields.
         - TimezoneMixin: Provides the timezone context for serializers.
         - RetrieveAPIView: Standard DRF view for retrieving a single model instance by ID.
 
@@ -231,37 +252,37 @@ class FastDetailView(TimezoneMixin, generics.RetrieveAPIView):
         # Return the model instance as expected by DRF
         return super().get_object()
 
+    def get_conditional_scopes(self):
+        return [f"fast:{self.kwargs['pk']}"]
+
+    def get_conditional_user_key(self):
+        joined = self.kwargs['pk'] in get_joined_fast_ids(self.request.user)
+        return f"{super().get_conditional_user_key()}:{joined}"
+
     def retrieve(self, request, *args, **kwargs):
-        # Generate cache key using the fast ID, auth status, and timezone
-        is_authenticated = request.user.is_authenticated
+        # Generate a user-independent cache key; `joined` is overlaid per request
+        tz = self.get_timezone()
         lang = request.query_params.get('lang') or 'en'
-        # Include user id when authenticated to prevent per-user fields (e.g., joined) from leaking
-        auth_segment = f"user:{request.user.id}" if is_authenticated else 'anon'
         cache_key = get_cache_key(
             'fast_detail',
             self.kwargs['pk'],
-            auth_segment,
-            self.get_timezone().zone,
+            get_content_version(f"fast:{self.kwargs['pk']}"),
+            tz.zone,
+            timezone.localdate(timezone=tz),
             lang
         )
         
-        # Try to get serialized data from cache
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return response.Response(cached_data)
+        # Try to get the shared payload from cache
+        data = cache.get(cache_key)
+        if data is None:
+            data = super().retrieve(request, *args, **kwargs).data
+            cache.set(cache_key, data, CACHE_TTL)
         
-        # If not in cache, get the response from the parent class
-        response_data = super().retrieve(request, *args, **kwargs)
-        
-        # Cache the serialized data
-        cache.set(cache_key, response_data.data, CACHE_TTL)
-        
-        return response_data
+        return response.Response(self.overlay_user_fields(data))
 
 
-@method_decorator(cache_page(CACHE_TTL), name='dispatch')
 @method_decorator(vary_on_headers('Authorization'), name='dispatch')
-class FastByDateView(ChurchContextMixin, TimezoneMixin, generics.ListAPIView):
+class FastByDateView(SharedFastPayloadMixin, ChurchContextMixin, TimezoneMixin, generics.ListAPIView):
     """
     API view to list fasts based on a specific date or the current date.
 
@@ -283,10 +304,30 @@ class FastByDateView(ChurchContextMixin, TimezoneMixin, generics.ListAPIView):
 
     Returns:
         - A list of fasts filtered by the church and date context.
+
+    The page is cached once per church/date/timezone/language and shared by all users;
+    the per-user `joined` flag is overlaid at response time.
     """
     serializer_class = FastSerializer
     permission_classes = [permissions.AllowAny]  # Allow any user to access this view
 
+    def list(self, request, *args, **kwargs):
+        tz = self.get_timezone()
+        cache_key = get_cache_key(
+            'fast_by_date_payload',
+            self.get_church().id,
+            request.query_params.get('date') or timezone.localdate(timezone=tz),
+            tz.zone,
+            timezone.localdate(timezone=tz),
+            request.query_params.get('lang') or 'en',
+            request.query_params.get('page') or 1,
+        )
+        data = cache.get(cache_key)
+        if data is None:
+            data = super().list(request, *args, **kwargs).data
+            cache.set(cache_key, data, CACHE_TTL)
+        return response.Response(self.overlay_user_fields(data))
+
     def get_queryset(self):
         church = self.get_church()
         date_str = self.request.query_params.get('date')
@@ -309,20 +350,14 @@ class FastByDateView(ChurchContextMixin, TimezoneMixin, generics.ListAPIView):
         else:
             target_date = timezone.localdate(timezone=tz)
 
-        # Optimize queryset with select_related and prefetch_related
+        # Only fasts whose stored span covers the date can have a day on it
         queryset = Fast.objects.annotate(
-            participant_count=Count('profiles', distinct=True),
-            total_days=Count('days', distinct=True),
-            start_date=Min('days__date'),
-            end_date=Max('days__date'),
-            current_day_count=Count(
-                'days',
-                filter=Q(days__date__lte=target_date),
-                distinct=True
-            )
+            current_day_count=current_day_count(target_date)
         ).filter(
+            Exists(Day.objects.filter(fast=OuterRef('pk'), date=target_date)),
             church=church,
-            days__date=target_date
+            start_date__lte=target_date,
+            end_date__gte=target_date,
         ).select_related(
             'church'
         )
@@ -334,9 +369,8 @@ class FastByDateView(ChurchContextMixin, TimezoneMixin, generics.ListAPIView):
         return queryset
 
 
-@method_decorator(cache_page(CACHE_TTL), name='dispatch')
 @method_decorator(vary_on_headers('Authorization'), name='dispatch')
-class FastByFeastDateView(ChurchContextMixin, TimezoneMixin, generics.ListAPIView):
+class FastByFeastDateView(SharedFastPayloadMixin, ChurchContextMixin, TimezoneMixin, generics.ListAPIView):
     """
     API view to list fasts based on their culmination feast date.
 
@@ -358,10 +392,30 @@ class FastByFeastDateView(ChurchContextMixin, TimezoneMixin, generics.ListAPIVie
 
     Returns:
         - A list of fasts filtered by the church and culmination feast date.
+
+    The page is cached once per church/date/timezone/language and shared by all users;
+    the per-user `joined` flag is overlaid at response time.
     """
     serializer_class = FastSerializer
     permission_classes = [permissions.AllowAny]  # Allow any user to access this view
 
+    def list(self, request, *args, **kwargs):
+        tz = self.get_timezone()
+        cache_key = get_cache_key(
+            'fast_by_feast_date_payload',
+            self.get_church().id,
+            request.query_params.get('date'),
+            tz.zone,
+            timezone.localdate(timezone=tz),
+            request.query_params.get('lang') or 'en',
+            request.query_params.get('page') or 1,
+        )
+        data = cache.get(cache_key)
+        if data is None:
+            data = super().list(request, *args, **kwargs).data
+            cache.set(cache_key, data, CACHE_TTL)
+        return response.Response(self.overlay_user_fields(data))
+
     def get_queryset(self):
         church = self.get_church()
         date_str = self.request.query_params.get('date')
@@ -389,15 +443,7 @@ class FastByFeastDateView(ChurchContextMixin, TimezoneMixin, generics.ListAPIVie
 
         # Optimize queryset with select_related and prefetch_related
         queryset = Fast.objects.annotate(
-            participant_count=Count('profiles', distinct=True),
-            total_days=Count('days', distinct=True),
-            start_date=Min('days__date'),
-            end_date=Max('days__date'),
-            current_day_count=Count(
-                'days',
-                filter=Q(days__date__lte=today),
-                distinct=True
-            )
+            current_day_count=current_day_count(today)
         ).filter(
             church=church,
             culmination_feast_date=feast_date
@@ -412,6 +458,121 @@ class FastByFeastDateView(ChurchContextMixin, TimezoneMixin, generics.ListAPIVie
         return queryset
 
 
+class FastCalendarView(ChurchContextMixin, views.APIView):
+    """
+    API view returning the fasts of a church for a whole date range in one response.
+
+    Replaces one `FastByDateView` request per calendar day: the response maps each
+    date that belongs to a fast to the ids of its fasts, and carries each fast's
+    payload once in a separate table.
+
+    Months are built with a single query over `Day` joined to `Fast` and cached per
+    church, month and language. Any change to a fast or its days bumps the church's
+    calendar version, which invalidates every cached month at once.
+
+    Permissions:
+        - AllowAny: Any user, authenticated or not, can access this view.
+
+    Query Parameters:
+        - start_date: Required. Start date in YYYY-MM-DD format.
+        - end_date: Required. End date in YYYY-MM-DD format (inclusive).
+        - church_id: Optional. A string representing the church id. Required if unauthenticated.
+        - lang: Optional. Language code for translations (e.g., en, hy). Defaults to 'en'.
+
+    Returns:
+        - start_date / end_date: The requested range.
+        - days: Mapping of date (YYYY-MM-DD) to the ids of the fasts on that date.
+        - fasts: Mapping of fast id to its compact payload (see `FastCalendarSerializer`).
+    """
+    permission_classes = [permissions.AllowAny]
+    max_range_days = 366
+
+    def get(self, request):
+        church = self.get_church()
+        start_date = self._parse_date('start_date')
+        end_date = self._parse_date('end_date')
+        if end_date < start_date:
+            raise ValidationError("end_date must not be before start_date.")
+        if (end_date - start_date).days >= self.max_range_days:
+            raise ValidationError(f"Date range cannot exceed {self.max_range_days} days.")
+        lang = request.query_params.get('lang') or 'en'
+
+        months = self._months_between(start_date, end_date)
+        version = get_fast_calendar_version(church.id)
+        cache_keys = {
+            month: get_cache_key('fast_calendar', church.id, month.strftime('%Y-%m'), lang, version)
+            for month in months
+        }
+        cached = cache.get_many(list(cache_keys.values()))
+        month_data = {month: cached[key] for month, key in cache_keys.items() if key in cached}
+
+        missing = [month for month in months if month not in month_data]
+        if missing:
+            built = self._build_months(church, missing, lang)
+            cache.set_many({cache_keys[month]: data for month, data in built.items()}, CALENDAR_CACHE_TTL)
+            month_data.update(built)
+
+        start_key, end_key = start_date.isoformat(), end_date.isoformat()
+        days, fasts = {}, {}
+        for month in months:
+            data = month_data[month]
+            for date_key, fast_ids in data['days'].items():
+                if start_key <= date_key <= end_key:
+                    days[date_key] = fast_ids
+                    for fast_id in fast_ids:
+                        fasts[str(fast_id)] = data['fasts'][str(fast_id)]
+
+        return response.Response({
+            'start_date': start_key,
+            'end_date': end_key,
+            'days': days,
+            'fasts': fasts,
+        })
+
+    def _parse_date(self, param):
+        value = self.request.query_params.get(param)
+        if not value:
+            raise ValidationError(f"{param} query parameter is required.")
+        try:
+            return datetime.datetime.strptime(value, "%Y-%m-%d").date()
+        except ValueError:
+            raise ValidationError("Invalid date format. Expected format: yyyy-mm-dd.")
+
+    @staticmethod
+    def _months_between(start_date, end_date):
+        """First day of every month touched by the (inclusive) date range."""
+        months = []
+        month = start_date.replace(day=1)
+        while month <= end_date:
+            months.append(month)
+            month = (month + datetime.timedelta(days=32)).replace(day=1)
+        return months
+
+    def _build_months(self, church, months, lang):
+        """Build the day map and fast table for each month with one query."""
+        range_end = (months[-1] + datetime.timedelta(days=32)).replace(day=1)
+        days = Day.objects.filter(
+            fast__church=church,
+            date__gte=months[0],
+            date__lt=range_end,
+        ).select_related('fast').order_by('date', 'fast_id')
+
+        built = {month: {'days': {}, 'fasts': {}} for month in months}
+        serializer_context = {'request': self.request, 'lang': lang}
+        for day in days:
+            data = built.get(day.date.replace(day=1))
+            if data is None:
+                continue
+            fast_ids = data['days'].setdefault(day.date.isoformat(), [])
+            if day.fast_id not in fast_ids:
+                fast_ids.append(day.fast_id)
+            if str(day.fast_id) not in data['fasts']:
+                data['fasts'][str(day.fast_id)] = dict(FastCalendarSerializer(
+                    day.fast, context=serializer_context
+                ).data)
+        return built
+
+
 class JoinFastView(generics.UpdateAPIView):
     """
     API view for a user to join a specific fast.
@@ -482,9 +643,6 @@ class JoinFastView(generics.UpdateAPIView):
         
         # Invalidate the participant list cache for this fast
         invalidate_fast_participants_cache(fast.id)
-        
-        # Invalidate the stats cache for this user
-        invalidate_fast_stats_cache(self.request.user)
 
 
 class LeaveFastView(generics.UpdateAPIView):
@@ -560,9 +718,6 @@ class LeaveFastView(generics.UpdateAPIView):
         
         # Invalidate the participant list cache for this fast
         invalidate_fast_participants_cache(fast.id)
-        
-        # Invalidate the stats cache for this user
-        invalidate_fast_stats_cache(self.request.user)
 
 
 def vary_on_query_params(*params):
@@ -732,13 +887,10 @@ class FastStatsView(views.APIView):
     API view to retrieve statistics about users fasting participation
 
     This view returns statistics about the specified user's fasting participation.
-    
-    Caching:
-        - Cached for 15 minutes per user with user-specific cache key
-        - Cache is invalidated when:
-          * User joins or leaves a fast
-          * User uses a checklist
-        - Uses manual caching with predictable cache key: bahk:fast_stats:{user_id}
+
+    The counts are read from the user's ProfileFastStats row, which is kept up to
+    date incrementally (join/leave signal, checklist tracking endpoint and the
+    day-rollover task) instead of being aggregated on every request.
 
     Permissions:
         - IsAuthenticated: Only authenticated users can access this view.
@@ -753,35 +905,10 @@ class FastStatsView(views.APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request):
-        # Use user-specific cache key for reliable invalidation
-        cache_key = f"bahk:fast_stats:{request.user.id}"
-        
-        # Try to get cached data
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return response.Response(cached_data)
-        
-        # Optimized: Prefetch related data to avoid N+1 queries
-        # This ensures that when the serializer calls obj.fasts.aggregate(),
-        # it has efficient access to the related data
-        user_profile = request.user.profile
-        
-        # Get user's timezone for accurate date calculations
-        user_tz = pytz.timezone(user_profile.timezone) if user_profile.timezone else pytz.UTC
-        
-        # Prefetch the fasts and their days to optimize the serializer queries
-        optimized_profile = Profile.objects.select_related('user', 'church').prefetch_related(
-            Prefetch('fasts', queryset=Fast.objects.prefetch_related('days'))
-        ).get(id=user_profile.id)
-        
-        # Pass timezone in context for date filtering
-        serialized_stats = FastStatsSerializer(optimized_profile, context={'tz': user_tz})
-        data = serialized_stats.data
-        
-        # Cache the result for 15 minutes
-        cache.set(cache_key, data, CACHE_TTL)
-        
-        return response.Response(data)
+        profile = request.user.profile
+        stats = ProfileFastStats.for_profile(profile)
+        serialized_stats = FastStatsSerializer(profile, context={'stats': stats})
+        return response.Response(serialized_stats.data)
 
 
 class FastOnDate(views.APIView):
@@ -967,3 +1094,53 @@ class FastParticipantsMapView(views.APIView):
             # Return the map data
             serializer = FastParticipantMapSerializer(map_obj)
             return response.Response(serializer.data)
+
+
+class FastParticipantsDensityView(views.APIView):
+    """
+    API view returning where the participants of a fast are, as grid clusters.
+
+    Participants are counted per grid cell at several zoom levels (see
+    hub.services.participant_density); the cells are kept up to date as
+    profiles join or leave fasts or get geocoded, so clients can render
+    interactive maps without a server-side rendered image.
+
+    Permissions:
+        - IsAuthenticated: Only authenticated users can access this view.
+
+    URL Parameters:
+        - fast_id: The ID of the fast.
+
+    Query Parameters:
+        - zoom: Map zoom level; the highest available grid level not above it is
+          used (default: the coarsest).
+        - bbox: Optional "min_lon,min_lat,max_lon,max_lat" to restrict the cells to.
+
+    Returns:
+        - A GeoJSON FeatureCollection of points with a participant `count` and the
+          `cell` bounds; its `properties` list the zoom levels and the cell size.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, fast_id):
+        fast = get_object_or_404(Fast, id=fast_id)
+
+        zoom_param = request.query_params.get('zoom')
+        try:
+            zoom = nearest_zoom(int(zoom_param) if zoom_param else None)
+        except ValueError:
+            raise ValidationError("zoom must be an integer.")
+
+        bbox = None
+        bbox_param = request.query_params.get('bbox')
+        if bbox_param:
+            try:
+                bbox = tuple(float(value) for value in bbox_param.split(','))
+            except ValueError:
+                bbox = ()
+            if len(bbox) != 4 or not all(math.isfinite(value) for value in bbox):
+                raise ValidationError("bbox must be min_lon,min_lat,max_lon,max_lat.")
+            if bbox[0] > bbox[2] or bbox[1] > bbox[3]:
+                raise ValidationError("bbox minimums must not exceed its maximums.")
+
+        return response.Response(density_geojson(fast, zoom, bbox))
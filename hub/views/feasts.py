@@ -18,15 +18,19 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from hub.models import Church, Day, Feast, FeastContext
-from hub.tasks import generate_feast_context_task
-from hub.utils import get_user_profile_safe, get_or_create_feast_for_date
+from hub.services.context_generation_service import enqueue_feast_context
+from hub.utils import bump_content_version, get_content_version, get_user_profile_safe, get_or_create_feast_for_date
+from hub.views.mixins import ConditionalGetMixin
 from icons.serializers import IconSerializer
 
 
-class GetFeastForDate(generics.GenericAPIView):
+class GetFeastForDate(ConditionalGetMixin, generics.GenericAPIView):
     """
     API view to provide feast information for a given date.
 
+    Supports conditional GET; the ETag changes whenever a feast, feast context,
+    feast prayer or icon is saved.
+
     Permissions:
         - AllowAny: No authentication required
 
@@ -43,11 +47,14 @@ class GetFeastForDate(generics.GenericAPIView):
                 "text": "AI-generated context text for the feast",
                 "short_text": "Short 2-sentence summary",
                 "context_thumbs_up": 10,
-                "context_thumbs_down": 2
+                "context_thumbs_down": 2,
+                "context_status": "ready"  # "pending" while being generated, "unavailable" for fast days
             }
         }
     """
 
+    conditional_scopes = ('feasts',)
+
     def get(self, request, *args, **kwargs):
         date_format = "%Y-%m-%d"
 
@@ -73,8 +80,9 @@ class GetFeastForDate(generics.GenericAPIView):
         else:
             church = Church.objects.get(pk=Church.get_default_pk())
 
-        # Cache key for feast lookup (includes lang to prevent cross-language poisoning)
-        cache_key = f"feast:{date_obj}:{church.id}:{lang}"
+        # Cache key for feast lookup (includes lang to prevent cross-language poisoning,
+        # and the feasts content version so edits are never served from a stale entry)
+        cache_key = f"feast:{date_obj}:{church.id}:{lang}:{get_content_version('feasts')}"
         cached_result = cache.get(cache_key)
         if cached_result:
             return Response(cached_result)
@@ -126,14 +134,15 @@ class GetFeastForDate(generics.GenericAPIView):
                 # No context at all, trigger generation for all languages if appropriate
                 if should_trigger_generation:
                     logging.warning("No context found for feast %s", str(feast))
-                    logging.info("Enqueue context generation for feast %s (all languages)", feast.id)
-                    generate_feast_context_task.delay(feast.id)
+                    if enqueue_feast_context(feast.id):
+                        logging.info("Enqueued context generation for feast %s (all languages)", feast.id)
                 
                 context_dict = {
                     "text": "",
                     "short_text": "",
                     "context_thumbs_up": 0,
                     "context_thumbs_down": 0,
+                    "context_status": "pending" if should_trigger_generation else "unavailable",
                 }
             else:
                 # Get the requested language translations
@@ -156,18 +165,19 @@ class GetFeastForDate(generics.GenericAPIView):
                         break
 
                 # If any translation is missing, trigger generation for all languages if appropriate
-                if not all_languages_present and should_trigger_generation:
+                # (unless a job for this feast is already in flight)
+                if not all_languages_present and should_trigger_generation and enqueue_feast_context(feast.id):
                     logging.info(
-                        "Context translations missing for feast %s, enqueuing generation for all languages",
+                        "Context translations missing for feast %s, enqueued generation for all languages",
                         feast.id
                     )
-                    generate_feast_context_task.delay(feast.id)
 
                 context_dict = {
                     "text": context_text or "",
                     "short_text": short_context_text or "",
                     "context_thumbs_up": active_context.thumbs_up,
                     "context_thumbs_down": active_context.thumbs_down,
+                    "context_status": "ready" if all_languages_present or not should_trigger_generation else "pending",
                 }
 
             # Serialize icon if it exists
@@ -269,11 +279,12 @@ class FeastContextFeedbackView(APIView):
         # Check if active context exists
         if active_context is None:
             # Trigger context generation if not already in progress
-            generate_feast_context_task.delay(feast.id)
+            queued = enqueue_feast_context(feast.id)
             return Response(
                 {
                     "status": "error",
-                    "message": "No context available for this feast. Context generation has been queued."
+                    "message": "No context available for this feast. Context generation has been "
+                               + ("queued." if queued else "in progress."),
                 },
                 status=status.HTTP_404_NOT_FOUND,
             )
@@ -284,20 +295,22 @@ class FeastContextFeedbackView(APIView):
             FeastContext.objects.filter(pk=active_context.pk).update(
                 thumbs_up=F('thumbs_up') + 1
             )
+            bump_content_version('feasts')
             return Response({"status": "success", "regenerate": False})
         elif feedback_type == "down":
             # Use atomic increment to prevent race conditions
             FeastContext.objects.filter(pk=active_context.pk).update(
                 thumbs_down=F('thumbs_down') + 1
             )
+            bump_content_version('feasts')
             # Refresh the object to get the updated value for threshold check
             active_context.refresh_from_db()
             threshold = getattr(settings, "FEAST_CONTEXT_REGENERATION_THRESHOLD", 5)
             regenerate = False
             if active_context.thumbs_down >= threshold:
                 regenerate = True
-                # Force regeneration via Celery task
-                generate_feast_context_task.delay(feast.id, force_regeneration=True)
+                # Force regeneration via Celery task (once, however many down-votes arrive meanwhile)
+                enqueue_feast_context(feast.id, force_regeneration=True)
             return Response({"status": "success", "regenerate": regenerate})
         else:
             return Response(
@@ -1,6 +1,13 @@
+import datetime
+import hashlib
+
 from rest_framework.exceptions import ValidationError
 from ..models import Church
+from ..utils import get_content_versions, get_joined_fast_ids, get_user_profile_safe
 from django.core.exceptions import ObjectDoesNotExist
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date, quote_etag
 import pytz
 from pytz.exceptions import UnknownTimeZoneError
 
@@ -51,3 +58,129 @@ class TimezoneMixin:
             except UnknownTimeZoneError:
                 pass
         return pytz.UTC
+
+
+class SharedFastPayloadMixin:
+    """
+    Mixin for fast views that cache one user-independent payload and overlay the
+    per-user `joined` flag at response time.
+
+    The serializer is told to render a shared payload (`joined` is always false in
+    it), so cache entries scale with fasts rather than users x fasts. The overlay
+    reads the user's joined fast IDs from a small per-user cache.
+    """
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['shared_payload'] = True
+        return context
+
+    def overlay_user_fields(self, data):
+        """Set `joined` on each fast in ``data`` (a fast, list, or paginated page)."""
+        joined_ids = get_joined_fast_ids(self.request.user)
+        if isinstance(data, dict) and 'results' in data:
+            fasts = data['results']
+        elif isinstance(data, list):
+            fasts = data
+        else:
+            fasts = [data]
+        for fast in fasts:
+            fast['joined'] = fast['id'] in joined_ids
+        return data
+
+
+class _NotModified(Exception):
+    """Raised from ``initial()`` to short-circuit a request with a 304/412 response."""
+
+    def __init__(self, response):
+        super().__init__()
+        self.response = response
+
+
+class ConditionalGetMixin:
+    """
+    Mixin answering conditional GETs (If-None-Match / If-Modified-Since) with
+    304 Not Modified before the response body is built.
+
+    The validator is derived from cheap inputs only:
+    - the content versions of `conditional_scopes` (bumped by signals whenever
+      the underlying data changes, see hub.utils.bump_content_version)
+    - the request path and query string, and the Accept-Language header
+    - the requester's local date, for endpoints that default to "today"
+    - a per-user key (church and timezone by default; views with per-user
+      overlays extend it)
+
+    Every GET/HEAD response carries an ETag; anonymous responses also carry a
+    Last-Modified derived from the same versions.
+    """
+
+    conditional_scopes = ()
+
+    def get_conditional_scopes(self):
+        return self.conditional_scopes
+
+    def get_conditional_timezone(self):
+        """Timezone whose current date the response depends on."""
+        if hasattr(self, 'get_timezone'):
+            return self.get_timezone()
+        return timezone.get_default_timezone()
+
+    def get_conditional_user_key(self):
+        """Key for the user-specific inputs of the response."""
+        user = self.request.user
+        if not user.is_authenticated:
+            return 'anon'
+        profile = get_user_profile_safe(user)
+        if profile is None:
+            return 'noprofile'
+        return f"{profile.church_id}:{profile.timezone}"
+
+    def get_conditional_validators(self):
+        """Return the ``(etag, last_modified)`` pair for the current request."""
+        request = self.request
+        versions = get_content_versions(self.get_conditional_scopes())
+        tz = self.get_conditional_timezone()
+        local_date = timezone.localdate(timezone=tz)
+        parts = [
+            *(f"{scope}={version}" for scope, version in sorted(versions.items())),
+            request.get_full_path(),
+            request.META.get('HTTP_ACCEPT_LANGUAGE', ''),
+            local_date.isoformat(),
+            self.get_conditional_user_key(),
+        ]
+        etag = quote_etag(hashlib.md5('|'.join(parts).encode()).hexdigest())
+
+        # Last-Modified cannot express per-user state, so it is only sent to
+        # anonymous clients; the local date rolling over counts as a modification.
+        last_modified = None
+        if not request.user.is_authenticated:
+            midnight = timezone.make_aware(datetime.datetime.combine(local_date, datetime.time.min), tz)
+            last_modified = int(max(
+                [midnight.timestamp(), *(version / 1e9 for version in versions.values())]
+            ))
+        return etag, last_modified
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self._conditional_validators = None
+        if request.method in ('GET', 'HEAD'):
+            etag, last_modified = self._conditional_validators = self.get_conditional_validators()
+            response = get_conditional_response(request._request, etag=etag, last_modified=last_modified)
+            if response is not None:
+                raise _NotModified(response)
+
+    def handle_exception(self, exc):
+        if isinstance(exc, _NotModified):
+            return exc.response
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        validators = getattr(self, '_conditional_validators', None)
+        if validators and response.status_code in (200, 304):
+            etag, last_modified = validators
+            response['ETag'] = etag
+            if last_modified is not None:
+                response['Last-Modified'] = http_date(last_modified)
+            patch_vary_headers(response, ('Accept-Language', 'Authorization'))
+        return response
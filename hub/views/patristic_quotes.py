@@ -1,9 +1,9 @@
 """Views for patristic quotes."""
-import hashlib
 from datetime import datetime
 
-from django.core.cache import cache
+import pytz
 from django.db.models import Q
+from django.utils import timezone
 from django.utils.translation import activate, get_language_from_request
 from rest_framework import generics, views
 from rest_framework.permissions import AllowAny
@@ -11,6 +11,8 @@ from rest_framework.response import Response
 
 from hub.models import PatristicQuote
 from hub.serializers import PatristicQuoteSerializer
+from hub.services.patristic_quote_service import parse_tags, record_quote_filter, render_quote_of_the_day
+from hub.views.mixins import ConditionalGetMixin
 
 
 class PatristicQuoteListView(generics.ListAPIView):
@@ -203,7 +205,7 @@ class PatristicQuotesByFastView(generics.ListAPIView):
         return queryset.distinct().order_by('-created_at')
 
 
-class PatristicQuoteOfTheDayView(views.APIView):
+class PatristicQuoteOfTheDayView(ConditionalGetMixin, views.APIView):
     """
     API endpoint that returns a deterministic "quote of the day".
     
@@ -225,7 +227,14 @@ class PatristicQuoteOfTheDayView(views.APIView):
         3. Create a deterministic seed from: date + fast_id + sorted tags
         4. Hash the seed and convert to integer
         5. Use modulo to select a specific quote from the filtered set
-        6. Cache the result for 24 hours
+           (the filtered, ordered quote IDs are cached per quotes content version)
+        6. Cache the result for 24 hours (keyed on the quotes content version)
+
+    The nightly prerender_quotes_of_the_day_task renders the next day's quote
+    for common filters in every language ahead of time.
+
+    Supports conditional GET; the ETag changes when a quote is edited or the
+    user's local date rolls over.
     
     Returns:
         A JSON response with a single patristic quote.
@@ -238,68 +247,42 @@ class PatristicQuoteOfTheDayView(views.APIView):
         GET /api/patristic-quotes/quote-of-the-day/?fast_id=1&tags=humility&lang=hy
     """
     permission_classes = [AllowAny]
-    
+    conditional_scopes = ('patristic_quotes',)
+
+    def get_conditional_timezone(self):
+        """The user's profile timezone if authenticated, otherwise the server's."""
+        user = self.request.user
+        if user.is_authenticated and hasattr(user, 'profile'):
+            try:
+                return pytz.timezone(user.profile.timezone)
+            except Exception:
+                pass
+        return timezone.get_default_timezone()
+
     def get(self, request):
         """Get the quote of the day using deterministic selection."""
         # Get query parameters
         fast_id = request.query_params.get('fast_id', None)
-        tags_param = request.query_params.get('tags', None)
+        tag_list = parse_tags(request.query_params.get('tags', None))
         lang = request.query_params.get('lang') or get_language_from_request(request) or 'en'
-        
+
         # Activate language for translations
         activate(lang)
-        
-        # Get current date in user's timezone if authenticated, otherwise UTC
-        if request.user.is_authenticated and hasattr(request.user, 'profile'):
-            import pytz
-            try:
-                user_tz = pytz.timezone(request.user.profile.timezone)
-                current_date = datetime.now(user_tz).date()
-            except Exception:
-                current_date = datetime.now().date()
-        else:
-            current_date = datetime.now().date()
-        
-        # Format date as YYYY-MM-DD
-        date_str = current_date.strftime('%Y-%m-%d')
-        
-        # Parse and sort tags for consistency
-        tag_list = []
-        if tags_param:
-            tag_list = sorted([tag.strip().lower() for tag in tags_param.split(',')])
-        
-        # Create cache key
-        tags_str = ','.join(tag_list) if tag_list else 'none'
-        fast_str = str(fast_id) if fast_id else 'none'
-        cache_key = f'patristic_quote_of_day:{date_str}:{fast_str}:{tags_str}:{lang}'
-        
-        # Try to get from cache first
-        cached_quote = cache.get(cache_key)
-        if cached_quote:
-            return Response(cached_quote)
-        
-        # Build queryset with filters
-        queryset = PatristicQuote.objects.prefetch_related('churches', 'fasts', 'tags')
-        
+
         if fast_id:
             try:
-                queryset = queryset.filter(fasts__id=int(fast_id))
+                fast_id = int(fast_id)
             except ValueError:
                 return Response(
                     {'detail': 'Invalid fast_id parameter.'},
                     status=400
                 )
-        
-        if tag_list:
-            for tag in tag_list:
-                queryset = queryset.filter(tags__name__iexact=tag)
-        
-        queryset = queryset.distinct().order_by('id')  # Consistent ordering for deterministic selection
-        
-        # Get count
-        count = queryset.count()
-        
-        if count == 0:
+
+        # Get current date in user's timezone if authenticated, otherwise server time
+        current_date = datetime.now(self.get_conditional_timezone()).date()
+
+        response_data = render_quote_of_the_day(current_date, fast_id, tag_list, lang, request=request)
+        if response_data is None:
             return Response(
                 {
                     'detail': 'No patristic quotes found matching the specified criteria.',
@@ -308,24 +291,6 @@ class PatristicQuoteOfTheDayView(views.APIView):
                 },
                 status=404
             )
-        
-        # Create deterministic seed and hash it
-        seed = f"{date_str}-{fast_str}-{tags_str}"
-        hash_object = hashlib.md5(seed.encode())
-        hash_int = int(hash_object.hexdigest(), 16)
-        
-        # Use modulo to select quote index
-        selected_index = hash_int % count
-        
-        # Get the selected quote
-        selected_quote = queryset[selected_index]
-        
-        # Serialize the quote
-        serializer = PatristicQuoteSerializer(selected_quote, context={'request': request, 'lang': lang})
-        response_data = serializer.data
-        
-        # Cache for 24 hours (86400 seconds)
-        cache.set(cache_key, response_data, 86400)
-        
-        return Response(response_data)
 
+        record_quote_filter(fast_id, tag_list, current_date)
+        return Response(response_data)
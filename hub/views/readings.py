@@ -7,6 +7,8 @@ import logging
 from datetime import datetime
 
 from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Prefetch
 from django.shortcuts import get_object_or_404
 from django.utils.translation import activate, get_language_from_request
 from rest_framework import generics, status
@@ -14,20 +16,28 @@ from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from hub.models import Church, Day, Reading
-from hub.services.reading_text_service import (
-    fetch_all_reading_texts,
-    get_reading_text_fields,
-    prepare_shared_resources,
-)
-from hub.tasks import generate_reading_context_task
-from hub.utils import get_user_profile_safe, scrape_readings
+from hub.models import Church, Day, Reading, ReadingContext
+from hub.services.context_generation_service import enqueue_reading_context
+from hub.services.prefetch_service import import_readings_for_day
+from hub.services.reading_text_service import get_reading_text_fields
+from hub.utils import get_content_version, get_user_profile_safe
+from hub.views.mixins import ConditionalGetMixin
 
+# Entries are keyed on the readings content version, so this only bounds memory use
+READINGS_CACHE_TIMEOUT = 60 * 60 * 24
 
-class GetDailyReadingsForDate(generics.GenericAPIView):
+
+class GetDailyReadingsForDate(ConditionalGetMixin, generics.GenericAPIView):
     """
     API view to provide daily Scripture readings from database along with link to read them.
 
+    Supports conditional GET: responses carry an ETag (and Last-Modified for anonymous
+    users) that changes whenever a reading or reading context is saved, so clients can
+    revalidate with If-None-Match and get a 304 without the readings being rebuilt.
+
+    The formatted readings are cached per (date, church, language) and invalidated by
+    the same content version.
+
     Permissions:
         - AllowAny: No authentication required
 
@@ -49,7 +59,8 @@ class GetDailyReadingsForDate(generics.GenericAPIView):
                     "url": https://link.to.read.this.passage/,
                     "context": "AI-generated context text for the reading"
                     "context_thumbs_up": 10,
-                    "context_thumbs_down": 2
+                    "context_thumbs_down": 2,
+                    "context_status": "ready"  # or "pending" while it is being generated
                 }
             ]
         }
@@ -87,6 +98,7 @@ class GetDailyReadingsForDate(generics.GenericAPIView):
     """
 
     queryset = Reading.objects.all()
+    conditional_scopes = ('readings',)
 
     def get(self, request, *args, **kwargs):
         date_format = "%Y-%m-%d"
@@ -107,82 +119,75 @@ class GetDailyReadingsForDate(generics.GenericAPIView):
         else:
             date_obj = datetime.today().date()
 
-        if request.user.is_authenticated:
-            profile = get_user_profile_safe(request.user)
-            church = profile.church if profile else Church.objects.get(pk=Church.get_default_pk())
-        else:
-            church = Church.objects.get(pk=Church.get_default_pk())
-
-        day, _ = Day.objects.get_or_create(date=date_obj, church=church)
-
-        # If no readings exist for the requested day/church, scrape and persist them
-        if not day.readings.exists():
-            # import readings for this date into db
-            readings = scrape_readings(date_obj, church)
-            new_reading_objs = []
-            for reading in readings:
-                reading.update({"day": day})
-                # Extract and remove all book-related fields to handle them separately
-                book_en = reading.pop("book_en", reading.get("book"))
-                book_hy = reading.pop("book_hy", None)
-                # Remove 'book' from the dict to avoid using it in get_or_create lookup
-                reading.pop("book", None)
-
-                # Use explicit lookup with book_en to match the uniqueness constraint
-                # (modeltrans treats 'book' as 'book_en' in the database)
-                reading_obj, created = Reading.objects.get_or_create(
-                    day=reading["day"],
-                    book=book_en,  # This becomes book_en in the database
-                    start_chapter=reading["start_chapter"],
-                    start_verse=reading["start_verse"],
-                    end_chapter=reading["end_chapter"],
-                    end_verse=reading["end_verse"]
-                )
+        profile = get_user_profile_safe(request.user) if request.user.is_authenticated else None
+        church_id = profile.church_id if (profile and profile.church_id) else Church.get_default_pk()
+
+        # The readings content version is bumped whenever a reading, its context or its
+        # text changes, so a cached entry is never served after an edit
+        cache_key = f"daily_readings:{date_obj}:{church_id}:{lang}:{get_content_version('readings')}"
+        formatted_readings = cache.get(cache_key)
+        if formatted_readings is None:
+            formatted_readings = self.get_formatted_readings(date_obj, church_id, lang)
+            cache.set(cache_key, formatted_readings, READINGS_CACHE_TIMEOUT)
+
+        response_data = {
+            "date": date_str,
+            "readings": formatted_readings,
+        }
+
+        return Response(response_data)
 
-                # Set translations if they are missing
-                if book_hy and not reading_obj.book_hy:
-                    reading_obj.book_hy = book_hy
-                    reading_obj.save(update_fields=['i18n'])
+    def get_readings(self, day):
+        """Return the day's readings with their active context prefetched in one query."""
+        return list(
+            day.readings.prefetch_related(
+                Prefetch(
+                    "contexts",
+                    queryset=ReadingContext.objects.filter(active=True).order_by("pk"),
+                    to_attr="active_contexts",
+                )
+            )
+        )
 
-                # Track newly created readings that need text fetched
-                if created:
-                    new_reading_objs.append(reading_obj)
+    def get_formatted_readings(self, date_obj, church_id, lang):
+        """Build the readings payload for a day, importing the readings if needed.
 
-            # Fetch text for all languages synchronously so it is available in
-            # the response immediately.  Shared resources (API session, scraped
-            # pages, etc.) are created once for the whole batch.
-            if new_reading_objs:
-                shared = prepare_shared_resources(date_obj, church)
-                for reading_obj in new_reading_objs:
-                    fetch_all_reading_texts(reading_obj, **shared)
+        Runs a constant number of queries however many readings the day has
+        (plus the one-off import when the day is opened for the first time).
+        """
+        day, _ = Day.objects.get_or_create(date=date_obj, church_id=church_id)
+        readings = self.get_readings(day)
 
-        # Now ensure we have up-to-date queryset
-        day.refresh_from_db()
+        # Days inside the prefetch horizon are imported by prefetch_upcoming_days_task;
+        # only dates outside it are scraped (with their texts) during the request
+        if not readings:
+            import_readings_for_day(day, Church.objects.get(pk=church_id))
+            readings = self.get_readings(day)
 
+        available_languages = getattr(settings, 'MODELTRANS_AVAILABLE_LANGUAGES', ['en', 'hy'])
         formatted_readings = []
-        for reading in day.readings.all():
+        for reading in readings:
             # Get translated book name
             book_translated = getattr(reading, 'book_i18n', reading.book)
 
             # Check if context exists and has all translations
-            active_context = reading.active_context
+            active_context = reading.active_contexts[0] if reading.active_contexts else None
             if active_context is None:
                 # No context at all, trigger generation for all languages
                 logging.warning("No context found for reading %s", str(reading))
-                logging.info("Enqueue context generation for reading %s (all languages)", reading.id)
-                generate_reading_context_task.delay(reading.id)
+                if enqueue_reading_context(reading.id):
+                    logging.info("Enqueued context generation for reading %s (all languages)", reading.id)
                 context_dict = {
                     "context": "",
                     "context_thumbs_up": 0,
                     "context_thumbs_down": 0,
+                    "context_status": "pending",
                 }
             else:
                 # Get the requested language translation
                 context_text = getattr(active_context, 'text_i18n', active_context.text)
 
                 # Check if all languages have translations
-                from django.conf import settings
-                available_languages = getattr(settings, 'MODELTRANS_AVAILABLE_LANGUAGES', ['en', 'hy'])
                 all_languages_present = True
                 for available_lang in available_languages:
                     if available_lang == 'en':
@@ -195,17 +200,18 @@ class GetDailyReadingsForDate(generics.GenericAPIView):
                         break
 
                 # If any translation is missing, trigger generation for all languages
-                if not all_languages_present:
+                # (unless a job for this reading is already in flight)
+                if not all_languages_present and enqueue_reading_context(reading.id):
                     logging.info(
-                        "Context translations missing for reading %s, enqueuing generation for all languages",
+                        "Context translations missing for reading %s, enqueued generation for all languages",
                         reading.id
                     )
-                    generate_reading_context_task.delay(reading.id)
 
                 context_dict = {
                     "context": context_text or "",
                     "context_thumbs_up": active_context.thumbs_up,
                     "context_thumbs_down": active_context.thumbs_down,
+                    "context_status": "ready" if all_languages_present else "pending",
                 }
 
             formatted_readings.append(
@@ -222,12 +228,7 @@ class GetDailyReadingsForDate(generics.GenericAPIView):
                 }
             )
 
-        response_data = {
-            "date": date_str,
-            "readings": formatted_readings,
-        }
-
-        return Response(response_data)
+        return formatted_readings
 
 
 # New Feedback view
@@ -273,11 +274,12 @@ class ReadingContextFeedbackView(APIView):
         # Check if active context exists
         if active_context is None:
             # Trigger context generation if not already in progress
-            generate_reading_context_task.delay(reading.id)
+            queued = enqueue_reading_context(reading.id)
             return Response(
                 {
                     "status": "error",
-                    "message": "No context available for this reading. Context generation has been queued."
+                    "message": "No context available for this reading. Context generation has been "
+                               + ("queued." if queued else "in progress."),
                 },
                 status=status.HTTP_404_NOT_FOUND,
             )
@@ -293,8 +295,8 @@ class ReadingContextFeedbackView(APIView):
             regenerate = False
             if active_context.thumbs_down >= threshold:
                 regenerate = True
-                # Force regeneration via Celery task
-                generate_reading_context_task.delay(reading.id, force_regeneration=True)
+                # Force regeneration via Celery task (once, however many down-votes arrive meanwhile)
+                enqueue_reading_context(reading.id, force_regeneration=True)
             active_context.save(update_fields=["thumbs_down"])
             return Response({"status": "success", "regenerate": regenerate})
         else:
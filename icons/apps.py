@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class IconsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'icons'
+
+    def ready(self):
+        """Import signals when the app is ready."""
+        from . import signals  # noqa: F401
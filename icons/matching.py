@@ -0,0 +1,445 @@
+"""Icon matching: a BM25 index over icon titles and tags, re-ranked by an LLM.
+
+``IconMatchView`` and ``match_icon_to_feast_task`` used to format every icon
+into one prompt and ask the LLM.  The index shortlists the best lexical
+candidates (in memory, per process) so the LLM only re-ranks a few icons,
+and is skipped altogether when the prompt names an icon's title exactly.
+
+The index is rebuilt when the ``icons`` content version changes, which
+``icons.signals`` bumps whenever an icon or its tags change.  Match results
+are cached under the normalized prompt, church and that same version, so
+repeated requests for a feast skip the LLM until the catalog changes.
+"""
+
+import hashlib
+import json
+import logging
+import math
+import re
+import threading
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.cache import cache
+
+from hub.utils import get_content_version
+from icons.models import Icon
+
+logger = logging.getLogger(__name__)
+
+# Icons sent to the LLM for re-ranking
+ICON_SHORTLIST_SIZE = 10
+# Title terms count this many times as much as tag terms
+TITLE_WEIGHT = 2
+BM25_K1 = 1.2
+BM25_B = 0.75
+# Matches computed (and cached) per prompt; smaller requests are served a prefix
+ICON_MATCH_CACHE_DEPTH = 3
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+_STOPWORDS = frozenset({
+    "a", "an", "and", "at", "by", "for", "from", "icon", "icons", "in", "of", "on",
+    "or", "the", "to", "with", "showing", "st", "saint", "saints", "holy",
+})
+
+SYSTEM_PROMPT = """
+You match a user's natural-language request to the most relevant icons.
+
+INPUT:
+- A list of icons. Each icon has: ID, Title, and Tags.
+- A user request.
+- A maximum number of results (N).
+
+OUTPUT FORMAT (STRICT):
+Return a JSON array of match objects. Each object must follow this exact format:
+
+[
+  {
+    "id": 3,
+    "confidence": "high"
+  },
+  {
+    "id": 12,
+    "confidence": "medium"
+  }
+]
+
+Rules for Output:
+- Do NOT include any text outside the JSON.
+- Do NOT include extra keys or commentary.
+- If no icons are meaningfully relevant, return: []
+- Return at most N matches.
+
+CONFIDENCE SCORING:
+Assign confidence based on clarity of match:
+- "high": The icon's title or tags clearly and directly match the request, with minimal ambiguity.
+- "medium": The match is plausible and relevant, but not exact.
+- "low": Only return "low" confidence if it is still clearly related; otherwise do not return it at all.
+
+RELEVANCE RULES:
+- Prefer icons whose Title strongly matches the user request.
+- Next, consider strong Tag matches.
+- Ignore weak or tangential keyword overlap.
+- Only return IDs that appear in the provided list.
+- NEVER guess or invent icons.
+
+TIEBREAKERS:
+If multiple icons seem similar in relevance:
+1) Exact title match or near-synonym wins.
+2) More specific tags beat general tags.
+3) Well-known canonical association beats broad thematic similarity.
+
+If unsure whether an icon is relevant:
+DO NOT RETURN IT.
+"""
+
+# Try models in order of preference, falling back if one fails
+LLM_MODELS = ['gpt-5-mini', 'gpt-4.1-nano', 'gpt-4o-mini', 'gpt-4.1-mini']
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase word terms of ``text`` without stopwords, with plural 's' stripped."""
+    terms = []
+    for token in _TOKEN_RE.findall(text.lower()):
+        if token in _STOPWORDS:
+            continue
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        terms.append(token)
+    return terms
+
+
+@dataclass
+class IndexedIcon:
+    id: int
+    church_id: int
+    title: str
+    tags: list[str]
+    title_terms: frozenset
+    length: int
+
+
+class IconIndex:
+    """Inverted BM25 index over icon titles and tags."""
+
+    def __init__(self, icons: list[IndexedIcon], term_frequencies: dict[int, Counter]):
+        self.icons = {icon.id: icon for icon in icons}
+        self._postings = defaultdict(dict)
+        for icon_id, frequencies in term_frequencies.items():
+            for term, frequency in frequencies.items():
+                self._postings[term][icon_id] = frequency
+        self._average_length = (sum(icon.length for icon in icons) / len(icons)) if icons else 0.0
+
+    @classmethod
+    def build(cls, rows) -> "IconIndex":
+        """Build from ``(id, church_id, title, [tag names])`` rows."""
+        icons, term_frequencies = [], {}
+        for icon_id, church_id, title, tags in rows:
+            title_terms = tokenize(title)
+            frequencies = Counter()
+            for term in title_terms:
+                frequencies[term] += TITLE_WEIGHT
+            for tag in tags:
+                frequencies.update(tokenize(tag))
+            term_frequencies[icon_id] = frequencies
+            icons.append(IndexedIcon(
+                id=icon_id, church_id=church_id, title=title, tags=list(tags),
+                title_terms=frozenset(title_terms), length=sum(frequencies.values()),
+            ))
+        return cls(icons, term_frequencies)
+
+    def __len__(self):
+        return len(self.icons)
+
+    def search(self, prompt: str, church_id=None, limit: int = ICON_SHORTLIST_SIZE, icon_ids=None) -> list[tuple[int, float]]:
+        """Best ``(icon_id, score)`` pairs for ``prompt``, highest score first.
+
+        Args:
+            prompt: Free-text request or feast name
+            church_id: Only consider icons of this church
+            limit: Maximum number of results
+            icon_ids: Only consider these icons
+        """
+        document_count = len(self.icons)
+        scores = defaultdict(float)
+        for term in set(tokenize(prompt)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (document_count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for icon_id, frequency in postings.items():
+                icon = self.icons[icon_id]
+                if church_id is not None and icon.church_id != church_id:
+                    continue
+                if icon_ids is not None and icon_id not in icon_ids:
+                    continue
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * icon.length / (self._average_length or 1))
+                scores[icon_id] += idf * frequency * (BM25_K1 + 1) / (frequency + norm)
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return ranked[:limit]
+
+    def catalog(self, church_id=None) -> list[IndexedIcon]:
+        """All indexed icons (of a church), newest first like the Icon default ordering."""
+        icons = [icon for icon in self.icons.values() if church_id is None or icon.church_id == church_id]
+        return sorted(icons, key=lambda icon: -icon.id)
+
+
+_index = None
+_index_version = None
+_index_lock = threading.Lock()
+
+
+def _load_rows():
+    tags = defaultdict(list)
+    for icon_id, tag_name in Icon.tags.through.objects.filter(
+        content_type__app_label='icons', content_type__model='icon',
+    ).values_list('object_id', 'tag__name'):
+        tags[icon_id].append(tag_name)
+    return [
+        (icon_id, church_id, title, tags.get(icon_id, []))
+        for icon_id, church_id, title in Icon.objects.values_list('id', 'church_id', 'title')
+    ]
+
+
+def get_icon_index() -> IconIndex:
+    """The process-wide icon index, rebuilt if the icon catalog changed."""
+    global _index, _index_version
+
+    version = get_content_version('icons')
+    with _index_lock:
+        if _index is None or _index_version != version:
+            _index = IconIndex.build(_load_rows())
+            _index_version = version
+            logger.debug("Built icon index with %d icons (version %s)", len(_index), version)
+        return _index
+
+
+def simple_match_icons(icons, prompt, max_results):
+    """Lexical matching of ``prompt`` against the given icons, best first."""
+    icon_ids = {icon.id for icon in icons}
+    return [icon_id for icon_id, _ in get_icon_index().search(prompt, limit=max_results, icon_ids=icon_ids)]
+
+
+def _exact_title_match(index: IconIndex, prompt: str, shortlist: list[tuple[int, float]]):
+    """The shortlisted icon whose title has exactly the prompt's terms, if only one has."""
+    prompt_terms = frozenset(tokenize(prompt))
+    if not prompt_terms:
+        return None
+    exact = [icon_id for icon_id, _ in shortlist if index.icons[icon_id].title_terms == prompt_terms]
+    return exact[0] if len(exact) == 1 else None
+
+
+def _parse_llm_response(llm_response: str, max_results: int) -> list[dict]:
+    # Try to parse as JSON array
+    try:
+        parsed_response = json.loads(llm_response)
+        if not isinstance(parsed_response, list):
+            parsed_response = [parsed_response]
+
+        # Handle new format: array of objects with 'id' and 'confidence'
+        matched_results = []
+        valid_confidence_levels = {'high', 'medium', 'low'}
+        for item in parsed_response:
+            if isinstance(item, dict):
+                # New format: {"id": 3, "confidence": "high"}
+                if 'id' in item:
+                    confidence = item.get('confidence', 'medium')
+                    # Validate confidence level
+                    if confidence not in valid_confidence_levels:
+                        logger.warning(f"Invalid confidence '{confidence}', defaulting to 'medium'")
+                        confidence = 'medium'
+                    matched_results.append({
+                        'id': int(item['id']),
+                        'confidence': confidence
+                    })
+            elif isinstance(item, (int, str)):
+                # Backward compatibility: just an ID
+                matched_results.append({
+                    'id': int(item),
+                    'confidence': 'medium'  # Default if not provided
+                })
+
+        # Limit to max_results
+        return matched_results[:max_results]
+
+    except json.JSONDecodeError:
+        # Fallback: extract numbers from response
+        matched_ids = [int(x) for x in re.findall(r'\d+', llm_response)]
+        return [
+            {'id': icon_id, 'confidence': 'medium'}
+            for icon_id in matched_ids[:max_results]
+        ]
+
+
+def _create_completion(client, user_message):
+    """Run the request on the first available model of LLM_MODELS."""
+    from openai import APIError
+
+    last_error = None
+    for model in LLM_MODELS:
+        try:
+            response = client.chat.completions.create(
+                model=model,
+                messages=[
+                    {"role": "system", "content": SYSTEM_PROMPT},
+                    {"role": "user", "content": user_message},
+                ],
+                max_completion_tokens=500
+            )
+            logger.info(f"Successfully used model: {model}")
+            return response
+        except APIError as api_error:
+            last_error = api_error
+            error_body = getattr(api_error, 'body', {}) or {}
+            error_code = error_body.get('error', {}).get('code', '')
+            error_message = str(api_error)
+
+            # Check if it's a model access error (403 or model_not_found)
+            if api_error.status_code == 403 or 'model_not_found' in error_code or 'does not have access' in error_message:
+                logger.warning(f"Model {model} not available (status: {api_error.status_code}), trying next model...")
+                continue
+            raise
+        except Exception as model_error:
+            last_error = model_error
+            error_str = str(model_error)
+            # Check if it's a model access error
+            if 'model_not_found' in error_str or 'does not have access' in error_str:
+                logger.warning(f"Model {model} not available, trying next model...")
+                continue
+            raise
+    raise last_error if last_error else Exception("No models available")
+
+
+def rerank_with_llm(candidates: list[IndexedIcon], prompt: str, max_results: int) -> list[dict]:
+    """Ask the LLM which of ``candidates`` match ``prompt``.
+
+    Returns a list of dicts with 'id' and 'confidence' keys.
+    """
+    from openai import OpenAI
+
+    icon_descriptions = [
+        f"Icon ID: {icon.id}, Title: {icon.title}, Tags: {', '.join(icon.tags)}"
+        for icon in candidates
+    ]
+    allowed_ids = [icon.id for icon in candidates]
+
+    user_message = f"""User request: "{prompt}"
+Allowed icon IDs: {allowed_ids}
+
+Available icons (ID, Title, Tags):
+{chr(10).join(icon_descriptions)}
+
+Return up to {max_results} most relevant icons as a JSON array of objects with "id" and "confidence" fields."""
+
+    client = OpenAI(api_key=settings.OPENAI_API_KEY)
+    response = _create_completion(client, user_message)
+    return _parse_llm_response(response.choices[0].message.content.strip(), max_results)
+
+
+def _match_icons_uncached(prompt: str, church_id, max_results: int) -> tuple[list[dict], bool]:
+    """Match ``prompt`` to icons; also returns whether the result may be cached."""
+    index = get_icon_index()
+    shortlist = index.search(prompt, church_id=church_id)
+    lexical_results = [{'id': icon_id, 'confidence': 'medium'} for icon_id, _ in shortlist[:max_results]]
+
+    exact_id = _exact_title_match(index, prompt, shortlist)
+    if exact_id is not None:
+        logger.info("Exact title match for %r, skipping the LLM", prompt)
+        others = [result for result in lexical_results if result['id'] != exact_id]
+        return ([{'id': exact_id, 'confidence': 'high'}] + others)[:max_results], True
+
+    if not settings.OPENAI_API_KEY:
+        logger.warning("OPENAI_API_KEY not configured, falling back to simple tag matching")
+        return lexical_results, False
+
+    candidates = [index.icons[icon_id] for icon_id, _ in shortlist] or index.catalog(church_id)
+    if not candidates:
+        return [], True
+    try:
+        return rerank_with_llm(candidates, prompt, max_results), True
+    except Exception as e:
+        logger.error(f"Error in LLM icon matching: {e}", exc_info=True)
+        return lexical_results, False
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Casefolded words of ``prompt``, so spacing and punctuation share cache entries."""
+    return " ".join(_TOKEN_RE.findall(prompt.casefold()))
+
+
+def _match_cache_key(prompt: str, church_id, depth: int) -> str:
+    digest = hashlib.sha256(normalize_prompt(prompt).encode()).hexdigest()[:32]
+    church = church_id if church_id is not None else 'all'
+    return f"bahk:icon_match:{get_content_version('icons')}:{church}:{depth}:{digest}"
+
+
+def _cache_depth(max_results: int) -> int:
+    return max(max_results, ICON_MATCH_CACHE_DEPTH)
+
+
+def _record_cache_lookup(outcome: str) -> None:
+    key = f"bahk:icon_match_cache:{outcome}"
+    cache.add(key, 0, None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Evicted between add and incr
+        cache.set(key, 1, None)
+
+
+def icon_match_cache_stats() -> dict:
+    """Hit/miss counts of the icon match cache since the last reset."""
+    counts = cache.get_many(["bahk:icon_match_cache:hits", "bahk:icon_match_cache:misses"])
+    hits = counts.get("bahk:icon_match_cache:hits", 0)
+    misses = counts.get("bahk:icon_match_cache:misses", 0)
+    lookups = hits + misses
+    return {"hits": hits, "misses": misses, "hit_rate": round(hits / lookups, 3) if lookups else None}
+
+
+def reset_icon_match_cache_stats() -> None:
+    cache.delete_many(["bahk:icon_match_cache:hits", "bahk:icon_match_cache:misses"])
+
+
+def is_icon_match_cached(prompt: str, church_id=None, max_results: int = 3) -> bool:
+    """Whether ``match_icons`` would answer from the cache (not counted as a lookup)."""
+    return cache.get(_match_cache_key(prompt, church_id, _cache_depth(max_results))) is not None
+
+
+def match_icons(prompt: str, church_id=None, max_results: int = 3, use_cache: bool = True) -> list[dict]:
+    """Match ``prompt`` to icons, best first.
+
+    The index shortlists up to ICON_SHORTLIST_SIZE icons.  An exact title
+    match is returned with high confidence without asking the LLM; otherwise
+    the LLM re-ranks the shortlist (or the whole catalog when nothing matches
+    lexically, so purely semantic requests still work).  Without an API key,
+    or if the LLM fails, the shortlist order is used.
+
+    Results are cached for ICON_MATCH_CACHE_TTL seconds, or until the icon
+    catalog changes.  At least ICON_MATCH_CACHE_DEPTH matches are computed
+    so requests for fewer matches share the entry.  Fallback results are not
+    cached.  With ``use_cache=False`` the match is recomputed and replaces
+    the cached entry.
+
+    Args:
+        prompt: Free-text request or feast name
+        church_id: Only match icons of this church
+        max_results: Maximum number of matches
+        use_cache: If False, skip the cached result and refresh it
+
+    Returns:
+        A list of dicts with 'id' and 'confidence' keys
+    """
+    depth = _cache_depth(max_results)
+    cache_key = _match_cache_key(prompt, church_id, depth)
+    if use_cache:
+        results = cache.get(cache_key)
+        if results is not None:
+            _record_cache_lookup("hits")
+            return results[:max_results]
+        _record_cache_lookup("misses")
+
+    results, cacheable = _match_icons_uncached(prompt, church_id, depth)
+    if cacheable:
+        cache.set(cache_key, results, getattr(settings, 'ICON_MATCH_CACHE_TTL', 60 * 60 * 24 * 7))
+    return results[:max_results]
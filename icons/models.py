@@ -2,14 +2,13 @@
 import logging
 
 from django.db import models
-from django.utils import timezone
 from imagekit.models import ImageSpecField
 from imagekit.processors import ResizeToFit
 from model_utils.tracker import FieldTracker
 from taggit.managers import TaggableManager
 
-from hub.constants import DAYS_TO_CACHE_THUMBNAIL
 from hub.models import Church
+from hub.services.thumbnail_service import sync_thumbnail
 from icons.utils import icon_image_upload_path
 
 logger = logging.getLogger(__name__)
@@ -70,50 +69,8 @@ class Icon(models.Model):
         
         super().save(**kwargs)
         
-        # Handle thumbnail URL caching after the instance and image are fully saved to S3
-        if self.image:
-            # Update cache if:
-            # 1. No cached URL exists
-            # 2. Image was changed/uploaded
-            # 3. Cache is older than 7 days
-            should_update_cache = (
-                not self.cached_thumbnail_url
-                or is_new_image
-                or (
-                    self.cached_thumbnail_updated
-                    and (timezone.now() - self.cached_thumbnail_updated).days
-                    >= DAYS_TO_CACHE_THUMBNAIL
-                )
-            )
-            
-            if should_update_cache:
-                try:
-                    # Force generation of the thumbnail and wait for S3 upload
-                    thumbnail = self.thumbnail.generate()
-                    
-                    # Get the S3 URL after the file has been uploaded
-                    self.cached_thumbnail_url = self.thumbnail.url
-                    self.cached_thumbnail_updated = timezone.now()
-                    
-                    # Save again to update the cache fields only
-                    super().save(
-                        update_fields=[
-                            'cached_thumbnail_url',
-                            'cached_thumbnail_updated',
-                        ]
-                    )
-                except Exception as e:
-                    logger.error(
-                        f'Error caching S3 thumbnail URL for Icon {self.id}: {e}'
-                    )
-        else:
-            # Clear cached URL if image is removed
-            if self.cached_thumbnail_url or self.cached_thumbnail_updated:
-                self.cached_thumbnail_url = None
-                self.cached_thumbnail_updated = None
-                super().save(
-                    update_fields=['cached_thumbnail_url', 'cached_thumbnail_updated']
-                )
+        # Thumbnails are generated in the background (see hub.services.thumbnail_service)
+        sync_thumbnail(self, image_changed=is_new_image)
 
 
 class IconFeedback(models.Model):
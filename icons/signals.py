@@ -0,0 +1,26 @@
+"""Signals keeping the icon match index (see icons.matching) current."""
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from taggit.models import Tag
+
+from hub.utils import bump_content_version
+from icons.models import Icon
+
+
+@receiver(post_save, sender=Icon)
+@receiver(post_delete, sender=Icon)
+def bump_icons_content_version(sender, **kwargs):
+    bump_content_version('icons')
+
+
+@receiver(m2m_changed, sender=Icon.tags.through)
+def bump_icons_version_on_retag(sender, instance, action, **kwargs):
+    if isinstance(instance, Icon) and action in ('post_add', 'post_remove', 'post_clear'):
+        bump_content_version('icons')
+
+
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+def bump_icons_version_on_tag_change(sender, **kwargs):
+    # A renamed or deleted tag changes the terms of every icon carrying it
+    bump_content_version('icons')
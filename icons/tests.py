@@ -1,11 +1,21 @@
 """Tests for the icons app."""
 
+from types import SimpleNamespace
+from unittest.mock import patch
+
 from django.test import TestCase, override_settings
 from django.core.files.uploadedfile import SimpleUploadedFile
 from rest_framework.test import APITestCase
 from rest_framework import status
 
 from hub.models import Church
+from icons.matching import (
+    IconIndex,
+    get_icon_index,
+    icon_match_cache_stats,
+    match_icons,
+    reset_icon_match_cache_stats,
+)
 from icons.models import Icon, IconFeedback
 
 
@@ -346,3 +356,143 @@ class IconFeedbackAPITests(APITestCase):
                 format='json'
             )
             self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+
+class IconIndexTests(TestCase):
+    """Tests for the BM25 icon index and LLM re-ranking of its shortlist."""
+
+    def setUp(self):
+        self.church = Church.objects.create(name="Test Church")
+
+    def _icon(self, title, tags=(), church=None):
+        icon = Icon.objects.create(
+            title=title,
+            church=church or self.church,
+            image=SimpleUploadedFile(name='icon.jpg', content=b'fake image content', content_type='image/jpeg'),
+        )
+        if tags:
+            icon.tags.add(*tags)
+        return icon
+
+    def test_search_ranks_title_terms_above_tag_terms(self):
+        index = IconIndex.build([
+            (1, 1, "Nativity of Christ", ["christmas", "bethlehem"]),
+            (2, 1, "Adoration of the Magi", ["nativity", "magi"]),
+            (3, 1, "Resurrection", ["easter", "pascha"]),
+        ])
+
+        self.assertEqual([icon_id for icon_id, _ in index.search("The Nativity")], [1, 2])
+        self.assertEqual([icon_id for icon_id, _ in index.search("Easter Sunday")], [3])
+        self.assertEqual(index.search("Nativity", church_id=2), [])
+        self.assertEqual(index.search("Holy Icon"), [])
+
+    def test_index_is_rebuilt_when_an_icon_is_retagged(self):
+        icon = self._icon("Saint Vartan", tags=["martyr"])
+        self.assertEqual(get_icon_index().search("Avarayr"), [])
+
+        icon.tags.add("avarayr")
+
+        self.assertEqual([icon_id for icon_id, _ in get_icon_index().search("Avarayr")], [icon.id])
+
+    @override_settings(OPENAI_API_KEY='test-key')
+    @patch('icons.matching.rerank_with_llm')
+    def test_exact_title_match_skips_the_llm(self, mock_rerank):
+        icon = self._icon("Holy Cross", tags=["exaltation"])
+        self._icon("Cross of Varag", tags=["cross"])
+
+        results = match_icons("The Holy Cross", church_id=self.church.id)
+
+        mock_rerank.assert_not_called()
+        self.assertEqual(results[0], {'id': icon.id, 'confidence': 'high'})
+
+    @override_settings(OPENAI_API_KEY='test-key')
+    @patch('openai.OpenAI')
+    def test_llm_only_sees_the_shortlist(self, mock_openai):
+        baptism = self._icon("Baptism of Christ", tags=["theophany", "jordan"])
+        nativity = self._icon("Nativity of Christ", tags=["theophany", "christmas"])
+        unrelated = self._icon("Saint Gregory the Illuminator", tags=["khor virap"])
+        create = mock_openai.return_value.chat.completions.create
+        create.return_value = SimpleNamespace(choices=[SimpleNamespace(
+            message=SimpleNamespace(content=f'[{{"id": {baptism.id}, "confidence": "high"}}]'),
+        )])
+
+        results = match_icons("Theophany at the Jordan", church_id=self.church.id)
+
+        self.assertEqual(results, [{'id': baptism.id, 'confidence': 'high'}])
+        user_message = create.call_args.kwargs['messages'][1]['content']
+        self.assertIn(f"Icon ID: {nativity.id},", user_message)
+        self.assertNotIn(f"Icon ID: {unrelated.id},", user_message)
+
+    def test_without_api_key_the_shortlist_is_returned(self):
+        icon = self._icon("Theophany", tags=["baptism"])
+        self._icon("Theophany", church=Church.objects.create(name="Other Church"))
+
+        results = match_icons("Baptism of the Lord", church_id=self.church.id)
+
+        self.assertEqual(results, [{'id': icon.id, 'confidence': 'medium'}])
+
+
+@override_settings(OPENAI_API_KEY='test-key')
+@patch('icons.matching.rerank_with_llm')
+class IconMatchCacheTests(TestCase):
+    """Tests for caching icon match results."""
+
+    def setUp(self):
+        self.church = Church.objects.create(name="Test Church")
+        self.icon = Icon.objects.create(
+            title="Baptism of Christ",
+            church=self.church,
+            image=SimpleUploadedFile(name='icon.jpg', content=b'fake image content', content_type='image/jpeg'),
+        )
+        self.icon.tags.add("theophany")
+        reset_icon_match_cache_stats()
+
+    def test_repeated_prompt_is_served_from_the_cache(self, mock_rerank):
+        mock_rerank.return_value = [{'id': self.icon.id, 'confidence': 'high'}]
+
+        first = match_icons("Theophany of our Lord", church_id=self.church.id)
+        second = match_icons("  theophany of our LORD! ", church_id=self.church.id, max_results=1)
+
+        self.assertEqual(first, second)
+        mock_rerank.assert_called_once()
+        self.assertEqual(icon_match_cache_stats(), {'hits': 1, 'misses': 1, 'hit_rate': 0.5})
+
+    def test_church_filter_is_part_of_the_key(self, mock_rerank):
+        mock_rerank.return_value = [{'id': self.icon.id, 'confidence': 'high'}]
+
+        match_icons("Theophany of our Lord", church_id=self.church.id)
+        match_icons("Theophany of our Lord")
+
+        self.assertEqual(mock_rerank.call_count, 2)
+
+    def test_retagging_an_icon_invalidates_cached_matches(self, mock_rerank):
+        mock_rerank.return_value = [{'id': self.icon.id, 'confidence': 'high'}]
+        match_icons("Theophany of our Lord", church_id=self.church.id)
+
+        self.icon.tags.add("jordan")
+        match_icons("Theophany of our Lord", church_id=self.church.id)
+
+        self.assertEqual(mock_rerank.call_count, 2)
+
+    def test_refresh_recomputes_and_replaces_the_cached_match(self, mock_rerank):
+        mock_rerank.return_value = [{'id': self.icon.id, 'confidence': 'medium'}]
+        match_icons("Theophany of our Lord", church_id=self.church.id)
+
+        mock_rerank.return_value = [{'id': self.icon.id, 'confidence': 'high'}]
+        refreshed = match_icons("Theophany of our Lord", church_id=self.church.id, use_cache=False)
+
+        self.assertEqual(refreshed, [{'id': self.icon.id, 'confidence': 'high'}])
+        self.assertEqual(match_icons("Theophany of our Lord", church_id=self.church.id), refreshed)
+        self.assertEqual(mock_rerank.call_count, 2)
+        self.assertEqual(icon_match_cache_stats(), {'hits': 1, 'misses': 1, 'hit_rate': 0.5})
+
+    def test_fallback_results_are_not_cached(self, mock_rerank):
+        mock_rerank.side_effect = RuntimeError("LLM down")
+
+        self.assertEqual(
+            match_icons("Theophany of our Lord", church_id=self.church.id),
+            [{'id': self.icon.id, 'confidence': 'medium'}],
+        )
+        match_icons("Theophany of our Lord", church_id=self.church.id)
+
+        self.assertEqual(mock_rerank.call_count, 2)
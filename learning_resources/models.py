@@ -4,12 +4,10 @@ from django.contrib.contenttypes.models import ContentType
 from django.contrib.contenttypes.fields import GenericForeignKey
 from imagekit.models import ImageSpecField
 from imagekit.processors import ResizeToFill
-from django.utils import timezone
-import logging
 from s3_file_field.fields import S3FileField
 from modeltrans.fields import TranslationField
 
-from learning_resources.constants import DAYS_TO_CACHE_THUMBNAIL
+from hub.services.thumbnail_service import sync_thumbnail
 from learning_resources.utils import (
     video_upload_path,
     video_thumbnail_upload_path,
@@ -85,27 +83,8 @@ class Video(models.Model):
         # Call the parent save method
         super().save(*args, **kwargs)
         
-        if self.thumbnail:
-            should_update_cache = (
-                not self.cached_thumbnail_url or
-                is_new_image or
-                (self.cached_thumbnail_updated and 
-                 timezone.now() - self.cached_thumbnail_updated > timezone.timedelta(days=DAYS_TO_CACHE_THUMBNAIL))
-            )
-            
-            if should_update_cache:
-                try:
-                    thumbnail = self.thumbnail_small.generate()
-                    self.cached_thumbnail_url = self.thumbnail_small.url
-                    self.cached_thumbnail_updated = timezone.now()
-                    super().save(update_fields=['cached_thumbnail_url', 'cached_thumbnail_updated'])
-                except Exception as e:
-                    logging.error(f"Error caching S3 thumbnail URL for Video {self.id}: {e}")
-        else:
-            if self.cached_thumbnail_url or self.cached_thumbnail_updated:
-                self.cached_thumbnail_url = None
-                self.cached_thumbnail_updated = None
-                super().save(update_fields=['cached_thumbnail_url', 'cached_thumbnail_updated'])
+        # Thumbnails are generated in the background (see hub.services.thumbnail_service)
+        sync_thumbnail(self, image_changed=is_new_image)
 
     def __str__(self):
         return self.title
@@ -172,38 +151,8 @@ class Article(models.Model):
         # Call the parent save method
         super().save(*args, **kwargs)
         
-        # Handle thumbnail URL caching after the instance and image are fully saved to S3
-        if self.image:
-            # Update cache if:
-            # 1. No cached URL exists
-            # 2. New image was uploaded
-            # 3. Cache is older than 7 days
-            should_update_cache = (
-                not self.cached_thumbnail_url or
-                is_new_image or
-                (self.cached_thumbnail_updated and 
-                 timezone.now() - self.cached_thumbnail_updated > timezone.timedelta(days=DAYS_TO_CACHE_THUMBNAIL))
-            )
-            
-            if should_update_cache:
-                try:
-                    # Force generation of the thumbnail and wait for S3 upload
-                    thumbnail = self.thumbnail.generate()
-                    
-                    # Get the S3 URL after the file has been uploaded
-                    self.cached_thumbnail_url = self.thumbnail.url
-                    self.cached_thumbnail_updated = timezone.now()
-                    
-                    # Save again to update the cache fields only
-                    super().save(update_fields=['cached_thumbnail_url', 'cached_thumbnail_updated'])
-                except Exception as e:
-                    logging.error(f"Error caching S3 thumbnail URL for Article {self.id}: {e}")
-        else:
-            # Clear cached URL if image is removed
-            if self.cached_thumbnail_url or self.cached_thumbnail_updated:
-                self.cached_thumbnail_url = None
-                self.cached_thumbnail_updated = None
-                super().save(update_fields=['cached_thumbnail_url', 'cached_thumbnail_updated'])
+        # Thumbnails are generated in the background (see hub.services.thumbnail_service)
+        sync_thumbnail(self, image_changed=is_new_image)
 
     def __str__(self):
         return self.title
@@ -258,38 +207,8 @@ class Recipe(models.Model):
         is_new_image = 'image' in kwargs.get('update_fields', []) if kwargs.get('update_fields') else self._state.adding
         super().save(**kwargs)
 
-        # Handle thumbnail URL caching after the instance and image are fully saved to S3
-        if self.image:
-            # Update cache if:
-            # 1. No cached URL exists
-            # 2. New image was uploaded
-            # 3. Cache is older than 7 days
-            should_update_cache = (
-                not self.cached_thumbnail_url or
-                is_new_image or
-                (self.cached_thumbnail_updated and
-                 (timezone.now() - self.cached_thumbnail_updated).days >= DAYS_TO_CACHE_THUMBNAIL)
-            )
-
-            if should_update_cache:
-                try:
-                    # Force generation of the thumbnail and wait for S3 upload
-                    thumbnail = self.thumbnail.generate()
-
-                    # Get the S3 URL after the file has been uploaded
-                    self.cached_thumbnail_url = self.thumbnail.url
-                    self.cached_thumbnail_updated = timezone.now()
-
-                    # Save again to update the cache fields only
-                    super().save(update_fields=['cached_thumbnail_url', 'cached_thumbnail_updated'])
-                except Exception as e:
-                    logging.error(f"Error caching S3 thumbnail URL for Recipe {self.id}: {e}")
-        else:
-            # Clear cached URL if image is removed
-            if self.cached_thumbnail_url or self.cached_thumbnail_updated:
-                self.cached_thumbnail_url = None
-                self.cached_thumbnail_updated = None
-                super().save(update_fields=['cached_thumbnail_url', 'cached_thumbnail_updated'])
+        # Thumbnails are generated in the background (see hub.services.thumbnail_service)
+        sync_thumbnail(self, image_changed=is_new_image)
 
     def __str__(self):
         return self.title
@@ -374,14 +293,7 @@ class Bookmark(models.Model):
             if hasattr(content, 'video') and content.video:
                 representation['title'] = content.video.title
                 representation['description'] = content.video.description
-                # Handle thumbnail URL with proper error handling
-                try:
-                    representation['thumbnail_url'] = (
-                        content.video.cached_thumbnail_url or
-                        (content.video.thumbnail_small.url if content.video.thumbnail else None)
-                    )
-                except (AttributeError, ValueError, OSError):
-                    representation['thumbnail_url'] = None
+                representation['thumbnail_url'] = content.video.cached_thumbnail_url or None
             else:
                 # Fallback to devotional's own information
                 representation['title'] = getattr(content, 'title', f'Devotional {content.id}')
@@ -58,18 +58,7 @@ class VideoSerializer(BookmarkOptimizedSerializerMixin, serializers.ModelSeriali
         read_only_fields = ['created_at', 'updated_at', 'is_bookmarked']
 
     def get_thumbnail_small_url(self, obj):
-        if obj.thumbnail:
-            # Try to get/update cached URL
-            cached_url = self.update_thumbnail_cache(obj, 'thumbnail', 'thumbnail_small')
-            if cached_url:
-                return cached_url
-            
-            # Fall back to direct thumbnail URL if caching fails
-            try:
-                return obj.thumbnail_small.url
-            except Exception:
-                return None
-        return None
+        return self.get_cached_thumbnail_url(obj)
 
     def to_representation(self, instance):
         lang = self.context.get('lang') or (self.context.get('request').query_params.get('lang') if self.context.get('request') else None) or 'en'
@@ -92,18 +81,7 @@ class ArticleSerializer(BookmarkOptimizedSerializerMixin, serializers.ModelSeria
         read_only_fields = ['created_at', 'updated_at', 'is_bookmarked']
 
     def get_thumbnail_url(self, obj):
-        if obj.image:
-            # Try to get/update cached URL
-            cached_url = self.update_thumbnail_cache(obj, 'image', 'thumbnail')
-            if cached_url:
-                return cached_url
-            
-            # Fall back to direct thumbnail URL if caching fails
-            try:
-                return obj.thumbnail.url
-            except Exception:
-                return None
-        return None 
+        return self.get_cached_thumbnail_url(obj)
     
     def to_representation(self, instance):
         lang = self.context.get('lang') or (self.context.get('request').query_params.get('lang') if self.context.get('request') else None) or 'en'
@@ -154,18 +132,7 @@ class DevotionalSetSerializer(BookmarkOptimizedSerializerMixin, serializers.Mode
         read_only_fields = ['created_at', 'updated_at', 'is_bookmarked']
 
     def get_thumbnail_url(self, obj):
-        if obj.image:
-            # Try to get/update cached URL
-            cached_url = self.update_thumbnail_cache(obj, 'image', 'thumbnail')
-            if cached_url:
-                return cached_url
-            
-            # Fall back to direct thumbnail URL if caching fails
-            try:
-                return obj.thumbnail.url
-            except (AttributeError, ValueError, OSError):
-                return None
-        return None
+        return self.get_cached_thumbnail_url(obj)
 
     def to_representation(self, instance):
         lang = self.context.get('lang') or (self.context.get('request').query_params.get('lang') if self.context.get('request') else None) or 'en'
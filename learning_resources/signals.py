@@ -20,6 +20,7 @@ from django.contrib.contenttypes.models import ContentType
 from django.conf import settings
 from .models import Bookmark, Video, Article, Recipe
 from .cache import BookmarkCacheManager
+from hub.utils import bump_content_version
 
 # Import from hub app for DevotionalSet
 try:
@@ -51,6 +52,7 @@ def bookmark_created_signal(sender, instance, created, **kwargs):
             content_type=instance.content_type,
             object_id=instance.object_id
         )
+        bump_content_version(f"bookmarks:{instance.user_id}")
         logger.debug(f"Signal: Bookmark created for user {instance.user.id}, "
                     f"content_type {instance.content_type.id}, object {instance.object_id}")
 
@@ -68,6 +70,7 @@ def bookmark_deleted_signal(sender, instance, **kwargs):
         content_type=instance.content_type,
         object_id=instance.object_id
     )
+    bump_content_version(f"bookmarks:{instance.user_id}")
     logger.debug(f"Signal: Bookmark deleted for user {instance.user.id}, "
                 f"content_type {instance.content_type.id}, object {instance.object_id}")
 
@@ -214,4 +217,28 @@ if Reading:
     @receiver(post_delete, sender=Reading)
     def reading_deleted_signal(sender, instance, **kwargs):
         """Clean up bookmarks when a reading is deleted."""
-        cleanup_orphaned_bookmarks(sender, instance, **kwargs)
\ No newline at end of file
+        cleanup_orphaned_bookmarks(sender, instance, **kwargs)
+
+
+# Content version bumps: learning resource list responses are revalidated with
+# ETags derived from these versions (see LearningResourceConditionalGetMixin)
+@receiver(post_save, sender=Video)
+@receiver(post_delete, sender=Video)
+def bump_video_content_versions(sender, **kwargs):
+    """Videos are listed directly and embedded in devotionals."""
+    bump_content_version('learning_resources', 'devotionals')
+
+
+@receiver(post_save, sender=Article)
+@receiver(post_delete, sender=Article)
+@receiver(post_save, sender=Recipe)
+@receiver(post_delete, sender=Recipe)
+def bump_learning_resources_content_version(sender, **kwargs):
+    bump_content_version('learning_resources')
+
+
+if DevotionalSet:
+    @receiver(post_save, sender=DevotionalSet)
+    @receiver(post_delete, sender=DevotionalSet)
+    def bump_devotional_set_content_version(sender, **kwargs):
+        bump_content_version('learning_resources')
@@ -13,6 +13,9 @@ from .serializers import (
 )
 from .cache import BookmarkCacheManager
 from hub.models import DevotionalSet
+from hub.services import search_service
+from hub.utils import get_content_version
+from hub.views.mixins import ConditionalGetMixin
 from django.utils.translation import activate, get_language_from_request
 
 
@@ -84,7 +87,25 @@ class BookmarkOptimizedMixin:
         return obj
 
 
-class VideoListView(BookmarkOptimizedMixin, generics.ListAPIView):
+class LearningResourceConditionalGetMixin(ConditionalGetMixin):
+    """
+    Conditional GET for learning resource lists.
+
+    The ETag follows the learning resources content version; for authenticated
+    users it also follows their bookmarks version, since each item carries an
+    ``is_bookmarked`` flag.
+    """
+
+    conditional_scopes = ('learning_resources',)
+
+    def get_conditional_user_key(self):
+        user = self.request.user
+        if not user.is_authenticated:
+            return 'anon'
+        return f"{user.id}:{get_content_version(f'bookmarks:{user.id}')}"
+
+
+class VideoListView(LearningResourceConditionalGetMixin, BookmarkOptimizedMixin, generics.ListAPIView):
     """
     API endpoint that allows videos to be viewed.
 
@@ -93,8 +114,8 @@ class VideoListView(BookmarkOptimizedMixin, generics.ListAPIView):
         - POST/PUT/PATCH/DELETE: Not supported
 
     Query Parameters:
-        - search (str): Optional. Filter videos by matching text in title or description.
-                       Case-insensitive partial matches are supported.
+        - search (str): Optional. Filter videos by matching words in title or description.
+                       Words match as prefixes; best matches first.
         - category (str): Optional. Filter videos by category ('general', 'devotional', 'tutorial').
                          Defaults to 'general' if not specified.
 
@@ -141,18 +162,17 @@ class VideoListView(BookmarkOptimizedMixin, generics.ListAPIView):
         queryset = queryset.filter(category=category)
         
         # Apply search filter if provided
-        if search is not None:
-            queryset = queryset.filter(
-                Q(title__icontains=search) |
-                Q(description__icontains=search)
-            )
+        if search:
+            queryset = search_service.search(queryset, search)
         # Video language-specific filtering if provided
         language_code = self.request.query_params.get('language_code')
         if language_code:
             queryset = queryset.filter(language_code=language_code)
+        if search:
+            return queryset.order_by('-search_rank', '-created_at')
         return queryset.order_by('-created_at')
 
-class ArticleListView(BookmarkOptimizedMixin, generics.ListAPIView):
+class ArticleListView(LearningResourceConditionalGetMixin, BookmarkOptimizedMixin, generics.ListAPIView):
     """
     API endpoint that allows articles to be viewed.
 
@@ -161,8 +181,8 @@ class ArticleListView(BookmarkOptimizedMixin, generics.ListAPIView):
         - POST/PUT/PATCH/DELETE: Not supported
 
     Query Parameters:
-        - search (str): Optional. Filter articles by matching text in title or body.
-                       Case-insensitive partial matches are supported.
+        - search (str): Optional. Filter articles by matching words in title or body.
+                       Words match as prefixes; best matches first.
 
     Returns:
         A JSON response with the following structure:
@@ -196,15 +216,12 @@ class ArticleListView(BookmarkOptimizedMixin, generics.ListAPIView):
         activate(lang)
         queryset = Article.objects.all()
         search = self.request.query_params.get('search', None)
-        if search is not None:
-            queryset = queryset.filter(
-                Q(title__icontains=search) |
-                Q(body__icontains=search)
-            )
+        if search:
+            return search_service.search(queryset, search).order_by('-search_rank', '-created_at')
         return queryset.order_by('-created_at')
 
 
-class RecipeListView(BookmarkOptimizedMixin, generics.ListAPIView):
+class RecipeListView(LearningResourceConditionalGetMixin, BookmarkOptimizedMixin, generics.ListAPIView):
     """
     API endpoint that allows recipes to be viewed.
 
@@ -213,8 +230,8 @@ class RecipeListView(BookmarkOptimizedMixin, generics.ListAPIView):
         - POST/PUT/PATCH/DELETE: Not supported
 
     Query Parameters:
-        - search (str): Optional. Filter recipes by matching text in title, body, or ingredients.
-                       Case-insensitive partial matches are supported.
+        - search (str): Optional. Filter recipes by matching words in title, description,
+                       ingredients or directions. Words match as prefixes; best matches first.
 
     Returns:
         A JSON response with the following structure:
@@ -252,12 +269,8 @@ class RecipeListView(BookmarkOptimizedMixin, generics.ListAPIView):
         activate(lang)
         queryset = Recipe.objects.all()
         search = self.request.query_params.get('search', None)
-        if search is not None:
-            queryset = queryset.filter(
-                Q(title__icontains=search) |
-                Q(body__icontains=search) |
-                Q(ingredients__icontains=search)
-            )
+        if search:
+            return search_service.search(queryset, search).order_by('-search_rank', '-created_at')
         return queryset.order_by('-created_at')
 
 
@@ -354,7 +367,7 @@ class RecipeDetailView(BookmarkOptimizedMixin, generics.RetrieveAPIView):
     queryset = Recipe.objects.all()
 
 
-class DevotionalSetListView(BookmarkOptimizedMixin, generics.ListAPIView):
+class DevotionalSetListView(LearningResourceConditionalGetMixin, BookmarkOptimizedMixin, generics.ListAPIView):
     """
     API endpoint that allows devotional sets to be viewed.
 
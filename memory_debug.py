@@ -7,6 +7,9 @@ what's causing high memory consumption at worker initialization.
 
 Usage:
     heroku run python memory_debug.py -a yourapp
+
+    # Import time, peak RSS and heavy modules of a web worker start-up, as JSON
+    python memory_debug.py --web [--settings bahk.settings]
 """
 
 import os
@@ -15,6 +18,7 @@ import gc
 import time
 import resource
 import importlib
+import json
 from collections import defaultdict
 
 # --------------- Configuration ---------------
@@ -23,6 +27,10 @@ DJANGO_SETTINGS_MODULE = 'bahk.settings'
 # Set your Celery app module here
 CELERY_APP_MODULE = 'bahk.celery'
 
+# Modules web processes must not load at start-up: they are only needed by
+# the Celery tasks that use them (LLM SDKs, map rendering)
+HEAVY_MODULES = ['anthropic', 'openai', 'numpy', 'shapely', 'geopandas', 'matplotlib', 'sklearn']
+
 # Start with basic memory tracking
 memory_snapshots = []
 module_sizes = defaultdict(float)
@@ -66,120 +74,155 @@ def import_and_track(module_name):
         log_memory(f"Error importing {module_name}: {str(e)}")
         return None
 
-# --------------- Main Script ---------------
-print("\n" + "="*80)
-print(" DJANGO/CELERY MEMORY USAGE PROFILER ")
-print("="*80 + "\n")
-
-# Start tracking from the beginning
-initial_memory = log_memory("Script started")
-
-# Check Python version and environment
-log_memory(f"Python version: {sys.version}")
-log_memory(f"Current working directory: {os.getcwd()}")
-
-# Record environment variables that might affect memory
-env_vars = ["PYTHONPATH", "DJANGO_SETTINGS_MODULE", "NEW_RELIC_CONFIG_FILE", 
-            "NEW_RELIC_ENVIRONMENT", "NEW_RELIC_LICENSE_KEY"]
-for var in env_vars:
-    if var in os.environ:
-        # Mask sensitive values
-        value = os.environ[var]
-        if var == "NEW_RELIC_LICENSE_KEY" and value:
-            value = value[:5] + "..." + value[-5:] if len(value) > 10 else "***"
-        log_memory(f"Environment variable {var}={value}")
-
-# Import core packages
-log_memory("--- Importing core Python packages ---")
-core_modules = ['json', 'requests', 'datetime', 'logging']
-for module in core_modules:
-    import_and_track(module)
-
-# Import and initialize Django
-log_memory("--- Starting Django initialization ---")
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', DJANGO_SETTINGS_MODULE)
-django_module = import_and_track('django')
-
-log_memory("Before django.setup()")
-import django
-django.setup()
-log_memory("After django.setup()", force_gc=True)
-
-# Track memory usage for each Django app
-log_memory("\n--- Django Apps Memory Usage ---")
-for app in django.apps.apps.get_app_configs():
-    if app.name.startswith('django.'):
-        # Skip Django's internal apps to focus on project apps
-        continue
-    
-    log_memory(f"Before importing app: {app.name}")
+def web_import_footprint(settings_module=DJANGO_SETTINGS_MODULE):
+    """Measure what booting a web process costs.
+
+    Sets up Django and imports the URLconf, and with it every view, as a
+    gunicorn worker does.  Run it in a fresh interpreter, since modules
+    imported earlier are not counted.
+
+    Returns:
+        Dict with the import time in seconds, the peak RSS before and after
+        in MB, and the HEAVY_MODULES that were loaded
+    """
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', settings_module)
+    rss_before = get_memory_mb()
+    start = time.perf_counter()
+    import django
+    django.setup()
+    from django.conf import settings
+    importlib.import_module(settings.ROOT_URLCONF)
+    return {
+        'seconds': round(time.perf_counter() - start, 3),
+        'rss_before_mb': round(rss_before, 1),
+        'rss_after_mb': round(get_memory_mb(), 1),
+        'heavy_modules': [name for name in HEAVY_MODULES if name in sys.modules],
+    }
+
+
+def profile_startup():
+    """Log memory usage step by step through Django, app, New Relic and Celery start-up."""
+    print("\n" + "="*80)
+    print(" DJANGO/CELERY MEMORY USAGE PROFILER ")
+    print("="*80 + "\n")
+
+    # Start tracking from the beginning
+    initial_memory = log_memory("Script started")
+
+    # Check Python version and environment
+    log_memory(f"Python version: {sys.version}")
+    log_memory(f"Current working directory: {os.getcwd()}")
+
+    # Record environment variables that might affect memory
+    env_vars = ["PYTHONPATH", "DJANGO_SETTINGS_MODULE", "NEW_RELIC_CONFIG_FILE", 
+                "NEW_RELIC_ENVIRONMENT", "NEW_RELIC_LICENSE_KEY"]
+    for var in env_vars:
+        if var in os.environ:
+            # Mask sensitive values
+            value = os.environ[var]
+            if var == "NEW_RELIC_LICENSE_KEY" and value:
+                value = value[:5] + "..." + value[-5:] if len(value) > 10 else "***"
+            log_memory(f"Environment variable {var}={value}")
+
+    # Import core packages
+    log_memory("--- Importing core Python packages ---")
+    core_modules = ['json', 'requests', 'datetime', 'logging']
+    for module in core_modules:
+        import_and_track(module)
+
+    # Import and initialize Django
+    log_memory("--- Starting Django initialization ---")
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', DJANGO_SETTINGS_MODULE)
+    django_module = import_and_track('django')
+
+    log_memory("Before django.setup()")
+    import django
+    django.setup()
+    log_memory("After django.setup()", force_gc=True)
+
+    # Track memory usage for each Django app
+    log_memory("\n--- Django Apps Memory Usage ---")
+    for app in django.apps.apps.get_app_configs():
+        if app.name.startswith('django.'):
+            # Skip Django's internal apps to focus on project apps
+            continue
+
+        log_memory(f"Before importing app: {app.name}")
+        try:
+            importlib.import_module(app.name)
+            log_memory(f"After importing app: {app.name}", force_gc=True)
+
+            # Try to import common modules in the app
+            for submodule in ['models', 'views', 'admin', 'signals', 'tasks']:
+                try:
+                    submodule_name = f"{app.name}.{submodule}"
+                    import_and_track(submodule_name)
+                except ImportError:
+                    pass
+        except ImportError as e:
+            log_memory(f"Error importing {app.name}: {str(e)}")
+
+    # Check New Relic
+    log_memory("\n--- New Relic Agent Memory Usage ---")
     try:
-        importlib.import_module(app.name)
-        log_memory(f"After importing app: {app.name}", force_gc=True)
-        
-        # Try to import common modules in the app
-        for submodule in ['models', 'views', 'admin', 'signals', 'tasks']:
-            try:
-                submodule_name = f"{app.name}.{submodule}"
-                import_and_track(submodule_name)
-            except ImportError:
-                pass
-    except ImportError as e:
-        log_memory(f"Error importing {app.name}: {str(e)}")
-
-# Check New Relic
-log_memory("\n--- New Relic Agent Memory Usage ---")
-try:
-    new_relic_before = get_memory_mb()
-    import_and_track('newrelic')
-    import newrelic.agent
-    log_memory("Before newrelic.agent.initialize()")
-    newrelic.agent.initialize()
-    log_memory("After newrelic.agent.initialize()", force_gc=True)
-except ImportError:
-    log_memory("New Relic agent not installed")
-except Exception as e:
-    log_memory(f"Error initializing New Relic: {str(e)}")
-
-# Import Celery and related modules
-log_memory("\n--- Celery Memory Usage ---")
-import_and_track('celery')
-try:
-    log_memory(f"Before importing Celery app from {CELERY_APP_MODULE}")
-    celery_app_module = importlib.import_module(CELERY_APP_MODULE)
-    log_memory(f"After importing Celery app", force_gc=True)
-    
-    # Check if 'app' attribute exists in the module
-    if hasattr(celery_app_module, 'app'):
-        log_memory("Before accessing celery app instance")
-        app = celery_app_module.app
-        log_memory("After accessing celery app instance", force_gc=True)
-except Exception as e:
-    log_memory(f"Error with Celery app import: {str(e)}")
-
-# Get list of all loaded modules sorted by memory usage
-log_memory("\n--- Memory Usage by Module (Top 30) ---")
-all_modules = sorted(module_sizes.items(), key=lambda x: x[1], reverse=True)
-for i, (module_name, size) in enumerate(all_modules[:30]):
-    print(f"{i+1:2d}. {module_name}: {size:.2f} MB")
-
-# Summary of memory usage
-total_memory = get_memory_mb()
-log_memory("\n--- Memory Usage Summary ---")
-log_memory(f"Initial memory: {initial_memory:.2f} MB")
-log_memory(f"Final memory: {total_memory:.2f} MB")
-log_memory(f"Memory change: {total_memory - initial_memory:.2f} MB")
-
-# Print top 10 memory increases
-log_memory("\n--- Top 10 Memory Increases ---")
-memory_increases = sorted(
-    [(msg, diff) for _, _, msg, diff in memory_snapshots[1:]],
-    key=lambda x: x[1],
-    reverse=True
-)
-for i, (msg, diff) in enumerate(memory_increases[:10]):
-    print(f"{i+1:2d}. {msg}: {diff:.2f} MB")
-
-print("\n" + "="*80)
-print(" MEMORY PROFILING COMPLETE ")
-print("="*80 + "\n")
+        new_relic_before = get_memory_mb()
+        import_and_track('newrelic')
+        import newrelic.agent
+        log_memory("Before newrelic.agent.initialize()")
+        newrelic.agent.initialize()
+        log_memory("After newrelic.agent.initialize()", force_gc=True)
+    except ImportError:
+        log_memory("New Relic agent not installed")
+    except Exception as e:
+        log_memory(f"Error initializing New Relic: {str(e)}")
+
+    # Import Celery and related modules
+    log_memory("\n--- Celery Memory Usage ---")
+    import_and_track('celery')
+    try:
+        log_memory(f"Before importing Celery app from {CELERY_APP_MODULE}")
+        celery_app_module = importlib.import_module(CELERY_APP_MODULE)
+        log_memory(f"After importing Celery app", force_gc=True)
+
+        # Check if 'app' attribute exists in the module
+        if hasattr(celery_app_module, 'app'):
+            log_memory("Before accessing celery app instance")
+            app = celery_app_module.app
+            log_memory("After accessing celery app instance", force_gc=True)
+    except Exception as e:
+        log_memory(f"Error with Celery app import: {str(e)}")
+
+    # Get list of all loaded modules sorted by memory usage
+    log_memory("\n--- Memory Usage by Module (Top 30) ---")
+    all_modules = sorted(module_sizes.items(), key=lambda x: x[1], reverse=True)
+    for i, (module_name, size) in enumerate(all_modules[:30]):
+        print(f"{i+1:2d}. {module_name}: {size:.2f} MB")
+
+    # Summary of memory usage
+    total_memory = get_memory_mb()
+    log_memory("\n--- Memory Usage Summary ---")
+    log_memory(f"Initial memory: {initial_memory:.2f} MB")
+    log_memory(f"Final memory: {total_memory:.2f} MB")
+    log_memory(f"Memory change: {total_memory - initial_memory:.2f} MB")
+
+    # Print top 10 memory increases
+    log_memory("\n--- Top 10 Memory Increases ---")
+    memory_increases = sorted(
+        [(msg, diff) for _, _, msg, diff in memory_snapshots[1:]],
+        key=lambda x: x[1],
+        reverse=True
+    )
+    for i, (msg, diff) in enumerate(memory_increases[:10]):
+        print(f"{i+1:2d}. {msg}: {diff:.2f} MB")
+
+    print("\n" + "="*80)
+    print(" MEMORY PROFILING COMPLETE ")
+    print("="*80 + "\n")
+
+
+if __name__ == '__main__':
+    if '--web' in sys.argv:
+        settings_module = sys.argv[sys.argv.index('--settings') + 1] if '--settings' in sys.argv else DJANGO_SETTINGS_MODULE
+        print(json.dumps(web_import_footprint(settings_module)))
+    else:
+        profile_startup()
@@ -87,18 +87,7 @@ class PrayerSetSerializer(BookmarkOptimizedSerializerMixin, serializers.ModelSer
     
     def get_thumbnail_url(self, obj):
         """Get cached or generated thumbnail URL."""
-        if obj.image:
-            # Try to get/update cached URL
-            cached_url = self.update_thumbnail_cache(obj, 'image', 'thumbnail')
-            if cached_url:
-                return cached_url
-            
-            # Fall back to direct thumbnail URL if caching fails
-            try:
-                return obj.thumbnail.url
-            except (AttributeError, ValueError, OSError):
-                return None
-        return None
+        return self.get_cached_thumbnail_url(obj)
     
     def get_prayers(self, obj):
         """Get ordered list of prayers in this set."""
@@ -145,15 +134,7 @@ class PrayerSetListSerializer(BookmarkOptimizedSerializerMixin, serializers.Mode
     
     def get_thumbnail_url(self, obj):
         """Get cached or generated thumbnail URL."""
-        if obj.image:
-            cached_url = self.update_thumbnail_cache(obj, 'image', 'thumbnail')
-            if cached_url:
-                return cached_url
-            try:
-                return obj.thumbnail.url
-            except (AttributeError, ValueError, OSError):
-                return None
-        return None
+        return self.get_cached_thumbnail_url(obj)
     
     def get_prayer_count(self, obj):
         """Return the number of prayers in this set."""
@@ -176,7 +157,7 @@ class PrayerSetListSerializer(BookmarkOptimizedSerializerMixin, serializers.Mode
 # Prayer Request Serializers
 
 
-class RequesterSerializer(serializers.ModelSerializer):
+class RequesterSerializer(serializers.ModelSerializer, ThumbnailCacheMixin):
     """Minimal serializer for prayer request requester."""
 
     full_name = serializers.SerializerMethodField()
@@ -204,18 +185,17 @@ class RequesterSerializer(serializers.ModelSerializer):
         return None
 
     def get_profile_image_thumbnail_url(self, obj):
-        """Get the cached or generated thumbnail URL for profile image."""
-        if hasattr(obj, 'profile') and obj.profile and obj.profile.profile_image:
-            # Try to use cached URL if available and recent
-            if obj.profile.cached_thumbnail_url:
-                return obj.profile.cached_thumbnail_url
-
-            # Fall back to generating thumbnail URL
-            try:
-                return obj.profile.profile_image_thumbnail.url
-            except (AttributeError, ValueError, OSError):
-                return None
-        return None
+        """Get the cached thumbnail URL for profile image, or the image itself until it is ready."""
+        profile = getattr(obj, 'profile', None)
+        if not profile or not profile.profile_image:
+            return None
+        cached_url = self.get_cached_thumbnail_url(profile)
+        if cached_url:
+            return cached_url
+        try:
+            return profile.profile_image.url
+        except (AttributeError, ValueError, OSError):
+            return None
 
 
 class PrayerRequestSerializer(serializers.ModelSerializer, ThumbnailCacheMixin):
@@ -262,26 +242,16 @@ class PrayerRequestSerializer(serializers.ModelSerializer, ThumbnailCacheMixin):
     def get_thumbnail_url(self, obj):
         """Get cached or generated thumbnail URL (uploaded image, or fallback icon)."""
         if obj.image:
-            cached_url = self.update_thumbnail_cache(obj, 'image', 'thumbnail')
-            if cached_url:
-                return cached_url
-
-            try:
-                return obj.thumbnail.url
-            except (AttributeError, ValueError, OSError):
-                return None
+            return self.get_cached_thumbnail_url(obj)
         if obj.icon:
-            cached_url = self.update_thumbnail_cache(obj.icon, 'image', 'thumbnail')
+            cached_url = self.get_cached_thumbnail_url(obj.icon)
             if cached_url:
                 return cached_url
+            # Until the icon thumbnail is ready, fall back to the original image
             try:
-                return obj.icon.thumbnail.url
+                return obj.icon.image.url
             except (AttributeError, ValueError, OSError):
-                # As a last resort, try full image URL
-                try:
-                    return obj.icon.image.url
-                except (AttributeError, ValueError, OSError):
-                    return None
+                return None
         return None
 
     def get_acceptance_count(self, obj):
@@ -4,6 +4,7 @@ from django.utils.translation import activate, get_language_from_request
 from rest_framework import generics
 from rest_framework.permissions import AllowAny
 
+from hub.services import search_service
 from notifications.tasks import send_push_notification_to_users_task
 from prayers.models import Prayer, PrayerSet
 from prayers.serializers import (
@@ -22,8 +23,8 @@ class PrayerListView(generics.ListAPIView):
         - POST/PUT/PATCH/DELETE: Not supported
 
     Query Parameters:
-        - search (str): Optional. Filter prayers by matching text in title or text content.
-                       Case-insensitive partial matches are supported.
+        - search (str): Optional. Filter prayers by matching words in title or text content.
+                       Words match as prefixes; best matches first.
         - church (int): Optional. Filter prayers by church ID.
         - category (str): Optional. Filter prayers by category (morning, evening, meal, etc.).
         - tags (str): Optional. Filter prayers by tag name(s). Comma-separated for multiple tags.
@@ -62,10 +63,7 @@ class PrayerListView(generics.ListAPIView):
         # Apply search filter if provided
         search = self.request.query_params.get('search', None)
         if search:
-            queryset = queryset.filter(
-                Q(title__icontains=search) |
-                Q(text__icontains=search)
-            )
+            queryset = search_service.search(queryset, search)
         
         # Filter by church
         church_id = self.request.query_params.get('church', None)
@@ -95,6 +93,8 @@ class PrayerListView(generics.ListAPIView):
             except ValueError:
                 return Prayer.objects.none()
         
+        if search:
+            return queryset.distinct().order_by('-search_rank', '-created_at')
         return queryset.distinct().order_by('-created_at')
 
 
@@ -130,8 +130,8 @@ class PrayerSetListView(generics.ListAPIView):
         - POST/PUT/PATCH/DELETE: Not supported
 
     Query Parameters:
-        - search (str): Optional. Filter prayer sets by matching text in title or description.
-                       Case-insensitive partial matches are supported.
+        - search (str): Optional. Filter prayer sets by matching words in title or description.
+                       Words match as prefixes; best matches first.
         - church (int): Optional. Filter prayer sets by church ID.
         - category (str): Optional. Filter prayer sets by category (morning, evening, general).
 
@@ -166,10 +166,7 @@ class PrayerSetListView(generics.ListAPIView):
         # Apply search filter if provided
         search = self.request.query_params.get('search', None)
         if search:
-            queryset = queryset.filter(
-                Q(title__icontains=search) |
-                Q(description__icontains=search)
-            )
+            queryset = search_service.search(queryset, search)
         
         # Filter by church
         church_id = self.request.query_params.get('church', None)
@@ -184,6 +181,8 @@ class PrayerSetListView(generics.ListAPIView):
         if category:
             queryset = queryset.filter(category=category)
         
+        if search:
+            return queryset.order_by('-search_rank', '-created_at')
         return queryset.order_by('-created_at')
 
 
@@ -0,0 +1,83 @@
+"""Fakes of sacredtradition.am for scraping tests.
+
+``pages_by_language`` replaces ``requests.Session.get`` with a function that
+answers by the ``iL`` (language) query parameter, so the concurrent
+per-language fetches don't depend on call order.  ``FixtureServer`` serves the
+same pages over real HTTP on localhost for end-to-end client tests.
+"""
+import threading
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+
+def page_language(url):
+    """The ``iL`` query parameter of a calendar URL."""
+    return int(urllib.parse.parse_qs(urllib.parse.urlparse(url).query)["iL"][0])
+
+
+def fake_response(html="", status=200, url=""):
+    """A ``requests.Response`` with the given body and status."""
+    response = requests.Response()
+    response.status_code = status
+    response._content = html.encode("utf-8") if isinstance(html, str) else html
+    response.url = url
+    return response
+
+
+def pages_by_language(pages, status=200):
+    """Side effect for a patched ``requests.Session.get`` serving ``pages`` (``{iL: html}``).
+
+    Languages missing from ``pages`` get a 404.
+    """
+    def get(url, **kwargs):
+        html = pages.get(page_language(url))
+        if html is None:
+            return fake_response("", 404, url)
+        return fake_response(html, status, url)
+    return get
+
+
+class FixtureServer:
+    """Local HTTP server answering calendar requests from ``pages`` (``{iL: html}``).
+
+    Use as a context manager; ``url`` is the base URL to configure the client
+    with and ``requests`` records ``(path, headers, client_port)`` of every
+    request.  Set ``status`` to make every response fail.
+    """
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.status = 200
+        self.requests = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive
+
+            def do_GET(self):
+                server.requests.append((self.path, dict(self.headers), self.client_address[1]))
+                html = server.pages.get(page_language(self.path))
+                status = server.status if html is not None else 404
+                body = (html or "").encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.httpd.shutdown()
+        self.httpd.server_close()
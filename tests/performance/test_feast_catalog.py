@@ -0,0 +1,75 @@
+"""Benchmark of feast reference matching against the bundled feasts.json."""
+
+import json
+import os
+import time
+from datetime import date
+from difflib import SequenceMatcher
+from unittest.mock import patch
+
+from django.conf import settings
+from django.test import TestCase
+from django.test.utils import tag
+
+from hub.models import Church, Day, Feast
+from hub.services.feast_catalog import reset_feast_catalog
+from hub.services.llm_service import MIN_MULTI_FEAST_SIMILARITY, _find_all_matching_feasts
+
+FEAST_NAMES = [
+    "Saint Stephen the Protomartyr",
+    "Feast of the Holy Cross",
+    "St. Gregory the Illuminator",
+    "Holy Translators Sahak and Mesrop",
+    "Saints Vartanants",
+    "Commemoration of Sts. Cyricus and Julitta",
+    "Presentation of the Lord to the Temple",
+    "Assumption of the Holy Mother-of-God",
+]
+
+
+def _full_scan(feast_name):
+    """The previous implementation: parse the file and score every entry."""
+    with open(os.path.join(settings.BASE_DIR, 'data', 'feasts.json'), encoding='utf-8') as f:
+        entries = json.load(f)
+    name = feast_name.lower()
+    scores = [(SequenceMatcher(None, name, e.get('name', '').lower()).ratio(), e) for e in entries]
+    return [e for score, e in sorted(scores, key=lambda s: -s[0]) if score >= MIN_MULTI_FEAST_SIMILARITY]
+
+
+@tag('performance')
+@patch('hub.services.llm_service.mail_admins')
+@patch('hub.services.llm_service._llm_filter_feast_matches', side_effect=lambda feast, candidates: candidates)
+class FeastCatalogPerformanceTests(TestCase):
+    def setUp(self):
+        reset_feast_catalog()
+        self.addCleanup(reset_feast_catalog)
+        church = Church.objects.get(pk=Church.get_default_pk())
+        self.feasts = [
+            Feast(day=Day(date=date(2025, 1, 1 + i), church=church), name=name)
+            for i, name in enumerate(FEAST_NAMES)
+        ]
+
+    def test_per_feast_match_time(self, mock_filter, mock_mail):
+        start_time = time.perf_counter()
+        for feast in self.feasts:
+            _full_scan(feast.name)
+        scan_time = (time.perf_counter() - start_time) / len(self.feasts)
+
+        _find_all_matching_feasts(self.feasts[0])  # loads the catalog
+        start_time = time.perf_counter()
+        for feast in self.feasts:
+            _find_all_matching_feasts(feast)
+        catalog_time = (time.perf_counter() - start_time) / len(self.feasts)
+
+        print(f"\nFull scan per feast: {scan_time * 1000:.2f}ms")
+        print(f"Indexed catalog per feast: {catalog_time * 1000:.2f}ms")
+        print(f"Speed improvement: {scan_time / catalog_time:.1f}x")
+
+        self.assertLess(catalog_time, scan_time)
+
+    def test_best_match_is_unchanged(self, mock_filter, mock_mail):
+        for feast in self.feasts:
+            expected = _full_scan(feast.name)
+            matches = _find_all_matching_feasts(feast)
+            if expected:
+                self.assertEqual(matches[0]['name'], expected[0]['name'], feast.name)
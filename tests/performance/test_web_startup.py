@@ -0,0 +1,42 @@
+"""Regression benchmark of web-process start-up, built on memory_debug.py."""
+
+import json
+import os
+import subprocess
+import sys
+
+from django.conf import settings
+from django.test import SimpleTestCase
+from django.test.utils import tag
+
+# Peak RSS added by Django set-up and the URLconf imports; about 85 MB with
+# the LLM SDKs and map rendering kept out of web processes, 155 MB without
+RSS_BUDGET_MB = 120
+
+
+@tag('performance')
+class WebStartupFootprintTests(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # A fresh interpreter, since this one has imported everything already
+        result = subprocess.run(
+            [sys.executable, 'memory_debug.py', '--web', '--settings', 'tests.test_settings'],
+            cwd=settings.BASE_DIR,
+            env={**os.environ, 'DJANGO_SETTINGS_MODULE': 'tests.test_settings'},
+            capture_output=True,
+            text=True,
+            timeout=120,
+            check=True,
+        )
+        cls.footprint = json.loads(result.stdout.strip().splitlines()[-1])
+        print(
+            f"\nWeb start-up: {cls.footprint['seconds']:.2f}s, "
+            f"{cls.footprint['rss_after_mb'] - cls.footprint['rss_before_mb']:.1f} MB"
+        )
+
+    def test_heavy_task_dependencies_are_not_imported(self):
+        self.assertEqual(self.footprint['heavy_modules'], [])
+
+    def test_rss_stays_within_budget(self):
+        self.assertLess(self.footprint['rss_after_mb'] - self.footprint['rss_before_mb'], RSS_BUDGET_MB)
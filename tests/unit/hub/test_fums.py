@@ -2,6 +2,7 @@
 import datetime
 from unittest.mock import Mock, patch
 
+from django.core.cache import cache
 from django.test import TestCase
 from django.utils import timezone
 
@@ -92,6 +93,7 @@ class ReadingFumsTokenAPITests(TestCase):
     """Tests for FUMS token in the readings API response."""
 
     def setUp(self):
+        cache.clear()
         # Use the default church so the anonymous readings view finds our Day
         self.church = Church.objects.get_or_create(
             name="Armenian Apostolic Church"
@@ -100,8 +102,8 @@ class ReadingFumsTokenAPITests(TestCase):
             date=timezone.now().date(), church=self.church
         )
 
-    @patch("hub.views.readings.scrape_readings")
-    @patch("hub.views.readings.generate_reading_context_task")
+    @patch("hub.services.prefetch_service.scrape_readings")
+    @patch("hub.tasks.generate_reading_context_task")
     def test_readings_api_includes_fums_token(self, mock_gen_task, mock_scrape):
         """The readings API should include fumsToken in each reading."""
         mock_scrape.return_value = []
@@ -122,8 +124,8 @@ class ReadingFumsTokenAPITests(TestCase):
         self.assertEqual(len(readings), 1)
         self.assertEqual(readings[0]["fumsToken"], "api-fums-token-xyz")
 
-    @patch("hub.views.readings.scrape_readings")
-    @patch("hub.views.readings.generate_reading_context_task")
+    @patch("hub.services.prefetch_service.scrape_readings")
+    @patch("hub.tasks.generate_reading_context_task")
     def test_readings_api_fums_token_empty_when_not_set(self, mock_gen_task, mock_scrape):
         """fumsToken should be empty string when no FUMS token is stored."""
         mock_scrape.return_value = []